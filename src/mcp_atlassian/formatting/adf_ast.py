@@ -5,11 +5,12 @@ parser, replacing the fragile custom line-by-line parser.
 """
 
 import logging
-from functools import lru_cache
+import threading
 from typing import Any
 
 import mistune
 
+from .adf_cache import conversion_cache
 from .adf_plugins import registry as plugin_registry
 from .adf_validator import ADFValidator, get_validation_level
 
@@ -105,6 +106,22 @@ def parse_adf_block(self, m, state):
     return m.end()
 
 
+# Mistune plugins of the top-level and nested block parsers
+MARKDOWN_PLUGINS = [
+    "strikethrough",
+    "table",
+    "url",  # Auto-link URLs
+    "task_lists",  # GitHub-style task lists
+    "def_list",  # Definition lists
+    "abbr",  # Abbreviations
+    "mark",  # Marked/highlighted text
+    "insert",  # Inserted text
+    "superscript",  # Superscript
+    "subscript",  # Subscript
+    adf_extensions,  # Our custom ADF extensions
+]
+
+
 class ADFRenderer(mistune.BaseRenderer):
     """Mistune renderer that outputs ADF JSON instead of HTML."""
 
@@ -134,6 +151,9 @@ class ADFRenderer(mistune.BaseRenderer):
         self._list_item_count = 0
         self._table_row_count = 0
         self.inline_parser = inline_parser
+        # Per-thread pool of parsers for the block content of layouts and
+        # extension blocks, built on first use
+        self._nested = threading.local()
 
     def render_token(
         self, token: dict[str, Any], state: mistune.core.BlockState
@@ -294,51 +314,7 @@ class ADFRenderer(mistune.BaseRenderer):
                 content: Markdown content to render
                 block_mode: If True, parse as block-level markdown
             """
-            if block_mode and content:
-                # For block mode, we need to create a temporary parser
-                # to avoid circular dependencies
-                from mistune import create_markdown
-
-                temp_parser = create_markdown(
-                    renderer=ADFRenderer(
-                        validator=self.validator,
-                        max_table_rows=self.max_table_rows,
-                        max_list_items=self.max_list_items,
-                        inline_parser=self.inline_parser,
-                    ),
-                    plugins=[
-                        "strikethrough",
-                        "table",
-                        "url",
-                        "task_lists",
-                        "def_list",
-                        "abbr",
-                        "mark",
-                        "insert",
-                        "superscript",
-                        "subscript",
-                        adf_extensions,
-                    ],
-                )
-
-                # Parse the content as a full document
-                parsed = temp_parser(content)
-
-                # Extract just the content part
-                if isinstance(parsed, dict) and parsed.get("type") == "doc":
-                    return parsed.get("content", [])
-                else:
-                    return [parsed] if parsed else []
-            elif self.inline_parser and content:
-                # Create inline state with empty env and set src
-                inline_state = mistune.core.InlineState({})
-                inline_state.src = content
-                tokens = self.inline_parser.parse(inline_state)
-                result = self.render_inline_tokens(tokens, state)
-                return result
-            else:
-                # Fallback - just return text
-                return [{"type": "text", "text": content}]
+            return self._render_nested(content, state, block_mode=block_mode)
 
         # Use the LayoutPlugin directly
         from .adf_plugins import LayoutPlugin
@@ -383,51 +359,7 @@ class ADFRenderer(mistune.BaseRenderer):
                 content: Markdown content to render
                 block_mode: If True, parse as block-level markdown
             """
-            if block_mode and content:
-                # For block mode, we need to create a temporary parser
-                # to avoid circular dependencies
-                from mistune import create_markdown
-
-                temp_parser = create_markdown(
-                    renderer=ADFRenderer(
-                        validator=self.validator,
-                        max_table_rows=self.max_table_rows,
-                        max_list_items=self.max_list_items,
-                        inline_parser=self.inline_parser,
-                    ),
-                    plugins=[
-                        "strikethrough",
-                        "table",
-                        "url",
-                        "task_lists",
-                        "def_list",
-                        "abbr",
-                        "mark",
-                        "insert",
-                        "superscript",
-                        "subscript",
-                        adf_extensions,
-                    ],
-                )
-
-                # Parse the content as a full document
-                parsed = temp_parser(content)
-
-                # Extract just the content part
-                if isinstance(parsed, dict) and parsed.get("type") == "doc":
-                    return parsed.get("content", [])
-                else:
-                    return [parsed] if parsed else []
-            elif self.inline_parser and content:
-                # Create inline state with empty env and set src
-                inline_state = mistune.core.InlineState({})
-                inline_state.src = content
-                tokens = self.inline_parser.parse(inline_state)
-                result = self.render_inline_tokens(tokens, state)
-                return result
-            else:
-                # Fallback - just return text
-                return [{"type": "text", "text": content}]
+            return self._render_nested(content, state, block_mode=block_mode)
 
         nodes = plugin_registry.process_block_text(raw_text, render_content)
 
@@ -481,6 +413,58 @@ class ADFRenderer(mistune.BaseRenderer):
         # Unknown block type - return as paragraph
         return {"type": "paragraph", "content": [{"type": "text", "text": raw_text}]}
 
+    def _render_nested(
+        self,
+        content: str,
+        state: mistune.core.BlockState,
+        *,
+        block_mode: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Render the content of a layout column or extension block.
+
+        Block content is parsed by a pooled parser with its own renderer, so
+        its list and table counters stay separate from this renderer's. A
+        parser is taken out of the pool while in use, which keeps nested
+        blocks that render more nested blocks re-entrant.
+        """
+        if block_mode and content:
+            pool = self._nested.__dict__.setdefault("parsers", [])
+            parser = pool.pop() if pool else self._create_nested_parser()
+            parser.renderer._list_item_count = 0
+            parser.renderer._table_row_count = 0
+            try:
+                # Parse the content as a full document
+                parsed = parser(content)
+            finally:
+                pool.append(parser)
+
+            # Extract just the content part
+            if isinstance(parsed, dict) and parsed.get("type") == "doc":
+                return parsed.get("content", [])
+            else:
+                return [parsed] if parsed else []
+        elif self.inline_parser and content:
+            # Create inline state with empty env and set src
+            inline_state = mistune.core.InlineState({})
+            inline_state.src = content
+            tokens = self.inline_parser.parse(inline_state)
+            return self.render_inline_tokens(tokens, state)
+        else:
+            # Fallback - just return text
+            return [{"type": "text", "text": content}]
+
+    def _create_nested_parser(self) -> mistune.Markdown:
+        """Create a parser for nested block content with this renderer's settings."""
+        return mistune.create_markdown(
+            renderer=ADFRenderer(
+                validator=self.validator,
+                max_table_rows=self.max_table_rows,
+                max_list_items=self.max_list_items,
+                inline_parser=self.inline_parser,
+            ),
+            plugins=MARKDOWN_PLUGINS,
+        )
+
     def render_block_text(
         self, token: dict[str, Any], state: mistune.core.BlockState
     ) -> dict[str, Any]:
@@ -801,25 +785,15 @@ class ASTBasedADFGenerator:
         # Create mistune markdown parser with ADF renderer
         self.markdown = mistune.create_markdown(
             renderer=self.renderer,
-            plugins=[
-                "strikethrough",
-                "table",
-                "url",  # Auto-link URLs
-                "task_lists",  # GitHub-style task lists
-                "def_list",  # Definition lists
-                "abbr",  # Abbreviations
-                "mark",  # Marked/highlighted text
-                "insert",  # Inserted text
-                "superscript",  # Superscript
-                "subscript",  # Subscript
-                adf_extensions,  # Our custom ADF extensions
-            ],
+            plugins=MARKDOWN_PLUGINS,
         )
 
-    @lru_cache(maxsize=256)
     def markdown_to_adf(self, markdown_text: str) -> dict[str, Any]:
         """Convert markdown to ADF using AST parsing.
 
+        Conversions are cached process-wide, and every call returns its own
+        copy of the document.
+
         Args:
             markdown_text: Input markdown text
 
@@ -830,6 +804,11 @@ class ASTBasedADFGenerator:
             if not markdown_text or not markdown_text.strip():
                 return {"version": 1, "type": "doc", "content": []}
 
+            cache_key = conversion_cache.make_key(markdown_text, self._cache_settings())
+            cached = conversion_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             # Parse markdown to AST and render to ADF
             adf_doc = self.markdown(markdown_text)
 
@@ -850,14 +829,33 @@ class ASTBasedADFGenerator:
             ):
                 logger.error(f"ADF validation failed: {'; '.join(errors)}")
                 # Return error document
-                return self._create_error_document(markdown_text, errors)
+                adf_doc = self._create_error_document(markdown_text, errors)
 
+            conversion_cache.set(cache_key, adf_doc)
             return adf_doc
 
         except Exception as e:
             logger.error(f"AST-based ADF conversion failed: {e}", exc_info=True)
             return self._create_error_document(markdown_text, [str(e)])
 
+    def get_performance_metrics(self) -> dict[str, Any]:
+        """
+        Get conversion cache statistics for monitoring.
+
+        Returns:
+            Dictionary with the shared conversion cache statistics
+        """
+        return {"conversion_cache": conversion_cache.get_stats()}
+
+    def _cache_settings(self) -> tuple[Any, ...]:
+        """Settings that change the converted document, for the cache key."""
+        return (
+            self.validator.validation_level,
+            self.max_table_rows,
+            self.max_list_items,
+            tuple(plugin_registry.plugins),
+        )
+
     def _create_error_document(
         self, original_text: str, errors: list[str]
     ) -> dict[str, Any]:
@@ -0,0 +1,134 @@
+"""Process-wide cache of markdown to ADF conversions.
+
+Converting markdown to ADF parses and renders the whole document, while the
+same descriptions and comments are often converted again (retries, repeated
+updates, several generator instances). Conversions are cached here, keyed by
+a hash of the markdown and the generator settings, and bounded by the total
+size of the stored documents.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADF_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class ADFConversionCache:
+    """Thread-safe LRU cache of ADF documents bounded by their total size.
+
+    Documents are stored pickled, so every hit returns a fresh copy that the
+    caller is free to modify without affecting later conversions. Loading a
+    pickled document is far cheaper than converting the markdown again.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_ADF_CACHE_MAX_BYTES) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of the stored documents (0 disables
+                the cache)
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(markdown_text: str, settings: tuple[Hashable, ...]) -> str:
+        """Build the cache key of a conversion.
+
+        Args:
+            markdown_text: The markdown being converted
+            settings: Generator settings that change the converted document
+
+        Returns:
+            A digest of the markdown and settings
+        """
+        digest = hashlib.sha256(repr(settings).encode("utf-8"))
+        digest.update(markdown_text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a copy of the cached document for a key, or None when missing."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return pickle.loads(data)  # noqa: S301 - only our own pickles are stored
+
+    def set(self, key: str, document: dict[str, Any]) -> None:
+        """Store a document, evicting the least recently used ones to fit it.
+
+        Documents larger than the whole cache are not stored.
+        """
+        data = pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached document and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": (self._hits / lookups) * 100 if lookups else 0.0,
+            }
+
+
+def get_adf_cache_max_bytes() -> int:
+    """Get the ADF conversion cache size from environment."""
+    value = os.getenv("ATLASSIAN_ADF_CACHE_MAX_BYTES")
+    if not value:
+        return DEFAULT_ADF_CACHE_MAX_BYTES
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid ATLASSIAN_ADF_CACHE_MAX_BYTES '{value}', "
+            f"using {DEFAULT_ADF_CACHE_MAX_BYTES}"
+        )
+        return DEFAULT_ADF_CACHE_MAX_BYTES
+
+
+conversion_cache = ADFConversionCache(get_adf_cache_max_bytes())
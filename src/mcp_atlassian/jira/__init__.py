@@ -5,12 +5,14 @@ This module provides various Jira API client implementations.
 
 # flake8: noqa
 
+from .analytics import AnalyticsMixin
 from .client import JiraClient
 from .comments import CommentsMixin
 from .config import JiraConfig
 from .epics import EpicsMixin
 from .fields import FieldsMixin
 from .formatting import FormattingMixin
+from .graph import GraphMixin
 from .issues import IssuesMixin
 from .links import LinksMixin
 from .projects import ProjectsMixin
@@ -38,6 +40,8 @@ class JiraFetcher(
     SprintsMixin,
     AttachmentsMixin,
     LinksMixin,
+    AnalyticsMixin,
+    GraphMixin,
 ):
     """
     The main Jira client class providing access to all Jira operations.
@@ -57,6 +61,8 @@ class JiraFetcher(
     - SprintsMixin: Sprint operations
     - AttachmentsMixin: Attachment download operations
     - LinksMixin: Issue link operations
+    - AnalyticsMixin: Status analytics over changelogs
+    - GraphMixin: Issue dependency graph traversal
 
     The class structure is designed to maintain backward compatibility while
     improving code organization and maintainability.
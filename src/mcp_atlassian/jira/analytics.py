@@ -0,0 +1,328 @@
+"""Module for Jira status analytics computed from issue changelogs."""
+
+import logging
+import time
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from ..models.jira import JiraChangelog, JiraChangelogRecord, JiraIssue
+from ..utils.date import parse_timestamps
+from .cache import SiteCache, site_key
+from .client import JiraClient
+
+logger = logging.getLogger("mcp-jira")
+
+DEFAULT_PERCENTILES = (50, 85, 95)
+
+# Status category keys used by the Jira status API
+STATUS_CATEGORY_IN_PROGRESS = "indeterminate"
+STATUS_CATEGORY_DONE = "done"
+
+# Status definitions rarely change; share them per site
+_status_category_cache: SiteCache[dict[str, str]] = SiteCache(
+    "status_categories", maxsize=64, ttl=3600
+)
+
+
+@dataclass(slots=True)
+class StatusTimeline:
+    """
+    Status history of one issue.
+
+    ``statuses[i]`` was entered at ``entered_at[i]`` (epoch seconds) and held
+    until ``entered_at[i + 1]``, or until now for the last status. The first
+    entry is the status the issue was created in.
+    """
+
+    issue_key: str
+    entered_at: array
+    statuses: list[str]
+
+    @classmethod
+    def from_changelogs(
+        cls,
+        issue_key: str,
+        created: float,
+        changelogs: Iterable[JiraChangelog | JiraChangelogRecord],
+        current_status: str | None = None,
+    ) -> "StatusTimeline":
+        """
+        Build a timeline from an issue's changelog entries.
+
+        Args:
+            issue_key: The issue key
+            created: Issue creation time in epoch seconds
+            changelogs: Changelog entries in any order; non-status items are
+                ignored
+            current_status: Status to use when the issue never changed status
+
+        Returns:
+            A StatusTimeline instance
+        """
+        events = sorted(
+            (
+                (entry.created.timestamp(), item.from_string, item.to_string)
+                for entry in changelogs
+                if entry.created is not None
+                for item in entry.items
+                if item.field == "status"
+            ),
+            key=lambda event: event[0],
+        )
+        initial = (events[0][1] if events else current_status) or "Unknown"
+        entered_at = array("d", [created])
+        statuses = [initial]
+        for timestamp, _, to_status in events:
+            # Clamp clock skew so intervals never run backwards
+            entered_at.append(max(timestamp, entered_at[-1]))
+            statuses.append(to_status or "Unknown")
+        return cls(issue_key=issue_key, entered_at=entered_at, statuses=statuses)
+
+
+class StatusAnalytics:
+    """
+    Accumulate time-in-status, lead time, cycle time and transition counts.
+
+    Per-issue durations are kept in flat ``array('d')`` columns, and interval
+    lengths are computed by pairing each timeline's entry times with the next
+    entry time, so adding tens of thousands of issues stays cheap.
+    """
+
+    def __init__(
+        self,
+        status_categories: dict[str, str] | None = None,
+        now: float | None = None,
+        *,
+        include_current: bool = True,
+    ) -> None:
+        """
+        Initialize the accumulator.
+
+        Args:
+            status_categories: Status name to category key ('new',
+                'indeterminate' or 'done'); names are matched case-insensitively
+            now: End time for the current status, in epoch seconds
+            include_current: Whether time in each issue's current status counts
+        """
+        self.status_categories = {
+            name.lower(): category
+            for name, category in (status_categories or {}).items()
+        }
+        self.now = time.time() if now is None else now
+        self.include_current = include_current
+        self.issue_count = 0
+        self._time_in_status: defaultdict[str, array] = defaultdict(lambda: array("d"))
+        self._lead_times = array("d")
+        self._cycle_times = array("d")
+        self._transitions: Counter[tuple[str, str]] = Counter()
+
+    def add(self, timeline: StatusTimeline) -> None:
+        """
+        Add one issue's timeline to the statistics.
+
+        Lead time runs from creation, and cycle time from the first in-progress
+        status, to the moment the issue entered its final run of done statuses.
+        Both are only recorded for issues that are currently done.
+
+        Args:
+            timeline: The issue's status timeline
+        """
+        starts = timeline.entered_at
+        statuses = timeline.statuses
+        ends = starts[1:]
+        ends.append(max(self.now, starts[-1]))
+        held = len(statuses) if self.include_current else len(statuses) - 1
+
+        per_status: dict[str, float] = {}
+        for status, start, end in zip(statuses[:held], starts, ends, strict=False):
+            per_status[status] = per_status.get(status, 0.0) + (end - start)
+        for status, seconds in per_status.items():
+            self._time_in_status[status].append(seconds)
+
+        self._transitions.update(zip(statuses, statuses[1:], strict=False))
+
+        done_index = len(statuses)
+        while done_index > 0 and self._is_done(statuses[done_index - 1]):
+            done_index -= 1
+        if done_index < len(statuses):
+            done_at = starts[done_index]
+            self._lead_times.append(done_at - starts[0])
+            for status, start in zip(
+                statuses[:done_index], starts[:done_index], strict=True
+            ):
+                if self._category(status) == STATUS_CATEGORY_IN_PROGRESS:
+                    self._cycle_times.append(done_at - start)
+                    break
+
+        self.issue_count += 1
+
+    def summary(
+        self, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> dict[str, Any]:
+        """
+        Summarize the accumulated statistics.
+
+        Args:
+            percentiles: Percentiles (0-100) to report for each duration set
+
+        Returns:
+            Dictionary with per-status, lead time and cycle time statistics in
+            hours, and transition counts sorted from most frequent
+        """
+        return {
+            "issue_count": self.issue_count,
+            "time_in_status_hours": {
+                status: _describe(values, percentiles)
+                for status, values in sorted(self._time_in_status.items())
+            },
+            "lead_time_hours": _describe(self._lead_times, percentiles),
+            "cycle_time_hours": _describe(self._cycle_times, percentiles),
+            "transitions": [
+                {"from": from_status, "to": to_status, "count": count}
+                for (from_status, to_status), count in self._transitions.most_common()
+            ],
+        }
+
+    def _category(self, status: str) -> str:
+        return self.status_categories.get(status.lower(), "")
+
+    def _is_done(self, status: str) -> bool:
+        return self._category(status) == STATUS_CATEGORY_DONE
+
+
+def _describe(values: array, percentiles: Sequence[float]) -> dict[str, Any]:
+    """Count, mean and percentiles of durations in seconds, reported in hours."""
+    if not values:
+        return {"issues": 0}
+    ordered = sorted(values)
+    result: dict[str, Any] = {
+        "issues": len(ordered),
+        "mean": round(sum(ordered) / len(ordered) / 3600, 2),
+    }
+    for percentile in percentiles:
+        result[f"p{percentile:g}"] = round(_percentile(ordered, percentile) / 3600, 2)
+    return result
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    """Linearly interpolated percentile of pre-sorted values."""
+    rank = (len(ordered) - 1) * percentile / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class AnalyticsMixin(JiraClient):
+    """Mixin for Jira status analytics."""
+
+    def get_status_categories(self) -> dict[str, str]:
+        """
+        Get the status category of every status on the site.
+
+        Returns:
+            Dictionary mapping lower-cased status names to category keys
+        """
+
+        def _load() -> dict[str, str]:
+            statuses = self.jira.get(self.jira.resource_url("status"))
+            if not isinstance(statuses, list):
+                msg = f"Unexpected return value type from `jira.get`: {type(statuses)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return {
+                str(status["name"]).lower(): str(
+                    (status.get("statusCategory") or {}).get("key", "")
+                )
+                for status in statuses
+                if status.get("name")
+            }
+
+        return _status_category_cache.get_or_load(site_key(self.config), _load)
+
+    def get_status_analytics(
+        self,
+        jql: str,
+        limit: int = 1000,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        *,
+        include_current: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Compute time-in-status, lead time and cycle time for a set of issues.
+
+        On Jira Cloud, status changelogs are fetched with the bulk changelog
+        API; on Server/Data Center they are expanded in the search itself.
+
+        Args:
+            jql: JQL query selecting the issues
+            limit: Maximum number of issues to analyze
+            percentiles: Percentiles (0-100) to report
+            include_current: Whether time in each issue's current status counts
+
+        Returns:
+            Dictionary with the statistics described in StatusAnalytics.summary,
+            plus whether the issue set was truncated at ``limit``
+
+        Raises:
+            ValueError: If a percentile is outside 0-100
+        """
+        if any(not 0 <= percentile <= 100 for percentile in percentiles):
+            msg = "Percentiles must be between 0 and 100"
+            raise ValueError(msg)
+
+        # Server/DC expands changelogs in the search; one issue past the limit
+        # shows whether the issue set is truncated
+        issues = self.search_all_issues(  # type: ignore[attr-defined]
+            jql,
+            fields="created,status",
+            limit=limit + 1,
+            expand=None if self.config.is_cloud else "changelog",
+        )
+        truncated = len(issues) > limit
+        issues = issues[:limit]
+        if self.config.is_cloud:
+            changelogs_by_id: dict[
+                str, Sequence[JiraChangelog | JiraChangelogRecord]
+            ] = dict(
+                self.iter_changelogs(  # type: ignore[attr-defined]
+                    [issue.id for issue in issues], fields=["status"]
+                )
+            )
+        else:
+            changelogs_by_id = {issue.id: issue.changelogs for issue in issues}
+
+        categories = self._status_categories_for(issues)
+        analytics = StatusAnalytics(categories, include_current=include_current)
+        created_times = parse_timestamps(issue.created for issue in issues)
+        for issue, created in zip(issues, created_times, strict=True):
+            if created is None:
+                logger.debug(f"Skipping {issue.key}: no creation date")
+                continue
+            analytics.add(
+                StatusTimeline.from_changelogs(
+                    issue.key,
+                    created.timestamp(),
+                    changelogs_by_id.get(issue.id, []),
+                    current_status=issue.status.name if issue.status else None,
+                )
+            )
+
+        result = analytics.summary(percentiles)
+        result["truncated"] = truncated
+        return result
+
+    def _status_categories_for(self, issues: list[JiraIssue]) -> dict[str, str]:
+        """Site status categories, falling back to the issues' current statuses."""
+        categories = {
+            issue.status.name.lower(): issue.status.category.key
+            for issue in issues
+            if issue.status and issue.status.category
+        }
+        try:
+            categories.update(self.get_status_categories())
+        except Exception as e:  # noqa: BLE001 - categories from issues still usable
+            logger.warning(f"Could not load status categories: {e}")
+        return categories
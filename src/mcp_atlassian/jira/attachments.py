@@ -2,81 +2,199 @@
 
 import logging
 import os
+import time
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
 from ..models.jira import JiraAttachment
+from ..utils import parse_date
+from ..utils.concurrency import map_concurrently
 from .client import JiraClient
 from .protocols import AttachmentsOperationsProto
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+# Bytes read from a download response at a time; large enough to keep the
+# connection busy, small enough to bound memory per concurrent download
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
     """Mixin for Jira attachment operations."""
 
-    def download_attachment(self, url: str, target_path: str) -> bool:
+    def download_attachment(
+        self,
+        url: str,
+        target_path: str,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> bool:
         """
         Download a Jira attachment to the specified path.
 
         Args:
             url: The URL of the attachment to download
             target_path: The path where the attachment should be saved
+            chunk_size: Number of bytes read from the response at a time
 
         Returns:
             True if successful, False otherwise
         """
+        result = self._download_attachment_file(url, target_path, chunk_size=chunk_size)
+        return bool(result["success"])
+
+    def _download_attachment_file(
+        self,
+        url: str,
+        target_path: str,
+        *,
+        expected_size: int | None = None,
+        created: str | None = None,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> dict[str, Any]:
+        """
+        Download one attachment, skipping or resuming based on the local copy.
+
+        When the expected size is known, an existing local file of that size
+        that is newer than the attachment is left untouched, and a smaller one
+        is completed with an HTTP Range request instead of starting over.
+
+        Args:
+            url: The URL of the attachment to download
+            target_path: The path where the attachment should be saved
+            expected_size: Attachment size in bytes reported by Jira, if known
+            created: Attachment creation timestamp reported by Jira, if known
+            chunk_size: Number of bytes read from the response at a time
+
+        Returns:
+            Dictionary with ``success``, ``status`` (downloaded, resumed or
+            skipped), ``bytes`` transferred, ``seconds`` taken and ``error``
+            on failure
+        """
         if not url:
             logger.error("No URL provided for attachment download")
-            return False
+            return {"success": False, "error": "No URL provided"}
 
+        started = time.monotonic()
         try:
             # Convert to absolute path if relative
             if not os.path.isabs(target_path):
                 target_path = os.path.abspath(target_path)
 
+            offset = 0
+            if expected_size and os.path.exists(target_path):
+                local_size = os.path.getsize(target_path)
+                if self._is_local_copy_current(target_path, created):
+                    if local_size == expected_size:
+                        logger.info(f"Skipping unchanged attachment {target_path}")
+                        return {
+                            "success": True,
+                            "status": "skipped",
+                            "bytes": 0,
+                            "seconds": 0.0,
+                        }
+                    if 0 < local_size < expected_size:
+                        offset = local_size
+
             logger.info(f"Downloading attachment from {url} to {target_path}")
 
             # Create the directory if it doesn't exist
             os.makedirs(os.path.dirname(target_path), exist_ok=True)
 
             # Use the Jira session to download the file
-            response = self.jira._session.get(url, stream=True)
+            if offset:
+                logger.info(f"Resuming download of {target_path} at byte {offset}")
+                response = self.jira._session.get(
+                    url, stream=True, headers={"Range": f"bytes={offset}-"}
+                )
+            else:
+                response = self.jira._session.get(url, stream=True)
             response.raise_for_status()
+            if offset and response.status_code != 206:
+                # The server ignored the Range header and sent the whole file
+                offset = 0
 
             # Write the file to disk
-            with open(target_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            transferred = 0
+            with open(target_path, "ab" if offset else "wb") as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
                     f.write(chunk)
+                    transferred += len(chunk)
 
             # Verify the file was created
-            if os.path.exists(target_path):
-                file_size = os.path.getsize(target_path)
-                logger.info(
-                    f"Successfully downloaded attachment to {target_path} (size: {file_size} bytes)"
-                )
-                return True
-            else:
+            if not os.path.exists(target_path):
                 logger.error(f"File was not created at {target_path}")
-                return False
+                return {"success": False, "error": "File was not created"}
+
+            file_size = os.path.getsize(target_path)
+            if expected_size and file_size != expected_size:
+                error_msg = (
+                    f"Size mismatch for {target_path}: expected {expected_size} "
+                    f"bytes, got {file_size}"
+                )
+                logger.error(error_msg)
+                return {"success": False, "error": error_msg}
+
+            logger.info(
+                f"Successfully downloaded attachment to {target_path} (size: {file_size} bytes)"
+            )
+            return {
+                "success": True,
+                "status": "resumed" if offset else "downloaded",
+                "bytes": transferred,
+                "seconds": time.monotonic() - started,
+            }
 
         except Exception as e:
             logger.error(f"Error downloading attachment: {str(e)}")
-            return False
+            return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def _is_local_copy_current(target_path: str, created: str | None) -> bool:
+        """
+        Check whether a local file was written after the attachment was created.
+
+        Jira attachment metadata carries no checksum, so size plus modification
+        time is used to tell a previous download of this attachment apart from
+        an unrelated file with the same name.
+
+        Args:
+            target_path: Path of the local file
+            created: Attachment creation timestamp reported by Jira
+
+        Returns:
+            True if the local file is not older than the attachment
+        """
+        try:
+            created_at = parse_date(created)
+        except (ValueError, OverflowError):
+            created_at = None
+        if created_at is None:
+            return True
+        return os.path.getmtime(target_path) >= created_at.timestamp()
 
     def download_issue_attachments(
-        self, issue_key: str, target_dir: str
+        self,
+        issue_key: str,
+        target_dir: str,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
     ) -> dict[str, Any]:
         """
         Download all attachments for a Jira issue.
 
+        Attachments are downloaded in parallel. Files already present with the
+        expected size are skipped, and partially downloaded files are resumed.
+        Attachments sharing a file name are saved as ``{id}_{filename}`` so
+        each one gets its own file.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             target_dir: The directory where attachments should be saved
+            chunk_size: Number of bytes read from each response at a time
 
         Returns:
-            A dictionary with download results
+            A dictionary with download results and throughput metrics
         """
         # Convert to absolute path if relative
         if not os.path.isabs(target_dir):
@@ -105,7 +223,6 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
         # Process attachments
         attachments = []
-        results = []
 
         # Extract attachments from the API response
         attachment_data = issue_data.get("fields", {}).get("attachment", [])
@@ -123,10 +240,11 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             if isinstance(attachment, dict):
                 attachments.append(JiraAttachment.from_api_response(attachment))
 
-        # Download each attachment
         downloaded = []
+        skipped = []
         failed = []
 
+        downloadable = []
         for attachment in attachments:
             if not attachment.url:
                 logger.warning(f"No URL for attachment {attachment.filename}")
@@ -134,33 +252,70 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
                     {"filename": attachment.filename, "error": "No URL available"}
                 )
                 continue
-
-            # Create a safe filename
-            safe_filename = Path(attachment.filename).name
-            file_path = target_path / safe_filename
-
-            # Download the attachment
-            success = self.download_attachment(attachment.url, str(file_path))
-
-            if success:
-                downloaded.append(
+            downloadable.append(attachment)
+
+        # Create safe filenames that are unique within the issue
+        names = [Path(attachment.filename).name for attachment in downloadable]
+        name_counts = Counter(names)
+        downloads = [
+            (
+                attachment,
+                target_path
+                / (f"{attachment.id}_{name}" if name_counts[name] > 1 else name),
+            )
+            for attachment, name in zip(downloadable, names, strict=True)
+        ]
+
+        def _download(download: tuple[JiraAttachment, Path]) -> dict[str, Any]:
+            attachment, file_path = download
+            return self._download_attachment_file(
+                attachment.url,
+                str(file_path),
+                expected_size=attachment.size or None,
+                created=attachment.created or None,
+                chunk_size=chunk_size,
+            )
+
+        started = time.monotonic()
+        total_bytes = 0
+        for outcome in map_concurrently(
+            _download, downloads, max_workers=self.config.max_concurrency
+        ):
+            attachment, file_path = outcome.item
+            result = outcome.value or {"success": False, "error": str(outcome.error)}
+            if not result["success"]:
+                failed.append(
                     {
                         "filename": attachment.filename,
-                        "path": str(file_path),
-                        "size": attachment.size,
+                        "error": result.get("error") or "Download failed",
                     }
                 )
-            else:
-                failed.append(
-                    {"filename": attachment.filename, "error": "Download failed"}
-                )
+                continue
+            entry = {
+                "filename": attachment.filename,
+                "path": str(file_path),
+                "size": attachment.size,
+            }
+            if result["status"] == "skipped":
+                skipped.append(entry)
+                continue
+            entry["status"] = result["status"]
+            downloaded.append(entry)
+            total_bytes += result["bytes"]
+        elapsed = time.monotonic() - started
 
         return {
             "success": True,
             "issue_key": issue_key,
             "total": len(attachments),
             "downloaded": downloaded,
+            "skipped": skipped,
             "failed": failed,
+            "metrics": {
+                "bytes_downloaded": total_bytes,
+                "elapsed_seconds": round(elapsed, 3),
+                "bytes_per_second": round(total_bytes / elapsed) if elapsed else 0,
+            },
         }
 
     def upload_attachment(self, issue_key: str, file_path: str) -> dict[str, Any]:
@@ -196,10 +351,9 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
             # Use the Jira API to upload the file
             filename = os.path.basename(file_path)
-            with open(file_path, "rb") as file:
-                attachment = self.jira.add_attachment(
-                    issue_key=issue_key, filename=file_path
-                )
+            attachment = self.jira.add_attachment(
+                issue_key=issue_key, filename=file_path
+            )
 
             if attachment:
                 file_size = os.path.getsize(file_path)
@@ -233,6 +387,10 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
         """
         Upload multiple attachments to a Jira issue.
 
+        Files are uploaded concurrently (bounded by ``max_concurrency``), each
+        as its own streamed request so one failure doesn't fail the others.
+        Results are reported in input order.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             file_paths: List of paths to files to upload
@@ -250,12 +408,18 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
         logger.info(f"Uploading {len(file_paths)} attachments to issue {issue_key}")
 
-        # Upload each attachment
+        results = map_concurrently(
+            lambda file_path: self.upload_attachment(issue_key, file_path),
+            file_paths,
+            max_workers=self.config.max_concurrency,
+        )
+
         uploaded = []
         failed = []
 
-        for file_path in file_paths:
-            result = self.upload_attachment(issue_key, file_path)
+        for outcome in results:
+            file_path = outcome.item
+            result = outcome.value if outcome.ok else {"error": str(outcome.error)}
 
             if result.get("success"):
                 uploaded.append(
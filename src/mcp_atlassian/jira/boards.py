@@ -1,15 +1,93 @@
 """Module for Jira boards operations."""
 
 import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
 import requests
 
 from ..models.jira import JiraBoard
+from ..utils.concurrency import map_concurrently
+from .cache import SiteCache, user_key
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+# The Agile API returns at most 50 boards per page
+BOARD_PAGE_SIZE = 50
+# Directories older than this are served while a background refresh runs
+BOARD_DIRECTORY_REFRESH_SECONDS = 300
+
+# Board visibility depends on the caller, so directories are kept per user
+_board_directory_cache: SiteCache["BoardDirectory"] = SiteCache(
+    "board_directory", maxsize=256, ttl=3600
+)
+# Boards of one project, as Jira's projectKeyOrId query returns them, per user
+_project_boards_cache: SiteCache[list[dict[str, Any]]] = SiteCache(
+    "project_boards", maxsize=1024, ttl=BOARD_DIRECTORY_REFRESH_SECONDS
+)
+_refreshing: set[Hashable] = set()
+_refreshing_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class BoardDirectory:
+    """
+    Every board visible to a user, indexed for constant-time lookups.
+
+    Boards are indexed by id, lower-cased name and type. The board list API
+    does not report filter ids, so the filter index is filled in as filter
+    lookups are resolved. Boards are not indexed by project: a board belongs
+    to every project its filter covers, not just its location, so project
+    lookups are left to Jira (see BoardsMixin.get_project_boards).
+    """
+
+    boards: list[dict[str, Any]]
+    loaded_at: float = field(default_factory=time.time)
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    by_name: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    by_type: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    by_filter_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        by_name = defaultdict(list)
+        by_type = defaultdict(list)
+        for board in self.boards:
+            self.by_id[str(board.get("id"))] = board
+            by_name[str(board.get("name", "")).lower()].append(board)
+            by_type[str(board.get("type", "")).lower()].append(board)
+            filter_id = (board.get("filter") or {}).get("id")
+            if filter_id is not None:
+                self.by_filter_id[str(filter_id)] = board
+        self.by_name = dict(by_name)
+        self.by_type = dict(by_type)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the directory was loaded."""
+        return time.time() - self.loaded_at
+
+    def find(
+        self, board_name: str | None = None, board_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Find boards matching all of the given criteria.
+
+        Args:
+            board_name: Case-insensitive substring of the board name
+            board_type: Board type (e.g., scrum, kanban)
+
+        Returns:
+            Matching boards in directory order
+        """
+        if board_type and not board_name:
+            return self.by_type.get(board_type.lower(), [])
+        return _filter_boards(self.boards, board_name, board_type)
+
 
 class BoardsMixin(JiraClient):
     """Mixin for Jira boards operations."""
@@ -25,6 +103,10 @@ class BoardsMixin(JiraClient):
         """
         Get boards from Jira by name, project key, or type.
 
+        Project lookups use Jira's own project query, cached per project, so
+        boards whose filter spans the project are included. Other lookups are
+        answered from the cached board directory.
+
         Args:
             board_name: The name of board, support fuzzy search
             project_key: Project key (e.g., PROJECT-123)
@@ -39,14 +121,15 @@ class BoardsMixin(JiraClient):
             Exception: If there is an error retrieving the boards
         """
         try:
-            boards = self.jira.get_all_agile_boards(
-                board_name=board_name,
-                project_key=project_key,
-                board_type=board_type,
-                start=start,
-                limit=limit,
-            )
-            return boards.get("values", []) if isinstance(boards, dict) else []
+            if project_key:
+                boards = _filter_boards(
+                    self.get_project_boards(project_key), board_name, board_type
+                )
+            else:
+                boards = self.get_board_directory().find(
+                    board_name=board_name, board_type=board_type
+                )
+            return boards[start : start + limit]
         except requests.HTTPError as e:
             logger.error(f"Error getting all agile boards: {str(e.response.content)}")
             return []
@@ -86,3 +169,181 @@ class BoardsMixin(JiraClient):
             limit=limit,
         )
         return [JiraBoard.from_api_response(board) for board in boards]
+
+    def get_board_directory(self, *, refresh: bool = False) -> BoardDirectory:
+        """
+        Get the directory of every board visible to the current user.
+
+        The directory is cached per site and user. Once it is older than
+        BOARD_DIRECTORY_REFRESH_SECONDS, the cached copy is still returned and
+        a background thread reloads it.
+
+        Args:
+            refresh: Reload the directory now instead of using the cache
+
+        Returns:
+            The board directory
+        """
+        key = user_key(self.config)
+        directory = None if refresh else _board_directory_cache.get(key)
+        if directory is None:
+            directory = self._load_board_directory()
+            _board_directory_cache.set(key, directory)
+        elif directory.age > BOARD_DIRECTORY_REFRESH_SECONDS:
+            self._refresh_board_directory_in_background(key)
+        return directory
+
+    def get_project_boards(
+        self, project_key: str, *, refresh: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Get every board visible to the current user that shows a project.
+
+        Jira matches boards located in the project as well as boards whose
+        filter covers it. Results are cached per site, user and project.
+
+        Args:
+            project_key: Project key or id
+            refresh: Reload the boards now instead of using the cache
+
+        Returns:
+            The project's boards in Jira's order
+        """
+        key = (*user_key(self.config), project_key.strip().upper())
+        if refresh:
+            _project_boards_cache.invalidate(key)
+        return _project_boards_cache.get_or_load(
+            key, lambda: self._load_boards(project_key.strip())
+        )
+
+    def get_board_by_id(self, board_id: str | int) -> dict[str, Any] | None:
+        """
+        Get a board from the board directory by id.
+
+        Args:
+            board_id: The board id
+
+        Returns:
+            The board, or None if the user cannot see it
+        """
+        return self.get_board_directory().by_id.get(str(board_id))
+
+    def get_board_by_name(self, board_name: str) -> dict[str, Any] | None:
+        """
+        Get a board from the board directory by its exact name.
+
+        Args:
+            board_name: The board name, matched case-insensitively
+
+        Returns:
+            The first board with that name, or None if there is none
+        """
+        boards = self.get_board_directory().by_name.get(board_name.lower())
+        return boards[0] if boards else None
+
+    def get_board_by_filter_id(self, filter_id: str | int) -> dict[str, Any] | None:
+        """
+        Get the board built on a saved filter.
+
+        The board list does not include filter ids, so the first lookup of each
+        filter asks Jira and the answer is kept in the board directory.
+
+        Args:
+            filter_id: The saved filter id
+
+        Returns:
+            The board, or None if no visible board uses the filter
+        """
+        directory = self.get_board_directory()
+        board = directory.by_filter_id.get(str(filter_id))
+        if board is not None:
+            return board
+        try:
+            response = self.jira.get_all_agile_boards(
+                filter_id=filter_id, max_results=1
+            )
+        except requests.HTTPError as e:
+            logger.error(f"Error getting board for filter {filter_id}: {e}")
+            return None
+        values = response.get("values", []) if isinstance(response, dict) else []
+        if not values:
+            return None
+        board = directory.by_id.get(str(values[0].get("id")), values[0])
+        directory.by_filter_id[str(filter_id)] = board
+        return board
+
+    def _load_board_directory(self) -> BoardDirectory:
+        """Fetch every visible board into a new directory."""
+        boards = self._load_boards()
+        logger.debug(f"Loaded board directory with {len(boards)} boards")
+        return BoardDirectory(boards)
+
+    def _load_boards(self, project_key: str | None = None) -> list[dict[str, Any]]:
+        """Fetch every visible board, requesting pages after the first in parallel."""
+        first_page = self._get_board_page(0, project_key)
+        boards: list[dict[str, Any]] = list(first_page.get("values", []))
+        # The server may cap the page size below what was requested
+        page_size = len(boards)
+        if not page_size or first_page.get("isLast", True):
+            return boards
+
+        total = first_page.get("total")
+        if isinstance(total, int):
+            for outcome in map_concurrently(
+                lambda start_at: self._get_board_page(start_at, project_key),
+                range(page_size, total, page_size),
+                max_workers=self.config.max_concurrency,
+            ):
+                if not outcome.ok:
+                    raise outcome.error  # type: ignore[misc]
+                boards.extend((outcome.value or {}).get("values", []))
+        else:
+            page = first_page
+            while not page.get("isLast", True) and page.get("values"):
+                page = self._get_board_page(len(boards), project_key)
+                boards.extend(page.get("values", []))
+        return boards
+
+    def _get_board_page(
+        self, start_at: int, project_key: str | None = None
+    ) -> dict[str, Any]:
+        page = self.jira.get_all_agile_boards(
+            project_key=project_key, start_at=start_at, max_results=BOARD_PAGE_SIZE
+        )
+        return page if isinstance(page, dict) else {}
+
+    def _refresh_board_directory_in_background(self, key: Hashable) -> None:
+        """Reload a stale directory in a daemon thread, once per key at a time."""
+        with _refreshing_lock:
+            if key in _refreshing:
+                return
+            _refreshing.add(key)
+
+        def _refresh() -> None:
+            try:
+                _board_directory_cache.set(key, self._load_board_directory())
+            except Exception as e:  # noqa: BLE001 - stale directory stays usable
+                logger.warning(f"Background board directory refresh failed: {e}")
+            finally:
+                with _refreshing_lock:
+                    _refreshing.discard(key)
+
+        threading.Thread(
+            target=_refresh, name="board-directory-refresh", daemon=True
+        ).start()
+
+
+def _filter_boards(
+    boards: Iterable[dict[str, Any]],
+    board_name: str | None = None,
+    board_type: str | None = None,
+) -> list[dict[str, Any]]:
+    """Keep the boards whose name contains board_name and whose type matches."""
+    name = board_name.lower() if board_name else None
+    kind = board_type.lower() if board_type else None
+    return [
+        board
+        for board in boards
+        if (kind is None or str(board.get("type", "")).lower() == kind)
+        and (name is None or name in str(board.get("name", "")).lower())
+    ]
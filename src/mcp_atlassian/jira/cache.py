@@ -0,0 +1,142 @@
+"""Site-level caches shared across Jira fetcher instances.
+
+A new ``JiraFetcher`` is created for every request (and for every user in
+multi-user mode), so metadata that is identical for all callers of a Jira
+site is kept here, keyed by site, instead of on the fetcher instance.
+"""
+
+import hashlib
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+from cachetools import TTLCache
+
+from .config import JiraConfig
+
+logger = logging.getLogger("mcp-jira")
+
+V = TypeVar("V")
+
+_registry: list["SiteCache"] = []
+_registry_lock = threading.Lock()
+
+
+class SiteCache(Generic[V]):
+    """Thread-safe TTL cache for per-site Jira metadata."""
+
+    def __init__(self, name: str, maxsize: int = 64, ttl: float = 3600) -> None:
+        """
+        Initialize the cache and register it for global invalidation.
+
+        Args:
+            name: Cache name used in log messages
+            maxsize: Maximum number of entries to keep
+            ttl: Time-to-live of an entry in seconds
+        """
+        self.name = name
+        self._cache: TTLCache[Hashable, V] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.RLock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the cached value for a key, or None when missing or expired."""
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value for a key."""
+        with self._lock:
+            self._cache[key] = value
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V]) -> V:
+        """
+        Return the cached value for a key, loading and storing it when missing.
+
+        Args:
+            key: Cache key
+            loader: Callable producing the value on a cache miss
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        value = loader()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Drop one entry, or every entry when no key is given.
+
+        Args:
+            key: Cache key to drop (None clears the whole cache)
+        """
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+        logger.debug(f"Invalidated {self.name} cache entry: {key or '*'}")
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._cache
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+def site_key(config: JiraConfig) -> str:
+    """
+    Build the cache key identifying the Jira site behind a configuration.
+
+    Args:
+        config: The Jira configuration
+
+    Returns:
+        The OAuth cloud ID for OAuth cloud sites, otherwise the normalized base URL
+    """
+    oauth_config = getattr(config, "oauth_config", None)
+    if getattr(config, "auth_type", None) == "oauth" and oauth_config:
+        cloud_id = getattr(oauth_config, "cloud_id", None)
+        if cloud_id:
+            return f"cloud:{cloud_id}"
+    return str(getattr(config, "url", None) or "").rstrip("/").lower()
+
+
+def user_key(config: JiraConfig) -> tuple[str, str]:
+    """
+    Build the cache key identifying the caller of a Jira site.
+
+    Use this instead of ``site_key`` for data filtered by the caller's
+    permissions, such as the boards or projects they can browse.
+
+    Args:
+        config: The Jira configuration
+
+    Returns:
+        The site key and a digest of the configured user name or token
+    """
+    oauth_config = getattr(config, "oauth_config", None)
+    identity = (
+        getattr(config, "username", None)
+        or getattr(config, "personal_token", None)
+        or getattr(oauth_config, "access_token", None)
+        or ""
+    )
+    digest = hashlib.sha256(str(identity).encode()).hexdigest()[:16]
+    return site_key(config), digest
+
+
+def clear_site_caches() -> None:
+    """Drop every entry from every registered site cache."""
+    with _registry_lock:
+        caches = list(_registry)
+    for cache in caches:
+        cache.invalidate()
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from collections.abc import Iterator
 from typing import Any, Literal
 
 from requests import Session
@@ -246,6 +247,35 @@ class JiraClient:
         Returns:
             List of requested json data
 
+        Raises:
+            ValueError: If using paged request on non-cloud Jira
+        """
+        return list(self.iter_paged(method, url, params_or_json, absolute=absolute))
+
+    def iter_paged(
+        self,
+        method: Literal["get", "post"],
+        url: str,
+        params_or_json: dict | None = None,
+        *,
+        absolute: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Lazily fetch paged data from Jira API using `nextPageToken` to paginate.
+
+        Each page is yielded as soon as it arrives and the next page is only
+        requested once the caller asks for it, so pages need not be held in
+        memory together.
+
+        Args:
+            method: The HTTP method to use
+            url: The URL to retrieve data from
+            params_or_json: Optional query parameters or JSON data to send
+            absolute: Whether to use absolute URL
+
+        Yields:
+            The json data of each page
+
         Raises:
             ValueError: If using paged request on non-cloud Jira
         """
@@ -255,8 +285,7 @@ class JiraClient:
                 "Paged requests are only available for Jira Cloud platform"
             )
 
-        all_results: list[dict] = []
-        current_data = params_or_json or {}
+        current_data = dict(params_or_json or {})
 
         while True:
             if method == "get":
@@ -273,8 +302,7 @@ class JiraClient:
                 logger.error(error_message)
                 raise ValueError(error_message)
 
-            # Extract values from response
-            all_results.append(api_result)
+            yield api_result
 
             # Check if this is the last page
             if "nextPageToken" not in api_result:
@@ -283,8 +311,6 @@ class JiraClient:
             # Update for next iteration
             current_data["nextPageToken"] = api_result["nextPageToken"]
 
-        return all_results
-
     def create_version(
         self,
         project: str,
@@ -1,6 +1,8 @@
 """Module for Jira comment operations."""
 
 import logging
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any
 
 from ..preprocessing.jira import JiraPreprocessor
@@ -9,6 +11,9 @@ from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+# Comments requested per page when walking an issue's comment thread
+COMMENT_PAGE_SIZE = 100
+
 
 class CommentsMixin(JiraClient):
     """Mixin for Jira comment operations."""
@@ -33,7 +38,9 @@ class CommentsMixin(JiraClient):
         self, issue_key: str, limit: int = 50
     ) -> list[dict[str, Any]]:
         """
-        Get comments for a specific issue.
+        Get the most recent comments for a specific issue.
+
+        Only the requested window is fetched and converted, newest first.
 
         Args:
             issue_key: The issue key (e.g. 'PROJ-123')
@@ -46,34 +53,78 @@ class CommentsMixin(JiraClient):
             Exception: If there is an error getting comments
         """
         try:
-            comments = self.jira.issue_get_comments(issue_key)
-
-            if not isinstance(comments, dict):
-                msg = (
-                    "Unexpected return value type from "
-                    f"`jira.issue_get_comments`: {type(comments)}"
-                )
-                logger.error(msg)
-                raise TypeError(msg)
-
-            processed_comments = []
-            for comment in comments.get("comments", [])[:limit]:
-                processed_comment = {
+            comments = islice(
+                self.iter_issue_comments(
+                    issue_key, page_size=max(1, min(limit, COMMENT_PAGE_SIZE))
+                ),
+                max(limit, 0),
+            )
+            return [
+                {
                     "id": comment.get("id"),
                     "body": self._clean_text(comment.get("body", "")),
                     "created": str(parse_date(comment.get("created"))),
                     "updated": str(parse_date(comment.get("updated"))),
                     "author": comment.get("author", {}).get("displayName", "Unknown"),
                 }
-                processed_comments.append(processed_comment)
-
-            return processed_comments
+                for comment in comments
+            ]
         except Exception as e:
             error_msg = f"Error getting comments for issue {issue_key}: {str(e)}"
             logger.error(error_msg)
             raise_msg = f"Error getting comments: {str(e)}"
             raise Exception(raise_msg) from e
 
+    def iter_issue_comments(
+        self,
+        issue_key: str,
+        order_by: str = "-created",
+        page_size: int = COMMENT_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily iterate over an issue's raw comments, one page at a time.
+
+        The next page is only requested once the previous one has been
+        consumed, so stopping early avoids transferring older comments.
+
+        Args:
+            issue_key: The issue key (e.g. 'PROJ-123')
+            order_by: Sort order passed to Jira; newest first by default
+            page_size: Comments requested per page
+
+        Yields:
+            Comment data dictionaries as returned by the API
+
+        Raises:
+            TypeError: If the API returns something other than a dictionary
+        """
+        start_at = 0
+        while True:
+            page = self.jira.issue_get_comments(
+                issue_key, start_at=start_at, max_results=page_size, order_by=order_by
+            )
+            if not isinstance(page, dict):
+                msg = (
+                    "Unexpected return value type from "
+                    f"`jira.issue_get_comments`: {type(page)}"
+                )
+                logger.error(msg)
+                raise TypeError(msg)
+
+            comments = page.get("comments", [])
+            yield from comments
+
+            start_at += len(comments)
+            total = page.get("total")
+            if not comments:
+                return
+            if isinstance(total, int):
+                # The server may cap the page size, so trust the total
+                if start_at >= total:
+                    return
+            elif len(comments) < page_size:
+                return
+
     def add_comment(self, issue_key: str, comment: str) -> dict[str, Any]:
         """
         Add a comment to an issue.
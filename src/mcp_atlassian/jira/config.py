@@ -5,7 +5,8 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
-from ..utils.env import get_custom_headers, is_env_ssl_verify
+from ..utils.concurrency import DEFAULT_MAX_WORKERS
+from ..utils.env import get_custom_headers, get_key_value_pairs, is_env_ssl_verify
 from ..utils.oauth import (
     BYOAccessTokenOAuthConfig,
     OAuthConfig,
@@ -36,6 +37,9 @@ class JiraConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    # Explicit epic field IDs (epic_name, epic_link, epic_color, ...), skips discovery
+    epic_field_overrides: dict[str, str] | None = None
+    max_concurrency: int = DEFAULT_MAX_WORKERS  # Parallel requests for bulk operations
 
     # ADF and formatting configuration
     enable_adf: bool | None = (
@@ -153,6 +157,17 @@ class JiraConfig:
         # Custom headers - service-specific only
         custom_headers = get_custom_headers("JIRA_CUSTOM_HEADERS")
 
+        # Epic field overrides, e.g. "epic_name=customfield_10011,epic_link=parent"
+        epic_field_overrides = get_key_value_pairs("JIRA_EPIC_FIELDS") or None
+
+        # Upper bound on parallel requests issued by bulk operations
+        try:
+            max_concurrency = max(
+                1, int(os.getenv("JIRA_MAX_CONCURRENCY", str(DEFAULT_MAX_WORKERS)))
+            )
+        except ValueError:
+            max_concurrency = DEFAULT_MAX_WORKERS
+
         # ADF and formatting configuration from environment
         enable_adf = None
         if os.getenv("ATLASSIAN_ENABLE_ADF"):
@@ -206,6 +221,8 @@ class JiraConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            epic_field_overrides=epic_field_overrides,
+            max_concurrency=max_concurrency,
             enable_adf=enable_adf,
             force_wiki_markup=force_wiki_markup,
             deployment_type_override=deployment_type_override,
@@ -333,8 +333,30 @@ class EpicsMixin(
             # Get the dynamic field IDs for this Jira instance
             field_ids = self.get_field_ids_to_epic()
 
+            # Reuse the linking field that already worked on this site
+            epic_map = self._get_cached_epic_field_map()
+            known_link_field = epic_map.link_field if epic_map else None
+            if known_link_field:
+                try:
+                    known_fields: dict[str, Any] = (
+                        {"parent": {"key": epic_key}}
+                        if known_link_field == "parent"
+                        else {known_link_field: epic_key}
+                    )
+                    self.jira.update_issue(
+                        issue_key=issue_key, update={"fields": known_fields}
+                    )
+                    logger.info(
+                        f"Successfully linked {issue_key} to {epic_key} using cached field: {known_link_field}"
+                    )
+                    return self.get_issue(issue_key)
+                except Exception as e:
+                    logger.info(
+                        f"Couldn't link using cached field {known_link_field}: {str(e)}. Trying other methods..."
+                    )
+
             # Try the parent field first (if discovered or natively supported)
-            if "parent" in field_ids or "parent" not in field_ids:
+            if known_link_field != "parent":
                 try:
                     fields = {"parent": {"key": epic_key}}
                     self.jira.update_issue(
@@ -343,6 +365,7 @@ class EpicsMixin(
                     logger.info(
                         f"Successfully linked {issue_key} to {epic_key} using parent field"
                     )
+                    self._remember_epic_link_field("parent")
                     return self.get_issue(issue_key)
                 except Exception as e:
                     logger.info(
@@ -361,6 +384,7 @@ class EpicsMixin(
                     logger.info(
                         f"Successfully linked {issue_key} to {epic_key} using discovered epic_link field: {field_ids['epic_link']}"
                     )
+                    self._remember_epic_link_field(field_ids["epic_link"])
                     return self.get_issue(issue_key)
                 except Exception as e:
                     logger.info(
@@ -386,10 +410,8 @@ class EpicsMixin(
                         f"Successfully linked {issue_key} to {epic_key} using field: {field_id}"
                     )
 
-                    # If we get here, it worked - update our cached field ID
-                    if self._field_ids_cache is None:
-                        self._field_ids_cache = []
-                    self._field_ids_cache.append({"id": field_id, "name": "epic_link"})
+                    # If we get here, it worked - remember the field for this site
+                    self._remember_epic_link_field(field_id)
                     return self.get_issue(issue_key)
                 except Exception as e:
                     logger.info(f"Couldn't link using fields {fields}: {str(e)}")
@@ -624,11 +646,7 @@ class EpicsMixin(
                                 f"Successfully found {len(issues)} issues for epic {epic_key} using field ID {field_id}"
                             )
                             # Cache this successful field ID for future use
-                            if self._field_ids_cache is None:
-                                self._field_ids_cache = []
-                            self._field_ids_cache.append(
-                                {"id": field_id, "name": "epic_link"}
-                            )
+                            self._remember_epic_link_field(field_id)
                             return issues
                     except Exception:
                         # Just try the next field ID
@@ -710,7 +728,26 @@ class EpicsMixin(
                 )
                 return field_ids[name]
 
-        # If we still can't find it, try to detect it from issue links
+        # The remaining strategies search the instance; run them once per site
+        epic_map = self._get_cached_epic_field_map()
+        if epic_map is not None and epic_map.link_field_probed:
+            if epic_map.link_field and epic_map.link_field != "parent":
+                return epic_map.link_field
+            logger.debug("Epic Link field already probed for this site, skipping")
+            return None
+
+        field_id = self._probe_epic_link_field()
+        self._remember_epic_link_field(field_id, probed=True)
+        return field_id
+
+    def _probe_epic_link_field(self) -> str | None:
+        """
+        Detect the Epic Link field by inspecting sample epics and field schemas.
+
+        Returns:
+            The field ID for Epic Link if found, None otherwise
+        """
+        # Try to detect it from issue links
         try:
             # Try to find an existing epic
             epics = self._find_sample_epic()
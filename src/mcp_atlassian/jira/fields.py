@@ -1,16 +1,37 @@
 """Module for Jira field operations."""
 
+import dataclasses
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 from thefuzz import fuzz
 
+from .cache import SiteCache, site_key
 from .client import JiraClient
 from .protocols import EpicOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
 
+@dataclass
+class EpicFieldMap:
+    """Epic-related field IDs discovered for a Jira site."""
+
+    field_ids: dict[str, str] = dataclasses.field(default_factory=dict)
+    # Field that successfully linked an issue to an epic ("parent" or a custom field)
+    link_field: str | None = None
+    # Whether the expensive sample-epic probe for the Epic Link field already ran
+    link_field_probed: bool = False
+
+
+# Epic field discovery is identical for every fetcher on a site, so it is
+# computed once per site and reused until invalidated or expired.
+_epic_field_cache: SiteCache[EpicFieldMap] = SiteCache(
+    "epic_fields", maxsize=64, ttl=24 * 3600
+)
+
+
 class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
     """Mixin for Jira field operations.
 
@@ -40,6 +61,7 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 self._field_name_to_id_map = (
                     None  # Clear name map cache if refreshing fields
                 )
+                self.invalidate_epic_field_cache()
 
             # Fetch fields from Jira API
             fields = self.jira.get_all_fields()
@@ -265,6 +287,65 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             return {}
 
     def get_field_ids_to_epic(self) -> dict[str, str]:
+        """
+        Get Jira field IDs relevant to Epic linking.
+
+        Discovery results are cached per site, so only the first fetcher for a
+        site pays for field scanning and sample-epic searches. Explicit
+        overrides from the configuration take precedence over discovery.
+
+        Returns:
+            Dictionary mapping field names to their IDs
+            (e.g., {'epic_link': 'customfield_10014', 'epic_name': 'customfield_10011'})
+        """
+        cached = self._get_cached_epic_field_map()
+        if cached is not None:
+            return dict(cached.field_ids)
+
+        field_ids = self._discover_field_ids_to_epic()
+        if field_ids:
+            epic_map = EpicFieldMap(field_ids=dict(field_ids))
+            link_override = self._get_epic_field_overrides().get("epic_link")
+            if link_override:
+                epic_map.link_field = link_override
+                epic_map.link_field_probed = True
+            _epic_field_cache.set(site_key(self.config), epic_map)
+        return field_ids
+
+    def invalidate_epic_field_cache(self) -> None:
+        """Drop the cached epic field map for this site, forcing rediscovery."""
+        _epic_field_cache.invalidate(site_key(self.config))
+
+    def _get_cached_epic_field_map(self) -> EpicFieldMap | None:
+        """Return the cached epic field map for this site, if any."""
+        return _epic_field_cache.get(site_key(self.config))
+
+    def _remember_epic_link_field(
+        self, field_id: str | None, *, probed: bool = False
+    ) -> None:
+        """
+        Record the field that links issues to epics on this site.
+
+        Args:
+            field_id: "parent" or the Epic Link custom field ID (None if unknown)
+            probed: Whether this is the outcome of the sample-epic probe
+        """
+        epic_map = self._get_cached_epic_field_map()
+        if epic_map is None:
+            # Nothing discovered yet; the next discovery will find it anyway
+            return
+        if field_id:
+            epic_map.link_field = field_id
+            if field_id != "parent":
+                epic_map.field_ids.setdefault("epic_link", field_id)
+        if probed:
+            epic_map.link_field_probed = True
+
+    def _get_epic_field_overrides(self) -> dict[str, str]:
+        """Return configured epic field overrides (empty if none)."""
+        return dict(getattr(self.config, "epic_field_overrides", None) or {})
+
+    def _discover_field_ids_to_epic(self) -> dict[str, str]:
         """
         Dynamically discover Jira field IDs relevant to Epic linking.
         This method queries the Jira API to find the correct custom field IDs
@@ -272,7 +353,6 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
 
         Returns:
             Dictionary mapping field names to their IDs
-            (e.g., {'epic_link': 'customfield_10014', 'epic_name': 'customfield_10011'})
         """
         try:
             # Ensure field list and map are cached/generated
@@ -378,8 +458,16 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                         f"Found potential Epic-related field: {field_id} ({original_name})"
                     )
 
+            # Explicit overrides win over anything discovered by name or schema
+            overrides = self._get_epic_field_overrides()
+            for key, field_id in overrides.items():
+                if key == "epic_link" and field_id == "parent":
+                    continue
+                field_ids[key] = field_id
+
             # If we couldn't find certain key fields, try alternative approaches
-            if "epic_name" not in field_ids or "epic_link" not in field_ids:
+            missing = {"epic_name", "epic_link"} - field_ids.keys() - overrides.keys()
+            if missing:
                 logger.debug(
                     "Standard field search didn't find all Epic fields, trying alternative approaches"
                 )
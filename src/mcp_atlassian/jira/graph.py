@@ -0,0 +1,294 @@
+"""Module for traversing the Jira issue dependency graph."""
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
+
+from ..models.jira import JiraIssue
+from .client import JiraClient
+
+logger = logging.getLogger("mcp-jira")
+
+GraphDirection = Literal["outward", "inward", "both"]
+
+MAX_GRAPH_DEPTH = 10
+MAX_GRAPH_ISSUES = 1000
+
+# Relation names used for the issue hierarchy in the adjacency list
+SUBTASK_RELATION = "has subtask"
+
+_GRAPH_FIELDS = "summary,status,issuetype,issuelinks,subtasks,parent"
+
+
+class GraphMixin(JiraClient):
+    """Mixin for Jira issue dependency graph traversal."""
+
+    def get_issue_graph(
+        self,
+        issue_keys: list[str],
+        link_types: list[str] | None = None,
+        direction: GraphDirection = "both",
+        max_depth: int = 3,
+        max_issues: int = 200,
+        *,
+        include_hierarchy: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Walk issue links, subtasks and parents breadth-first from some issues.
+
+        Each level of the walk is fetched with batched, concurrent JQL key
+        lookups, so the number of requests grows with the depth of the graph
+        rather than with the number of issues. Issues are visited once, which
+        makes the walk safe on cyclic link graphs.
+
+        Edges always point in the link's own direction: an issue that blocks
+        another has a ``blocks`` edge to it, and a parent has a ``has subtask``
+        edge to each subtask, whichever way the walk went.
+
+        Args:
+            issue_keys: Keys of the issues to start from
+            link_types: Only follow these link types, given by name or by
+                inward/outward description (None follows every type)
+            direction: 'outward' follows links away from each issue (e.g.
+                'blocks') and down to subtasks, 'inward' follows them backwards
+                (e.g. 'is blocked by') and up to parents, 'both' does both
+            max_depth: Maximum number of hops from the starting issues
+            max_issues: Maximum number of issues in the graph
+            include_hierarchy: Whether subtask and parent relations are followed
+
+        Returns:
+            Dictionary with ``roots``, per-issue ``issues`` details (summary,
+            status, type and depth), an ``adjacency`` list mapping each issue
+            to its related issues by relation, ``cycles`` listing issues on a
+            directed cycle, ``missing`` roots and whether the walk was
+            ``truncated`` by ``max_issues``
+
+        Raises:
+            ValueError: If the direction or limits are invalid
+            MCPAtlassianAuthenticationError: If the issue lookup is not authorized
+            MCPAtlassianError: If an issue lookup fails for any other reason
+                than an unknown key (e.g. rate limiting)
+        """
+        if direction not in ("outward", "inward", "both"):
+            msg = "Direction must be 'outward', 'inward' or 'both'"
+            raise ValueError(msg)
+        if not 0 <= max_depth <= MAX_GRAPH_DEPTH:
+            msg = f"max_depth must be between 0 and {MAX_GRAPH_DEPTH}"
+            raise ValueError(msg)
+        if not 1 <= max_issues <= MAX_GRAPH_ISSUES:
+            msg = f"max_issues must be between 1 and {MAX_GRAPH_ISSUES}"
+            raise ValueError(msg)
+
+        roots = list(dict.fromkeys(k.strip().upper() for k in issue_keys if k.strip()))
+        wanted_types = {t.casefold() for t in link_types or [] if t}
+        follow_outward = direction in ("outward", "both")
+        follow_inward = direction in ("inward", "both")
+
+        issues: dict[str, dict[str, Any]] = {}
+        depths: dict[str, int] = dict.fromkeys(roots[:max_issues], 0)
+        edges: set[tuple[str, str, str]] = set()
+        missing: list[str] = []
+        truncated = len(roots) > max_issues
+
+        frontier = list(depths)
+        depth = 0
+        while frontier:
+            fetched = self._fetch_raw_issues_by_keys(  # type: ignore[attr-defined]
+                frontier, fields=_GRAPH_FIELDS
+            )
+            next_frontier: list[str] = []
+            for key in frontier:
+                raw = fetched.get(key)
+                if raw is None:
+                    if depth == 0:
+                        missing.append(key)
+                    continue
+                fields = raw.get("fields") or {}
+                issues[key] = _describe_issue(fields)
+                if depth >= max_depth:
+                    continue
+
+                for neighbor, source, relation, target, forward in _relations(
+                    key, fields, include_hierarchy=include_hierarchy
+                ):
+                    if wanted_types and relation.type_names.isdisjoint(wanted_types):
+                        continue
+                    if not (follow_outward if forward else follow_inward):
+                        continue
+                    if neighbor.key not in depths:
+                        if len(depths) >= max_issues:
+                            truncated = True
+                            continue
+                        depths[neighbor.key] = depth + 1
+                        issues.setdefault(neighbor.key, neighbor.details)
+                        next_frontier.append(neighbor.key)
+                    edges.add((source, relation.label, target))
+
+            depth += 1
+            # Issues at the depth limit are not expanded, so the details taken
+            # from their links are enough and they need no request of their own
+            frontier = next_frontier if depth < max_depth else []
+
+        adjacency: dict[str, dict[str, list[str]]] = defaultdict(dict)
+        for source, label, target in sorted(edges):
+            adjacency[source].setdefault(label, []).append(target)
+
+        for key, issue in issues.items():
+            issue["depth"] = depths.get(key, 0)
+
+        logger.debug(
+            f"Issue graph from {roots}: {len(issues)} issues, {len(edges)} edges"
+        )
+        return {
+            "roots": roots,
+            "issue_count": len(issues),
+            "edge_count": len(edges),
+            "truncated": truncated,
+            "missing": missing,
+            "issues": issues,
+            "adjacency": dict(adjacency),
+            "cycles": _cycle_members(edges),
+        }
+
+
+class _Relation:
+    """How one related issue is connected, as seen from the walk."""
+
+    __slots__ = ("label", "type_names")
+
+    def __init__(self, label: str, type_names: Iterable[str]) -> None:
+        self.label = label
+        self.type_names = frozenset(name.casefold() for name in type_names if name)
+
+
+class _Neighbor:
+    """A related issue and what the link data says about it."""
+
+    __slots__ = ("details", "key")
+
+    def __init__(self, key: str, details: dict[str, Any]) -> None:
+        self.key = key
+        self.details = details
+
+
+def _relations(
+    key: str, fields: dict[str, Any], *, include_hierarchy: bool
+) -> Iterator[tuple[_Neighbor, str, _Relation, str, bool]]:
+    """
+    Yield the issues related to one issue.
+
+    Yields:
+        (neighbor, edge source, relation, edge target, whether the neighbor
+        lies in the outward direction) tuples
+    """
+    for link in JiraIssue._extract_issue_links(fields):
+        link_type = link.type
+        if link_type is None:
+            continue
+        relation = _Relation(
+            link_type.outward or link_type.name,
+            (link_type.name, link_type.inward, link_type.outward),
+        )
+        if link.outward_issue and link.outward_issue.key:
+            other = link.outward_issue
+            neighbor = _Neighbor(other.key.upper(), _describe_linked(other))
+            yield neighbor, key, relation, neighbor.key, True
+        elif link.inward_issue and link.inward_issue.key:
+            other = link.inward_issue
+            neighbor = _Neighbor(other.key.upper(), _describe_linked(other))
+            yield neighbor, neighbor.key, relation, key, False
+
+    if not include_hierarchy:
+        return
+    hierarchy = _Relation(SUBTASK_RELATION, (SUBTASK_RELATION, "subtask", "parent"))
+    for subtask in fields.get("subtasks") or []:
+        if isinstance(subtask, dict) and subtask.get("key"):
+            neighbor = _Neighbor(
+                str(subtask["key"]).upper(), _describe_issue(subtask.get("fields"))
+            )
+            yield neighbor, key, hierarchy, neighbor.key, True
+    parent = fields.get("parent")
+    if isinstance(parent, dict) and parent.get("key"):
+        neighbor = _Neighbor(
+            str(parent["key"]).upper(), _describe_issue(parent.get("fields"))
+        )
+        yield neighbor, neighbor.key, hierarchy, key, False
+
+
+def _describe_issue(fields: dict[str, Any] | None) -> dict[str, Any]:
+    """Summary, status and type from raw issue fields."""
+    fields = fields or {}
+    return {
+        "summary": fields.get("summary", ""),
+        "status": (fields.get("status") or {}).get("name"),
+        "type": (fields.get("issuetype") or {}).get("name"),
+    }
+
+
+def _describe_linked(issue: Any) -> dict[str, Any]:
+    """Summary, status and type from a JiraLinkedIssue model."""
+    fields = issue.fields
+    if fields is None:
+        return {"summary": "", "status": None, "type": None}
+    return {
+        "summary": fields.summary,
+        "status": fields.status.name if fields.status else None,
+        "type": fields.issuetype.name if fields.issuetype else None,
+    }
+
+
+def _cycle_members(edges: set[tuple[str, str, str]]) -> list[str]:
+    """
+    Find the issues that lie on a directed cycle.
+
+    An issue is on a cycle exactly when its strongly connected component has
+    more than one issue or it links to itself. Components are found with an
+    iterative version of Tarjan's algorithm, so deep link chains cannot hit
+    the recursion limit.
+    """
+    successors: defaultdict[str, set[str]] = defaultdict(set)
+    for source, _, target in edges:
+        successors[source].add(target)
+
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    members: list[str] = []
+
+    for start in sorted(successors):
+        if start in index:
+            continue
+        index[start] = lowlink[start] = len(index)
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(sorted(successors[start])))]
+        while work:
+            node, targets = work[-1]
+            for target in targets:
+                if target not in index:
+                    index[target] = lowlink[target] = len(index)
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(sorted(successors[target]))))
+                    break
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index[node]:
+                    continue
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in successors[node]:
+                    members.extend(component)
+    return sorted(members)
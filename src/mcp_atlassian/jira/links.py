@@ -7,10 +7,17 @@ from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraIssueLinkType
+from ..utils.concurrency import map_concurrently
+from .cache import SiteCache, site_key
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+# Link types are site configuration that rarely changes
+_link_types_cache: SiteCache[list[dict[str, Any]]] = SiteCache(
+    "issue_link_types", maxsize=64, ttl=3600
+)
+
 
 class LinksMixin(JiraClient):
     """Mixin for Jira issue link operations."""
@@ -19,6 +26,8 @@ class LinksMixin(JiraClient):
         """
         Get all available issue link types.
 
+        Link types are cached per site.
+
         Returns:
             List of JiraIssueLinkType objects
 
@@ -28,17 +37,9 @@ class LinksMixin(JiraClient):
             Exception: If there is an error retrieving issue link types
         """
         try:
-            link_types_response = self.jira.get("rest/api/2/issueLinkType")
-            if not isinstance(link_types_response, dict):
-                msg = f"Unexpected return value type from `jira.get`: {type(link_types_response)}"
-                logger.error(msg)
-                raise TypeError(msg)
-
-            link_types_data = link_types_response.get("issueLinkTypes", [])
-
             link_types = [
                 JiraIssueLinkType.from_api_response(link_type)
-                for link_type in link_types_data
+                for link_type in self._get_raw_link_types()
             ]
 
             return link_types
@@ -267,3 +268,224 @@ class LinksMixin(JiraClient):
             error_msg = str(e)
             logger.error(f"Error removing issue link: {error_msg}", exc_info=True)
             raise Exception(f"Error removing issue link: {error_msg}") from e
+
+    def batch_create_issue_links(
+        self, links: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Create many issue links, skipping links that already exist.
+
+        Link types are validated once against the cached link types, and the
+        existing links of every involved issue are read from their
+        ``issuelinks`` field with batched JQL queries. The remaining links are
+        created concurrently. Failures are reported per link and never abort
+        the rest of the batch.
+
+        Args:
+            links: Link data dictionaries in the format accepted by
+                ``create_issue_link``. The link type may be given by name or
+                by its inward or outward description.
+
+        Returns:
+            One result dictionary per link, in input order, with ``link_type``,
+            ``inward_issue``, ``outward_issue``, ``success`` and, where
+            relevant, ``skipped``, ``link_id`` or ``error``
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        """
+        link_type_names = self._link_type_names()
+        results: list[dict[str, Any]] = []
+        planned: dict[tuple[str, str, str], list[int]] = {}
+
+        for index, data in enumerate(links):
+            link_type = str((data.get("type") or {}).get("name") or "").strip()
+            inward = str((data.get("inwardIssue") or {}).get("key") or "")
+            outward = str((data.get("outwardIssue") or {}).get("key") or "")
+            inward, outward = inward.strip().upper(), outward.strip().upper()
+            result: dict[str, Any] = {
+                "link_type": link_type,
+                "inward_issue": inward,
+                "outward_issue": outward,
+                "success": False,
+            }
+            results.append(result)
+            if not link_type or not inward or not outward:
+                result["error"] = "Link type, inward and outward issue are required"
+                continue
+            name = link_type_names.get(link_type.casefold())
+            if name is None:
+                result["error"] = (
+                    f"Unknown link type '{link_type}'. "
+                    f"Available: {', '.join(sorted(set(link_type_names.values())))}"
+                )
+                continue
+            result["link_type"] = name
+            # Identical links in one batch are created once
+            planned.setdefault((name, inward, outward), []).append(index)
+
+        issue_keys = {
+            key for _, inward, outward in planned for key in (inward, outward)
+        }
+        issues = (
+            self._fetch_raw_issues_by_keys(  # type: ignore[attr-defined]
+                list(issue_keys), fields="issuelinks"
+            )
+            if issue_keys
+            else {}
+        )
+
+        existing = _existing_issue_links(issues)
+        to_create: list[tuple[str, str, str]] = []
+        for link, indexes in planned.items():
+            _, inward, outward = link
+            missing = [key for key in (inward, outward) if key not in issues]
+            for index in indexes:
+                result = results[index]
+                if missing:
+                    result["error"] = (
+                        f"Issue not found or not accessible: {', '.join(missing)}"
+                    )
+                elif link in existing:
+                    result.update(success=True, skipped=True, link_id=existing[link])
+            if not missing and link not in existing:
+                to_create.append(link)
+
+        def _create(link: tuple[str, str, str]) -> None:
+            name, inward, outward = link
+            data = links[planned[link][0]]
+            link_data: dict[str, Any] = {
+                "type": {"name": name},
+                "inwardIssue": {"key": inward},
+                "outwardIssue": {"key": outward},
+            }
+            if data.get("comment"):
+                link_data["comment"] = data["comment"]
+            self.jira.create_issue_link(link_data)
+
+        logger.info(f"Creating {len(to_create)} of {len(links)} issue links")
+        for outcome in map_concurrently(
+            _create, to_create, max_workers=self.config.max_concurrency
+        ):
+            for index in planned[outcome.item]:
+                result = results[index]
+                result["success"] = outcome.ok
+                if not outcome.ok:
+                    result["error"] = str(outcome.error)
+
+        return results
+
+    def batch_create_remote_issue_links(
+        self, links: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Create many remote issue links concurrently.
+
+        Links without a ``globalId`` use their URL as one, so Jira updates an
+        existing link to the same URL instead of adding a duplicate. Repeated
+        (issue, URL) pairs within the batch are only sent once.
+
+        Args:
+            links: Dictionaries with ``issue_key`` and ``link_data`` in the
+                format accepted by ``create_remote_issue_link``
+
+        Returns:
+            One result dictionary per link, in input order, with ``issue_key``,
+            ``link_url``, ``link_title``, ``success`` and, where relevant,
+            ``skipped`` or ``error``
+        """
+        results: list[dict[str, Any]] = []
+        planned: dict[tuple[str, str], tuple[str, dict[str, Any]]] = {}
+        indexes: dict[tuple[str, str], list[int]] = {}
+
+        for index, item in enumerate(links):
+            issue_key = str(item.get("issue_key") or "").strip().upper()
+            link_data = dict(item.get("link_data") or {})
+            link_object = link_data.get("object") or {}
+            url, title = link_object.get("url"), link_object.get("title")
+            result: dict[str, Any] = {
+                "issue_key": issue_key,
+                "link_url": url,
+                "link_title": title,
+                "success": False,
+            }
+            results.append(result)
+            if not issue_key or not url or not title:
+                result["error"] = "Issue key, URL and title are required"
+                continue
+            link_data.setdefault("globalId", url)
+            key = (issue_key, str(link_data["globalId"]))
+            if key in planned:
+                result.update(success=True, skipped=True)
+                continue
+            planned[key] = (issue_key, link_data)
+            indexes[key] = [index]
+
+        def _create(key: tuple[str, str]) -> None:
+            issue_key, link_data = planned[key]
+            self.jira.post(f"rest/api/3/issue/{issue_key}/remotelink", json=link_data)
+
+        logger.info(f"Creating {len(planned)} of {len(links)} remote issue links")
+        for outcome in map_concurrently(
+            _create, list(planned), max_workers=self.config.max_concurrency
+        ):
+            for index in indexes[outcome.item]:
+                results[index]["success"] = outcome.ok
+                if not outcome.ok:
+                    results[index]["error"] = str(outcome.error)
+
+        return results
+
+    def _get_raw_link_types(self) -> list[dict[str, Any]]:
+        """Fetch the site's issue link types through the site cache."""
+
+        def _load() -> list[dict[str, Any]]:
+            response = self.jira.get("rest/api/2/issueLinkType")
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `jira.get`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return list(response.get("issueLinkTypes", []))
+
+        return _link_types_cache.get_or_load(site_key(self.config), _load)
+
+    def _link_type_names(self) -> dict[str, str]:
+        """Map case-folded link type names and descriptions to type names."""
+        names: dict[str, str] = {}
+        for link_type in self._get_raw_link_types():
+            name = link_type.get("name")
+            if not name:
+                continue
+            for alias in (link_type.get("inward"), link_type.get("outward"), name):
+                if alias:
+                    names[str(alias).casefold()] = name
+        return names
+
+
+def _existing_issue_links(
+    issues: dict[str, dict[str, Any]],
+) -> dict[tuple[str, str, str], str]:
+    """
+    Index the links already present on a set of issues.
+
+    Each entry of an issue's ``issuelinks`` names the other issue under the
+    side it occupies, so an ``outwardIssue`` entry on X is the link
+    (X -> other) and an ``inwardIssue`` entry is (other -> X).
+
+    Args:
+        issues: Raw issues with the ``issuelinks`` field, keyed by issue key
+
+    Returns:
+        Dictionary mapping (type name, inward key, outward key) to link IDs
+    """
+    existing: dict[tuple[str, str, str], str] = {}
+    for key, issue in issues.items():
+        for link in (issue.get("fields") or {}).get("issuelinks") or []:
+            name = (link.get("type") or {}).get("name", "")
+            if "outwardIssue" in link:
+                other = str(link["outwardIssue"].get("key", "")).upper()
+                existing[(name, key, other)] = str(link.get("id", ""))
+            elif "inwardIssue" in link:
+                other = str(link["inwardIssue"].get("key", "")).upper()
+                existing[(name, other, key)] = str(link.get("id", ""))
+    return existing
@@ -2,9 +2,11 @@
 
 import logging
 from collections import defaultdict
+from collections.abc import Iterator
 from typing import Any
 
-from ...models.jira import JiraChangelog, JiraIssue
+from ...models.jira import JiraChangelogRecord, JiraIssue, RecordInterner
+from ...utils.concurrency import iter_concurrently
 from ..client import JiraClient
 from ..protocols import (
     IssueOperationsProto,
@@ -13,6 +15,11 @@ from ..protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# The changelog bulk fetch API accepts at most 1000 issues per request. Smaller
+# chunks keep pages small and let several chunks be fetched in parallel.
+CHANGELOG_BULKFETCH_MAX_ISSUES = 1000
+CHANGELOG_BULKFETCH_CHUNK_SIZE = 100
+
 
 class IssueBatchMixin(
     JiraClient,
@@ -49,6 +56,15 @@ class IssueBatchMixin(
         if not issues:
             return []
 
+        # Resolve all distinct assignees up front so each is looked up only once
+        assignees = [
+            issue_data["assignee"]
+            for issue_data in issues
+            if isinstance(issue_data.get("assignee"), str)
+        ]
+        if assignees:
+            self.resolve_account_ids(assignees)  # type: ignore[attr-defined]
+
         # Prepare issues for bulk creation
         issue_updates = []
         for issue_data in issues:
@@ -185,40 +201,86 @@ class IssueBatchMixin(
         Returns:
             List of JiraIssue objects that only contain changelogs and id
         """
+        return [
+            JiraIssue(
+                id=issue_id, changelogs=[record.to_model() for record in changelogs]
+            )
+            for issue_id, changelogs in self.iter_changelogs(
+                issue_ids_or_keys, fields=fields
+            )
+        ]
+
+    def iter_changelogs(
+        self,
+        issue_ids_or_keys: list[str],
+        fields: list[str] | None = None,
+        chunk_size: int = CHANGELOG_BULKFETCH_CHUNK_SIZE,
+    ) -> Iterator[tuple[str, list[JiraChangelogRecord]]]:
+        """
+        Stream changelogs for many issues.
+
+        Issues are split into chunks that are fetched concurrently from the
+        bulk fetch API, with the ``fields`` filter applied server-side. Each
+        page is parsed into compact changelog records as it arrives and the raw
+        page is dropped, and only a bounded number of chunks is in flight, so
+        memory does not grow with the total number of issues. Authors and
+        change items are interned across the whole fetch; convert records
+        with ``to_model`` where a response is built.
+
+        Warning:
+            This function is only avaiable on Jira Cloud.
 
+        Args:
+            issue_ids_or_keys: List of issue IDs or keys
+            fields: Filter the changelogs by fields, e.g. ['status', 'assignee']. Default to None for all fields.
+            chunk_size: Number of issues requested per bulk fetch call
+
+        Yields:
+            Tuples of (issue ID, changelog records) in input chunk order
+
+        Raises:
+            NotImplementedError: If run on Jira Server/Data Center
+            ValueError: If chunk_size is outside the range accepted by the API
+        """
         if not self.config.is_cloud:
             error_msg = "Batch get issue changelogs is only available on Jira Cloud."
             logger.error(error_msg)
             raise NotImplementedError(error_msg)
-
-        # Get paged api results
-        paged_api_results = self.get_paged(
-            method="post",
-            url=self.jira.resource_url("changelog/bulkfetch"),
-            params_or_json={
-                "fieldIds": fields,
-                "issueIdsOrKeys": issue_ids_or_keys,
-            },
-        )
-
-        # Save (issue_id, changelogs)
-        issue_changelog_results: defaultdict[str, list[JiraChangelog]] = defaultdict(
-            list
-        )
-
-        for api_result in paged_api_results:
-            for data in api_result.get("issueChangeLogs", []):
-                issue_id = data.get("issueId", "")
-                changelogs = [
-                    JiraChangelog.from_api_response(changelog_data)
-                    for changelog_data in data.get("changeHistories", [])
-                ]
-
-                issue_changelog_results[issue_id].extend(changelogs)
-
-        issues = [
-            JiraIssue(id=issue_id, changelogs=changelogs)
-            for issue_id, changelogs in issue_changelog_results.items()
-        ]
-
-        return issues
+        if not 0 < chunk_size <= CHANGELOG_BULKFETCH_MAX_ISSUES:
+            raise ValueError(
+                f"chunk_size must be between 1 and {CHANGELOG_BULKFETCH_MAX_ISSUES}"
+            )
+
+        url = self.jira.resource_url("changelog/bulkfetch")
+        intern = RecordInterner()
+
+        def _fetch_chunk(chunk: list[str]) -> dict[str, list[JiraChangelogRecord]]:
+            # Save (issue_id, changelogs); an issue may span several pages
+            chunk_results: defaultdict[str, list[JiraChangelogRecord]] = defaultdict(
+                list
+            )
+            for api_result in self.iter_paged(
+                method="post",
+                url=url,
+                params_or_json={"fieldIds": fields, "issueIdsOrKeys": chunk},
+            ):
+                for data in api_result.get("issueChangeLogs", []):
+                    chunk_results[data.get("issueId", "")].extend(
+                        JiraChangelogRecord.from_api_response(changelog_data, intern)
+                        for changelog_data in data.get("changeHistories", [])
+                    )
+            return chunk_results
+
+        unique_ids = list(dict.fromkeys(issue_ids_or_keys))
+        for outcome in iter_concurrently(
+            _fetch_chunk,
+            (
+                unique_ids[i : i + chunk_size]
+                for i in range(0, len(unique_ids), chunk_size)
+            ),
+            max_workers=self.config.max_concurrency,
+        ):
+            if not outcome.ok:
+                logger.error(f"Error fetching changelogs: {outcome.error}")
+                raise outcome.error  # type: ignore[misc]
+            yield from (outcome.value or {}).items()
@@ -1,6 +1,7 @@
 """Issue retrieval operations mixin for Jira client."""
 
 import logging
+from itertools import islice
 from typing import Any
 
 from requests.exceptions import HTTPError
@@ -9,7 +10,9 @@ from ...exceptions import MCPAtlassianAuthenticationError
 from ...models.jira import JiraIssue
 from ...utils import parse_date
 from ..client import JiraClient
+from ..comments import COMMENT_PAGE_SIZE
 from ..constants import DEFAULT_READ_JIRA_FIELDS
+from ..projects import parse_projects_filter
 from ..protocols import (
     AttachmentsOperationsProto,
     EpicOperationsProto,
@@ -55,7 +58,9 @@ class IssueRetrievalMixin(
         fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
         properties: str | list[str] | None = None,
         update_history: bool = True,
-    ) -> JiraIssue:
+        *,
+        raw: bool = False,
+    ) -> JiraIssue | dict[str, Any]:
         """
         Get a Jira issue by key.
 
@@ -66,9 +71,12 @@ class IssueRetrievalMixin(
             fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
             properties: Issue properties to return (comma-separated string or list)
             update_history: Whether to update the issue view history
+            raw: Return the issue data, with its comments and epic fields
+                filled in, instead of building the model
 
         Returns:
-            JiraIssue model with issue data and metadata
+            JiraIssue model with issue data and metadata, or the issue data
+            if raw is set
 
         Raises:
             MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
@@ -77,13 +85,10 @@ class IssueRetrievalMixin(
         try:
             # Obtain the projects filter from the config.
             # These should NOT be overridden by the request.
-            filter_to_use = self.config.projects_filter
+            projects = parse_projects_filter(self.config.projects_filter)
 
             # Apply projects filter if present
-            if filter_to_use:
-                # Split projects filter by commas and handle possible whitespace
-                projects = [p.strip() for p in filter_to_use.split(",")]
-
+            if projects:
                 # Obtain the project key from issue_key
                 issue_key_project = issue_key.split("-")[0]
 
@@ -214,6 +219,8 @@ class IssueRetrievalMixin(
 
             # Update the issue data with the fields
             issue["fields"] = fields_data
+            if raw:
+                return issue
 
             # Create and return the JiraIssue model, passing requested_fields
             return JiraIssue.from_api_response(
@@ -270,30 +277,25 @@ class IssueRetrievalMixin(
         self, issue_key: str, comment_limit: int | None
     ) -> list[dict]:
         """
-        Get comments for an issue if needed.
+        Get the most recent comments for an issue if needed.
 
         Args:
             issue_key: The issue key
-            comment_limit: Maximum number of comments to include
+            comment_limit: Maximum number of comments to include (None for all)
 
         Returns:
             List of comments
         """
         if comment_limit is None or comment_limit > 0:
             try:
-                response = self.jira.issue_get_comments(issue_key)
-                if not isinstance(response, dict):
-                    msg = f"Unexpected return value type from `jira.issue_get_comments`: {type(response)}"
-                    logger.error(msg)
-                    raise TypeError(msg)
-
-                comments = response["comments"]
-
-                # Limit comments if needed
-                if comment_limit is not None:
-                    comments = comments[:comment_limit]
-
-                return comments
+                comments = self.iter_issue_comments(  # type: ignore[attr-defined]
+                    issue_key,
+                    page_size=min(
+                        comment_limit or COMMENT_PAGE_SIZE, COMMENT_PAGE_SIZE
+                    ),
+                )
+                # Only the pages covering the limit are requested
+                return list(islice(comments, comment_limit))
             except Exception as e:
                 logger.warning(f"Error getting comments for {issue_key}: {str(e)}")
                 return []
@@ -4,6 +4,7 @@ import logging
 from typing import Any
 
 from ...models.jira import JiraIssue
+from ...utils.concurrency import map_concurrently
 from ..client import JiraClient
 from ..protocols import (
     AttachmentsOperationsProto,
@@ -87,58 +88,7 @@ class IssueUpdateMixin(
                 update_fields["status"] = status_value
                 return self._update_issue_with_status(issue_key, update_fields)
 
-            # SINGLE PROCESSING PATH: Convert description from Markdown to Jira format if present
-            if "description" in update_fields:
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug("[DEBUG] Processing description field...")
-                    logger.debug(
-                        f"[DEBUG] Original description: {update_fields['description'][:200]}..."
-                    )
-
-                description_content = self.markdown_to_jira(
-                    update_fields["description"], return_raw_adf=True
-                )
-
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug("[DEBUG] Description content after conversion:")
-                    logger.debug(f"[DEBUG]   Type: {type(description_content)}")
-                    logger.debug(
-                        f"[DEBUG]   Is dict: {isinstance(description_content, dict)}"
-                    )
-                    logger.debug(
-                        f"[DEBUG]   Is str: {isinstance(description_content, str)}"
-                    )
-                    logger.debug(
-                        f"[DEBUG]   Content preview: {str(description_content)[:300]}..."
-                    )
-
-                # Handle both ADF (dict) and wiki markup (str) formats
-                # With the new REST client, ADF is passed as-is (dict)
-                update_fields["description"] = description_content
-
-            # Handle assignee updates with special processing
-            if "assignee" in update_fields:
-                assignee_value = update_fields["assignee"]
-                if assignee_value is None or assignee_value == "":
-                    update_fields["assignee"] = None
-                else:
-                    try:
-                        account_id = self._get_account_id(assignee_value)
-                        self._add_assignee_to_fields(update_fields, account_id)
-                    except ValueError as e:
-                        logger.warning(f"Could not update assignee: {str(e)}")
-                        # Remove invalid assignee to prevent API errors
-                        update_fields.pop("assignee", None)
-
-            # Process any remaining fields that need additional processing
-            # (Note: description and assignee are already handled above)
-            fields_to_process = {
-                k: v
-                for k, v in update_fields.items()
-                if k not in ["description", "assignee", "status"]
-            }
-            if fields_to_process:
-                self._process_additional_fields(update_fields, fields_to_process)
+            self._prepare_update_fields(update_fields)
 
             # Update the issue fields
             if update_fields:
@@ -182,6 +132,139 @@ class IssueUpdateMixin(
             logger.error(f"Error updating issue {issue_key}: {error_msg}")
             raise ValueError(f"Failed to update issue {issue_key}: {error_msg}") from e
 
+    def _prepare_update_fields(self, update_fields: dict[str, Any]) -> None:
+        """
+        Convert user-supplied field values into the Jira API format in place.
+
+        Converts the description from Markdown, resolves the assignee to an
+        account identifier and maps remaining field names to field IDs with
+        their write format.
+
+        Args:
+            update_fields: Fields to update, keyed by field name or ID
+        """
+        # SINGLE PROCESSING PATH: Convert description from Markdown to Jira format if present
+        if "description" in update_fields:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[DEBUG] Processing description field...")
+                logger.debug(
+                    f"[DEBUG] Original description: {update_fields['description'][:200]}..."
+                )
+
+            description_content = self.markdown_to_jira(
+                update_fields["description"], return_raw_adf=True
+            )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[DEBUG] Description content after conversion:")
+                logger.debug(f"[DEBUG]   Type: {type(description_content)}")
+                logger.debug(
+                    f"[DEBUG]   Is dict: {isinstance(description_content, dict)}"
+                )
+                logger.debug(
+                    f"[DEBUG]   Is str: {isinstance(description_content, str)}"
+                )
+                logger.debug(
+                    f"[DEBUG]   Content preview: {str(description_content)[:300]}..."
+                )
+
+            # Handle both ADF (dict) and wiki markup (str) formats
+            # With the new REST client, ADF is passed as-is (dict)
+            update_fields["description"] = description_content
+
+        # Handle assignee updates with special processing
+        if "assignee" in update_fields:
+            assignee_value = update_fields["assignee"]
+            if assignee_value is None or assignee_value == "":
+                update_fields["assignee"] = None
+            else:
+                try:
+                    account_id = self._get_account_id(assignee_value)
+                    self._add_assignee_to_fields(update_fields, account_id)
+                except ValueError as e:
+                    logger.warning(f"Could not update assignee: {str(e)}")
+                    # Remove invalid assignee to prevent API errors
+                    update_fields.pop("assignee", None)
+
+        # Process any remaining fields that need additional processing
+        # (Note: description and assignee are already handled above)
+        fields_to_process = {
+            k: v
+            for k, v in update_fields.items()
+            if k not in ["description", "assignee", "status"]
+        }
+        if fields_to_process:
+            self._process_additional_fields(update_fields, fields_to_process)
+
+    def batch_update_issues(
+        self,
+        issue_keys: list[str],
+        fields: dict[str, Any],
+        notify_users: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Apply the same field changes to many issues.
+
+        Field IDs, value formats and the assignee are resolved once for the
+        whole batch, then the updates are sent concurrently. Updated issues
+        are not re-read.
+
+        Args:
+            issue_keys: Keys of the issues to update
+            fields: Fields to set on every issue, keyed by field name or ID
+            notify_users: Whether Jira should send notifications for the updates
+
+        Returns:
+            One result dictionary per distinct issue key, in input order, with
+            ``issue_key``, ``success`` and ``error`` when the update failed
+
+        Raises:
+            ValueError: If no fields are given, the fields include a status or
+                attachments, or none of the fields could be resolved
+        """
+        if not fields:
+            raise ValueError("At least one field to update is required")
+        if "status" in fields:
+            raise ValueError(
+                "Status cannot be changed with a field update; "
+                "use batch_transition_issues instead"
+            )
+        if "attachments" in fields:
+            raise ValueError("Attachments cannot be uploaded in a batch update")
+
+        unique_keys = list(
+            dict.fromkeys(key.strip().upper() for key in issue_keys if key.strip())
+        )
+        if not unique_keys:
+            return []
+
+        update_fields = dict(fields)
+        self._prepare_update_fields(update_fields)
+        if not update_fields:
+            raise ValueError("None of the given fields could be resolved")
+
+        def _update(issue_key: str) -> None:
+            self.jira.update_issue(
+                issue_key=issue_key,
+                fields=update_fields,
+                update=None,
+                notify_users=notify_users,
+            )
+
+        logger.info(
+            f"Updating fields {list(update_fields)} on {len(unique_keys)} issues"
+        )
+        results: list[dict[str, Any]] = []
+        for outcome in map_concurrently(
+            _update, unique_keys, max_workers=self.config.max_concurrency
+        ):
+            result: dict[str, Any] = {"issue_key": outcome.item, "success": outcome.ok}
+            if not outcome.ok:
+                logger.warning(f"Error updating issue {outcome.item}: {outcome.error}")
+                result["error"] = str(outcome.error)
+            results.append(result)
+        return results
+
     def _update_issue_with_status(
         self, issue_key: str, fields: dict[str, Any]
     ) -> JiraIssue:
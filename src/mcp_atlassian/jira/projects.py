@@ -1,16 +1,89 @@
 """Module for Jira project operations."""
 
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from ..models import JiraProject
-from ..models.jira.search import JiraSearchResult
+from ..models.jira.search import JiraSearchPage, JiraSearchResult
 from ..models.jira.version import JiraVersion
+from .cache import SiteCache, user_key
 from .client import JiraClient
 from .protocols import SearchOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Project visibility depends on the caller, so catalogs are kept per user
+_project_catalog_cache: SiteCache["ProjectCatalog"] = SiteCache(
+    "project_catalog", maxsize=256, ttl=900
+)
+
+
+@lru_cache(maxsize=32)
+def parse_projects_filter(projects_filter: str | None) -> tuple[str, ...]:
+    """
+    Split a comma-separated projects filter into project keys.
+
+    Args:
+        projects_filter: Filter such as JIRA_PROJECTS_FILTER, e.g. "PROJ, OPS"
+
+    Returns:
+        The stripped, non-empty keys in their original case
+    """
+    if not projects_filter:
+        return ()
+    return tuple(key for key in (p.strip() for p in projects_filter.split(",")) if key)
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectCatalog:
+    """
+    Every project visible to a user, indexed by upper-cased key.
+
+    Keys are upper-cased and the projects filter is applied once, when the
+    catalog is built. ``projects`` and ``by_key`` share the same dictionaries.
+    """
+
+    projects: tuple[dict[str, Any], ...]
+    by_key: dict[str, dict[str, Any]]
+
+    @classmethod
+    def build(
+        cls, projects: list[dict[str, Any]], projects_filter: str | None = None
+    ) -> "ProjectCatalog":
+        """
+        Build a catalog from project search results.
+
+        Args:
+            projects: Projects as returned by the API, archived ones included
+            projects_filter: Optional comma-separated project keys to keep
+
+        Returns:
+            A ProjectCatalog instance
+        """
+        allowed = {key.upper() for key in parse_projects_filter(projects_filter)}
+        by_key: dict[str, dict[str, Any]] = {}
+        for project in projects:
+            key = project.get("key")
+            if not isinstance(key, str):
+                continue
+            key = key.upper()
+            if allowed and key not in allowed:
+                continue
+            project["key"] = key
+            by_key[key] = project
+        return cls(projects=tuple(by_key.values()), by_key=by_key)
+
+    def list_projects(self, *, include_archived: bool = False) -> list[dict[str, Any]]:
+        """List the catalog's projects, leaving out archived ones by default."""
+        if include_archived:
+            return list(self.projects)
+        return [p for p in self.projects if not p.get("archived", False)]
+
+    def __contains__(self, project_key: object) -> bool:
+        return isinstance(project_key, str) and project_key.upper() in self.by_key
+
 
 class ProjectsMixin(JiraClient, SearchOperationsProto):
     """Mixin for Jira project operations.
@@ -23,6 +96,9 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         """
         Get all projects visible to the current user.
 
+        Projects come from the cached project catalog, so keys are upper-cased
+        and JIRA_PROJECTS_FILTER, when configured, is already applied.
+
         Args:
             include_archived: Whether to include archived projects
 
@@ -30,17 +106,43 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             List of project data dictionaries
         """
         try:
-            params = {}
-            if include_archived:
-                params["includeArchived"] = "true"
-
-            projects = self.jira.projects(included_archived=include_archived)
-            return projects if isinstance(projects, list) else []
-
+            return self.get_project_catalog().list_projects(
+                include_archived=include_archived
+            )
         except Exception as e:
             logger.error(f"Error getting all projects: {str(e)}")
             return []
 
+    def get_project_catalog(self, *, refresh: bool = False) -> ProjectCatalog:
+        """
+        Get the catalog of projects visible to the current user.
+
+        The catalog is cached per site and user and reloaded once it expires.
+
+        Args:
+            refresh: Reload the catalog now instead of using the cache
+
+        Returns:
+            The project catalog
+
+        Raises:
+            TypeError: If the API returns something other than a list
+        """
+        key = user_key(self.config)
+        catalog = None if refresh else _project_catalog_cache.get(key)
+        if catalog is None:
+            projects = self.jira.projects(included_archived=True)
+            if not isinstance(projects, list):
+                msg = f"Unexpected return value type from `jira.projects`: {type(projects)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            catalog = ProjectCatalog.build(projects, self.config.projects_filter)
+            _project_catalog_cache.set(key, catalog)
+            logger.debug(
+                f"Loaded project catalog with {len(catalog.projects)} projects"
+            )
+        return catalog
+
     def get_project(self, project_key: str) -> dict[str, Any] | None:
         """
         Get project information by key.
@@ -82,6 +184,9 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         """
         Check if a project exists.
 
+        The check uses the cached project catalog, so projects excluded by
+        JIRA_PROJECTS_FILTER are reported as missing.
+
         Args:
             project_key: The project key to check
 
@@ -89,8 +194,7 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             True if the project exists, False otherwise
         """
         try:
-            project = self.get_project(project_key)
-            return project is not None
+            return project_key in self.get_project_catalog()
 
         except Exception:
             return False
@@ -304,8 +408,8 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             return 0
 
     def get_project_issues(
-        self, project_key: str, start: int = 0, limit: int = 50
-    ) -> JiraSearchResult:
+        self, project_key: str, start: int = 0, limit: int = 50, *, lazy: bool = False
+    ) -> JiraSearchResult | JiraSearchPage:
         """
         Get issues for a specific project.
 
@@ -313,6 +417,7 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             project_key: The project key
             start: Index of the first issue to return
             limit: Maximum number of issues to return
+            lazy: Return a JiraSearchPage that keeps the raw issues instead
 
         Returns:
             List of JiraIssue models representing the issues
@@ -321,10 +426,12 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             # Use JQL to get issues in the project
             jql = f'project = "{project_key}"'
 
-            return self.search_issues(jql, start=start, limit=limit)
+            return self.search_issues(jql, start=start, limit=limit, lazy=lazy)
 
         except Exception as e:
             logger.error(f"Error getting issues for project {project_key}: {str(e)}")
+            if lazy:
+                return JiraSearchPage([])
             return JiraSearchResult(issues=[], total=0)
 
     def get_project_keys(self) -> list[str]:
@@ -1,10 +1,13 @@
 """Module for Jira protocol definitions."""
 
 from abc import abstractmethod
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from ..models.jira import JiraIssue
-from ..models.jira.search import JiraSearchResult
+from ..models.jira.search import JiraSearchPage, JiraSearchResult
+
+if TYPE_CHECKING:
+    from .fields import EpicFieldMap
 
 
 class AttachmentsOperationsProto(Protocol):
@@ -42,7 +45,9 @@ class IssueOperationsProto(Protocol):
         | None = "summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype",
         properties: str | list[str] | None = None,
         update_history: bool = True,
-    ) -> JiraIssue:
+        *,
+        raw: bool = False,
+    ) -> JiraIssue | dict[str, Any]:
         """Get a Jira issue by key."""
 
 
@@ -62,9 +67,17 @@ class SearchOperationsProto(Protocol):
         limit: int = 50,
         expand: str | None = None,
         projects_filter: str | None = None,
-    ) -> JiraSearchResult:
+        *,
+        lazy: bool = False,
+    ) -> JiraSearchResult | JiraSearchPage:
         """Search for issues using JQL."""
 
+    @abstractmethod
+    def _fetch_raw_issues_by_keys(
+        self, issue_keys: list[str], fields: str
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch many issues by key, returning raw issue data keyed by issue key."""
+
 
 class EpicOperationsProto(Protocol):
     """Protocol defining epic operations interface."""
@@ -157,6 +170,22 @@ class FieldsOperationsProto(Protocol):
             (e.g., {'epic_link': 'customfield_10014', 'epic_name': 'customfield_10011'})
         """
 
+    @abstractmethod
+    def _get_cached_epic_field_map(self) -> "EpicFieldMap | None":
+        """Return the cached epic field map for this site, if any."""
+
+    @abstractmethod
+    def _remember_epic_link_field(
+        self, field_id: str | None, *, probed: bool = False
+    ) -> None:
+        """
+        Record the field that links issues to epics on this site.
+
+        Args:
+            field_id: "parent" or the Epic Link custom field ID (None if unknown)
+            probed: Whether this is the outcome of the sample-epic probe
+        """
+
     @abstractmethod
     def get_required_fields(self, issue_type: str, project_key: str) -> dict[str, Any]:
         """
@@ -1,18 +1,30 @@
 """Module for Jira search operations."""
 
 import logging
+from typing import Any
 
 import requests
 from requests.exceptions import HTTPError
 
-from ..exceptions import MCPAtlassianAuthenticationError
-from ..models.jira import JiraSearchResult
+from ..exceptions import (
+    MCPAtlassianAuthenticationError,
+    MCPAtlassianValidationError,
+)
+from ..models.jira import JiraIssue, JiraSearchPage, JiraSearchResult
+from ..utils.concurrency import chunked, map_concurrently
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
+from .projects import parse_projects_filter
 from .protocols import IssueOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Maximum number of keys looked up in a single `key in (...)` JQL query
+ISSUE_KEY_LOOKUP_CHUNK_SIZE = 100
+
+# Issues requested per Jira Cloud search call; Cloud caps maxResults at 100
+CLOUD_SEARCH_PAGE_SIZE = 100
+
 
 class SearchMixin(JiraClient, IssueOperationsProto):
     """Mixin for Jira search operations."""
@@ -25,7 +37,9 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         limit: int = 50,
         expand: str | None = None,
         projects_filter: str | None = None,
-    ) -> JiraSearchResult:
+        *,
+        lazy: bool = False,
+    ) -> JiraSearchResult | JiraSearchPage:
         """
         Search for issues using JQL (Jira Query Language).
 
@@ -33,14 +47,15 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             jql: JQL query string
             fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
             start: Starting index if number of issues is greater than the limit
-                  Note: This parameter is ignored in Cloud environments and results will always
-                  start from the first page.
-            limit: Maximum issues to return
+            limit: Maximum issues to return; on Cloud, pages are requested until
+                  the limit is reached
             expand: Optional items to expand (comma-separated)
             projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            lazy: Return a JiraSearchPage that keeps the raw issues instead
 
         Returns:
-            JiraSearchResult object containing issues and metadata (total, start_at, max_results)
+            JiraSearchResult object containing issues and metadata (total, start_at, max_results),
+            or a JiraSearchPage with the same metadata if ``lazy`` is set
 
         Raises:
             MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
@@ -51,10 +66,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             filter_to_use = projects_filter or self.config.projects_filter
 
             # Apply projects filter if present
-            if filter_to_use:
-                # Split projects filter by commas and handle possible whitespace
-                projects = [p.strip() for p in filter_to_use.split(",")]
-
+            projects = parse_projects_filter(filter_to_use)
+            if projects:
                 # Build the project filter query part
                 if len(projects) == 1:
                     project_query = f'project = "{projects[0]}"'
@@ -85,6 +98,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             else:
                 fields_param = fields
 
+            result_type = JiraSearchPage if lazy else JiraSearchResult
+
             if self.config.is_cloud:
                 actual_total = -1
                 try:
@@ -113,22 +128,41 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                         f"Error fetching metadata for JQL '{jql}': {str(meta_err)}"
                     )
 
-                # Call 2: Get the actual issues using the enhanced method
-                issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
-                    jql, fields=fields_param, limit=limit, expand=expand
-                )
+                # Call 2: Get the actual issues using the enhanced method, one
+                # page at a time because Cloud caps the page size
+                issues_response_list: list[dict[str, Any]] = []
+                while len(issues_response_list) < limit:
+                    page_limit = min(
+                        CLOUD_SEARCH_PAGE_SIZE, limit - len(issues_response_list)
+                    )
+                    page = self.jira.enhanced_jql_get_list_of_tickets(
+                        jql,
+                        fields=fields_param,
+                        limit=page_limit,
+                        expand=expand,
+                        start_at=start + len(issues_response_list),
+                    )
 
-                if not isinstance(issues_response_list, list):
-                    msg = f"Unexpected return value type from `jira.enhanced_jql_get_list_of_tickets`: {type(issues_response_list)}"
-                    logger.error(msg)
-                    raise TypeError(msg)
+                    if not isinstance(page, list):
+                        msg = f"Unexpected return value type from `jira.enhanced_jql_get_list_of_tickets`: {type(page)}"
+                        logger.error(msg)
+                        raise TypeError(msg)
+
+                    issues_response_list.extend(page)
+                    fetched = start + len(issues_response_list)
+                    if not page or 0 <= actual_total <= fetched:
+                        break
+                    # Without a total, a short page is taken as the last one
+                    if actual_total < 0 and len(page) < page_limit:
+                        break
 
                 response_dict_for_model = {
                     "issues": issues_response_list,
                     "total": actual_total,
+                    "startAt": start,
                 }
 
-                search_result = JiraSearchResult.from_api_response(
+                search_result = result_type.from_api_response(
                     response_dict_for_model,
                     base_url=self.config.url,
                     requested_fields=fields_param,
@@ -139,7 +173,7 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             else:
                 limit = min(limit, 50)
                 response = self.jira.jql(
-                    jql, fields=fields_param, start=start, limit=limit, expand=expand
+                    jql, fields=fields_param, start_at=start, limit=limit, expand=expand
                 )
                 if not isinstance(response, dict):
                     msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
@@ -147,7 +181,7 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                     raise TypeError(msg)
 
                 # Convert the response to a search result model
-                search_result = JiraSearchResult.from_api_response(
+                search_result = result_type.from_api_response(
                     response, base_url=self.config.url, requested_fields=fields_param
                 )
 
@@ -172,6 +206,107 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
             raise Exception(f"Error searching issues: {str(e)}") from e
 
+    def search_all_issues(
+        self,
+        jql: str,
+        fields: str | None = None,
+        limit: int = 1000,
+        expand: str | None = None,
+    ) -> list[JiraIssue]:
+        """
+        Collect up to ``limit`` issues matching a JQL query across pages.
+
+        To tell whether more issues match, ask for one issue more than needed.
+
+        Args:
+            jql: JQL query string
+            fields: Comma-separated fields to return
+            limit: Maximum number of issues to collect
+            expand: Optional items to expand (comma-separated)
+
+        Returns:
+            List of matching issues, at most ``limit`` long
+        """
+        issues: list[JiraIssue] = []
+        while len(issues) < limit:
+            result = self.search_issues(
+                jql,
+                fields=fields,
+                start=len(issues),
+                limit=limit - len(issues),
+                expand=expand,
+            )
+            issues.extend(result.issues)
+            # Server/DC returns at most 50 issues per call; Cloud stops early
+            # only when the matches run out
+            if not result.issues or len(issues) >= result.total:
+                break
+        return issues[:limit]
+
+    def _fetch_raw_issues_by_keys(
+        self, issue_keys: list[str], fields: str
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetch many issues by key with a few batched JQL queries.
+
+        Keys are looked up in chunks of ``ISSUE_KEY_LOOKUP_CHUNK_SIZE``, and the
+        chunks are queried concurrently. Keys that do not exist or are not
+        visible to the user are simply absent from the result.
+
+        JQL rejects a whole query when one of its keys does not exist, so only
+        a chunk that fails validation is retried key by key. Any other failure,
+        such as an expired token, missing permission or rate limiting, is
+        raised.
+
+        Args:
+            issue_keys: Issue keys to fetch
+            fields: Comma-separated fields to return for each issue
+
+        Returns:
+            Dictionary mapping upper-cased issue keys to raw issue data
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If a lookup fails for a reason other than an unknown key
+        """
+        unique_keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys))
+
+        def _fetch_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+            quoted_keys = ", ".join(f'"{key}"' for key in chunk)
+            response = self.jira.jql(
+                f"key in ({quoted_keys})", fields=fields, limit=len(chunk)
+            )
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return response.get("issues", [])
+
+        issues_by_key: dict[str, dict[str, Any]] = {}
+        for outcome in map_concurrently(
+            _fetch_chunk,
+            chunked(unique_keys, ISSUE_KEY_LOOKUP_CHUNK_SIZE),
+            max_workers=self.config.max_concurrency,
+        ):
+            if not outcome.ok:
+                _raise_unless_invalid_jql(outcome.error)
+                # Fall back to individual lookups so valid keys in the chunk
+                # still resolve
+                logger.debug(f"Batched key lookup failed: {outcome.error}")
+                for single in map_concurrently(
+                    _fetch_chunk,
+                    [[key] for key in outcome.item],
+                    max_workers=self.config.max_concurrency,
+                ):
+                    if not single.ok:
+                        _raise_unless_invalid_jql(single.error)
+                    for issue in single.value or []:
+                        issues_by_key[str(issue.get("key", "")).upper()] = issue
+                continue
+            for issue in outcome.value or []:
+                issues_by_key[str(issue.get("key", "")).upper()] = issue
+        return issues_by_key
+
     def get_board_issues(
         self,
         board_id: str,
@@ -180,7 +315,9 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         start: int = 0,
         limit: int = 50,
         expand: str | None = None,
-    ) -> JiraSearchResult:
+        *,
+        lazy: bool = False,
+    ) -> JiraSearchResult | JiraSearchPage:
         """
         Get all issues linked to a specific board.
 
@@ -191,9 +328,11 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             start: Starting index
             limit: Maximum issues to return
             expand: Optional items to expand (comma-separated)
+            lazy: Return a JiraSearchPage that keeps the raw issues instead
 
         Returns:
-            JiraSearchResult object containing board issues and metadata
+            JiraSearchResult object containing board issues and metadata, or a
+            JiraSearchPage if ``lazy`` is set
 
         Raises:
             Exception: If there is an error getting board issues
@@ -218,7 +357,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                 raise TypeError(msg)
 
             # Convert the response to a search result model
-            search_result = JiraSearchResult.from_api_response(
+            result_type = JiraSearchPage if lazy else JiraSearchResult
+            search_result = result_type.from_api_response(
                 response, base_url=self.config.url, requested_fields=fields_param
             )
             return search_result
@@ -241,7 +381,9 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         fields: str | None = None,
         start: int = 0,
         limit: int = 50,
-    ) -> JiraSearchResult:
+        *,
+        lazy: bool = False,
+    ) -> JiraSearchResult | JiraSearchPage:
         """
         Get all issues linked to a specific sprint.
 
@@ -250,9 +392,11 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             fields: Fields to return (comma-separated string or "*all")
             start: Starting index
             limit: Maximum issues to return
+            lazy: Return a JiraSearchPage that keeps the raw issues instead
 
         Returns:
-            JiraSearchResult object containing sprint issues and metadata
+            JiraSearchResult object containing sprint issues and metadata, or a
+            JiraSearchPage if ``lazy`` is set
 
         Raises:
             Exception: If there is an error getting board issues
@@ -262,11 +406,14 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             fields_param = fields
             if fields_param is None:
                 fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
+            elif isinstance(fields_param, list | tuple | set):
+                fields_param = ",".join(fields_param)
 
             response = self.jira.get_sprint_issues(
                 sprint_id=sprint_id,
-                start=start,
-                limit=limit,
+                start_at=start,
+                max_results=limit,
+                fields=fields_param,
             )
             if not isinstance(response, dict):
                 msg = f"Unexpected return value type from `jira.get_sprint_issues`: {type(response)}"
@@ -274,7 +421,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                 raise TypeError(msg)
 
             # Convert the response to a search result model
-            search_result = JiraSearchResult.from_api_response(
+            result_type = JiraSearchPage if lazy else JiraSearchResult
+            search_result = result_type.from_api_response(
                 response, base_url=self.config.url, requested_fields=fields_param
             )
             return search_result
@@ -288,3 +436,30 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         except Exception as e:
             logger.error(f"Error searching issues for sprint: {sprint_id}': {str(e)}")
             raise Exception(f"Error searching issues for sprint: {str(e)}") from e
+
+
+def _raise_unless_invalid_jql(error: Exception | None) -> None:
+    """
+    Re-raise a failed key lookup unless JQL rejected the query (400).
+
+    Args:
+        error: The exception raised by the lookup
+
+    Raises:
+        MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        Exception: The original error for any other failure
+    """
+    if error is None or isinstance(error, MCPAtlassianValidationError):
+        return
+    if isinstance(error, HTTPError) and error.response is not None:
+        status_code = error.response.status_code
+        if status_code == 400:
+            return
+        if status_code in [401, 403]:
+            error_msg = (
+                f"Authentication failed for Jira API ({status_code}). "
+                "Token may be expired or invalid. Please verify credentials."
+            )
+            logger.error(error_msg)
+            raise MCPAtlassianAuthenticationError(error_msg) from error
+    raise error
@@ -2,16 +2,23 @@
 
 import datetime
 import logging
+from collections import Counter, defaultdict
 from typing import Any
 
 import requests
 
 from ..models.jira import JiraSprint
 from ..utils import parse_date
+from ..utils.concurrency import map_concurrently
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+# Page size requested from the agile sprint issue endpoint
+SPRINT_ISSUES_PAGE_SIZE = 100
+# Field names used for story points by company- and team-managed projects
+STORY_POINTS_FIELD_NAMES = ("Story Points", "Story point estimate")
+
 
 class SprintsMixin(JiraClient):
     """Mixin for Jira sprints operations."""
@@ -195,3 +202,211 @@ class SprintsMixin(JiraClient):
         except Exception as e:
             logger.error(f"Error creating sprint: {str(e)}")
             raise
+
+    def get_sprint_report(
+        self, sprint_id: str, story_points_field: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Summarize a sprint's commitment, progress and workload.
+
+        Sprint metadata and the first page of sprint issues are fetched
+        concurrently, remaining pages are fetched in parallel, and all figures
+        are computed in a single pass over the raw issues.
+
+        An issue counts as added after the sprint started if its Sprint field
+        changelog shows it joining the sprint after the start date, or if it was
+        created in the sprint after the start date. Issues removed from the
+        sprint are no longer returned by Jira and are not reflected.
+
+        Args:
+            sprint_id: Sprint ID
+            story_points_field: Story points field ID; discovered by field name
+                when omitted
+
+        Returns:
+            Dictionary with sprint details, issue and story point totals, scope
+            change, status breakdown and per-assignee load
+        """
+        points_field = story_points_field or self._find_story_points_field()
+        fields = ["status", "assignee", "created", "resolutiondate"]
+        if points_field:
+            fields.append(points_field)
+
+        sprint_outcome, issues_outcome = map_concurrently(
+            lambda fetch: fetch(),
+            [
+                lambda: self.jira.get_sprint(sprint_id),
+                lambda: self._fetch_all_sprint_issues(
+                    sprint_id, ",".join(fields), expand="changelog"
+                ),
+            ],
+            max_workers=2,
+        )
+        for outcome in (sprint_outcome, issues_outcome):
+            if not outcome.ok:
+                logger.error(f"Error building report for sprint {sprint_id}")
+                raise outcome.error  # type: ignore[misc]
+        sprint_data: dict[str, Any] = sprint_outcome.value or {}
+        issues: list[dict[str, Any]] = issues_outcome.value or []
+
+        started = _parse_aware(sprint_data.get("startDate"))
+        completed_at = _parse_aware(sprint_data.get("completeDate"))
+
+        status_counts: Counter[str] = Counter()
+        category_counts: Counter[str] = Counter()
+        assignees: defaultdict[str, dict[str, float]] = defaultdict(
+            lambda: {"issues": 0, "completed": 0, "story_points": 0.0}
+        )
+        added_keys: list[str] = []
+        completed_issues = unestimated = 0
+        committed_points = completed_points = added_points = 0.0
+
+        for issue in issues:
+            issue_fields = issue.get("fields") or {}
+            status = issue_fields.get("status") or {}
+            category = (status.get("statusCategory") or {}).get("key", "")
+            points = _story_points(issue_fields.get(points_field or ""))
+            if points is None:
+                unestimated += 1
+                points = 0.0
+
+            is_done = category == "done"
+            if is_done and completed_at:
+                # Issues resolved after the sprint closed don't count for it
+                resolved = _parse_aware(issue_fields.get("resolutiondate"))
+                is_done = resolved is None or resolved <= completed_at
+            added = started is not None and _added_after(issue, str(sprint_id), started)
+
+            status_counts[status.get("name", "Unknown")] += 1
+            category_counts[category or "unknown"] += 1
+            if added:
+                added_keys.append(issue.get("key", ""))
+                added_points += points
+            else:
+                committed_points += points
+            if is_done:
+                completed_issues += 1
+                completed_points += points
+
+            assignee = issue_fields.get("assignee") or {}
+            load = assignees[assignee.get("displayName") or "Unassigned"]
+            load["issues"] += 1
+            load["story_points"] += points
+            load["completed"] += int(is_done)
+
+        total_points = committed_points + added_points
+        return {
+            "sprint": JiraSprint.from_api_response(sprint_data).to_simplified_dict(),
+            "story_points_field": points_field,
+            "issues": {
+                "total": len(issues),
+                "completed": completed_issues,
+                "not_completed": len(issues) - completed_issues,
+                "unestimated": unestimated,
+            },
+            "story_points": {
+                "committed": committed_points,
+                "added": added_points,
+                "total": total_points,
+                "completed": completed_points,
+                "completion_pct": round(completed_points / total_points * 100, 1)
+                if total_points
+                else None,
+            },
+            "scope_change": {
+                "added_issues": len(added_keys),
+                "added_points": added_points,
+                "added_issue_keys": added_keys,
+            },
+            "status_breakdown": dict(status_counts.most_common()),
+            "status_category_breakdown": dict(category_counts.most_common()),
+            "assignee_load": dict(
+                sorted(
+                    assignees.items(),
+                    key=lambda item: (-item[1]["story_points"], -item[1]["issues"]),
+                )
+            ),
+        }
+
+    def _fetch_all_sprint_issues(
+        self, sprint_id: str, fields: str, expand: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch every issue in a sprint, requesting later pages concurrently."""
+
+        def _fetch_page(start_at: int) -> dict[str, Any]:
+            page = self.jira.get_sprint_issues(
+                sprint_id=sprint_id,
+                start_at=start_at,
+                max_results=SPRINT_ISSUES_PAGE_SIZE,
+                fields=fields,
+                expand=expand,
+            )
+            if not isinstance(page, dict):
+                msg = f"Unexpected return value type from `jira.get_sprint_issues`: {type(page)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return page
+
+        first_page = _fetch_page(0)
+        issues: list[dict[str, Any]] = list(first_page.get("issues", []))
+        total = int(first_page.get("total") or len(issues))
+        # The server may cap the page size below what was requested
+        page_size = len(issues)
+        if not page_size or total <= page_size:
+            return issues
+
+        for outcome in map_concurrently(
+            _fetch_page,
+            range(page_size, total, page_size),
+            max_workers=self.config.max_concurrency,
+        ):
+            if not outcome.ok:
+                raise outcome.error  # type: ignore[misc]
+            issues.extend((outcome.value or {}).get("issues", []))
+        return issues
+
+    def _find_story_points_field(self) -> str | None:
+        """Look up the story points custom field ID by its well-known names."""
+        for name in STORY_POINTS_FIELD_NAMES:
+            field_id = self.get_field_id(name)  # type: ignore[attr-defined]
+            if field_id:
+                return field_id
+        return None
+
+
+def _story_points(value: Any) -> float | None:
+    """Parse a story points field value, returning None when unestimated."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _added_after(
+    issue: dict[str, Any], sprint_id: str, started: datetime.datetime
+) -> bool:
+    """Whether an issue joined the sprint after it started."""
+    joined: datetime.datetime | None = None
+    for history in (issue.get("changelog") or {}).get("histories", []):
+        for item in history.get("items", []):
+            if item.get("field") != "Sprint":
+                continue
+            to_ids = {i.strip() for i in str(item.get("to") or "").split(",")}
+            from_ids = {i.strip() for i in str(item.get("from") or "").split(",")}
+            if sprint_id in to_ids and sprint_id not in from_ids:
+                changed = _parse_aware(history.get("created"))
+                if changed and (joined is None or changed > joined):
+                    joined = changed
+    if joined is None:
+        joined = _parse_aware((issue.get("fields") or {}).get("created"))
+    return joined is not None and joined > started
+
+
+def _parse_aware(value: str | None) -> datetime.datetime | None:
+    """Parse a Jira timestamp, treating values without an offset as UTC."""
+    parsed = parse_date(value)
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
@@ -8,13 +8,27 @@ from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models import JiraIssue, JiraTransition
+from ..utils.concurrency import map_concurrently
+from .cache import SiteCache, site_key
 from .client import JiraClient
-from .protocols import IssueOperationsProto, UsersOperationsProto
+from .protocols import (
+    IssueOperationsProto,
+    SearchOperationsProto,
+    UsersOperationsProto,
+)
 
 logger = logging.getLogger("mcp-jira")
 
+# Available transitions per (site, project, issue type, status). Workflows change
+# rarely, and a stale entry is dropped as soon as a transition using it fails.
+_transitions_cache: SiteCache[list[dict[str, Any]]] = SiteCache(
+    "workflow_transitions", maxsize=1024, ttl=600
+)
 
-class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
+
+class TransitionsMixin(
+    JiraClient, IssueOperationsProto, SearchOperationsProto, UsersOperationsProto
+):
     """Mixin for Jira transition operations."""
 
     def get_available_transitions(self, issue_key: str) -> list[dict[str, Any]]:
@@ -261,6 +275,192 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
             logger.error(error_msg)
             raise ValueError(error_msg) from e
 
+    def batch_transition_issues(
+        self,
+        issue_keys: list[str],
+        transition: str | int,
+        fields: dict[str, Any] | None = None,
+        comment: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Transition many issues with a single transition.
+
+        The current status of all issues is read with batched JQL queries and
+        the available transitions are fetched once per distinct (project,
+        issue type, status) combination, so the transition is validated
+        locally instead of with one lookup per issue. Transitions are then
+        applied concurrently. Failures are reported per issue and never abort
+        the rest of the batch.
+
+        Args:
+            issue_keys: Keys of the issues to transition
+            transition: Transition ID, transition name, or target status name
+            fields: Optional fields to set during the transition
+            comment: Optional comment to add during the transition
+
+        Returns:
+            One result dictionary per distinct issue key, in input order, with
+            ``issue_key``, ``success``, ``from_status``, ``to_status``,
+            ``transition_id`` and, where relevant, ``skipped`` or ``error``
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        """
+        unique_keys = list(
+            dict.fromkeys(key.strip().upper() for key in issue_keys if key.strip())
+        )
+        if not unique_keys:
+            return []
+
+        issues = self._fetch_raw_issues_by_keys(
+            unique_keys, fields="status,issuetype,project"
+        )
+
+        results: dict[str, dict[str, Any]] = {}
+        groups: dict[tuple[str, str, str], list[str]] = {}
+        status_names: dict[str, str] = {}
+        for key in unique_keys:
+            issue = issues.get(key)
+            if issue is None:
+                results[key] = {
+                    "issue_key": key,
+                    "success": False,
+                    "error": "Issue not found or not accessible",
+                }
+                continue
+            issue_fields = issue.get("fields") or {}
+            status = issue_fields.get("status") or {}
+            state = (
+                str((issue_fields.get("project") or {}).get("key", "")),
+                str((issue_fields.get("issuetype") or {}).get("id", "")),
+                str(status.get("id", "")),
+            )
+            status_names[key] = status.get("name", "")
+            groups.setdefault(state, []).append(key)
+
+        # Resolve the transitions available from each distinct workflow state
+        site = site_key(self.config)
+
+        def _load_transitions(state: tuple[str, str, str]) -> list[dict[str, Any]]:
+            return _transitions_cache.get_or_load(
+                (site, *state),
+                lambda: list(self.jira.get_issue_transitions(groups[state][0])),
+            )
+
+        transitions_by_state: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+        for outcome in map_concurrently(
+            _load_transitions, list(groups), max_workers=self.config.max_concurrency
+        ):
+            if outcome.ok:
+                transitions_by_state[outcome.item] = outcome.value or []
+                continue
+            for key in groups[outcome.item]:
+                results[key] = {
+                    "issue_key": key,
+                    "success": False,
+                    "from_status": status_names[key],
+                    "error": f"Could not load transitions: {outcome.error}",
+                }
+
+        # Prepare the request payload once for the whole batch
+        fields_for_api = self._sanitize_transition_fields(fields) if fields else None
+        update_for_api = None
+        if comment:
+            temp_transition_data: dict[str, Any] = {}
+            self._add_comment_to_transition_data(temp_transition_data, comment)
+            update_for_api = temp_transition_data.get("update")
+
+        target = str(transition).strip().casefold()
+        planned: list[tuple[str, tuple[str, str, str], dict[str, Any]]] = []
+        for state, transitions in transitions_by_state.items():
+            match = self._match_transition(transitions, transition)
+            for key in groups[state]:
+                from_status = status_names[key]
+                if from_status.casefold() == target:
+                    # Already in the requested status, nothing to do
+                    results[key] = {
+                        "issue_key": key,
+                        "success": True,
+                        "skipped": True,
+                        "from_status": from_status,
+                        "to_status": from_status,
+                    }
+                elif match is None:
+                    available = ", ".join(
+                        f"{t.get('id')} ({t.get('name')})" for t in transitions
+                    )
+                    results[key] = {
+                        "issue_key": key,
+                        "success": False,
+                        "from_status": from_status,
+                        "error": (
+                            f"Transition '{transition}' is not available from "
+                            f"status '{from_status}'. Available: {available or 'none'}"
+                        ),
+                    }
+                else:
+                    planned.append((key, state, match))
+
+        def _apply(plan: tuple[str, tuple[str, str, str], dict[str, Any]]) -> None:
+            key, _, match = plan
+            self.jira.set_issue_status_by_transition_id(
+                issue_key=key,
+                transition_id=str(match.get("id")),
+                fields=fields_for_api or None,
+                update=update_for_api,
+            )
+
+        logger.info(
+            f"Applying transition '{transition}' to {len(planned)} of "
+            f"{len(unique_keys)} issues"
+        )
+        for outcome in map_concurrently(
+            _apply, planned, max_workers=self.config.max_concurrency
+        ):
+            key, state, match = outcome.item
+            result: dict[str, Any] = {
+                "issue_key": key,
+                "success": outcome.ok,
+                "from_status": status_names[key],
+                "to_status": (match.get("to") or {}).get("name"),
+                "transition_id": str(match.get("id")),
+            }
+            if not outcome.ok:
+                result["error"] = str(outcome.error)
+                # The workflow may have changed since the transitions were cached
+                _transitions_cache.invalidate((site, *state))
+            results[key] = result
+
+        return [results[key] for key in unique_keys]
+
+    @staticmethod
+    def _match_transition(
+        transitions: list[dict[str, Any]], transition: str | int
+    ) -> dict[str, Any] | None:
+        """
+        Find a transition by ID, transition name, or target status name.
+
+        Args:
+            transitions: Raw transitions available from an issue's status
+            transition: Transition ID, transition name, or target status name
+
+        Returns:
+            The matching raw transition, or None if none matches
+        """
+        wanted = str(transition).strip()
+        for candidate in transitions:
+            if str(candidate.get("id")) == wanted:
+                return candidate
+        wanted_name = wanted.casefold()
+        for candidate in transitions:
+            if str(candidate.get("name", "")).casefold() == wanted_name:
+                return candidate
+        for candidate in transitions:
+            to_status = candidate.get("to") or {}
+            if str(to_status.get("name", "")).casefold() == wanted_name:
+                return candidate
+        return None
+
     def _normalize_transition_id(self, transition_id: str | int | dict) -> str | int:
         """
         Normalize the transition ID to a common format.
@@ -2,6 +2,7 @@
 
 import logging
 import re
+import threading
 from typing import TYPE_CHECKING, TypeVar
 
 import requests
@@ -10,6 +11,8 @@ from requests.exceptions import HTTPError
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.models.jira.common import JiraUser
 
+from ..utils.concurrency import map_concurrently
+from .cache import SiteCache, site_key
 from .client import JiraClient
 
 if TYPE_CHECKING:
@@ -19,6 +22,17 @@ JiraUserType = TypeVar("JiraUserType", bound="JiraUser")
 
 logger = logging.getLogger("mcp-jira")
 
+# Resolved user identifiers (email, username, display name) per site. Misses are
+# kept separately with a short TTL so typos don't trigger repeated searches
+# while newly created users still become resolvable quickly.
+_user_id_cache: SiteCache[str] = SiteCache("user_identities", maxsize=4096, ttl=3600)
+_user_miss_cache: SiteCache[bool] = SiteCache(
+    "user_identity_misses", maxsize=1024, ttl=300
+)
+# Marks a lookup in the current thread whose user search failed, so the
+# failure is not cached as a missing user
+_lookup_state = threading.local()
+
 
 class UsersMixin(JiraClient):
     """Mixin for Jira user operations."""
@@ -105,17 +119,76 @@ class UsersMixin(JiraClient):
         if assignee.startswith("5") and len(assignee) >= 10:
             return assignee
 
-        account_id = self._lookup_user_directly(assignee)
+        cache_key = self._user_cache_key(assignee)
+        account_id = _user_id_cache.get(cache_key)
         if account_id:
             return account_id
+        if cache_key in _user_miss_cache:
+            error_msg = f"Could not find account ID for user: {assignee}"
+            raise ValueError(error_msg)
 
-        account_id = self._lookup_user_by_permissions(assignee)
+        _lookup_state.failed = False
+        account_id = self._lookup_user_directly(assignee)
+        if not account_id:
+            account_id = self._lookup_user_by_permissions(assignee)
         if account_id:
+            _user_id_cache.set(cache_key, account_id)
             return account_id
 
+        if _lookup_state.failed:
+            # Timeouts and rate limiting say nothing about the user
+            error_msg = (
+                f"Could not find account ID for user: {assignee} "
+                "(the user search failed)"
+            )
+            raise ValueError(error_msg)
+        _user_miss_cache.set(cache_key, value=True)
         error_msg = f"Could not find account ID for user: {assignee}"
         raise ValueError(error_msg)
 
+    def resolve_account_ids(self, identifiers: list[str]) -> dict[str, str | None]:
+        """
+        Resolve many user identifiers to account IDs.
+
+        Identifiers are deduplicated (case-insensitively) and the ones not
+        already cached are looked up concurrently.
+
+        Args:
+            identifiers: Usernames, emails, display names or account IDs
+
+        Returns:
+            Dictionary mapping each given identifier to its account ID, or
+            None when the user could not be found
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        """
+        unique: dict[str, str] = {}
+        for identifier in identifiers:
+            if identifier and identifier.strip():
+                unique.setdefault(identifier.strip().casefold(), identifier.strip())
+
+        resolved: dict[str, str | None] = {}
+        for outcome in map_concurrently(
+            self._get_account_id,
+            list(unique.values()),
+            max_workers=self.config.max_concurrency,
+        ):
+            if isinstance(outcome.error, MCPAtlassianAuthenticationError):
+                raise outcome.error
+            if not outcome.ok:
+                logger.warning(f"Could not resolve user: {outcome.error}")
+            resolved[outcome.item.casefold()] = outcome.value
+
+        return {
+            identifier: resolved.get(identifier.strip().casefold())
+            for identifier in identifiers
+        }
+
+    def _user_cache_key(self, identifier: str) -> tuple[str, str]:
+        """Build the site-scoped cache key for a user identifier."""
+        return (site_key(self.config), identifier.strip().casefold())
+
     def _lookup_user_directly(self, username: str) -> str | None:
         """
         Look up a user account ID directly.
@@ -125,6 +198,9 @@ class UsersMixin(JiraClient):
 
         Returns:
             Optional[str]: Account ID if found, None otherwise.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
         """
         try:
             # For Cloud, use query parameter; for Server/DC use username
@@ -163,8 +239,16 @@ class UsersMixin(JiraClient):
                             )
                             return user["key"]
             return None
+        except MCPAtlassianAuthenticationError:
+            raise
+        except HTTPError as http_err:
+            _raise_for_auth_error(http_err)
+            logger.info(f"Error looking up user directly: {str(http_err)}")
+            _lookup_state.failed = True
+            return None
         except Exception as e:
             logger.info(f"Error looking up user directly: {str(e)}")
+            _lookup_state.failed = True
             return None
 
     def _lookup_user_by_permissions(self, username: str) -> str | None:
@@ -176,6 +260,9 @@ class UsersMixin(JiraClient):
 
         Returns:
             Optional[str]: Account ID if found, None otherwise.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
         """
         try:
             url = f"{self.config.url}/rest/api/2/user/permission/search"
@@ -213,9 +300,22 @@ class UsersMixin(JiraClient):
                                 "Using 'key' as fallback for assignee name in Jira Data Center/Server"
                             )
                             return user["key"]
+            elif response.status_code in [401, 403]:
+                response.raise_for_status()
+            else:
+                logger.info(
+                    f"User permission search returned status {response.status_code}"
+                )
+                _lookup_state.failed = True
+            return None
+        except HTTPError as http_err:
+            _raise_for_auth_error(http_err)
+            logger.info(f"Error looking up user by permissions: {str(http_err)}")
+            _lookup_state.failed = True
             return None
         except Exception as e:
             logger.info(f"Error looking up user by permissions: {str(e)}")
+            _lookup_state.failed = True
             return None
 
     def _determine_user_api_params(self, identifier: str) -> dict[str, str]:
@@ -255,7 +355,9 @@ class UsersMixin(JiraClient):
         # Cloud: identifier is email
         elif self.config.is_cloud and "@" in identifier:
             try:
-                resolved_id = self._lookup_user_directly(identifier)
+                resolved_id = _user_id_cache.get(
+                    self._user_cache_key(identifier)
+                ) or self._lookup_user_directly(identifier)
                 if resolved_id and (
                     re.match(r"^[0-9a-f]{24}$", resolved_id)
                     or re.match(r"^\d+:\w+", resolved_id)
@@ -381,3 +483,18 @@ class UsersMixin(JiraClient):
             raise Exception(
                 f"Error processing user profile for '{identifier}': {str(e)}"
             ) from e
+
+
+def _raise_for_auth_error(http_err: HTTPError) -> None:
+    """Raise MCPAtlassianAuthenticationError for 401/403 responses."""
+    if http_err.response is not None and http_err.response.status_code in [
+        401,
+        403,
+    ]:
+        error_msg = (
+            f"Authentication failed for Jira API "
+            f"({http_err.response.status_code}). "
+            "Token may be expired or invalid. Please verify credentials."
+        )
+        logger.error(error_msg)
+        raise MCPAtlassianAuthenticationError(error_msg) from http_err
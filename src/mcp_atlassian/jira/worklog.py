@@ -2,14 +2,26 @@
 
 import logging
 import re
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import replace
+from datetime import datetime, timezone
 from typing import Any
 
-from ..models import JiraWorklog
+from ..models import JiraWorklog, JiraWorklogRecord
+from ..models.jira import RecordInterner
 from ..utils import parse_date
+from ..utils.concurrency import chunked, iter_concurrently
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+# worklog/list accepts at most 1000 IDs per request
+WORKLOG_LIST_MAX_IDS = 1000
+# Page size for per-issue worklog requests (Server/DC returns all entries)
+WORKLOG_PAGE_SIZE = 1000
+WORKLOG_GROUP_BY = ("author", "issue", "day")
+
 
 class WorklogMixin(JiraClient):
     """Mixin for Jira worklog operations."""
@@ -129,8 +141,6 @@ class WorklogMixin(JiraClient):
                 worklog_data["started"] = started
             else:
                 # Default to current time in ISO format if not provided
-                from datetime import datetime, timezone
-
                 worklog_data["started"] = datetime.now(timezone.utc).strftime(
                     "%Y-%m-%dT%H:%M:%S.000+0000"
                 )
@@ -258,3 +268,253 @@ class WorklogMixin(JiraClient):
         except Exception as e:
             logger.error(f"Error getting worklogs for issue {issue_key}: {str(e)}")
             raise Exception(f"Error getting worklogs: {str(e)}") from e
+
+    def iter_worklog_records(
+        self,
+        issue_keys: list[str],
+        started_after: datetime | str | None = None,
+        started_before: datetime | str | None = None,
+    ) -> Iterator[tuple[str, JiraWorklogRecord]]:
+        """
+        Stream compact worklog records for many issues.
+
+        On Jira Cloud with a start date, worklog IDs changed since that date
+        are listed with ``worklog/updated`` and fetched in bulk with
+        ``worklog/list``, so the number of requests does not grow with the
+        number of issues. Otherwise each issue's worklogs are paged
+        concurrently. Keys that do not exist or are not visible are skipped.
+
+        Note:
+            The bulk path selects worklogs by last update time, so an entry
+            created before ``started_after`` but dated after it is not seen.
+
+        Args:
+            issue_keys: Issue keys to report on
+            started_after: Only include work started at or after this time
+            started_before: Only include work started before this time
+
+        Yields:
+            Tuples of (issue key, worklog record)
+
+        Raises:
+            MCPAtlassianAuthenticationError: If the issue lookup is not authorized
+        """
+        issues = self._fetch_raw_issues_by_keys(  # type: ignore[attr-defined]
+            issue_keys, fields="key"
+        )
+        keys_by_id = {str(issue.get("id")): key for key, issue in issues.items()}
+        yield from self._iter_worklog_records(
+            keys_by_id, _as_utc(started_after), _as_utc(started_before)
+        )
+
+    def summarize_worklogs(
+        self,
+        issue_keys: list[str],
+        group_by: list[str] | tuple[str, ...] = ("author",),
+        started_after: datetime | str | None = None,
+        started_before: datetime | str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Total time spent across many issues without returning raw worklogs.
+
+        Args:
+            issue_keys: Issue keys to report on
+            group_by: Dimensions to total by: 'author', 'issue' and/or 'day'
+            started_after: Only include work started at or after this time
+            started_before: Only include work started before this time
+
+        Returns:
+            Dictionary with worklog and issue counts, overall seconds spent,
+            and per-dimension totals in seconds sorted from largest
+
+        Raises:
+            ValueError: If group_by contains an unsupported dimension
+            MCPAtlassianAuthenticationError: If the issue lookup is not authorized
+        """
+        invalid = [dim for dim in group_by if dim not in WORKLOG_GROUP_BY]
+        if invalid:
+            msg = (
+                f"Unsupported group_by value(s): {', '.join(invalid)}. "
+                f"Use one or more of: {', '.join(WORKLOG_GROUP_BY)}"
+            )
+            raise ValueError(msg)
+
+        issues = self._fetch_raw_issues_by_keys(  # type: ignore[attr-defined]
+            issue_keys, fields="key"
+        )
+        keys_by_id = {str(issue.get("id")): key for key, issue in issues.items()}
+
+        totals: dict[str, defaultdict[str, int]] = {
+            dim: defaultdict(int) for dim in group_by
+        }
+        worklog_count = 0
+        total_seconds = 0
+        for issue_key, record in self._iter_worklog_records(
+            keys_by_id, _as_utc(started_after), _as_utc(started_before)
+        ):
+            worklog_count += 1
+            total_seconds += record.time_spent_seconds
+            for dim in group_by:
+                if dim == "author":
+                    group = record.author
+                elif dim == "issue":
+                    group = issue_key
+                else:
+                    group = record.started[:10]
+                totals[dim][group] += record.time_spent_seconds
+
+        requested = list(dict.fromkeys(key.strip().upper() for key in issue_keys))
+        return {
+            "issue_count": len(keys_by_id),
+            "missing_issue_keys": [key for key in requested if key not in issues],
+            "worklog_count": worklog_count,
+            "total_seconds": total_seconds,
+            "total_hours": round(total_seconds / 3600, 2),
+            "totals": {
+                f"by_{dim}": dict(
+                    sorted(values.items(), key=lambda item: (-item[1], item[0]))
+                )
+                for dim, values in totals.items()
+            },
+        }
+
+    def _iter_worklog_records(
+        self,
+        keys_by_id: dict[str, str],
+        started_after: datetime | None,
+        started_before: datetime | None,
+    ) -> Iterator[tuple[str, JiraWorklogRecord]]:
+        """Yield (issue key, record) for worklogs of the given issues in range."""
+        if not keys_by_id:
+            return
+
+        if self.config.is_cloud and started_after is not None:
+            records = self._iter_updated_worklogs(
+                _epoch_millis(started_after), set(keys_by_id)
+            )
+        else:
+            records = self._iter_issue_worklogs(
+                keys_by_id, started_after, started_before
+            )
+
+        for record in records:
+            issue_key = keys_by_id.get(record.issue_id)
+            if issue_key is None:
+                continue
+            started = _as_utc(record.started)
+            if started_after and (started is None or started < started_after):
+                continue
+            if started_before and (started is None or started >= started_before):
+                continue
+            yield issue_key, record
+
+    def _iter_updated_worklogs(
+        self, since_millis: int, issue_ids: set[str]
+    ) -> Iterator[JiraWorklogRecord]:
+        """Bulk-fetch worklogs updated since a time, keeping the given issues."""
+
+        def _id_chunks() -> Iterator[list[int]]:
+            url = self.jira.resource_url("worklog/updated")
+            params: dict[str, Any] | None = {"since": since_millis}
+            while True:
+                page = self.jira.get(url, params=params)
+                if not isinstance(page, dict):
+                    msg = f"Unexpected return value type from `jira.get`: {type(page)}"
+                    logger.error(msg)
+                    raise TypeError(msg)
+                worklog_ids = [
+                    value["worklogId"]
+                    for value in page.get("values", [])
+                    if "worklogId" in value
+                ]
+                yield from chunked(worklog_ids, WORKLOG_LIST_MAX_IDS)
+                if page.get("lastPage", True) or not page.get("nextPage"):
+                    return
+                # nextPage is an absolute URL that already carries the cursor
+                url, params = page["nextPage"], None
+
+        list_url = self.jira.resource_url("worklog/list")
+        intern = RecordInterner()
+
+        def _fetch_chunk(worklog_ids: list[int]) -> list[JiraWorklogRecord]:
+            result = self.jira.post(list_url, json={"ids": worklog_ids})
+            if not isinstance(result, list):
+                msg = f"Unexpected return value type from `jira.post`: {type(result)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return [
+                record
+                for record in (
+                    JiraWorklogRecord.from_api_response(data, intern) for data in result
+                )
+                if record.issue_id in issue_ids
+            ]
+
+        for outcome in iter_concurrently(
+            _fetch_chunk, _id_chunks(), max_workers=self.config.max_concurrency
+        ):
+            if not outcome.ok:
+                logger.error(f"Error fetching worklogs: {outcome.error}")
+                raise outcome.error  # type: ignore[misc]
+            yield from outcome.value or []
+
+    def _iter_issue_worklogs(
+        self,
+        keys_by_id: dict[str, str],
+        started_after: datetime | None,
+        started_before: datetime | None,
+    ) -> Iterator[JiraWorklogRecord]:
+        """Page each issue's worklogs, fetching several issues concurrently."""
+        params: dict[str, Any] = {"maxResults": WORKLOG_PAGE_SIZE}
+        if started_after:
+            params["startedAfter"] = _epoch_millis(started_after)
+        if started_before:
+            params["startedBefore"] = _epoch_millis(started_before)
+        intern = RecordInterner()
+
+        def _fetch_issue(issue: tuple[str, str]) -> list[JiraWorklogRecord]:
+            issue_id, issue_key = issue
+            url = self.jira.resource_url(f"issue/{issue_key}/worklog")
+            records: list[JiraWorklogRecord] = []
+            start_at = 0
+            while True:
+                page = self.jira.get(url, params={**params, "startAt": start_at})
+                if not isinstance(page, dict):
+                    msg = f"Unexpected return value type from `jira.get`: {type(page)}"
+                    logger.error(msg)
+                    raise TypeError(msg)
+                worklogs = page.get("worklogs", [])
+                for data in worklogs:
+                    record = JiraWorklogRecord.from_api_response(data, intern)
+                    if not record.issue_id:
+                        record = replace(record, issue_id=issue_id)
+                    records.append(record)
+                start_at += len(worklogs)
+                if not worklogs or start_at >= int(page.get("total") or 0):
+                    return records
+
+        for outcome in iter_concurrently(
+            _fetch_issue,
+            keys_by_id.items(),
+            max_workers=self.config.max_concurrency,
+        ):
+            if not outcome.ok:
+                logger.error(
+                    f"Error getting worklogs for issue {outcome.item[1]}: "
+                    f"{outcome.error}"
+                )
+                raise outcome.error  # type: ignore[misc]
+            yield from outcome.value or []
+
+
+def _as_utc(value: datetime | str | None) -> datetime | None:
+    """Parse a date or datetime, treating naive values as UTC."""
+    parsed = parse_date(value) if isinstance(value, str) else value
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _epoch_millis(value: datetime) -> int:
+    """Convert a timezone-aware datetime to Unix epoch milliseconds."""
+    return int(value.timestamp() * 1000)
@@ -41,12 +41,14 @@ from .constants import (  # noqa: F401 - Keep constants available
 from .jira import (
     JiraAttachment,
     JiraBoard,
+    JiraChangelogRecord,
     JiraComment,
     JiraIssue,
     JiraIssueType,
     JiraPriority,
     JiraProject,
     JiraResolution,
+    JiraSearchPage,
     JiraSearchResult,
     JiraSprint,
     JiraStatus,
@@ -55,6 +57,7 @@ from .jira import (
     JiraTransition,
     JiraUser,
     JiraWorklog,
+    JiraWorklogRecord,
 )
 
 # Additional models will be added as they are implemented
@@ -90,7 +93,10 @@ __all__ = [
     "JiraResolution",
     "JiraTransition",
     "JiraWorklog",
+    "JiraWorklogRecord",
+    "JiraChangelogRecord",
     "JiraSearchResult",
+    "JiraSearchPage",
     "JiraAttachment",
     "JiraTimetracking",
     "JiraBoard",
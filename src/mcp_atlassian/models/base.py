@@ -6,16 +6,22 @@ Jira and Confluence models to ensure consistent behavior and reduce
 code duplication.
 """
 
-from datetime import datetime
+from collections.abc import Callable
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
 
+from ..utils.date import parse_timestamp
 from .constants import EMPTY_STRING
 
 # Type variable for the return type of from_api_response
 T = TypeVar("T", bound="ApiModel")
 
+# Static defaults and default factories per model, for construct_trusted
+_FieldDefaults = tuple[dict[str, Any], tuple[tuple[str, Callable[[], Any]], ...]]
+_field_defaults: dict[type, _FieldDefaults] = {}
+
 
 class ApiModel(BaseModel):
     """
@@ -26,6 +32,42 @@ class ApiModel(BaseModel):
     for API responses.
     """
 
+    @classmethod
+    def construct_trusted(cls: type[T], **values: Any) -> T:
+        """
+        Create an instance from values that are already of the field types.
+
+        This skips pydantic validation, like ``model_construct`` but without
+        its per-call field introspection. It is meant for ``from_api_response``
+        implementations that normalize API data themselves, on models whose
+        validation would copy large containers such as custom field maps.
+        Input that comes from users must go through the validating
+        constructor instead.
+
+        Args:
+            **values: Field values; missing fields get their defaults
+
+        Returns:
+            An instance of the model
+        """
+        defaults = _field_defaults.get(cls)
+        if defaults is None:
+            defaults = _field_defaults.setdefault(cls, _collect_defaults(cls))
+        static_defaults, factories = defaults
+
+        data = static_defaults.copy()
+        for name, factory in factories:
+            if name not in values:
+                data[name] = factory()
+        data.update(values)
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", data)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
     @classmethod
     def from_api_response(cls: type[T], data: dict[str, Any], **kwargs: Any) -> T:
         """
@@ -53,9 +95,25 @@ class ApiModel(BaseModel):
         return self.model_dump(exclude_none=True)
 
 
+def _collect_defaults(model: type[BaseModel]) -> _FieldDefaults:
+    """Split a model's field defaults into static values and factories."""
+    static_defaults: dict[str, Any] = {}
+    factories: list[tuple[str, Callable[[], Any]]] = []
+    for name, field in model.model_fields.items():
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))  # type: ignore[arg-type]
+        elif field.default is not PydanticUndefined:
+            static_defaults[name] = field.default
+    return static_defaults, tuple(factories)
+
+
 class TimestampMixin:
     """
     Mixin for handling Atlassian API timestamp formats.
+
+    Parsing goes through the shared, memoized ``parse_timestamp``, so the
+    timestamps repeated across comments, changelogs and worklogs are parsed
+    once.
     """
 
     @staticmethod
@@ -72,25 +130,11 @@ class TimestampMixin:
         if not timestamp:
             return EMPTY_STRING
 
-        try:
-            # Parse ISO 8601 format like "2024-01-01T10:00:00.000+0000"
-            # Convert Z format to +00:00 for compatibility with fromisoformat
-            ts = timestamp.replace("Z", "+00:00")
-
-            # Handle timezone format without colon (+0000 -> +00:00)
-            if "+" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("+")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-            elif "-" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("-")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-
-            dt = datetime.fromisoformat(ts)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, TypeError):
-            return timestamp or EMPTY_STRING
+        # Parse ISO 8601 format like "2024-01-01T10:00:00.000+0000"
+        dt = parse_timestamp(timestamp)
+        if dt is None:
+            return timestamp
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
 
     @staticmethod
     def is_valid_timestamp(timestamp: str | None) -> bool:
@@ -105,22 +149,4 @@ class TimestampMixin:
         """
         if not timestamp:
             return False
-
-        try:
-            # Convert Z format to +00:00 for compatibility with fromisoformat
-            ts = timestamp.replace("Z", "+00:00")
-
-            # Handle timezone format without colon (+0000 -> +00:00)
-            if "+" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("+")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-            elif "-" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("-")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-
-            datetime.fromisoformat(ts)
-            return True
-        except (ValueError, TypeError):
-            return False
+        return parse_timestamp(timestamp) is not None
@@ -270,3 +270,33 @@ class ConfluencePage(ApiModel, TimestampMixin):
             ]
 
         return result
+
+    def to_markdown_header(self) -> str:
+        """Render the title and metadata as compact markdown, without the content."""
+        details = []
+        if self.space:
+            space = self.space.key
+            details.append(
+                f"Space: {space} ({self.space.name})"
+                if self.space.name
+                else f"Space: {space}"
+            )
+        if self.version:
+            details.append(f"Version: {self.version.number}")
+        if self.author:
+            details.append(f"Author: {self.author.display_name}")
+        if self.updated:
+            details.append(f"Updated: {self.format_timestamp(self.updated)}")
+
+        lines = [f"# {self.title}"]
+        if details:
+            lines.append(f"- {' | '.join(details)}")
+        if self.url:
+            lines.append(f"- URL: {self.url}")
+        ancestors = [a["title"] for a in self.ancestors if a.get("title")]
+        if ancestors:
+            lines.append(f"- Ancestors: {' > '.join(ancestors)}")
+        attachments = [a.title for a in self.attachments if a.title]
+        if attachments:
+            lines.append(f"- Attachments: {', '.join(attachments)}")
+        return "\n".join(lines)
@@ -11,6 +11,8 @@ from .common import (
     JiraAttachment,
     JiraChangelog,
     JiraChangelogItem,
+    JiraChangelogItemRecord,
+    JiraChangelogRecord,
     JiraIssueType,
     JiraPriority,
     JiraResolution,
@@ -18,6 +20,8 @@ from .common import (
     JiraStatusCategory,
     JiraTimetracking,
     JiraUser,
+    JiraUserRecord,
+    RecordInterner,
 )
 from .issue import JiraIssue
 from .link import (
@@ -27,9 +31,9 @@ from .link import (
     JiraLinkedIssueFields,
 )
 from .project import JiraProject
-from .search import JiraSearchResult
+from .search import JiraSearchPage, JiraSearchResult
 from .workflow import JiraTransition
-from .worklog import JiraWorklog
+from .worklog import JiraWorklog, JiraWorklogRecord
 
 __all__ = [
     # Common models
@@ -43,15 +47,21 @@ __all__ = [
     "JiraTimetracking",
     "JiraChangelog",
     "JiraChangelogItem",
+    "JiraChangelogRecord",
+    "JiraChangelogItemRecord",
+    "JiraUserRecord",
+    "RecordInterner",
     # Entity-specific models
     "JiraComment",
     "JiraWorklog",
+    "JiraWorklogRecord",
     "JiraProject",
     "JiraTransition",
     "JiraBoard",
     "JiraSprint",
     "JiraIssue",
     "JiraSearchResult",
+    "JiraSearchPage",
     "JiraIssueLinkType",
     "JiraIssueLink",
     "JiraLinkedIssue",
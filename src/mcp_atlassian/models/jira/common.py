@@ -6,8 +6,9 @@ issue types, priorities, attachments, and time tracking.
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from pydantic import Field
 
@@ -24,6 +25,8 @@ from ..constants import (
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class JiraUser(ApiModel):
     """
@@ -582,3 +585,198 @@ class JiraChangelog(ApiModel, TimestampMixin):
             result["created"] = str(self.created)
 
         return result
+
+
+class RecordInterner:
+    """
+    Share one instance among equal values while building compact records.
+
+    Field names, status names and authors repeat across thousands of
+    changelog and worklog entries; interning them keeps a single copy of
+    each. The pool lives as long as the interner, so use one per fetch.
+    """
+
+    __slots__ = ("_pool",)
+
+    def __init__(self) -> None:
+        self._pool: dict[Any, Any] = {}
+
+    def __call__(self, value: _T) -> _T:
+        """Return the pooled instance equal to ``value``."""
+        if value is None:
+            return value
+        return self._pool.setdefault(value, value)
+
+
+def _intern_nothing(value: _T) -> _T:
+    return value
+
+
+def _optional_str(value: Any) -> str | None:
+    return None if value is None else str(value)
+
+
+@dataclass(frozen=True, slots=True)
+class JiraUserRecord:
+    """Compact, hashable counterpart of ``JiraUser`` for bulk records."""
+
+    account_id: str | None
+    display_name: str
+    email: str | None = None
+    active: bool = True
+    avatar_url: str | None = None
+    time_zone: str | None = None
+
+    @classmethod
+    def from_api_response(
+        cls, data: dict[str, Any], intern: RecordInterner | None = None
+    ) -> "JiraUserRecord":
+        """
+        Create a JiraUserRecord from a Jira API user.
+
+        Args:
+            data: The user data from the Jira API
+            intern: Interner shared by the records of one fetch
+
+        Returns:
+            A JiraUserRecord instance, shared with equal users when interned
+        """
+        intern = intern or _intern_nothing
+        if not data or not isinstance(data, dict):
+            return intern(cls(account_id=JIRA_DEFAULT_ID, display_name=UNKNOWN))
+        avatars = data.get("avatarUrls")
+        record = cls(
+            account_id=intern(_optional_str(data.get("accountId"))),
+            display_name=intern(str(data.get("displayName", UNKNOWN))),
+            email=intern(_optional_str(data.get("emailAddress"))),
+            active=bool(data.get("active", True)),
+            avatar_url=intern(
+                _optional_str(avatars.get("48x48"))
+                if isinstance(avatars, dict)
+                else None
+            ),
+            time_zone=intern(_optional_str(data.get("timeZone"))),
+        )
+        return intern(record)
+
+    def to_model(self) -> JiraUser:
+        """Convert to a JiraUser model."""
+        return JiraUser(
+            account_id=self.account_id,
+            display_name=self.display_name,
+            email=self.email,
+            active=self.active,
+            avatar_url=self.avatar_url,
+            time_zone=self.time_zone,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class JiraChangelogItemRecord:
+    """Compact, hashable counterpart of ``JiraChangelogItem`` for bulk records."""
+
+    field: str
+    fieldtype: str
+    from_string: str | None = None
+    to_string: str | None = None
+    from_id: str | None = None
+    to_id: str | None = None
+
+    @classmethod
+    def from_api_response(
+        cls, data: dict[str, Any], intern: RecordInterner | None = None
+    ) -> "JiraChangelogItemRecord":
+        """
+        Create a JiraChangelogItemRecord from a Jira API change item.
+
+        Args:
+            data: The change item data from the Jira API
+            intern: Interner shared by the records of one fetch
+
+        Returns:
+            A JiraChangelogItemRecord instance, shared with equal items when
+            interned
+        """
+        intern = intern or _intern_nothing
+        if not isinstance(data, dict):
+            data = {}
+        record = cls(
+            field=intern(str(data.get("field", EMPTY_STRING))),
+            fieldtype=intern(str(data.get("fieldtype", EMPTY_STRING))),
+            from_string=intern(_optional_str(data.get("fromString"))),
+            to_string=intern(_optional_str(data.get("toString"))),
+            from_id=intern(_optional_str(data.get("from"))),
+            to_id=intern(_optional_str(data.get("to"))),
+        )
+        return intern(record)
+
+    def to_model(self) -> JiraChangelogItem:
+        """Convert to a JiraChangelogItem model."""
+        return JiraChangelogItem(
+            field=self.field,
+            fieldtype=self.fieldtype,
+            from_string=self.from_string,
+            to_string=self.to_string,
+            from_id=self.from_id,
+            to_id=self.to_id,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class JiraChangelogRecord:
+    """
+    Compact changelog entry used by bulk changelog fetches.
+
+    Holds the same data as ``JiraChangelog`` in a slotted record whose author
+    and items are interned, so hundreds of thousands of entries stay small.
+    Convert with ``to_model`` where a response is built.
+    """
+
+    id: str
+    author: JiraUserRecord | None
+    created: datetime | None
+    items: tuple[JiraChangelogItemRecord, ...]
+
+    @classmethod
+    def from_api_response(
+        cls, data: dict[str, Any], intern: RecordInterner | None = None
+    ) -> "JiraChangelogRecord":
+        """
+        Create a JiraChangelogRecord from a Jira API changelog entry.
+
+        Args:
+            data: The changelog data from the Jira API
+            intern: Interner shared by the records of one fetch
+
+        Returns:
+            A JiraChangelogRecord instance
+        """
+        if not isinstance(data, dict):
+            data = {}
+        author_data = data.get("author")
+        items_data = data.get("items")
+        created_data = data.get("created")
+        return cls(
+            id=str(data.get("id", JIRA_DEFAULT_ID)),
+            author=(
+                JiraUserRecord.from_api_response(author_data, intern)
+                if author_data
+                else None
+            ),
+            created=parse_date(created_data) if created_data else None,
+            items=tuple(
+                JiraChangelogItemRecord.from_api_response(item, intern)
+                for item in items_data
+            )
+            if isinstance(items_data, list)
+            else (),
+        )
+
+    def to_model(self) -> JiraChangelog:
+        """Convert to a JiraChangelog model."""
+        return JiraChangelog(
+            id=self.id,
+            author=self.author.to_model() if self.author else None,
+            created=self.created,
+            items=[item.to_model() for item in self.items],
+        )
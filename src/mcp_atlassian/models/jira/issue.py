@@ -6,7 +6,9 @@ This module provides Pydantic models for Jira issues.
 
 import logging
 import re
-from typing import Any, Literal
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import Field
 
@@ -15,6 +17,8 @@ from ..constants import (
     EMPTY_STRING,
     JIRA_DEFAULT_ID,
     JIRA_DEFAULT_KEY,
+    NONE_VALUE,
+    UNKNOWN,
 )
 from .comment import JiraComment
 from .common import (
@@ -89,32 +93,72 @@ class JiraIssue(ApiModel, TimestampMixin):
     changelogs: list[JiraChangelog] = Field(default_factory=list)
     issuelinks: list[JiraIssueLink] = Field(default_factory=list)
 
-    def __getattribute__(self, name: str) -> Any:
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """
+            Fall back to custom fields for attributes the model does not define.
+
+            Only called when normal attribute lookup fails, so declared fields
+            are read at full speed.
+
+            Args:
+                name: The attribute name to access
+
+            Returns:
+                The custom field value
+            """
+            try:
+                return super().__getattr__(name)
+            except AttributeError:
+                custom_fields = self.__dict__.get("custom_fields") or {}
+                if name in custom_fields:
+                    return custom_fields[name]
+                raise
+
+    @property
+    def _custom_field_ids_by_name(self) -> dict[str, str]:
         """
-        Custom attribute access to handle custom field access.
+        Lower-cased custom field names mapped to field IDs, first one wins.
 
-        This allows accessing custom fields by their name as if they were
-        regular attributes of the JiraIssue class.
+        The index is kept with the ``custom_fields`` dictionary it was built
+        from and rebuilt when the issue holds another one, as after
+        ``model_copy(update=...)`` or assigning ``custom_fields``.
+        """
+        custom_fields = self.custom_fields
+        cached = self.__dict__.get("_custom_field_index")
+        if cached is not None and cached[0] is custom_fields:
+            return cached[1]
+        ids_by_name: dict[str, str] = {}
+        for field_id, field_data in custom_fields.items():
+            name = field_data.get("name") if isinstance(field_data, dict) else None
+            if name:
+                ids_by_name.setdefault(name.lower(), field_id)
+        self.__dict__["_custom_field_index"] = (custom_fields, ids_by_name)
+        return ids_by_name
+
+    def resolve_custom_field_id(self, key_or_name: str) -> str | None:
+        """
+        Find the ID of a custom field on this issue.
 
         Args:
-            name: The attribute name to access
+            key_or_name: A field ID ('customfield_10010'), a field name
+                (case-insensitive) or a short ID ('cf_10010')
 
         Returns:
-            The attribute value or custom field value
+            The custom field ID, or None if the issue has no such field
         """
-        # First try to get the attribute normally
-        try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            # If the attribute doesn't exist, check if it's a custom field
-            try:
-                custom_fields = super().__getattribute__("custom_fields")
-                if name in custom_fields:
-                    return custom_fields[name]
-            except AttributeError:
-                pass
-            # Re-raise the original AttributeError
-            raise
+        if key_or_name.startswith("customfield_") and key_or_name in self.custom_fields:
+            return key_or_name
+        field_id = self._custom_field_ids_by_name.get(key_or_name.lower())
+        if field_id is not None and field_id not in self.custom_fields:
+            # The dictionary was changed in place after the index was built
+            field_id = None
+        if field_id is None and key_or_name.startswith("cf_"):
+            full_id = "customfield_" + key_or_name[3:]
+            if full_id in self.custom_fields:
+                field_id = full_id
+        return field_id
 
     @property
     def page_content(self) -> str | None:
@@ -432,17 +476,13 @@ class JiraIssue(ApiModel, TimestampMixin):
                     value_obj_to_store["name"] = human_readable_name
                 custom_fields[orig_field_id] = value_obj_to_store
 
-        # Handle requested_fields parameter
-        requested_fields_param = kwargs.get("requested_fields")
-
-        # Convert string requested_fields to list (except "*all")
-        if isinstance(requested_fields_param, str) and requested_fields_param != "*all":
-            requested_fields_param = requested_fields_param.split(",")
-            # Strip whitespace from each field name
-            requested_fields_param = [field.strip() for field in requested_fields_param]
+        requested_fields_param = _normalize_requested_fields(
+            kwargs.get("requested_fields")
+        )
 
-        # Create the issue instance with all the extracted data
-        return cls(
+        # Every value above is already normalized to its field type, so skip
+        # validation, which would copy custom_fields and other containers
+        return cls.construct_trusted(
             id=issue_id,
             key=key,
             summary=summary,
@@ -479,197 +519,10 @@ class JiraIssue(ApiModel, TimestampMixin):
 
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API response."""
-        result: dict[str, Any] = {
-            "id": self.id,
-            "key": self.key,
-        }
-
-        # Helper method to check if a field should be included
-        def should_include_field(field_name: str) -> bool:
-            return (
-                self.requested_fields == "*all"
-                or not isinstance(self.requested_fields, list)
-                or field_name in self.requested_fields
-            )
-
-        # Add summary if requested
-        if should_include_field("summary"):
-            result["summary"] = self.summary
-
-        # Add URL if available and requested
-        if self.url and should_include_field("url"):
-            result["url"] = self.url
-
-        # Add description if available and requested
-        if self.description and should_include_field("description"):
-            result["description"] = self.description
-
-        # Add status if available and requested
-        if self.status and should_include_field("status"):
-            result["status"] = self.status.to_simplified_dict()
-
-        # Add issue type if available and requested
-        if self.issue_type and should_include_field("issue_type"):
-            result["issue_type"] = self.issue_type.to_simplified_dict()
-
-        # Add priority if available and requested
-        if self.priority and should_include_field("priority"):
-            result["priority"] = self.priority.to_simplified_dict()
-
-        # Add project info if available and requested
-        if self.project and should_include_field("project"):
-            result["project"] = self.project.to_simplified_dict()
-
-        # Add resolution if available and requested
-        if self.resolution and should_include_field("resolution"):
-            result["resolution"] = self.resolution.to_simplified_dict()
-
-        # Add dates if available and requested
-        if self.duedate and should_include_field("duedate"):
-            result["duedate"] = self.duedate
-
-        if self.resolutiondate and should_include_field("resolutiondate"):
-            result["resolutiondate"] = self.resolutiondate
-
-        # Add parent and subtasks if available and requested
-        if self.parent and should_include_field("parent"):
-            result["parent"] = self.parent
-
-        if self.subtasks and should_include_field("subtasks"):
-            result["subtasks"] = self.subtasks
-
-        # Add security and worklog if available and requested
-        if self.security and should_include_field("security"):
-            result["security"] = self.security
-
-        if self.worklog and should_include_field("worklog"):
-            result["worklog"] = self.worklog
+        return IssueProjection.for_fields(self.requested_fields).apply(self)
 
-        # Add assignee if requested
-        if should_include_field("assignee"):
-            if self.assignee:
-                result["assignee"] = self.assignee.to_simplified_dict()
-            else:
-                result["assignee"] = {"display_name": "Unassigned"}
-
-        # Add reporter if available and requested
-        if self.reporter and should_include_field("reporter"):
-            result["reporter"] = self.reporter.to_simplified_dict()
-
-        # Add lists if available and requested
-        if self.labels and should_include_field("labels"):
-            result["labels"] = self.labels
-
-        if self.components and should_include_field("components"):
-            result["components"] = self.components
-
-        if self.fix_versions and should_include_field("fix_versions"):
-            result["fix_versions"] = self.fix_versions
-
-        # Add epic fields if available and requested
-        if self.epic_key and should_include_field("epic_key"):
-            result["epic_key"] = self.epic_key
-
-        if self.epic_name and should_include_field("epic_name"):
-            result["epic_name"] = self.epic_name
-
-        # Add time tracking if available and requested
-        if self.timetracking and should_include_field("timetracking"):
-            result["timetracking"] = self.timetracking.to_simplified_dict()
-
-        # Add created and updated timestamps if available and requested
-        if self.created and should_include_field("created"):
-            result["created"] = self.created
-
-        if self.updated and should_include_field("updated"):
-            result["updated"] = self.updated
-
-        # Add comments if available and requested
-        if self.comments and should_include_field("comment"):
-            result["comments"] = [
-                comment.to_simplified_dict() for comment in self.comments
-            ]
-
-        # Add attachments if available and requested
-        if self.attachments and should_include_field("attachment"):
-            result["attachments"] = [
-                attachment.to_simplified_dict() for attachment in self.attachments
-            ]
-
-        # Not use should_include_field since you won't get changelogs
-        # if you don't ask for them
-        if self.changelogs:
-            result["changelogs"] = [
-                changelog.to_simplified_dict() for changelog in self.changelogs
-            ]
-
-        # Add issue links if available and requested
-        if self.issuelinks and should_include_field("issuelinks"):
-            result["issuelinks"] = [
-                link.to_simplified_dict() for link in self.issuelinks
-            ]
-
-        # Process custom fields
-        if self.custom_fields:
-            if self.requested_fields == "*all":
-                for internal_id, field_data_obj in self.custom_fields.items():
-                    processed_value = self._process_custom_field_value(
-                        field_data_obj.get("value")
-                    )
-                    output_value_obj = {"value": processed_value}
-                    if "name" in field_data_obj:
-                        output_value_obj["name"] = field_data_obj["name"]
-                    result[internal_id] = output_value_obj
-            elif isinstance(self.requested_fields, list):
-                for requested_key_or_name in self.requested_fields:
-                    found_by_id_or_name = False
-                    if (
-                        requested_key_or_name.startswith("customfield_")
-                        and requested_key_or_name in self.custom_fields
-                    ):
-                        field_data_obj = self.custom_fields[requested_key_or_name]
-                        output_value_obj = {
-                            "value": self._process_custom_field_value(
-                                field_data_obj.get("value")
-                            )
-                        }
-                        if "name" in field_data_obj:
-                            output_value_obj["name"] = field_data_obj["name"]
-                        result[requested_key_or_name] = output_value_obj
-                        found_by_id_or_name = True
-                    else:
-                        for internal_id, field_data_obj in self.custom_fields.items():
-                            if (
-                                field_data_obj.get("name", "").lower()
-                                == requested_key_or_name.lower()
-                            ):
-                                output_value_obj = {
-                                    "value": self._process_custom_field_value(
-                                        field_data_obj.get("value")
-                                    )
-                                }
-                                output_value_obj["name"] = field_data_obj["name"]
-                                result[internal_id] = output_value_obj
-                                found_by_id_or_name = True
-                                break
-                    if not found_by_id_or_name and requested_key_or_name.startswith(
-                        "cf_"
-                    ):
-                        full_id = "customfield_" + requested_key_or_name[3:]
-                        if full_id in self.custom_fields:
-                            field_data_obj = self.custom_fields[full_id]
-                            output_value_obj = {
-                                "value": self._process_custom_field_value(
-                                    field_data_obj.get("value")
-                                )
-                            }
-                            if "name" in field_data_obj:
-                                output_value_obj["name"] = field_data_obj["name"]
-                            result[full_id] = output_value_obj
-
-        return {k: v for k, v in result.items() if v is not None}
-
-    def _process_custom_field_value(self, field_value: Any) -> Any:
+    @staticmethod
+    def _process_custom_field_value(field_value: Any) -> Any:
         """
         Process a custom field value for simplified dict output.
 
@@ -691,7 +544,7 @@ class JiraIssue(ApiModel, TimestampMixin):
             return field_value
 
         if isinstance(field_value, list):
-            return [self._process_custom_field_value(item) for item in field_value]
+            return [JiraIssue._process_custom_field_value(item) for item in field_value]
 
         return str(field_value)
 
@@ -797,3 +650,412 @@ class JiraIssue(ApiModel, TimestampMixin):
             for link_data in issuelinks_data
             if link_data
         ]
+
+
+def _normalize_requested_fields(
+    requested_fields: Any,
+) -> Literal["*all"] | list[str] | None:
+    """Turn a comma-separated string or other iterable of field names into a list."""
+    if isinstance(requested_fields, str) and requested_fields != "*all":
+        return [field.strip() for field in requested_fields.split(",")]
+    if requested_fields is not None and not isinstance(requested_fields, str | list):
+        return list(requested_fields)
+    return requested_fields
+
+
+def _dict_or_none(model: ApiModel | None) -> dict[str, Any] | None:
+    return model.to_simplified_dict() if model else None
+
+
+def _dicts_or_none(models: list[Any]) -> list[dict[str, Any]] | None:
+    return [model.to_simplified_dict() for model in models] if models else None
+
+
+# (output key, name used in requested_fields or None if always included,
+# extractor returning None to leave the key out), in output order
+_ISSUE_FIELDS: tuple[tuple[str, str | None, Callable[[JiraIssue], Any]], ...] = (
+    ("id", None, lambda issue: issue.id),
+    ("key", None, lambda issue: issue.key),
+    ("summary", "summary", lambda issue: issue.summary),
+    ("url", "url", lambda issue: issue.url or None),
+    ("description", "description", lambda issue: issue.description or None),
+    ("status", "status", lambda issue: _dict_or_none(issue.status)),
+    ("issue_type", "issue_type", lambda issue: _dict_or_none(issue.issue_type)),
+    ("priority", "priority", lambda issue: _dict_or_none(issue.priority)),
+    ("project", "project", lambda issue: _dict_or_none(issue.project)),
+    ("resolution", "resolution", lambda issue: _dict_or_none(issue.resolution)),
+    ("duedate", "duedate", lambda issue: issue.duedate or None),
+    ("resolutiondate", "resolutiondate", lambda issue: issue.resolutiondate or None),
+    ("parent", "parent", lambda issue: issue.parent or None),
+    ("subtasks", "subtasks", lambda issue: issue.subtasks or None),
+    ("security", "security", lambda issue: issue.security or None),
+    ("worklog", "worklog", lambda issue: issue.worklog or None),
+    (
+        "assignee",
+        "assignee",
+        lambda issue: (
+            issue.assignee.to_simplified_dict()
+            if issue.assignee
+            else {"display_name": "Unassigned"}
+        ),
+    ),
+    ("reporter", "reporter", lambda issue: _dict_or_none(issue.reporter)),
+    ("labels", "labels", lambda issue: issue.labels or None),
+    ("components", "components", lambda issue: issue.components or None),
+    ("fix_versions", "fix_versions", lambda issue: issue.fix_versions or None),
+    ("epic_key", "epic_key", lambda issue: issue.epic_key or None),
+    ("epic_name", "epic_name", lambda issue: issue.epic_name or None),
+    ("timetracking", "timetracking", lambda issue: _dict_or_none(issue.timetracking)),
+    ("created", "created", lambda issue: issue.created or None),
+    ("updated", "updated", lambda issue: issue.updated or None),
+    ("comments", "comment", lambda issue: _dicts_or_none(issue.comments)),
+    ("attachments", "attachment", lambda issue: _dicts_or_none(issue.attachments)),
+    # Changelogs are only present when asked for, so they are always included
+    ("changelogs", None, lambda issue: _dicts_or_none(issue.changelogs)),
+    ("issuelinks", "issuelinks", lambda issue: _dicts_or_none(issue.issuelinks)),
+)
+
+
+# Raw API data counterparts of the _ISSUE_FIELDS extractors, called with the
+# issue data and its fields; each gives the same output as building the model
+# and running its extractor
+_RAW_ISSUE_FIELDS: dict[str, Callable[[dict[str, Any], dict[str, Any]], Any]] = {
+    "id": lambda data, fields: str(data.get("id", JIRA_DEFAULT_ID)),
+    "key": lambda data, fields: str(data.get("key", JIRA_DEFAULT_KEY)),
+    "summary": lambda data, fields: str(fields.get("summary", EMPTY_STRING)),
+    "url": lambda data, fields: data.get("self") or None,
+    "description": lambda data, fields: fields.get("description") or None,
+    "status": lambda data, fields: _raw_status(fields.get("status")),
+    "issue_type": lambda data, fields: _raw_named(fields.get("issuetype"), UNKNOWN),
+    "priority": lambda data, fields: _raw_named(fields.get("priority"), NONE_VALUE),
+    "project": lambda data, fields: _raw_model_dict(JiraProject, fields.get("project")),
+    "resolution": lambda data, fields: _raw_model_dict(
+        JiraResolution, fields.get("resolution")
+    ),
+    "duedate": lambda data, fields: _raw_typed(fields.get("duedate"), str),
+    "resolutiondate": lambda data, fields: _raw_typed(
+        fields.get("resolutiondate"), str
+    ),
+    "parent": lambda data, fields: _raw_typed(fields.get("parent"), dict),
+    "subtasks": lambda data, fields: _raw_subtasks(fields.get("subtasks")),
+    "security": lambda data, fields: _raw_typed(fields.get("security"), dict),
+    "worklog": lambda data, fields: _raw_typed(fields.get("worklog"), dict),
+    "assignee": lambda data, fields: (
+        _raw_user(fields.get("assignee")) or {"display_name": "Unassigned"}
+    ),
+    "reporter": lambda data, fields: _raw_user(fields.get("reporter")),
+    "labels": lambda data, fields: _raw_labels(fields.get("labels")),
+    "components": lambda data, fields: _raw_names(fields.get("components")),
+    "fix_versions": lambda data, fields: _raw_names(fields.get("fixVersions")),
+    "epic_key": lambda data, fields: _raw_typed(
+        JiraIssue._find_custom_field_in_api_response(
+            fields, ["epic link", "parent epic"]
+        ),
+        str,
+    ),
+    "epic_name": lambda data, fields: _raw_typed(
+        JiraIssue._find_custom_field_in_api_response(fields, ["epic name"]), str
+    ),
+    "timetracking": lambda data, fields: (
+        JiraTimetracking.from_api_response(timetracking).to_simplified_dict()
+        if (timetracking := fields.get("timetracking"))
+        else None
+    ),
+    "created": lambda data, fields: str(fields.get("created", EMPTY_STRING)) or None,
+    "updated": lambda data, fields: str(fields.get("updated", EMPTY_STRING)) or None,
+    "comments": lambda data, fields: _raw_comments(fields.get("comment")),
+    "attachments": lambda data, fields: _raw_model_dicts(
+        JiraAttachment, fields.get("attachment")
+    ),
+    "changelogs": lambda data, fields: _raw_changelogs(data.get("changelog")),
+    "issuelinks": lambda data, fields: _dicts_or_none(
+        JiraIssue._extract_issue_links(fields)
+    ),
+}
+
+
+def _raw_typed(value: Any, kind: type) -> Any:
+    return value if value and isinstance(value, kind) else None
+
+
+def _raw_named(data: Any, default: str) -> dict[str, Any] | None:
+    if not data:
+        return None
+    if not isinstance(data, dict):
+        data = {}
+    return {"name": str(data.get("name", default))}
+
+
+def _raw_status(data: Any) -> dict[str, Any] | None:
+    result = _raw_named(data, UNKNOWN)
+    if result is None or not isinstance(data, dict):
+        return result
+    if category := data.get("statusCategory"):
+        if not isinstance(category, dict):
+            category = {}
+        result["category"] = str(category.get("name", UNKNOWN))
+        result["color"] = str(category.get("colorName", EMPTY_STRING))
+    return result
+
+
+def _raw_user(data: Any) -> dict[str, Any] | None:
+    if not data:
+        return None
+    if not isinstance(data, dict):
+        data = {}
+    display_name = str(data.get("displayName", UNKNOWN))
+    avatars = data.get("avatarUrls")
+    return {
+        "display_name": display_name,
+        "name": display_name,
+        "email": data.get("emailAddress"),
+        "avatar_url": avatars.get("48x48") if isinstance(avatars, dict) else None,
+    }
+
+
+def _raw_labels(data: Any) -> list[str] | None:
+    if not isinstance(data, list):
+        return None
+    return [str(label) for label in data if label] or None
+
+
+def _raw_names(data: Any) -> list[str] | None:
+    if not isinstance(data, list):
+        return None
+    return [
+        str(item.get("name", "")) if isinstance(item, dict) else str(item)
+        for item in data
+        if item
+    ] or None
+
+
+def _raw_subtasks(data: Any) -> list[dict] | None:
+    if not isinstance(data, list):
+        return None
+    return [subtask for subtask in data if isinstance(subtask, dict)] or None
+
+
+def _raw_model_dict(model: type[ApiModel], data: Any) -> dict[str, Any] | None:
+    if not isinstance(data, dict):
+        return None
+    return model.from_api_response(data).to_simplified_dict()
+
+
+def _raw_model_dicts(model: type[ApiModel], data: Any) -> list[dict[str, Any]] | None:
+    if not isinstance(data, list):
+        return None
+    return [
+        model.from_api_response(item).to_simplified_dict() for item in data if item
+    ] or None
+
+
+def _raw_comments(data: Any) -> list[dict[str, Any]] | None:
+    if not isinstance(data, dict):
+        return None
+    return _raw_model_dicts(JiraComment, data.get("comments"))
+
+
+def _raw_changelogs(data: Any) -> list[dict[str, Any]] | None:
+    if not isinstance(data, dict) or "histories" not in data:
+        return None
+    return [
+        JiraChangelog.from_api_response(history).to_simplified_dict()
+        for history in data["histories"]
+    ] or None
+
+
+class IssueProjection:
+    """
+    The parts of an issue that ``to_simplified_dict`` outputs.
+
+    A projection is compiled once per requested-field signature into a flat
+    list of extractors plus the custom field lookups, and is shared by every
+    issue requested with the same fields, so rendering a result set does not
+    re-decide field inclusion for each issue. Raw issue data from the API can
+    be rendered directly, without building the model first.
+    """
+
+    __slots__ = (
+        "_all_custom_fields",
+        "_custom_fields",
+        "_extractors",
+        "_raw_extractors",
+    )
+
+    def __init__(
+        self,
+        extractors: tuple[tuple[str, Callable[[JiraIssue], Any]], ...],
+        custom_fields: tuple[tuple[str, str | None, str | None], ...],
+        *,
+        all_custom_fields: bool,
+    ) -> None:
+        """
+        Initialize the projection.
+
+        Args:
+            extractors: (output key, extractor) pairs in output order
+            custom_fields: (lower-cased name, field ID if the name is one,
+                full ID if the name is a 'cf_' short ID) per requested field
+            all_custom_fields: Whether every custom field is output
+        """
+        self._extractors = extractors
+        self._raw_extractors = tuple(
+            (key, _RAW_ISSUE_FIELDS[key]) for key, _ in extractors
+        )
+        self._custom_fields = custom_fields
+        self._all_custom_fields = all_custom_fields
+
+    @classmethod
+    def for_fields(
+        cls, requested_fields: Literal["*all"] | str | list[str] | None
+    ) -> "IssueProjection":
+        """
+        Get the projection for a requested_fields value.
+
+        Args:
+            requested_fields: '*all', a list or comma-separated string of
+                field names, or None for the default fields
+
+        Returns:
+            The cached projection for that signature
+        """
+        requested_fields = _normalize_requested_fields(requested_fields)
+        if isinstance(requested_fields, list):
+            return _compile_projection(tuple(requested_fields))
+        return _compile_projection(requested_fields)
+
+    def apply(self, issue: JiraIssue) -> dict[str, Any]:
+        """
+        Render one issue.
+
+        Args:
+            issue: The issue to render
+
+        Returns:
+            The simplified dictionary for the issue
+        """
+        result: dict[str, Any] = {}
+        for key, extract in self._extractors:
+            value = extract(issue)
+            if value is not None:
+                result[key] = value
+
+        custom_fields = issue.custom_fields
+        if not custom_fields:
+            return result
+        if self._all_custom_fields:
+            for field_id, field_data in custom_fields.items():
+                result[field_id] = _project_custom_field(field_data)
+            return result
+
+        for lower_name, direct_id, short_id in self._custom_fields:
+            if direct_id is not None and direct_id in custom_fields:
+                field_id: str | None = direct_id
+            else:
+                field_id = issue._custom_field_ids_by_name.get(lower_name)
+                if field_id not in custom_fields:
+                    field_id = None
+                if field_id is None and short_id in custom_fields:
+                    field_id = short_id
+            if field_id is not None:
+                result[field_id] = _project_custom_field(custom_fields[field_id])
+        return result
+
+    def apply_raw(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Render one issue straight from its API data.
+
+        The output is the same as ``apply`` on the issue built from the data,
+        but only the requested parts of the data are looked at.
+
+        Args:
+            data: The issue data from the Jira API
+
+        Returns:
+            The simplified dictionary for the issue
+        """
+        if not data or not isinstance(data, dict):
+            # Like from_api_response, fall back to a default issue
+            return _compile_projection(None).apply_raw({"fields": {}})
+        fields = data.get("fields", {})
+        if not isinstance(fields, dict):
+            fields = {}
+
+        result: dict[str, Any] = {}
+        for key, extract in self._raw_extractors:
+            value = extract(data, fields)
+            if value is not None:
+                result[key] = value
+
+        if not self._all_custom_fields and not self._custom_fields:
+            return result
+        names = data.get("names")
+        if not isinstance(names, dict):
+            names = {}
+        if self._all_custom_fields:
+            for field_id, value in fields.items():
+                if field_id.startswith("customfield_"):
+                    result[field_id] = _project_raw_custom_field(
+                        value, names.get(field_id)
+                    )
+            return result
+
+        ids_by_name: dict[str, str] | None = None
+        for lower_name, direct_id, short_id in self._custom_fields:
+            if direct_id is not None and direct_id in fields:
+                field_id: str | None = direct_id
+            else:
+                if ids_by_name is None:
+                    ids_by_name = {}
+                    for custom_id in fields:
+                        name = names.get(custom_id)
+                        if name and custom_id.startswith("customfield_"):
+                            ids_by_name.setdefault(name.lower(), custom_id)
+                field_id = ids_by_name.get(lower_name)
+                if field_id is None and short_id in fields:
+                    field_id = short_id
+            if field_id is not None:
+                result[field_id] = _project_raw_custom_field(
+                    fields[field_id], names.get(field_id)
+                )
+        return result
+
+
+def _project_custom_field(field_data: dict) -> dict[str, Any]:
+    output = {"value": JiraIssue._process_custom_field_value(field_data.get("value"))}
+    if "name" in field_data:
+        output["name"] = field_data["name"]
+    return output
+
+
+def _project_raw_custom_field(value: Any, name: Any) -> dict[str, Any]:
+    output = {"value": JiraIssue._process_custom_field_value(value)}
+    if name:
+        output["name"] = name
+    return output
+
+
+@lru_cache(maxsize=256)
+def _compile_projection(
+    signature: str | tuple[str, ...] | None,
+) -> IssueProjection:
+    """Compile the projection for a '*all', tuple-of-names or None signature."""
+    if isinstance(signature, tuple):
+        requested = frozenset(signature)
+        extractors = tuple(
+            (key, extract)
+            for key, name, extract in _ISSUE_FIELDS
+            if name is None or name in requested
+        )
+        custom_fields = tuple(
+            (
+                name.lower(),
+                name if name.startswith("customfield_") else None,
+                "customfield_" + name[3:] if name.startswith("cf_") else None,
+            )
+            for name in signature
+        )
+        return IssueProjection(extractors, custom_fields, all_custom_fields=False)
+
+    extractors = tuple((key, extract) for key, _, extract in _ISSUE_FIELDS)
+    return IssueProjection(extractors, (), all_custom_fields=signature == "*all")
@@ -0,0 +1,223 @@
+"""
+Compact markdown rendering of Jira issues.
+
+The renderers work on the simplified issue dictionaries that
+``IssueProjection.apply_raw`` builds from raw API data, so issues are
+rendered without building the models or serializing JSON.
+"""
+
+import json
+from typing import Any
+
+# Summary line fields: (output key, label); lines hold the non-empty values
+_SUMMARY_LINES: tuple[tuple[tuple[str, str], ...], ...] = (
+    (
+        ("issue_type", "Type"),
+        ("status", "Status"),
+        ("priority", "Priority"),
+        ("resolution", "Resolution"),
+    ),
+    (("assignee", "Assignee"), ("reporter", "Reporter")),
+    (("project", "Project"), ("parent", "Parent"), ("epic_key", "Epic")),
+    (
+        ("created", "Created"),
+        ("updated", "Updated"),
+        ("duedate", "Due"),
+        ("resolutiondate", "Resolved"),
+    ),
+    (
+        ("labels", "Labels"),
+        ("components", "Components"),
+        ("fix_versions", "Fix versions"),
+        ("security", "Security"),
+    ),
+    (("timetracking", "Time"), ("url", "URL")),
+)
+
+# Keys rendered in their own sections, or not at all
+_SECTION_KEYS = frozenset(
+    {
+        "id",
+        "key",
+        "summary",
+        "description",
+        "epic_name",
+        "subtasks",
+        "issuelinks",
+        "attachments",
+        "comments",
+        "changelogs",
+        "worklog",
+    }
+)
+_SUMMARY_KEYS = frozenset(key for line in _SUMMARY_LINES for key, _ in line)
+
+
+def render_issue_markdown(
+    issue: dict[str, Any], *, level: int = 1, include_comments: bool = True
+) -> str:
+    """
+    Render a simplified issue dictionary as compact markdown.
+
+    Args:
+        issue: Simplified issue dictionary, as built by ``IssueProjection``
+        level: Heading level of the issue title
+        include_comments: Whether the comments section is rendered
+
+    Returns:
+        The issue as markdown
+    """
+    heading = "#" * level
+    lines = [f"{heading} {issue.get('key', '')}: {issue.get('summary', '')}"]
+    for line in _SUMMARY_LINES:
+        parts = [
+            f"{label}: {_describe(key, issue[key], issue)}"
+            for key, label in line
+            if issue.get(key)
+        ]
+        if parts:
+            lines.append(f"- {' | '.join(parts)}")
+    for key, value in issue.items():
+        if key not in _SECTION_KEYS and key not in _SUMMARY_KEYS:
+            label = value.get("name", key) if isinstance(value, dict) else key
+            field_value = value.get("value") if isinstance(value, dict) else value
+            if field_value not in (None, "", []):
+                lines.append(f"- {label}: {_inline(field_value)}")
+
+    sections = ["\n".join(lines)]
+    subheading = f"{heading}#"
+    description = issue.get("description")
+    if description:
+        sections.append(f"{subheading} Description\n{_text(description)}")
+    for key, title, render in (
+        ("subtasks", "Subtasks", _subtask_line),
+        ("issuelinks", "Links", _link_line),
+        ("attachments", "Attachments", _attachment_line),
+        ("changelogs", "Changelog", _changelog_line),
+    ):
+        entries = [render(entry) for entry in issue.get(key) or []]
+        if entries:
+            sections.append(f"{subheading} {title}\n" + "\n".join(entries))
+    comments = issue.get("comments")
+    if include_comments and comments:
+        sections.append(
+            f"{subheading} Comments\n"
+            + "\n\n".join(render_comment_markdown(comment) for comment in comments)
+        )
+    return "\n\n".join(sections)
+
+
+def render_comment_markdown(comment: dict[str, Any]) -> str:
+    """Render a simplified comment dictionary as markdown."""
+    author = (comment.get("author") or {}).get("display_name") or "Unknown"
+    return f"**{author}** ({comment.get('created', '')}):\n{_text(comment.get('body'))}"
+
+
+def _describe(key: str, value: Any, issue: dict[str, Any]) -> str:
+    """Render the value of a summary line field."""
+    if key == "project":
+        name = value.get("name")
+        return f"{value.get('key')} ({name})" if name else str(value.get("key"))
+    if key == "parent":
+        summary = (value.get("fields") or {}).get("summary")
+        return f"{value.get('key')}: {summary}" if summary else str(value.get("key"))
+    if key == "epic_key" and issue.get("epic_name"):
+        return f"{value} ({issue['epic_name']})"
+    if key == "timetracking":
+        return ", ".join(
+            f"{name.replace('_', ' ')} {value[name]}"
+            for name in ("original_estimate", "remaining_estimate", "time_spent")
+            if value.get(name)
+        )
+    return _inline(value)
+
+
+def _inline(value: Any) -> str:
+    """Render a value on one line."""
+    if isinstance(value, dict):
+        for name in ("display_name", "name", "value", "key"):
+            if value.get(name):
+                return str(value[name])
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    if isinstance(value, list):
+        return ", ".join(_inline(item) for item in value)
+    return str(value)
+
+
+def _text(value: Any) -> str:
+    """Render a description or comment body, which may be an ADF document."""
+    if isinstance(value, dict):
+        return _adf_text(value).strip()
+    return "" if value is None else str(value).strip()
+
+
+def _adf_text(node: dict[str, Any]) -> str:
+    """Flatten an ADF node into plain text with markdown-like block breaks."""
+    node_type = node.get("type")
+    if node_type == "text":
+        return str(node.get("text", ""))
+    if node_type == "hardBreak":
+        return "\n"
+    if node_type in ("mention", "emoji", "status", "date", "inlineCard"):
+        attrs = node.get("attrs") or {}
+        return str(attrs.get("text") or attrs.get("url") or attrs.get("shortName", ""))
+    inner = "".join(
+        _adf_text(child)
+        for child in node.get("content") or []
+        if isinstance(child, dict)
+    )
+    if node_type == "heading":
+        level = (node.get("attrs") or {}).get("level", 1)
+        return f"{'#' * level} {inner}\n\n"
+    if node_type == "listItem":
+        return f"- {inner.strip()}\n"
+    if node_type == "codeBlock":
+        return f"```\n{inner}\n```\n\n"
+    if node_type == "paragraph":
+        return f"{inner.rstrip()}\n\n"
+    if node_type in ("blockquote", "bulletList", "orderedList"):
+        return f"{inner}\n"
+    return inner
+
+
+def _subtask_line(subtask: Any) -> str:
+    fields = subtask.get("fields") or {}
+    status = (fields.get("status") or {}).get("name")
+    state = f" [{status}]" if status else ""
+    return f"- {subtask.get('key')}{state}: {fields.get('summary', '')}"
+
+
+def _link_line(link: dict[str, Any]) -> str:
+    link_type = link.get("type") or {}
+    if link.get("outward_issue"):
+        relation, other = link_type.get("outward"), link["outward_issue"]
+    else:
+        relation, other = link_type.get("inward"), link.get("inward_issue") or {}
+    fields = other.get("fields") or {}
+    status = (fields.get("status") or {}).get("name")
+    state = f" [{status}]" if status else ""
+    relation = relation or link_type.get("name", "relates to")
+    return f"- {relation} {other.get('key')}{state}: {fields.get('summary', '')}"
+
+
+def _attachment_line(attachment: dict[str, Any]) -> str:
+    details = ", ".join(
+        str(part)
+        for part in (
+            attachment.get("content_type"),
+            f"{attachment['size']} bytes" if attachment.get("size") else None,
+        )
+        if part
+    )
+    name = attachment.get("filename", "")
+    return f"- {name} ({details})" if details else f"- {name}"
+
+
+def _changelog_line(changelog: dict[str, Any]) -> str:
+    author = (changelog.get("author") or {}).get("display_name") or "Unknown"
+    changes = "; ".join(
+        f"{item.get('field')}: {item.get('from_string') or '-'} → "
+        f"{item.get('to_string') or '-'}"
+        for item in changelog.get("items") or []
+    )
+    return f"- {changelog.get('created', '')} {author}: {changes}"
@@ -1,16 +1,19 @@
 """
 Jira search result models.
 
-This module provides Pydantic models for Jira search (JQL) results.
+This module provides Pydantic models for Jira search (JQL) results, and a
+lazy page type that keeps the raw issues of a result.
 """
 
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 from pydantic import Field, model_validator
 
 from ..base import ApiModel
-from .issue import JiraIssue
+from .issue import IssueProjection, JiraIssue
+from .markdown import render_issue_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -58,24 +61,7 @@ class JiraSearchResult(ApiModel):
                         )
                     )
 
-        raw_total = data.get("total")
-        raw_start_at = data.get("startAt")
-        raw_max_results = data.get("maxResults")
-
-        try:
-            total = int(raw_total) if raw_total is not None else -1
-        except (ValueError, TypeError):
-            total = -1
-
-        try:
-            start_at = int(raw_start_at) if raw_start_at is not None else -1
-        except (ValueError, TypeError):
-            start_at = -1
-
-        try:
-            max_results = int(raw_max_results) if raw_max_results is not None else -1
-        except (ValueError, TypeError):
-            max_results = -1
+        total, start_at, max_results = _page_counts(data)
 
         return cls(
             total=total,
@@ -99,9 +85,168 @@ class JiraSearchResult(ApiModel):
 
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API response."""
+        # Issues in a result normally share requested_fields, so look the
+        # projection up again only when they change
+        issues = []
+        projection = None
+        projected_fields: object = None
+        for issue in self.issues:
+            if projection is None or issue.requested_fields != projected_fields:
+                projected_fields = issue.requested_fields
+                projection = IssueProjection.for_fields(issue.requested_fields)
+            issues.append(projection.apply(issue))
         return {
             "total": self.total,
             "start_at": self.start_at,
             "max_results": self.max_results,
-            "issues": [issue.to_simplified_dict() for issue in self.issues],
+            "issues": issues,
         }
+
+
+class JiraSearchPage:
+    """
+    A page of Jira search results that keeps the raw issue data.
+
+    Issues are only built into ``JiraIssue`` models when they are accessed,
+    and ``to_simplified_dict`` renders the raw data directly, so a page that
+    is serialized straight back into a response never builds the models.
+    """
+
+    __slots__ = (
+        "_issues",
+        "max_results",
+        "raw_issues",
+        "requested_fields",
+        "start_at",
+        "total",
+    )
+
+    def __init__(
+        self,
+        raw_issues: list[dict[str, Any]],
+        *,
+        total: int = 0,
+        start_at: int = 0,
+        max_results: int = 0,
+        requested_fields: str | list[str] | None = None,
+    ) -> None:
+        """
+        Initialize the page.
+
+        Args:
+            raw_issues: The issue data from the Jira API
+            total: Total number of matching issues, -1 if unknown
+            start_at: Index of the first issue of the page
+            max_results: Page size used by the API
+            requested_fields: Fields requested in the search ('*all', a
+                comma-separated string or a list of field names)
+        """
+        self.raw_issues = raw_issues
+        self.total = total
+        self.start_at = start_at
+        self.max_results = max_results
+        self.requested_fields = requested_fields
+        self._issues: list[JiraIssue | None] = [None] * len(raw_issues)
+
+    @classmethod
+    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraSearchPage":
+        """
+        Create a JiraSearchPage from a Jira API response.
+
+        Args:
+            data: The search result data from the Jira API
+            **kwargs: Additional arguments, 'requested_fields' is kept for
+                building and rendering the issues
+
+        Returns:
+            A JiraSearchPage instance
+        """
+        if not data or not isinstance(data, dict):
+            return cls([])
+
+        issues_data = data.get("issues", [])
+        raw_issues = (
+            [issue for issue in issues_data if issue]
+            if isinstance(issues_data, list)
+            else []
+        )
+        total, start_at, max_results = _page_counts(data)
+        return cls(
+            raw_issues,
+            total=total,
+            start_at=start_at,
+            max_results=max_results,
+            requested_fields=kwargs.get("requested_fields"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.raw_issues)
+
+    def __getitem__(self, index: int) -> JiraIssue:
+        issue = self._issues[index]
+        if issue is None:
+            issue = JiraIssue.from_api_response(
+                self.raw_issues[index], requested_fields=self.requested_fields
+            )
+            self._issues[index] = issue
+        return issue
+
+    def __iter__(self) -> Iterator[JiraIssue]:
+        for index in range(len(self.raw_issues)):
+            yield self[index]
+
+    @property
+    def issues(self) -> list[JiraIssue]:
+        """The issues of the page, built on first access."""
+        return list(self)
+
+    def to_search_result(self) -> JiraSearchResult:
+        """Build the equivalent eager JiraSearchResult."""
+        return JiraSearchResult(
+            total=self.total,
+            start_at=self.start_at,
+            max_results=self.max_results,
+            issues=self.issues,
+        )
+
+    def iter_simplified_issues(self) -> Iterator[dict[str, Any]]:
+        """Render the issues one at a time, straight from the raw data."""
+        projection = IssueProjection.for_fields(self.requested_fields)
+        for raw_issue in self.raw_issues:
+            yield projection.apply_raw(raw_issue)
+
+    def iter_markdown_issues(self) -> Iterator[str]:
+        """Render the issues one at a time as markdown, straight from the raw data."""
+        for issue in self.iter_simplified_issues():
+            yield render_issue_markdown(issue, level=2)
+
+    def to_simplified_dict(self, *, lazy: bool = False) -> dict[str, Any]:
+        """
+        Convert to simplified dictionary for API response.
+
+        Args:
+            lazy: Give the issues as an iterator that renders them on demand,
+                so callers can stop before rendering them all
+
+        Returns:
+            Dictionary with the pagination details and issues
+        """
+        issues = self.iter_simplified_issues()
+        return {
+            "total": self.total,
+            "start_at": self.start_at,
+            "max_results": self.max_results,
+            "issues": issues if lazy else list(issues),
+        }
+
+
+def _page_counts(data: dict[str, Any]) -> tuple[int, int, int]:
+    """Total, start and page size of a search response, -1 where unknown."""
+    counts = []
+    for name in ("total", "startAt", "maxResults"):
+        raw_value = data.get(name)
+        try:
+            counts.append(int(raw_value) if raw_value is not None else -1)
+        except (ValueError, TypeError):
+            counts.append(-1)
+    return counts[0], counts[1], counts[2]
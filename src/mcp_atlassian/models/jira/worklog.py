@@ -5,6 +5,7 @@ This module provides Pydantic models for Jira worklogs (time tracking entries).
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 from ..base import ApiModel, TimestampMixin
@@ -12,7 +13,7 @@ from ..constants import (
     EMPTY_STRING,
     JIRA_DEFAULT_ID,
 )
-from .common import JiraUser
+from .common import JiraUser, RecordInterner
 
 logger = logging.getLogger(__name__)
 
@@ -122,3 +123,56 @@ class JiraWorklog(ApiModel, TimestampMixin):
             result["updated"] = self.updated
 
         return result
+
+
+@dataclass(frozen=True, slots=True)
+class JiraWorklogRecord:
+    """
+    Compact worklog entry used for bulk time reporting.
+
+    Unlike ``JiraWorklog`` this keeps only the fields needed to aggregate time
+    spent, so thousands of entries can be processed without holding full user
+    and comment payloads. Issue IDs and authors repeat across entries and are
+    interned when an interner is given.
+    """
+
+    id: str
+    issue_id: str
+    author: str
+    started: str
+    time_spent_seconds: int
+
+    @classmethod
+    def from_api_response(
+        cls, data: dict[str, Any], intern: RecordInterner | None = None
+    ) -> "JiraWorklogRecord":
+        """
+        Create a JiraWorklogRecord from a Jira API worklog.
+
+        Args:
+            data: The worklog data from the Jira API
+            intern: Interner shared by the records of one fetch
+
+        Returns:
+            A JiraWorklogRecord instance
+        """
+        intern = intern or str
+        author = data.get("author") or {}
+        try:
+            seconds = int(data.get("timeSpentSeconds") or 0)
+        except (ValueError, TypeError):
+            seconds = 0
+        return cls(
+            id=str(data.get("id") or JIRA_DEFAULT_ID),
+            issue_id=intern(str(data.get("issueId") or EMPTY_STRING)),
+            author=intern(
+                str(
+                    author.get("displayName")
+                    or author.get("accountId")
+                    or author.get("name")
+                    or "Unknown"
+                )
+            ),
+            started=str(data.get("started") or EMPTY_STRING),
+            time_spent_seconds=seconds,
+        )
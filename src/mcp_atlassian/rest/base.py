@@ -197,6 +197,7 @@ class BaseRESTClient:
         headers: dict[str, str] | None = None,
         absolute: bool = False,
         raw_response: bool = False,
+        stream: bool = False,
     ) -> dict[str, Any] | Response | None:
         """Make a request to the API.
 
@@ -209,6 +210,7 @@ class BaseRESTClient:
             headers: Additional headers
             absolute: If True, treat endpoint as absolute URL
             raw_response: If True, return raw Response object
+            stream: If True, defer downloading the body (use with raw_response)
 
         Returns:
             API response data or Response object if raw_response=True
@@ -303,6 +305,7 @@ class BaseRESTClient:
                 headers=request_headers,
                 verify=self.verify_ssl,
                 timeout=self.timeout,
+                stream=stream,
             )
 
             # Handle errors
@@ -338,6 +341,7 @@ class BaseRESTClient:
         headers: dict[str, str] | None = None,
         absolute: bool = False,
         raw_response: bool = False,
+        stream: bool = False,
     ) -> dict[str, Any] | Response | None:
         """Make a GET request."""
         return self.request(
@@ -347,6 +351,7 @@ class BaseRESTClient:
             headers=headers,
             absolute=absolute,
             raw_response=raw_response,
+            stream=stream,
         )
 
     def post(
@@ -135,10 +135,17 @@ class JiraAdapter:
 
     # === Comments ===
 
-    def issue_get_comments(self, issue_key: str) -> list[dict[str, Any]]:
-        """Get issue comments."""
-        result = self.client.get_comments(issue_key, max_results=100)
-        return result.get("comments", [])
+    def issue_get_comments(
+        self,
+        issue_key: str,
+        start_at: int = 0,
+        max_results: int = 100,
+        order_by: str | None = None,
+    ) -> dict[str, Any]:
+        """Get a page of issue comments."""
+        return self.client.get_comments(
+            issue_key, start_at=start_at, max_results=max_results, order_by=order_by
+        )
 
     def issue_add_comment(
         self,
@@ -242,6 +249,7 @@ class JiraAdapter:
         fields: str | list[str] | None = None,
         limit: int = 100,
         expand: str | None = None,
+        start_at: int = 0,
     ) -> list[dict[str, Any]]:
         """Enhanced JQL search for cloud instances that returns just issues list.
 
@@ -253,6 +261,7 @@ class JiraAdapter:
             fields: Fields to return (comma-separated string or list)
             limit: Maximum number of issues to return
             expand: Fields to expand
+            start_at: Index of the first issue to return
 
         Returns:
             List of issue dictionaries
@@ -260,7 +269,7 @@ class JiraAdapter:
         # Use the standard jql method but extract just the issues
         result = self.jql(
             jql=jql,
-            start_at=0,
+            start_at=start_at,
             limit=limit,
             fields=fields,
             expand=expand,
@@ -272,9 +281,17 @@ class JiraAdapter:
     # === Projects ===
 
     def projects(self, included_archived: bool = False) -> list[dict[str, Any]]:
-        """Get all projects."""
-        result = self.client.get_projects(max_results=1000)
-        projects = result.get("values", [])
+        """Get all projects, paging through the project search."""
+        status = ["live", "archived"] if included_archived else ["live"]
+        projects: list[dict[str, Any]] = []
+        while True:
+            result = self.client.search_projects(
+                start_at=len(projects), max_results=100, status=status
+            )
+            values = result.get("values", [])
+            projects.extend(values)
+            if not values or result.get("isLast", True):
+                break
 
         if not included_archived:
             projects = [p for p in projects if not p.get("archived", False)]
@@ -458,12 +475,10 @@ class JiraAdapter:
             filename = attachment.get("filename", f"attachment_{att_id}")
             filepath = os.path.join(path, filename)
 
-            # Download content
-            content = self.client.download_attachment(att_id, redirect=True)
-
-            # Save to file
+            # Stream content to file
             with open(filepath, "wb") as f:
-                f.write(content)
+                for chunk in self.client.iter_attachment_content(att_id):
+                    f.write(chunk)
 
             downloaded.append(filepath)
 
@@ -478,6 +493,7 @@ class JiraAdapter:
         board_type: str | None = None,
         start_at: int = 0,
         max_results: int = 50,
+        filter_id: int | str | None = None,
     ) -> dict[str, Any]:
         """Get agile boards."""
         # Use Agile API endpoint
@@ -492,6 +508,8 @@ class JiraAdapter:
             params["projectKeyOrId"] = project_key
         if board_type:
             params["type"] = board_type
+        if filter_id is not None:
+            params["filterId"] = filter_id
 
         return self.client.get(endpoint, params=params)
 
@@ -501,19 +519,30 @@ class JiraAdapter:
 
     def get_board_by_filter_id(self, filter_id: int) -> dict[str, Any]:
         """Get board by filter ID."""
-        boards = self.get_all_agile_boards(max_results=100)
-        for board in boards.get("values", []):
-            if board.get("filter", {}).get("id") == str(filter_id):
-                return board
-        raise ValueError(f"No board found with filter ID {filter_id}")
+        boards = self.get_all_agile_boards(filter_id=filter_id, max_results=1)
+        values = boards.get("values", [])
+        if not values:
+            raise ValueError(f"No board found with filter ID {filter_id}")
+        return values[0]
 
     def get_board_by_name(self, board_name: str) -> dict[str, Any]:
         """Get board by name."""
-        boards = self.get_all_agile_boards(board_name=board_name, max_results=1)
-        values = boards.get("values", [])
-        if not values:
+        # The name parameter is a substring match, so page until an exact hit
+        start_at = 0
+        first_match = None
+        while True:
+            boards = self.get_all_agile_boards(board_name=board_name, start_at=start_at)
+            values = boards.get("values", [])
+            for board in values:
+                if board.get("name") == board_name:
+                    return board
+                first_match = first_match or board
+            if not values or boards.get("isLast", True):
+                break
+            start_at += len(values)
+        if first_match is None:
             raise ValueError(f"No board found with name '{board_name}'")
-        return values[0]
+        return first_match
 
     def get_board_issues(
         self,
@@ -558,6 +587,10 @@ class JiraAdapter:
             params=params,
         )
 
+    def get_sprint(self, sprint_id: int) -> dict[str, Any]:
+        """Get sprint details."""
+        return self.client.get(f"/rest/agile/1.0/sprint/{sprint_id}")
+
     def get_sprint_issues(
         self,
         sprint_id: int,
@@ -565,6 +598,7 @@ class JiraAdapter:
         max_results: int = 50,
         jql: str | None = None,
         fields: str | None = None,
+        expand: str | None = None,
     ) -> dict[str, Any]:
         """Get sprint issues."""
         params = {
@@ -575,6 +609,8 @@ class JiraAdapter:
             params["jql"] = jql
         if fields:
             params["fields"] = fields
+        if expand:
+            params["expand"] = expand
 
         return self.client.get(
             f"/rest/agile/1.0/sprint/{sprint_id}/issue",
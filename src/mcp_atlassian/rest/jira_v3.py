@@ -1,10 +1,18 @@
 """JIRA v3 REST API client implementation."""
 
 import logging
+import os
+from collections.abc import Iterator
+from contextlib import ExitStack
 from typing import Any
 from urllib.parse import quote
 
 from .base import BaseRESTClient
+from .multipart import (
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    MultipartFileStream,
+    guess_content_type,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -401,6 +409,35 @@ class JiraV3Client(BaseRESTClient):
 
         return self.get("/rest/api/3/project", params=params)
 
+    def search_projects(
+        self,
+        start_at: int = 0,
+        max_results: int = 50,
+        status: list[str] | None = None,
+        order_by: str | None = None,
+    ) -> dict[str, Any]:
+        """Get a page of projects visible to the user.
+
+        Args:
+            start_at: Starting index
+            max_results: Maximum results
+            status: Project statuses to include (live, archived, deleted)
+            order_by: Sort order
+
+        Returns:
+            Projects data with pagination
+        """
+        params: dict[str, Any] = {
+            "startAt": start_at,
+            "maxResults": max_results,
+        }
+        if status:
+            params["status"] = status
+        if order_by:
+            params["orderBy"] = order_by
+
+        return self.get("/rest/api/3/project/search", params=params)
+
     def get_project(
         self,
         project_key: str,
@@ -717,18 +754,39 @@ class JiraV3Client(BaseRESTClient):
         Returns:
             Attachment content or redirect URL
         """
-        params = {"redirect": redirect}
+        if redirect:
+            return b"".join(self.iter_attachment_content(attachment_id))
+
         response = self.get(
             f"/rest/api/3/attachment/content/{attachment_id}",
-            params=params,
+            params={"redirect": False},
             raw_response=True,
         )
+        # Return the redirect URL from Location header
+        return response.headers.get("Location", "")
 
-        if redirect:
-            return response.content
-        else:
-            # Return the redirect URL from Location header
-            return response.headers.get("Location", "")
+    def iter_attachment_content(
+        self,
+        attachment_id: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> Iterator[bytes]:
+        """Stream attachment content without buffering the whole body.
+
+        Args:
+            attachment_id: Attachment ID
+            chunk_size: Number of bytes read at a time
+
+        Yields:
+            Chunks of the attachment content
+        """
+        response = self.get(
+            f"/rest/api/3/attachment/content/{attachment_id}",
+            params={"redirect": True},
+            raw_response=True,
+            stream=True,
+        )
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
 
     def add_attachment(
         self,
@@ -744,39 +802,54 @@ class JiraV3Client(BaseRESTClient):
         Returns:
             List of created attachments
         """
-        import mimetypes
-        import os
-
-        if not os.path.exists(filename):
-            msg = f"File not found: {filename}"
-            raise FileNotFoundError(msg)
-
-        # Determine MIME type
-        mime_type, _ = mimetypes.guess_type(filename)
-        if not mime_type:
-            mime_type = "application/octet-stream"  # Default fallback
-
-        # Prepare file for upload with explicit MIME type - use context manager for resource safety
-        with open(filename, "rb") as file_handle:
-            files = {"file": (os.path.basename(filename), file_handle, mime_type)}
-
-            # Temporarily remove Content-Type from session headers for multipart upload
-            original_content_type = self.session.headers.pop("Content-Type", None)
-            try:
-                # Set X-Atlassian-Token for XSRF protection
-                headers = {"X-Atlassian-Token": "no-check"}
-
-                response = self.session.post(
-                    f"{self.base_url}/rest/api/3/issue/{issue_key}/attachments",
-                    files=files,
-                    headers=headers,
+        return self.add_attachments(issue_key, [filename])
+
+    def add_attachments(
+        self,
+        issue_key: str,
+        filenames: list[str],
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ) -> Any:
+        """Add one or more attachments to an issue in a single request.
+
+        The multipart body is streamed from disk, and the multipart
+        Content-Type is set on this request only so concurrent requests
+        sharing the session keep their JSON headers.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            filenames: Paths to the files to attach
+            chunk_size: Bytes read from disk per body chunk
+
+        Returns:
+            List of created attachments
+        """
+        for filename in filenames:
+            if not os.path.exists(filename):
+                msg = f"File not found: {filename}"
+                raise FileNotFoundError(msg)
+
+        with ExitStack() as stack:
+            parts = [
+                (
+                    "file",
+                    os.path.basename(filename),
+                    stack.enter_context(open(filename, "rb")),
+                    guess_content_type(filename),
                 )
-                response.raise_for_status()
-                return response.json()
-            finally:
-                # Restore original Content-Type header
-                if original_content_type:
-                    self.session.headers["Content-Type"] = original_content_type
+                for filename in filenames
+            ]
+            body = MultipartFileStream(parts, chunk_size=chunk_size)
+            response = self.session.post(
+                f"{self.base_url}/rest/api/3/issue/{issue_key}/attachments",
+                data=body,
+                headers={
+                    "Content-Type": body.content_type,
+                    "X-Atlassian-Token": "no-check",
+                },
+            )
+            response.raise_for_status()
+            return response.json()
 
     # === Bulk Operations ===
 
@@ -0,0 +1,450 @@
+"""Response budgets that keep large tool results within a size limit."""
+
+import base64
+import binascii
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from mcp_atlassian.utils.env import get_key_value_pairs
+
+logger = logging.getLogger(__name__)
+
+# Tool results larger than this are cut down unless configured otherwise
+DEFAULT_RESPONSE_MAX_BYTES = 500_000
+# Rough size of a model token in JSON text, for MCP_RESPONSE_MAX_TOKENS
+BYTES_PER_TOKEN = 4
+# Room kept free for the continuation object of a cut-down response
+CONTINUATION_RESERVE = 256
+# How much of a shortened description or comment body is kept
+PREVIEW_CHARS = 500
+
+# Placeholder string replaced by the separately serialized list or text
+_SLOT = "\x00budget-slot\x00"
+
+
+def get_response_budget(tool_name: str) -> int | None:
+    """
+    Get the response budget of a tool from the environment.
+
+    MCP_RESPONSE_BUDGETS gives per-tool budgets in bytes (e.g.
+    'jira_search=200000,confluence_pages_get_page=100000'); otherwise
+    MCP_RESPONSE_MAX_BYTES or MCP_RESPONSE_MAX_TOKENS applies to every tool.
+    A budget of 0 turns the limit off.
+
+    Args:
+        tool_name: Name of the tool as clients see it, e.g. 'jira_search'
+
+    Returns:
+        The budget in bytes, or None if responses are not limited
+    """
+    value = get_key_value_pairs("MCP_RESPONSE_BUDGETS").get(tool_name)
+    multiplier = 1
+    if value is None:
+        value = os.getenv("MCP_RESPONSE_MAX_BYTES")
+    if value is None and os.getenv("MCP_RESPONSE_MAX_TOKENS") is not None:
+        value = os.getenv("MCP_RESPONSE_MAX_TOKENS")
+        multiplier = BYTES_PER_TOKEN
+    if value is None:
+        return DEFAULT_RESPONSE_MAX_BYTES
+    try:
+        budget = int(value) * multiplier
+    except ValueError:
+        logger.warning(
+            f"Invalid response budget '{value}' for {tool_name}, using default"
+        )
+        return DEFAULT_RESPONSE_MAX_BYTES
+    return budget if budget > 0 else None
+
+
+class ResponseBudget:
+    """
+    Serialize a tool result within a byte budget.
+
+    Results are written as ``json.dumps(result, indent=2, ensure_ascii=False)``
+    would write them. When a result does not fit, its lowest-priority fields
+    are shortened first (changelog details, then descriptions, then comment
+    bodies), and list items or text that still do not fit are left for a
+    follow-up call: the response then ends with a ``continuation`` object
+    holding a cursor to pass back to the same tool.
+
+    List items are serialized one at a time as they are produced, so items
+    past the budget are never built or serialized. Markdown responses are
+    cut the same way, and end with a line holding the cursor.
+    """
+
+    def __init__(self, tool_name: str, max_bytes: int | None) -> None:
+        self.tool_name = tool_name
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def for_tool(cls, tool_name: str) -> "ResponseBudget":
+        """Create the budget configured for a tool."""
+        return cls(tool_name, get_response_budget(tool_name))
+
+    def encode_cursor(self, offset: int) -> str:
+        """Encode a continuation cursor for this tool."""
+        token = f"{self.tool_name}:{offset}".encode()
+        return base64.urlsafe_b64encode(token).decode("ascii")
+
+    def decode_cursor(self, cursor: str | None) -> int:
+        """
+        Decode a continuation cursor issued by this tool.
+
+        Args:
+            cursor: Cursor from a previous response, or None
+
+        Returns:
+            The offset to continue from (0 without a cursor)
+
+        Raises:
+            ValueError: If the cursor is malformed or belongs to another tool
+        """
+        if not cursor:
+            return 0
+        try:
+            tool_name, _, offset = (
+                base64.urlsafe_b64decode(cursor.encode("ascii"))
+                .decode()
+                .rpartition(":")
+            )
+            position = int(offset)
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            msg = f"Invalid continuation cursor: {cursor}"
+            raise ValueError(msg) from e
+        if tool_name != self.tool_name or position < 0:
+            msg = f"Continuation cursor was not issued by {self.tool_name}"
+            raise ValueError(msg)
+        return position
+
+    def dump(self, result: Any) -> str:
+        """Serialize a result that is small by construction."""
+        return _dumps(result)
+
+    def dump_items(
+        self,
+        items: Iterable[dict[str, Any]],
+        *,
+        envelope: dict[str, Any] | None = None,
+        key: str = "results",
+        offset: int = 0,
+    ) -> str:
+        """
+        Serialize a list of results, stopping at the budget.
+
+        Items that do not fit are shortened; the first item that does not fit
+        even then ends the response. At least one item is always returned so
+        that following the cursors makes progress.
+
+        Args:
+            items: The items, from ``offset`` on
+            envelope: Other keys of the response; without one, the response
+                is the bare list unless it has to carry a continuation
+            key: Key of the list in the envelope
+            offset: Position of the first item, used for the next cursor
+
+        Returns:
+            The JSON response
+        """
+        if self.max_bytes is None:
+            if envelope is None:
+                return _dumps(list(items))
+            return _dumps({**envelope, key: list(items)})
+
+        document = {**(envelope or {}), key: _SLOT}
+        limit = self.max_bytes - _size(_dumps(document)) - CONTINUATION_RESERVE
+        texts: list[str] = []
+        used = 0
+        count = 0
+        for item in items:
+            for candidate in _shortened(item):
+                text = _dumps(candidate)
+                # Indentation of each line inside the envelope, and the
+                # newline, indentation and comma around the item
+                cost = _size(text) + 4 * text.count("\n") + 6
+                if used + cost <= limit:
+                    break
+            else:
+                if texts:
+                    break
+            texts.append(text)
+            used += cost
+            count += 1
+        else:
+            if envelope is None:
+                return _join(texts, "  ")
+            return _fill(_dumps(document), _join(texts, "    "))
+
+        logger.debug(f"{self.tool_name} response cut after {count} items")
+        document["continuation"] = self._continuation(offset + count)
+        return _fill(_dumps(document), _join(texts, "    "))
+
+    def dump_document(
+        self,
+        document: dict[str, Any],
+        *,
+        key: str,
+        offset: int = 0,
+        identity: tuple[str, ...] = ("id", "key"),
+    ) -> str:
+        """
+        Serialize one result with a list inside, such as an issue's comments.
+
+        The result is shortened first; if it still does not fit, its list is
+        split across responses. Follow-up responses only repeat
+        the ``identity`` fields next to the rest of the list.
+
+        Args:
+            document: The result
+            key: Key of the list that may be split
+            offset: Position in the list to continue from
+            identity: Fields repeated in follow-up responses
+
+        Returns:
+            The JSON response
+        """
+        if offset:
+            envelope = {name: document[name] for name in identity if name in document}
+            return self.dump_items(
+                (document.get(key) or [])[offset:],
+                envelope=envelope,
+                key=key,
+                offset=offset,
+            )
+        if self.max_bytes is None:
+            return _dumps(document)
+
+        for candidate in _shortened(document):
+            text = _dumps(candidate)
+            if _size(text) <= self.max_bytes:
+                return text
+        items = document.get(key)
+        if not isinstance(items, list):
+            return text
+        # Split the list as it came, shortening its items one by one, and
+        # leave it at least half of the budget
+        rest = {name: value for name, value in document.items() if name != key}
+        for envelope in _shortened(rest):
+            if _size(_dumps(envelope)) <= self.max_bytes // 2:
+                break
+        return self.dump_items(items, envelope=envelope, key=key)
+
+    def dump_text(
+        self,
+        document: dict[str, Any],
+        path: tuple[str, ...],
+        *,
+        offset: int = 0,
+    ) -> str:
+        """
+        Serialize a result holding a long text, such as a page body.
+
+        The text from ``offset`` on is cut to fit the budget, preferably at a
+        line break, and the cursor continues after the part that was sent.
+
+        Args:
+            document: The result
+            path: Keys leading to the text in the result
+            offset: Character position in the text to continue from
+
+        Returns:
+            The JSON response
+        """
+        document = dict(document)
+        parent = document
+        for name in path[:-1]:
+            if not isinstance(parent.get(name), dict):
+                return _dumps(document)
+            parent[name] = parent = dict(parent[name])
+        text = parent.get(path[-1])
+        if not isinstance(text, str):
+            return _dumps(document)
+
+        remaining = text[offset:]
+        parent[path[-1]] = _SLOT
+        if self.max_bytes is None:
+            return _fill(_dumps(document), _dumps(remaining))
+
+        limit = self.max_bytes - _size(_dumps(document)) - CONTINUATION_RESERVE
+        chunk, encoded = _cut(remaining, limit, _dumps)
+        if len(chunk) < len(remaining):
+            document["continuation"] = self._continuation(offset + len(chunk))
+        return _fill(_dumps(document), encoded)
+
+    def dump_markdown(
+        self, header: str, blocks: Iterable[str], *, offset: int = 0
+    ) -> str:
+        """
+        Write a markdown response made of a header and blocks, such as issues.
+
+        Blocks are separated by blank lines and added while they fit the
+        budget; at least one block is always included. When blocks are left
+        out, the response ends with a line holding the continuation cursor.
+
+        Args:
+            header: Text that starts the response
+            blocks: The blocks, from ``offset`` on
+            offset: Position of the first block, used for the next cursor
+
+        Returns:
+            The markdown response
+        """
+        parts = [header] if header else []
+        if self.max_bytes is None:
+            return "\n\n".join([*parts, *blocks])
+
+        used = _size(header) + CONTINUATION_RESERVE
+        count = 0
+        for block in blocks:
+            cost = _size(block) + 2
+            if count and used + cost > self.max_bytes:
+                parts.append(self._continuation_line(offset + count))
+                break
+            parts.append(block)
+            used += cost
+            count += 1
+        return "\n\n".join(parts)
+
+    def dump_markdown_text(self, header: str, text: str, *, offset: int = 0) -> str:
+        """
+        Write a markdown response made of a header and a long text.
+
+        The text from ``offset`` on is cut to fit the budget like
+        ``dump_text`` cuts it, and the cursor continues after the part sent.
+
+        Args:
+            header: Text that starts the response
+            text: The long text, such as a page body
+            offset: Character position in the text to continue from
+
+        Returns:
+            The markdown response
+        """
+        remaining = text[offset:]
+        parts = [header] if header else []
+        if self.max_bytes is None:
+            return "\n\n".join([*parts, remaining])
+
+        limit = self.max_bytes - _size(header) - CONTINUATION_RESERVE
+        chunk, _ = _cut(remaining, limit, str)
+        parts.append(chunk)
+        if len(chunk) < len(remaining):
+            parts.append(self._continuation_line(offset + len(chunk)))
+        return "\n\n".join(parts)
+
+    def _continuation(self, offset: int) -> dict[str, Any]:
+        return {
+            "cursor": self.encode_cursor(offset),
+            "reason": f"Response budget of {self.max_bytes} bytes reached",
+        }
+
+    def _continuation_line(self, offset: int) -> str:
+        return (
+            f"---\nResponse budget of {self.max_bytes} bytes reached; call again "
+            f"with cursor `{self.encode_cursor(offset)}` for the rest."
+        )
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _cut(text: str, limit: int, encode: Callable[[str], str]) -> tuple[str, str]:
+    """
+    Cut a text so that its encoded form fits a byte limit.
+
+    Returns:
+        The longest part found that fits, preferably ending at a line break,
+        and its encoded form; at least one character is kept
+    """
+    chunk = text
+    encoded = encode(chunk)
+    while _size(encoded) > limit and len(chunk) > 1:
+        # Escapes and multi-byte characters make the encoded size uneven,
+        # so scale the cut to the overshoot until it fits
+        end = max(1, len(chunk) * max(limit, 0) // _size(encoded))
+        line_end = chunk.rfind("\n", end // 2, end)
+        chunk = chunk[: line_end + 1 if line_end >= 0 else end]
+        encoded = encode(chunk)
+    return chunk, encoded
+
+
+def _join(texts: list[str], indent: str) -> str:
+    """Write serialized items as json.dumps writes a list at that indentation."""
+    if not texts:
+        return "[]"
+    body = f",\n{indent}".join(text.replace("\n", f"\n{indent}") for text in texts)
+    return f"[\n{indent}{body}\n{indent[:-2]}]"
+
+
+def _fill(document_text: str, value_text: str) -> str:
+    return document_text.replace(_dumps(_SLOT), value_text, 1)
+
+
+def _preview(text: Any) -> Any:
+    if isinstance(text, str) and len(text) > PREVIEW_CHARS:
+        return (
+            f"{text[:PREVIEW_CHARS]}... [{len(text) - PREVIEW_CHARS} more characters]"
+        )
+    return text
+
+
+def _summarize_changelogs(changelogs: Any) -> Any:
+    """Keep who changed which fields when, without the old and new values."""
+    if not isinstance(changelogs, list):
+        return changelogs
+    return [
+        {
+            "author": (changelog.get("author") or {}).get("display_name"),
+            "created": changelog.get("created"),
+            "fields": [item.get("field") for item in changelog.get("items") or []],
+        }
+        for changelog in changelogs
+    ]
+
+
+def _preview_comment_bodies(comments: Any) -> Any:
+    if not isinstance(comments, list):
+        return comments
+    return [
+        {**comment, "body": _preview(comment.get("body"))}
+        if isinstance(comment, dict)
+        else comment
+        for comment in comments
+    ]
+
+
+# Fields shortened when a result does not fit, lowest priority first
+_SHORTENERS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ("changelogs", _summarize_changelogs),
+    ("description", _preview),
+    ("comments", _preview_comment_bodies),
+    ("body", _preview),
+)
+
+
+def _shortened(item: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """
+    Yield an item and then ever shorter copies of it.
+
+    Each copy lists the fields shortened so far in ``truncated_fields``.
+    """
+    yield item
+    if not isinstance(item, dict):
+        return
+    truncated: list[str] = []
+    for name, shorten in _SHORTENERS:
+        if name not in item:
+            continue
+        value = shorten(item[name])
+        if value == item[name]:
+            continue
+        truncated.append(name)
+        item = {**item, name: value, "truncated_fields": list(truncated)}
+        yield item
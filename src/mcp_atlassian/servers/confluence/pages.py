@@ -2,11 +2,12 @@
 
 import json
 import logging
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastmcp import Context, FastMCP
 from pydantic import BeforeValidator, Field
 
+from mcp_atlassian.servers.budget import ResponseBudget
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
 from mcp_atlassian.utils.decorators import check_write_access
 
@@ -81,6 +82,26 @@ async def get_page(
             default=True,
         ),
     ] = True,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Continuation cursor from a previous response that "
+                "exceeded the response size budget; returns the rest of the content"
+            ),
+            default=None,
+        ),
+    ] = None,
+    output_format: Annotated[
+        Literal["json", "markdown"],
+        Field(
+            description=(
+                "(Optional) 'json' for the page as JSON, or 'markdown' for the "
+                "content under a compact metadata header, which takes fewer tokens"
+            ),
+            default="json",
+        ),
+    ] = "json",
 ) -> str:
     """Get content of a specific Confluence page by its ID, or by its title and space key.
 
@@ -91,12 +112,17 @@ async def get_page(
         space_key: The key of the space. Must be used with 'title'.
         include_metadata: Whether to include page metadata.
         convert_to_markdown: Convert content to markdown (true) or keep raw HTML (false).
+        cursor: Continuation cursor from a previous response.
+        output_format: 'json' or 'markdown'.
 
     Returns:
         JSON string representing the page content and/or metadata, or an error if not found or parameters are invalid.
+        Content beyond the response budget is left for a follow-up call with the returned continuation cursor.
     """
     from . import get_confluence_fetcher  # lazy import to allow test patching
 
+    budget = ResponseBudget.for_tool("confluence_pages_get_page")
+    offset = budget.decode_cursor(cursor)
     confluence_fetcher = await get_confluence_fetcher(ctx)
     page_object = None
 
@@ -140,12 +166,18 @@ async def get_page(
             ensure_ascii=False,
         )
 
+    if output_format == "markdown":
+        header = page_object.to_markdown_header() if include_metadata else ""
+        return budget.dump_markdown_text(header, page_object.content, offset=offset)
+
     if include_metadata:
         result = {"metadata": page_object.to_simplified_dict()}
+        content_path = ("metadata", "content", "value")
     else:
         result = {"content": {"value": page_object.content}}
+        content_path = ("content", "value")
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return budget.dump_text(result, content_path, offset=offset)
 
 
 @pages_mcp.tool(tags={"confluence", "read"})
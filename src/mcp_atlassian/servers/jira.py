@@ -2,7 +2,8 @@
 
 import json
 import logging
-from typing import Annotated, Any
+from itertools import islice
+from typing import Annotated, Any, Literal
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
@@ -11,6 +12,12 @@ from requests.exceptions import HTTPError
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
 from mcp_atlassian.models.jira.common import JiraUser
+from mcp_atlassian.models.jira.issue import IssueProjection
+from mcp_atlassian.models.jira.markdown import (
+    render_comment_markdown,
+    render_issue_markdown,
+)
+from mcp_atlassian.servers.budget import ResponseBudget
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
 from mcp_atlassian.utils.decorators import check_write_access
 from mcp_atlassian.utils.tool_helpers import safe_tool_result
@@ -109,7 +116,7 @@ async def get_issue(
     comment_limit: Annotated[
         int,
         Field(
-            description="Maximum number of comments to include (0 or null for no comments)",
+            description="Maximum number of most recent comments to include (0 or null for no comments)",
             default=10,
             ge=0,
             le=100,
@@ -129,6 +136,26 @@ async def get_issue(
             default=True,
         ),
     ] = True,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Continuation cursor from a previous response that "
+                "exceeded the response size budget; returns the remaining comments"
+            ),
+            default=None,
+        ),
+    ] = None,
+    output_format: Annotated[
+        Literal["json", "markdown"],
+        Field(
+            description=(
+                "(Optional) 'json' for the full issue object as JSON, or 'markdown' for a "
+                "compact text layout that takes far fewer tokens"
+            ),
+            default="json",
+        ),
+    ] = "json",
 ) -> str:
     """Get details of a specific Jira issue including its Epic links and relationship information.
 
@@ -140,28 +167,50 @@ async def get_issue(
         comment_limit: Maximum number of comments.
         properties: Issue properties to return.
         update_history: Whether to update issue view history.
+        cursor: Continuation cursor from a previous response.
+        output_format: 'json' or 'markdown'.
 
     Returns:
-        JSON string representing the Jira issue object.
+        JSON string representing the Jira issue object, or markdown text, with
+        a continuation cursor if it exceeded the response budget.
 
     Raises:
         ValueError: If the Jira client is not configured or available.
     """
+    budget = ResponseBudget.for_tool("jira_get_issue")
+    offset = budget.decode_cursor(cursor)
     jira = await get_jira_fetcher(ctx)
     fields_list: str | list[str] | None = fields
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    issue = jira.get_issue(
-        issue_key=issue_key,
-        fields=fields_list,
-        expand=expand,
-        comment_limit=comment_limit,
-        properties=properties.split(",") if properties else None,
-        update_history=update_history,
-    )
+    request: dict[str, Any] = {
+        "issue_key": issue_key,
+        "fields": fields_list,
+        "expand": expand,
+        "comment_limit": comment_limit,
+        "properties": properties.split(",") if properties else None,
+        "update_history": update_history,
+    }
+    if output_format == "markdown":
+        # Render straight from the issue data, without building the model
+        issue_data = IssueProjection.for_fields(fields_list).apply_raw(
+            jira.get_issue(**request, raw=True)
+        )
+        comments = (issue_data.get("comments") or [])[offset:]
+        if offset:
+            header = f"# {issue_data.get('key')}: {issue_data.get('summary')}"
+        else:
+            header = render_issue_markdown(issue_data, include_comments=False)
+        if comments:
+            header += "\n\n## Comments" + (" (continued)" if offset else "")
+        return budget.dump_markdown(
+            header, map(render_comment_markdown, comments), offset=offset
+        )
+
+    issue = jira.get_issue(**request)
     result = issue.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return budget.dump_document(result, key="comments", offset=offset)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -219,6 +268,26 @@ async def search(
             default=None,
         ),
     ] = None,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Continuation cursor from a previous response that "
+                "exceeded the response size budget; overrides start_at"
+            ),
+            default=None,
+        ),
+    ] = None,
+    output_format: Annotated[
+        Literal["json", "markdown"],
+        Field(
+            description=(
+                "(Optional) 'json' for the full search results as JSON, or 'markdown' for a "
+                "compact text layout that takes far fewer tokens"
+            ),
+            default="json",
+        ),
+    ] = "json",
 ) -> str:
     """Search Jira issues using JQL (Jira Query Language).
 
@@ -230,10 +299,17 @@ async def search(
         start_at: Starting index for pagination.
         projects_filter: Comma-separated list of project keys to filter by.
         expand: Optional fields to expand.
+        cursor: Continuation cursor from a previous response.
+        output_format: 'json' or 'markdown'.
 
     Returns:
-        JSON string representing the search results including pagination info.
+        JSON string representing the search results including pagination info,
+        or markdown text, with a continuation cursor if they exceeded the
+        response budget.
     """
+    budget = ResponseBudget.for_tool("jira_search")
+    if cursor:
+        start_at = budget.decode_cursor(cursor)
     jira = await get_jira_fetcher(ctx)
     fields_list: str | list[str] | None = fields
     if fields and fields != "*all":
@@ -246,9 +322,19 @@ async def search(
         start=start_at,
         expand=expand,
         projects_filter=projects_filter,
+        lazy=True,
     )
-    result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    # Issues are rendered one at a time and only up to the budget
+    if output_format == "markdown":
+        header = f"# {search_result.total} issues found"
+        if start_at:
+            header += f", showing from issue {start_at + 1}"
+        return budget.dump_markdown(
+            header, search_result.iter_markdown_issues(), offset=start_at
+        )
+    result = search_result.to_simplified_dict(lazy=True)
+    issues = result.pop("issues")
+    return budget.dump_items(issues, envelope=result, key="issues", offset=start_at)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -311,7 +397,7 @@ async def get_project_issues(
     """
     jira = await get_jira_fetcher(ctx)
     search_result = jira.get_project_issues(
-        project_key=project_key, start=start_at, limit=limit
+        project_key=project_key, start=start_at, limit=limit, lazy=True
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -516,6 +602,7 @@ async def get_board_issues(
         start=start_at,
         limit=limit,
         expand=expand,
+        lazy=True,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -600,12 +687,49 @@ async def get_sprint_issues(
         fields_list = [f.strip() for f in fields.split(",")]
 
     search_result = jira.get_sprint_issues(
-        sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
+        sprint_id=sprint_id,
+        fields=fields_list,
+        start=start_at,
+        limit=limit,
+        lazy=True,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_sprint_report(
+    ctx: Context,
+    sprint_id: Annotated[str, Field(description="The id of sprint (e.g., '10001')")],
+    story_points_field: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Story points field ID (e.g., 'customfield_10016'). "
+                "Discovered by name when omitted."
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Summarize a sprint: committed vs completed points, scope change and load.
+
+    Args:
+        ctx: The FastMCP context.
+        sprint_id: The ID of the sprint.
+        story_points_field: Optional story points field ID.
+
+    Returns:
+        JSON string with sprint details, story point totals, scope change,
+        status breakdown and per-assignee load.
+    """
+    jira = await get_jira_fetcher(ctx)
+    report = jira.get_sprint_report(
+        sprint_id=sprint_id, story_points_field=story_points_field
+    )
+    return json.dumps(report, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "read"})
 async def get_link_types(ctx: Context) -> str:
     """Get all available issue link types.
@@ -622,6 +746,101 @@ async def get_link_types(ctx: Context) -> str:
     return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
 
 
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_issue_graph(
+    ctx: Context,
+    issue_keys: Annotated[
+        str,
+        Field(
+            description=(
+                "Comma-separated keys of the issues to start from "
+                "(e.g., 'PROJ-1' or 'PROJ-1,PROJ-2')"
+            )
+        ),
+    ],
+    link_types: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated link types to follow, by name or "
+                "description (e.g., 'Blocks' or 'blocks,is blocked by'). "
+                "All link types are followed if omitted."
+            ),
+            default=None,
+        ),
+    ] = None,
+    direction: Annotated[
+        str,
+        Field(
+            description=(
+                "Which way to follow relations: 'outward' (e.g. what an issue "
+                "blocks, and its subtasks), 'inward' (e.g. what blocks an issue, "
+                "and its parent) or 'both'"
+            ),
+            default="both",
+        ),
+    ] = "both",
+    max_depth: Annotated[
+        int,
+        Field(
+            description="Maximum number of hops from the starting issues (0-10)",
+            default=3,
+            ge=0,
+            le=10,
+        ),
+    ] = 3,
+    max_issues: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues in the graph (1-1000)",
+            default=200,
+            ge=1,
+            le=1000,
+        ),
+    ] = 200,
+    include_hierarchy: Annotated[
+        bool,
+        Field(
+            description="Whether to follow subtask and parent relations",
+            default=True,
+        ),
+    ] = True,
+) -> str:
+    """Map the dependency graph around one or more issues in a single call.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: Comma-separated starting issue keys.
+        link_types: Comma-separated link types to follow.
+        direction: 'outward', 'inward' or 'both'.
+        max_depth: Maximum number of hops.
+        max_issues: Maximum number of issues.
+        include_hierarchy: Whether to follow subtasks and parents.
+
+    Returns:
+        JSON string with the issues, an adjacency list of their relations
+        and any issues on a dependency cycle.
+
+    Raises:
+        ValueError: If no issue keys are given or direction is invalid.
+    """
+    jira = await get_jira_fetcher(ctx)
+    keys = [key.strip() for key in issue_keys.split(",") if key.strip()]
+    if not keys:
+        raise ValueError("issue_keys must contain at least one issue key.")
+    types = [t.strip() for t in (link_types or "").split(",") if t.strip()]
+
+    graph = jira.get_issue_graph(
+        keys,
+        link_types=types or None,
+        direction=direction,  # type: ignore[arg-type]
+        max_depth=max_depth,
+        max_issues=max_issues,
+        include_hierarchy=include_hierarchy,
+    )
+    return json.dumps(graph, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "write"})
 @check_write_access
 @safe_tool_result
@@ -838,17 +1057,36 @@ async def batch_get_changelogs(
             default=-1,
         ),
     ] = -1,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Continuation cursor from a previous response that "
+                "exceeded the response size budget; returns the remaining issues. "
+                "Each continuation fetches every requested changelog again"
+            ),
+            default=None,
+        ),
+    ] = None,
 ) -> str:
     """Get changelogs for multiple Jira issues (Cloud only).
 
+    Continuing with a cursor fetches the changelogs of every requested issue
+    again and skips those already returned, because the bulk changelog API
+    cannot start at an offset.
+
     Args:
         ctx: The FastMCP context.
         issue_ids_or_keys: List of issue IDs or keys.
         fields: List of fields to filter changelogs by. None for all fields.
         limit: Maximum changelogs per issue (-1 for all).
+        cursor: Continuation cursor from a previous response.
 
     Returns:
-        JSON string representing a list of issues with their changelogs.
+        JSON string representing a list of issues with their changelogs. If
+        the list exceeded the response budget, the response is instead an
+        object with the list that fits under 'results' and a 'continuation'
+        with the cursor for the rest.
 
     Raises:
         NotImplementedError: If run on Jira Server/Data Center.
@@ -861,25 +1099,206 @@ async def batch_get_changelogs(
             "Batch get issue changelogs is only available on Jira Cloud."
         )
 
-    # Call the underlying method
-    issues_with_changelogs = jira.batch_get_changelogs(
-        issue_ids_or_keys=issue_ids_or_keys, fields=fields
-    )
+    budget = ResponseBudget.for_tool("jira_batch_get_changelogs")
+    offset = budget.decode_cursor(cursor)
 
-    # Format the response
-    results = []
+    # Stream changelogs chunk by chunk and format each issue as it arrives,
+    # so issues outside the response budget are never formatted. The API only
+    # returns issues that have changelogs, so the cursor counts results. The
+    # bulk changelog API has no offset either: a continuation fetches every
+    # changelog again and skips the ones already returned, so each follow-up
+    # call costs as many requests as the first
     limit_val = None if limit == -1 else limit
-    for issue in issues_with_changelogs:
-        results.append(
-            {
-                "issue_id": issue.id,
-                "changelogs": [
-                    changelog.to_simplified_dict()
-                    for changelog in issue.changelogs[:limit_val]
-                ],
-            }
+    results = (
+        {
+            "issue_id": issue_id,
+            "changelogs": [
+                changelog.to_model().to_simplified_dict()
+                for changelog in changelogs[:limit_val]
+            ],
+        }
+        for issue_id, changelogs in islice(
+            jira.iter_changelogs(issue_ids_or_keys=issue_ids_or_keys, fields=fields),
+            offset,
+            None,
         )
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    )
+    return budget.dump_items(results, offset=offset)
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_worklog_summary(
+    ctx: Context,
+    issue_keys: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated issue keys to report on "
+                "(e.g., 'PROJ-1,PROJ-2')"
+            ),
+            default=None,
+        ),
+    ] = None,
+    jql: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) JQL selecting the issues to report on "
+                "(e.g., 'sprint = 42'). Combined with issue_keys if both are given."
+            ),
+            default=None,
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues taken from the JQL query (1-1000)",
+            default=200,
+            ge=1,
+            le=1000,
+        ),
+    ] = 200,
+    group_by: Annotated[
+        str,
+        Field(
+            description=(
+                "Comma-separated dimensions to total time by: "
+                "'author', 'issue' and/or 'day'"
+            ),
+            default="author",
+        ),
+    ] = "author",
+    started_after: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Only count work started on or after this date/time "
+                "(e.g., '2024-01-01')"
+            ),
+            default=None,
+        ),
+    ] = None,
+    started_before: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Only count work started before this date/time "
+                "(e.g., '2024-02-01')"
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Total time logged across many issues, grouped by author, issue or day.
+
+    Worklogs are fetched and aggregated server-side; only totals are returned.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: Comma-separated issue keys.
+        jql: JQL query selecting issues.
+        limit: Maximum issues taken from the JQL query.
+        group_by: Comma-separated grouping dimensions.
+        started_after: Inclusive lower bound on worklog start time.
+        started_before: Exclusive upper bound on worklog start time.
+
+    Returns:
+        JSON string with worklog counts and seconds spent per group.
+
+    Raises:
+        ValueError: If no issues are selected or group_by is invalid.
+    """
+    jira = await get_jira_fetcher(ctx)
+    keys = [key.strip() for key in (issue_keys or "").split(",") if key.strip()]
+    if jql:
+        keys.extend(
+            issue.key
+            for issue in jira.search_all_issues(jql, fields="summary", limit=limit)
+        )
+    if not keys:
+        raise ValueError("Provide issue_keys and/or a jql query selecting issues.")
+
+    summary = jira.summarize_worklogs(
+        keys,
+        group_by=[dim.strip() for dim in group_by.split(",") if dim.strip()],
+        started_after=started_after,
+        started_before=started_before,
+    )
+    return json.dumps(summary, indent=2, ensure_ascii=False)
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_status_analytics(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(
+            description=(
+                "JQL selecting the issues to analyze "
+                "(e.g., 'project = PROJ AND resolved >= -30d')"
+            )
+        ),
+    ],
+    limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues to analyze (1-10000)",
+            default=1000,
+            ge=1,
+            le=10000,
+        ),
+    ] = 1000,
+    percentiles: Annotated[
+        str,
+        Field(
+            description="Comma-separated percentiles to report (e.g., '50,85,95')",
+            default="50,85,95",
+        ),
+    ] = "50,85,95",
+    include_current: Annotated[
+        bool,
+        Field(
+            description=(
+                "Whether time spent so far in each issue's current status counts"
+            ),
+            default=True,
+        ),
+    ] = True,
+) -> str:
+    """Compute time-in-status, lead time and cycle time percentiles for issues.
+
+    Changelogs are fetched and analyzed server-side; only statistics are
+    returned.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query selecting issues.
+        limit: Maximum number of issues to analyze.
+        percentiles: Comma-separated percentiles.
+        include_current: Whether the current status interval counts.
+
+    Returns:
+        JSON string with per-status duration percentiles (hours), lead and
+        cycle time percentiles, and transition counts.
+
+    Raises:
+        ValueError: If percentiles are invalid.
+    """
+    jira = await get_jira_fetcher(ctx)
+    try:
+        percentile_values = [
+            float(value) for value in percentiles.split(",") if value.strip()
+        ]
+    except ValueError as e:
+        raise ValueError(f"Invalid percentiles '{percentiles}': {e}") from e
+
+    result = jira.get_status_analytics(
+        jql,
+        limit=limit,
+        percentiles=percentile_values,
+        include_current=include_current,
+    )
+    return json.dumps(result, indent=2, ensure_ascii=False)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -984,6 +1403,69 @@ async def update_issue(
         raise ValueError(f"Failed to update issue {issue_key}: {str(e)}")
 
 
+@jira_mcp.tool(tags={"jira", "write"})
+@check_write_access
+async def batch_update_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(
+            description="List of Jira issue keys to update (e.g., ['PROJ-1', 'PROJ-2'])"
+        ),
+    ],
+    fields: Annotated[
+        dict[str, Any],
+        Field(
+            description=(
+                "Dictionary of fields to set on every issue, keyed by field name or ID. "
+                "Example: {'labels': ['backend'], 'fixVersions': ['1.2'], "
+                "'assignee': 'user@example.com', 'customfield_10010': 5}. "
+                "Use jira_batch_transition_issues to change status."
+            )
+        ),
+    ],
+    notify_users: Annotated[
+        bool,
+        Field(
+            description="Whether Jira should send update notifications",
+            default=True,
+        ),
+    ] = True,
+) -> str:
+    """Apply the same field changes to multiple Jira issues.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: Keys of the issues to update.
+        fields: Fields to set on every issue.
+        notify_users: Whether to send notifications.
+
+    Returns:
+        JSON string with counts and a per-issue result list.
+
+    Raises:
+        ValueError: If required fields missing, invalid input, in read-only mode, or Jira client unavailable.
+    """
+    jira = await get_jira_fetcher(ctx)
+    if not issue_keys:
+        raise ValueError("issue_keys is required.")
+    if not isinstance(fields, dict) or not fields:
+        raise ValueError("fields must be a non-empty dictionary.")
+
+    results = jira.batch_update_issues(
+        issue_keys=issue_keys, fields=fields, notify_users=notify_users
+    )
+
+    succeeded = sum(1 for r in results if r["success"])
+    response = {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+    return json.dumps(response, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "write"})
 @check_write_access
 async def delete_issue(
@@ -1223,6 +1705,143 @@ async def create_remote_issue_link(
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@jira_mcp.tool(tags={"jira", "write"})
+@check_write_access
+async def batch_create_issue_links(
+    ctx: Context,
+    links: Annotated[
+        list[dict[str, Any]],
+        Field(
+            description=(
+                "List of links to create. Each object contains:\n"
+                "- link_type (required): Link type name or description "
+                "(e.g., 'Blocks', 'is blocked by')\n"
+                "- inward_issue_key (required): The key of the inward issue\n"
+                "- outward_issue_key (required): The key of the outward issue\n"
+                "- comment (optional): Comment to add to the link\n"
+                "Example: [{'link_type': 'Blocks', 'inward_issue_key': 'PROJ-1', "
+                "'outward_issue_key': 'PROJ-2'}]"
+            )
+        ),
+    ],
+) -> str:
+    """Create many links between Jira issues in one call.
+
+    Links that already exist are skipped.
+
+    Args:
+        ctx: The FastMCP context.
+        links: Link definitions.
+
+    Returns:
+        JSON string with counts and a per-link result list.
+
+    Raises:
+        ValueError: If links is empty, in read-only mode, or Jira client unavailable.
+    """
+    jira = await get_jira_fetcher(ctx)
+    if not links:
+        raise ValueError("links is required.")
+
+    link_data = []
+    for link in links:
+        data: dict[str, Any] = {
+            "type": {"name": link.get("link_type")},
+            "inwardIssue": {"key": link.get("inward_issue_key")},
+            "outwardIssue": {"key": link.get("outward_issue_key")},
+        }
+        if link.get("comment"):
+            data["comment"] = {"body": link["comment"]}
+        link_data.append(data)
+
+    results = jira.batch_create_issue_links(link_data)
+
+    skipped = sum(1 for r in results if r.get("skipped"))
+    succeeded = sum(1 for r in results if r["success"]) - skipped
+    response = {
+        "total": len(results),
+        "succeeded": succeeded,
+        "skipped": skipped,
+        "failed": len(results) - succeeded - skipped,
+        "results": results,
+    }
+    return json.dumps(response, indent=2, ensure_ascii=False)
+
+
+@jira_mcp.tool(tags={"jira", "write"})
+@check_write_access
+async def batch_create_remote_issue_links(
+    ctx: Context,
+    links: Annotated[
+        list[dict[str, Any]],
+        Field(
+            description=(
+                "List of remote links to create. Each object contains:\n"
+                "- issue_key (required): The key of the issue to add the link to\n"
+                "- url (required): The URL to link to\n"
+                "- title (required): The title/name of the link\n"
+                "- summary (optional): Description of the link\n"
+                "- relationship (optional): Relationship description\n"
+                "- icon_url (optional): URL to a 16x16 icon for the link\n"
+                "Example: [{'issue_key': 'PROJ-1', 'url': 'https://example.com', "
+                "'title': 'Spec'}]"
+            )
+        ),
+    ],
+) -> str:
+    """Create many remote issue links (web or Confluence links) in one call.
+
+    A link to a URL the issue already links to updates that link instead of
+    adding a duplicate.
+
+    Args:
+        ctx: The FastMCP context.
+        links: Remote link definitions.
+
+    Returns:
+        JSON string with counts and a per-link result list.
+
+    Raises:
+        ValueError: If links is empty, in read-only mode, or Jira client unavailable.
+    """
+    jira = await get_jira_fetcher(ctx)
+    if not links:
+        raise ValueError("links is required.")
+
+    remote_links = []
+    for link in links:
+        link_object: dict[str, Any] = {
+            "url": link.get("url"),
+            "title": link.get("title"),
+        }
+        if link.get("summary"):
+            link_object["summary"] = link["summary"]
+        if link.get("icon_url"):
+            link_object["icon"] = {
+                "url16x16": link["icon_url"],
+                "title": link.get("title"),
+            }
+        link_data: dict[str, Any] = {"object": link_object}
+        if link.get("relationship"):
+            link_data["relationship"] = link["relationship"]
+        remote_links.append(
+            {"issue_key": link.get("issue_key"), "link_data": link_data}
+        )
+
+    results = jira.batch_create_remote_issue_links(remote_links)
+
+    skipped = sum(1 for r in results if r.get("skipped"))
+    succeeded = sum(1 for r in results if r["success"]) - skipped
+    response = {
+        "total": len(results),
+        "succeeded": succeeded,
+        "skipped": skipped,
+        "failed": len(results) - succeeded - skipped,
+        "results": results,
+    }
+    return json.dumps(response, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "write"})
 @check_write_access
 async def remove_issue_link(
@@ -1322,6 +1941,81 @@ async def transition_issue(
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@jira_mcp.tool(tags={"jira", "write"})
+@check_write_access
+async def batch_transition_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(
+            description="List of Jira issue keys to transition (e.g., ['PROJ-1', 'PROJ-2'])"
+        ),
+    ],
+    transition: Annotated[
+        str,
+        Field(
+            description=(
+                "Transition to apply to every issue: a transition ID (e.g., '31'), "
+                "a transition name (e.g., 'Resolve Issue') or a target status name "
+                "(e.g., 'Done'). Issues already in the target status are skipped."
+            )
+        ),
+    ],
+    fields: Annotated[
+        dict[str, Any] | None,
+        Field(
+            description=(
+                "(Optional) Dictionary of fields to set during each transition. "
+                "Example: {'resolution': {'name': 'Fixed'}}"
+            ),
+            default=None,
+        ),
+    ] = None,
+    comment: Annotated[
+        str | None,
+        Field(description="(Optional) Comment to add to every transitioned issue."),
+    ] = None,
+) -> str:
+    """Transition multiple Jira issues in one call.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: Keys of the issues to transition.
+        transition: Transition ID, transition name, or target status name.
+        fields: Optional dictionary of fields to set during each transition.
+        comment: Optional comment for each transition.
+
+    Returns:
+        JSON string with counts and a per-issue result list.
+
+    Raises:
+        ValueError: If required fields missing, invalid input, in read-only mode, or Jira client unavailable.
+    """
+    jira = await get_jira_fetcher(ctx)
+    if not issue_keys or not transition:
+        raise ValueError("issue_keys and transition are required.")
+    if fields is not None and not isinstance(fields, dict):
+        raise ValueError("fields must be a dictionary.")
+
+    results = jira.batch_transition_issues(
+        issue_keys=issue_keys,
+        transition=transition,
+        fields=fields,
+        comment=comment,
+    )
+
+    skipped = sum(1 for r in results if r.get("skipped"))
+    succeeded = sum(1 for r in results if r["success"]) - skipped
+    response = {
+        "total": len(results),
+        "succeeded": succeeded,
+        "skipped": skipped,
+        "failed": len(results) - succeeded - skipped,
+        "results": results,
+    }
+    return json.dumps(response, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "write"})
 @check_write_access
 async def create_sprint(
@@ -1481,23 +2175,7 @@ async def get_all_projects(
         logger.log(log_level, f"get_all_projects failed: {error_message}")
         return json.dumps(error_result, indent=2, ensure_ascii=False)
 
-    # Ensure all project keys are uppercase
-    for project in projects:
-        if "key" in project:
-            project["key"] = project["key"].upper()
-
-    # Apply project filter if configured
-    if jira.config.projects_filter:
-        # Split projects filter by commas and handle possible whitespace
-        allowed_project_keys = {
-            p.strip().upper() for p in jira.config.projects_filter.split(",")
-        }
-        projects = [
-            project
-            for project in projects
-            if project.get("key") in allowed_project_keys
-        ]
-
+    # Keys are upper-cased and the projects filter applied by the project catalog
     return json.dumps(projects, indent=2, ensure_ascii=False)
 
 
@@ -3,7 +3,7 @@ Utility functions for the MCP Atlassian integration.
 This package provides various utility functions used throughout the codebase.
 """
 
-from .date import parse_date
+from .date import parse_date, parse_timestamp, parse_timestamps
 from .io import is_read_only_mode
 
 # Export lifecycle utilities
@@ -26,6 +26,8 @@ __all__ = [
     "is_read_only_mode",
     "setup_logging",
     "parse_date",
+    "parse_timestamp",
+    "parse_timestamps",
     "parse_iso8601_date",
     "OAuthConfig",
     "configure_oauth_session",
@@ -0,0 +1,138 @@
+"""Bounded concurrency helpers for fanning out blocking API calls."""
+
+import logging
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+logger = logging.getLogger("mcp-atlassian.utils.concurrency")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Stays below the default urllib3 connection pool size (10) used by requests
+DEFAULT_MAX_WORKERS = 8
+
+_EXHAUSTED = object()
+
+
+@dataclass
+class ConcurrentResult(Generic[T, R]):
+    """Outcome of running a function for one input item."""
+
+    item: T
+    value: R | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call completed without raising."""
+        return self.error is None
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[ConcurrentResult[T, R]]:
+    """
+    Call a function for every item using a bounded thread pool.
+
+    Exceptions are captured per item instead of aborting the whole batch, and
+    results are returned in input order.
+
+    Args:
+        func: Blocking function to call for each item
+        items: Input items
+        max_workers: Maximum number of calls in flight at once
+
+    Returns:
+        One ConcurrentResult per input item, in input order
+    """
+    item_list = list(items)
+    if not item_list:
+        return []
+
+    workers = max(1, min(max_workers, len(item_list)))
+    if workers == 1:
+        return [_call(func, item) for item in item_list]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda item: _call(func, item), item_list))
+
+
+def iter_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[ConcurrentResult[T, R]]:
+    """
+    Lazily call a function for every item using a bounded thread pool.
+
+    Unlike ``map_concurrently``, items are consumed and submitted on demand so
+    that at most ``max_workers`` calls are in flight and at most that many
+    finished results wait to be consumed. Results are yielded in input order.
+
+    Args:
+        func: Blocking function to call for each item
+        items: Input items (may be a lazy iterable)
+        max_workers: Maximum number of calls in flight at once
+
+    Yields:
+        One ConcurrentResult per input item, in input order
+    """
+    item_iter = iter(items)
+    if max_workers <= 1:
+        for item in item_iter:
+            yield _call(func, item)
+        return
+
+    pending: deque[Future[ConcurrentResult[T, R]]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def _submit_next() -> bool:
+            item = next(item_iter, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return False
+            pending.append(executor.submit(_call, func, item))
+            return True
+
+        try:
+            while len(pending) < max_workers and _submit_next():
+                pass
+            while pending:
+                result = pending.popleft().result()
+                _submit_next()
+                yield result
+        finally:
+            # Consumer stopped early: don't start calls nobody will read
+            for future in pending:
+                future.cancel()
+
+
+def _call(func: Callable[[T], R], item: T) -> ConcurrentResult[T, R]:
+    """Run one call, capturing any exception in the result."""
+    try:
+        return ConcurrentResult(item=item, value=func(item))
+    except Exception as e:  # noqa: BLE001 - reported per item
+        logger.debug(f"Concurrent call failed for {item!r}: {e}")
+        return ConcurrentResult(item=item, error=e)
+
+
+def chunked(items: Iterable[T], size: int) -> list[list[T]]:
+    """
+    Split items into consecutive lists of at most ``size`` elements.
+
+    Args:
+        items: Input items
+        size: Maximum chunk size (must be positive)
+
+    Returns:
+        List of chunks
+    """
+    if size <= 0:
+        raise ValueError("Chunk size must be positive")
+    item_list = list(items)
+    return [item_list[i : i + size] for i in range(0, len(item_list), size)]
@@ -1,12 +1,18 @@
 """Utility functions for date operations."""
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import dateutil.parser
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Issues, comments and changelogs share many timestamps (a bulk edit stamps
+# every issue with the same time), and each model parses several of them
+TIMESTAMP_CACHE_SIZE = 8192
+
 
 def parse_date(date_str: str | int | None) -> datetime | None:
     """
@@ -17,6 +23,9 @@ def parse_date(date_str: str | int | None) -> datetime | None:
     - Epoch timestamp (only contains digits and is in milliseconds)
     - Other formats supported by `dateutil.parser` (ISO 8601, RFC 3339, etc.)
 
+    Atlassian ISO 8601 timestamps take the memoized ``parse_timestamp`` path,
+    and only other formats fall back to ``dateutil``.
+
     Args:
         date_str: Date string
 
@@ -28,4 +37,65 @@ def parse_date(date_str: str | int | None) -> datetime | None:
         return None
     if isinstance(date_str, int) or date_str.isdigit():
         return datetime.fromtimestamp(int(date_str) / 1000, tz=timezone.utc)
+    parsed = parse_timestamp(date_str)
+    if parsed is not None:
+        return parsed
     return dateutil.parser.parse(date_str)
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(timestamp: str) -> datetime | None:
+    """
+    Parse an Atlassian ISO 8601 timestamp, remembering recent values.
+
+    Accepts the forms the Jira and Confluence APIs return, such as
+    '2024-01-01T10:00:00.000+0000', '2024-01-01T10:00:00Z' and '2024-01-01'.
+    The returned datetimes are shared between calls, which is safe because
+    datetimes are immutable.
+
+    Args:
+        timestamp: The timestamp string
+
+    Returns:
+        The parsed datetime, or None if the string is not an ISO 8601 timestamp
+    """
+    try:
+        return datetime.fromisoformat(_to_isoformat(timestamp))
+    except ValueError:
+        return None
+
+
+def parse_timestamps(timestamps: Iterable[str | None]) -> list[datetime | None]:
+    """
+    Parse a column of Atlassian timestamps at once.
+
+    Each distinct value is parsed once, so columns with many repeated
+    timestamps cost little more than their distinct values.
+
+    Args:
+        timestamps: Timestamp strings; empty values are allowed
+
+    Returns:
+        The parsed datetimes in input order, None for empty or invalid values
+    """
+    parsed: dict[str, datetime | None] = {}
+    result: list[datetime | None] = []
+    for timestamp in timestamps:
+        if not timestamp:
+            result.append(None)
+            continue
+        value = parsed.get(timestamp)
+        if value is None and timestamp not in parsed:
+            value = parsed[timestamp] = parse_timestamp(timestamp)
+        result.append(value)
+    return result
+
+
+def _to_isoformat(timestamp: str) -> str:
+    """Rewrite 'Z' and '+hhmm' offsets, which older fromisoformat rejects."""
+    if timestamp.endswith("Z"):
+        return timestamp[:-1] + "+00:00"
+    # Offsets only follow a time, so skip date-only values like '2024-01-01'
+    if len(timestamp) > 10 and timestamp[-5] in "+-" and timestamp[-4:].isdigit():
+        return f"{timestamp[:-2]}:{timestamp[-2:]}"
+    return timestamp
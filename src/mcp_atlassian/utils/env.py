@@ -51,29 +51,26 @@ def is_env_ssl_verify(env_var_name: str, default: str = "true") -> bool:
     return os.getenv(env_var_name, default).lower() not in ("false", "0", "no")
 
 
-def get_custom_headers(env_var_name: str) -> dict[str, str]:
-    """Parse custom headers from environment variable containing comma-separated key=value pairs.
+def get_key_value_pairs(env_var_name: str) -> dict[str, str]:
+    """Parse an environment variable containing comma-separated key=value pairs.
 
     Args:
         env_var_name: Name of the environment variable to read
 
     Returns:
-        Dictionary of parsed headers
+        Dictionary of parsed pairs (empty if the variable is unset or blank)
 
     Examples:
-        >>> # With CUSTOM_HEADERS="X-Custom=value1,X-Other=value2"
-        >>> parse_custom_headers("CUSTOM_HEADERS")
-        {'X-Custom': 'value1', 'X-Other': 'value2'}
-        >>> # With unset environment variable
-        >>> parse_custom_headers("UNSET_VAR")
-        {}
+        >>> # With JIRA_EPIC_FIELDS="epic_name=customfield_10011,epic_link=parent"
+        >>> get_key_value_pairs("JIRA_EPIC_FIELDS")
+        {'epic_name': 'customfield_10011', 'epic_link': 'parent'}
     """
-    header_string = os.getenv(env_var_name)
-    if not header_string or not header_string.strip():
+    raw_value = os.getenv(env_var_name)
+    if not raw_value or not raw_value.strip():
         return {}
 
-    headers = {}
-    pairs = header_string.split(",")
+    pairs_map = {}
+    pairs = raw_value.split(",")
 
     for pair in pairs:
         pair = pair.strip()
@@ -88,9 +85,29 @@ def get_custom_headers(env_var_name: str) -> dict[str, str]:
         value = value.strip()
 
         if key:  # Only add if key is not empty
-            headers[key] = value
+            pairs_map[key] = value
+
+    return pairs_map
+
+
+def get_custom_headers(env_var_name: str) -> dict[str, str]:
+    """Parse custom headers from environment variable containing comma-separated key=value pairs.
 
-    return headers
+    Args:
+        env_var_name: Name of the environment variable to read
+
+    Returns:
+        Dictionary of parsed headers
+
+    Examples:
+        >>> # With CUSTOM_HEADERS="X-Custom=value1,X-Other=value2"
+        >>> parse_custom_headers("CUSTOM_HEADERS")
+        {'X-Custom': 'value1', 'X-Other': 'value2'}
+        >>> # With unset environment variable
+        >>> parse_custom_headers("UNSET_VAR")
+        {}
+    """
+    return get_key_value_pairs(env_var_name)
 
 
 def get_adf_rollout_percentage() -> int:
@@ -0,0 +1,67 @@
+"""Test the shared ADF conversion cache."""
+
+import pytest
+
+from src.mcp_atlassian.formatting.adf_ast import ASTBasedADFGenerator
+from src.mcp_atlassian.formatting.adf_cache import (
+    ADFConversionCache,
+    conversion_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_conversion_cache():
+    """Start every test with an empty shared cache."""
+    conversion_cache.clear()
+    yield
+    conversion_cache.clear()
+
+
+class TestADFConversionCache:
+    """Test ADFConversionCache."""
+
+    def test_hits_return_copies(self):
+        """Test that mutating a result does not affect later conversions."""
+        generator = ASTBasedADFGenerator()
+
+        first = generator.markdown_to_adf("**bold** text")
+        first["content"][0]["content"].clear()
+        second = ASTBasedADFGenerator().markdown_to_adf("**bold** text")
+
+        assert second["content"][0]["content"][0]["text"] == "bold"
+        stats = generator.get_performance_metrics()["conversion_cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 50.0
+
+    def test_settings_in_key(self):
+        """Test that generators with other limits do not share conversions."""
+        markdown = "\n".join(f"- item {i}" for i in range(10))
+
+        full = ASTBasedADFGenerator().markdown_to_adf(markdown)
+        limited = ASTBasedADFGenerator(max_list_items=3).markdown_to_adf(markdown)
+
+        assert "list truncated" not in str(full)
+        assert "list truncated" in str(limited)
+        assert conversion_cache.get_stats()["entries"] == 2
+
+    def test_evicts_by_size(self):
+        """Test that the least recently used documents go once the size is reached."""
+        document = {"type": "doc", "content": [{"type": "text", "text": "x" * 400}]}
+        cache = ADFConversionCache(max_bytes=1000)
+
+        cache.set("a", document)
+        cache.set("b", document)
+        assert cache.get("a") == document
+        cache.set("c", document)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == document
+        assert cache.get("c") == document
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["size_bytes"] <= 1000
+
+        cache.set("big", {"text": "x" * 2000})
+        assert cache.get("big") is None
@@ -185,3 +185,23 @@ Only one column provided.
         for i in [1, 2]:
             section = layout["content"][i]["content"][0]
             assert section["content"][0]["content"][0]["text"] == ""
+
+    def test_nested_parsers_reused(self):
+        """Test that column content reuses pooled parsers without sharing state."""
+        generator = ASTBasedADFGenerator(max_list_items=2)
+        column = "::: column\n- one\n- two\n- three\n:::"
+        layout = f":::layout columns=2\n{column}\n{column}\n:::"
+
+        result = generator.markdown("\n\n".join([layout] * 5))
+
+        layouts = result["content"]
+        assert len(layouts) == 5
+        lists = [
+            column["content"][0]["content"][0]
+            for layout in layouts
+            for column in layout["content"]
+        ]
+        # Every column counts its own list items
+        assert all(bullets == lists[0] for bullets in lists)
+        assert "list truncated after 2 items" in str(lists[0])
+        assert len(generator.renderer._nested.parsers) == 1
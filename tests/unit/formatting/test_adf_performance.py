@@ -4,7 +4,7 @@ import time
 
 import pytest
 
-from src.mcp_atlassian.formatting.adf_ast import ASTBasedADFGenerator
+from src.mcp_atlassian.formatting.adf_ast import ADFRenderer, ASTBasedADFGenerator
 
 
 class TestADFPerformance:
@@ -143,6 +143,39 @@ This is a test with **formatting** and [links](https://example.com).
         # All results should be identical
         assert result1 == result
 
+    def test_nested_block_pooling(self, monkeypatch):
+        """Test that pooled nested parsers render layouts like fresh ones."""
+        generator = ASTBasedADFGenerator()
+        layout = """:::layout columns=2
+::: column
+Left column with **bold** text
+:::
+::: column
+- first
+- second
+:::
+:::"""
+        panel = """:::panel type="info"
+Panel with *italic* text
+:::"""
+        markdown = "\n\n".join([layout, panel] * 10)
+
+        # Render twice so the second run uses parsers returned to the pool
+        generator.markdown(markdown)
+        pooled = generator.markdown(markdown)
+
+        # Build a new parser for every nested block, as before pooling
+        render_nested = ADFRenderer._render_nested
+
+        def unpooled(self, *args, **kwargs):
+            self._nested.__dict__.pop("parsers", None)
+            return render_nested(self, *args, **kwargs)
+
+        monkeypatch.setattr(ADFRenderer, "_render_nested", unpooled)
+        unpooled = generator.markdown(markdown)
+
+        assert pooled == unpooled
+
     def test_plugin_performance(self):
         """Test performance with plugin-heavy content."""
         generator = ASTBasedADFGenerator()
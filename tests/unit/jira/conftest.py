@@ -11,11 +11,21 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mcp_atlassian.jira.cache import clear_site_caches
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.config import JiraConfig
 from tests.utils.factories import AuthConfigFactory, JiraIssueFactory
 from tests.utils.mocks import MockAtlassianClient
 
+
+@pytest.fixture(autouse=True)
+def reset_jira_site_caches():
+    """Keep site-level caches from leaking between tests sharing a site URL."""
+    clear_site_caches()
+    yield
+    clear_site_caches()
+
+
 # ============================================================================
 # Session-Scoped Jira Data Fixtures
 # ============================================================================
@@ -0,0 +1,253 @@
+"""Tests for the Jira status analytics module."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira.analytics import StatusAnalytics, StatusTimeline
+from mcp_atlassian.models.jira import JiraChangelog
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+HOUR = 3600
+CATEGORIES = {
+    "To Do": "new",
+    "In Progress": "indeterminate",
+    "Review": "indeterminate",
+    "Done": "done",
+    "Closed": "done",
+}
+
+
+def _history(hours: float, from_status: str, to_status: str) -> dict:
+    return {
+        "id": "1",
+        "created": (BASE + timedelta(hours=hours)).isoformat(),
+        "items": [
+            {"field": "status", "fromString": from_status, "toString": to_status}
+        ],
+    }
+
+
+def _changelogs(*transitions: tuple[float, str, str]) -> list[JiraChangelog]:
+    return [JiraChangelog.from_api_response(_history(*t)) for t in transitions]
+
+
+class TestStatusTimeline:
+    """Tests for building timelines from changelogs."""
+
+    def test_orders_events_and_ignores_other_fields(self):
+        changelogs = _changelogs(
+            (5, "In Progress", "Done"), (1, "To Do", "In Progress")
+        )
+        changelogs.append(
+            JiraChangelog.from_api_response(
+                {
+                    "created": (BASE + timedelta(hours=2)).isoformat(),
+                    "items": [{"field": "assignee", "toString": "Bob"}],
+                }
+            )
+        )
+
+        timeline = StatusTimeline.from_changelogs(
+            "TEST-1", BASE.timestamp(), changelogs
+        )
+
+        assert timeline.statuses == ["To Do", "In Progress", "Done"]
+        assert [t - BASE.timestamp() for t in timeline.entered_at] == [
+            0,
+            HOUR,
+            5 * HOUR,
+        ]
+
+    def test_no_changes_uses_current_status(self):
+        timeline = StatusTimeline.from_changelogs(
+            "TEST-1", BASE.timestamp(), [], current_status="To Do"
+        )
+        assert timeline.statuses == ["To Do"]
+
+
+class TestStatusAnalytics:
+    """Tests for the interval arithmetic and summary statistics."""
+
+    def test_time_in_status_lead_and_cycle_time(self):
+        now = (BASE + timedelta(hours=100)).timestamp()
+        analytics = StatusAnalytics(CATEGORIES, now=now)
+        # Revisits In Progress, then Done -> Closed counts as one done run
+        analytics.add(
+            StatusTimeline.from_changelogs(
+                "TEST-1",
+                BASE.timestamp(),
+                _changelogs(
+                    (2, "To Do", "In Progress"),
+                    (4, "In Progress", "Review"),
+                    (5, "Review", "In Progress"),
+                    (8, "In Progress", "Done"),
+                    (9, "Done", "Closed"),
+                ),
+            )
+        )
+        # Still open: contributes time in status but no lead/cycle time
+        analytics.add(
+            StatusTimeline.from_changelogs(
+                "TEST-2", BASE.timestamp(), _changelogs((10, "To Do", "In Progress"))
+            )
+        )
+
+        summary = analytics.summary(percentiles=[50, 100])
+
+        assert summary["issue_count"] == 2
+        in_progress = summary["time_in_status_hours"]["In Progress"]
+        assert in_progress == {"issues": 2, "mean": 47.5, "p50": 47.5, "p100": 90.0}
+        assert summary["time_in_status_hours"]["Closed"]["p50"] == 91.0
+        assert summary["lead_time_hours"] == {
+            "issues": 1,
+            "mean": 8.0,
+            "p50": 8.0,
+            "p100": 8.0,
+        }
+        assert summary["cycle_time_hours"]["p50"] == 6.0
+        assert summary["transitions"][0] == {
+            "from": "To Do",
+            "to": "In Progress",
+            "count": 2,
+        }
+
+    def test_exclude_current_status(self):
+        analytics = StatusAnalytics(
+            CATEGORIES, now=BASE.timestamp() + 10 * HOUR, include_current=False
+        )
+        analytics.add(
+            StatusTimeline.from_changelogs(
+                "TEST-1", BASE.timestamp(), _changelogs((2, "To Do", "In Progress"))
+            )
+        )
+
+        summary = analytics.summary()
+
+        assert list(summary["time_in_status_hours"]) == ["To Do"]
+        assert summary["cycle_time_hours"] == {"issues": 0}
+
+    def test_ten_thousand_issues_is_fast(self):
+        """Analyzing 10k issue timelines stays well under a second of CPU."""
+        created = BASE.timestamp()
+        timelines = [
+            StatusTimeline.from_changelogs(
+                f"TEST-{i}",
+                created,
+                _changelogs(
+                    (1 + i % 7, "To Do", "In Progress"),
+                    (10 + i % 13, "In Progress", "Review"),
+                    (20 + i % 5, "Review", "Done"),
+                ),
+            )
+            for i in range(10_000)
+        ]
+
+        start = time.process_time()
+        analytics = StatusAnalytics(CATEGORIES, now=created + 1000 * HOUR)
+        for timeline in timelines:
+            analytics.add(timeline)
+        summary = analytics.summary()
+        elapsed = time.process_time() - start
+
+        assert summary["issue_count"] == 10_000
+        assert elapsed < 1.0, f"Analytics took {elapsed:.3f}s CPU"
+
+
+class TestAnalyticsMixin:
+    """Tests for gathering changelogs and status categories."""
+
+    @pytest.fixture
+    def fetcher(self, jira_fetcher: JiraFetcher) -> JiraFetcher:
+        jira_fetcher.jira.resource_url.side_effect = lambda resource: (
+            f"https://test.atlassian.net/rest/api/3/{resource}"
+        )
+        jira_fetcher.jira.get.return_value = [
+            {"name": "To Do", "statusCategory": {"key": "new"}},
+            {"name": "In Progress", "statusCategory": {"key": "indeterminate"}},
+            {"name": "Done", "statusCategory": {"key": "done"}},
+        ]
+        return jira_fetcher
+
+    def _search_results(self, with_changelog: bool) -> dict:
+        issue = {
+            "id": "101",
+            "key": "TEST-1",
+            "fields": {
+                "created": BASE.isoformat(),
+                "status": {"name": "Done", "statusCategory": {"key": "done"}},
+            },
+        }
+        if with_changelog:
+            issue["changelog"] = {
+                "histories": [
+                    _history(1, "To Do", "In Progress"),
+                    _history(3, "In Progress", "Done"),
+                ]
+            }
+        return {"issues": [issue], "total": 1}
+
+    def test_server_expands_changelog_in_search(self, fetcher: JiraFetcher):
+        fetcher.config.url = "https://jira.example.com"
+        fetcher.jira.jql.return_value = self._search_results(with_changelog=True)
+
+        result = fetcher.get_status_analytics("project = TEST", percentiles=[50])
+
+        assert fetcher.jira.jql.call_args.kwargs["expand"] == "changelog"
+        assert result["lead_time_hours"]["p50"] == 3.0
+        assert result["cycle_time_hours"]["p50"] == 2.0
+        assert result["truncated"] is False
+
+    def test_cloud_uses_bulk_changelogs(self, fetcher: JiraFetcher, monkeypatch):
+        fetcher.jira.enhanced_jql_get_list_of_tickets.return_value = (
+            self._search_results(with_changelog=False)["issues"]
+        )
+        requested = []
+
+        def fake_iter_changelogs(issue_ids, fields=None):
+            requested.append((issue_ids, fields))
+            yield (
+                "101",
+                _changelogs((1, "To Do", "In Progress"), (3, "In Progress", "Done")),
+            )
+
+        monkeypatch.setattr(fetcher, "iter_changelogs", fake_iter_changelogs)
+
+        result = fetcher.get_status_analytics("project = TEST", percentiles=[50])
+
+        assert requested == [(["101"], ["status"])]
+        assert result["lead_time_hours"]["p50"] == 3.0
+
+    def test_cloud_reports_truncation_across_pages(
+        self, fetcher: JiraFetcher, monkeypatch
+    ):
+        fetcher.jira.get.return_value = {"total": 150}
+        issue = self._search_results(with_changelog=False)["issues"][0]
+
+        def page(jql, fields=None, limit=100, expand=None, start_at=0):
+            count = max(0, min(limit, 150 - start_at))
+            return [{**issue, "id": str(start_at + i)} for i in range(count)]
+
+        fetcher.jira.enhanced_jql_get_list_of_tickets.side_effect = page
+        analyzed = []
+
+        def fake_iter_changelogs(issue_ids, fields=None):
+            analyzed.extend(issue_ids)
+            return iter(())
+
+        monkeypatch.setattr(fetcher, "iter_changelogs", fake_iter_changelogs)
+
+        result = fetcher.get_status_analytics("project = TEST", limit=120)
+        assert len(analyzed) == 120
+        assert result["truncated"] is True
+
+        analyzed.clear()
+        result = fetcher.get_status_analytics("project = TEST", limit=150)
+        assert len(analyzed) == 150
+        assert result["truncated"] is False
+
+    def test_rejects_invalid_percentiles(self, fetcher: JiraFetcher):
+        with pytest.raises(ValueError, match="Percentiles"):
+            fetcher.get_status_analytics("project = TEST", percentiles=[150])
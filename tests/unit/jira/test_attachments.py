@@ -1,5 +1,7 @@
 """Tests for the Jira attachments module."""
 
+import os
+import threading
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
@@ -224,7 +226,14 @@ class TestAttachmentsMixin:
         # Mock the download_attachment method
         with (
             patch.object(
-                attachments_mixin, "download_attachment", return_value=True
+                attachments_mixin,
+                "_download_attachment_file",
+                return_value={
+                    "success": True,
+                    "status": "downloaded",
+                    "bytes": 100,
+                    "seconds": 0.1,
+                },
             ) as mock_download,
             patch("pathlib.Path.mkdir") as mock_mkdir,
             patch(
@@ -272,7 +281,14 @@ class TestAttachmentsMixin:
         # Mock path operations
         with (
             patch.object(
-                attachments_mixin, "download_attachment", return_value=True
+                attachments_mixin,
+                "_download_attachment_file",
+                return_value={
+                    "success": True,
+                    "status": "downloaded",
+                    "bytes": 100,
+                    "seconds": 0.1,
+                },
             ) as mock_download,
             patch("pathlib.Path.mkdir") as mock_mkdir,
             patch(
@@ -376,10 +392,21 @@ class TestAttachmentsMixin:
         mock_attachment2.url = "https://test.url/attachment2"
         mock_attachment2.size = 200
 
-        # Mock the download_attachment method to succeed for first attachment and fail for second
+        # Mock the download to succeed for first attachment and fail for second
+        attachments_mixin.config.max_concurrency = 1
         with (
             patch.object(
-                attachments_mixin, "download_attachment", side_effect=[True, False]
+                attachments_mixin,
+                "_download_attachment_file",
+                side_effect=[
+                    {
+                        "success": True,
+                        "status": "downloaded",
+                        "bytes": 100,
+                        "seconds": 0.1,
+                    },
+                    {"success": False, "error": "Download failed"},
+                ],
             ) as mock_download,
             patch("pathlib.Path.mkdir") as mock_mkdir,
             patch(
@@ -442,6 +469,157 @@ class TestAttachmentsMixin:
             assert result["failed"][0]["filename"] == "test1.txt"
             assert "No URL available" in result["failed"][0]["error"]
 
+    def test_download_attachment_file_skips_unchanged(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test an up-to-date local copy with the expected size is not downloaded."""
+        target = tmp_path / "design.png"
+        target.write_bytes(b"0123456789")
+
+        result = attachments_mixin._download_attachment_file(
+            "https://test.url/attachment",
+            str(target),
+            expected_size=10,
+            created="2020-01-01T00:00:00.000+0000",
+        )
+
+        assert result["success"] is True
+        assert result["status"] == "skipped"
+        attachments_mixin.jira._session.get.assert_not_called()
+
+    def test_download_attachment_file_redownloads_older_copy(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a local file older than the attachment is downloaded again."""
+        target = tmp_path / "design.png"
+        target.write_bytes(b"old-bytes!")
+        os.utime(target, (0, 0))
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [b"new-bytes!"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin._download_attachment_file(
+            "https://test.url/attachment",
+            str(target),
+            expected_size=10,
+            created="2020-01-01T00:00:00.000+0000",
+        )
+
+        assert result["status"] == "downloaded"
+        assert target.read_bytes() == b"new-bytes!"
+
+    def test_download_attachment_file_resumes_partial(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a partial local file is completed with a Range request."""
+        target = tmp_path / "design.png"
+        target.write_bytes(b"01234")
+        mock_response = MagicMock()
+        mock_response.status_code = 206
+        mock_response.iter_content.return_value = [b"567", b"89"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin._download_attachment_file(
+            "https://test.url/attachment", str(target), expected_size=10, chunk_size=3
+        )
+
+        assert result["success"] is True
+        assert result["status"] == "resumed"
+        assert result["bytes"] == 5
+        assert target.read_bytes() == b"0123456789"
+        attachments_mixin.jira._session.get.assert_called_once_with(
+            "https://test.url/attachment", stream=True, headers={"Range": "bytes=5-"}
+        )
+        mock_response.iter_content.assert_called_once_with(chunk_size=3)
+
+    def test_download_attachment_file_restarts_when_range_ignored(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a full response to a Range request overwrites the partial file."""
+        target = tmp_path / "design.png"
+        target.write_bytes(b"01234")
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"0123456789"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin._download_attachment_file(
+            "https://test.url/attachment", str(target), expected_size=10
+        )
+
+        assert result["status"] == "downloaded"
+        assert target.read_bytes() == b"0123456789"
+
+    def test_download_issue_attachments_reports_metrics(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test downloaded, skipped and throughput details are reported."""
+        (tmp_path / "a.txt").write_bytes(b"aaaa")
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {"filename": "a.txt", "content": "https://t/a", "size": 4},
+                    {"filename": "b.txt", "content": "https://t/b", "size": 3},
+                ]
+            }
+        }
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [b"bbb"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin.download_issue_attachments("TEST-123", str(tmp_path))
+
+        assert [d["filename"] for d in result["downloaded"]] == ["b.txt"]
+        assert [d["filename"] for d in result["skipped"]] == ["a.txt"]
+        assert result["metrics"]["bytes_downloaded"] == 3
+        assert (tmp_path / "b.txt").read_bytes() == b"bbb"
+
+    def test_download_issue_attachments_same_filename(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test attachments sharing a name are saved to separate files."""
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {
+                        "id": "101",
+                        "filename": "image.png",
+                        "content": "https://t/101",
+                        "size": 5,
+                    },
+                    {
+                        "id": "102",
+                        "filename": "image.png",
+                        "content": "https://t/102",
+                        "size": 5,
+                    },
+                    {"id": "103", "filename": "notes.txt", "content": "https://t/103"},
+                ]
+            }
+        }
+
+        def _get(url, **kwargs):
+            response = MagicMock()
+            response.iter_content.return_value = [url[-5:].encode()]
+            return response
+
+        attachments_mixin.jira._session.get.side_effect = _get
+
+        result = attachments_mixin.download_issue_attachments("TEST-123", str(tmp_path))
+
+        assert [d["path"] for d in result["downloaded"]] == [
+            str(tmp_path / "101_image.png"),
+            str(tmp_path / "102_image.png"),
+            str(tmp_path / "notes.txt"),
+        ]
+        assert (tmp_path / "101_image.png").read_bytes() == b"t/101"
+        assert (tmp_path / "102_image.png").read_bytes() == b"t/102"
+
+        # A second run finds both files unchanged
+        attachments_mixin.jira._session.get.reset_mock()
+        rerun = attachments_mixin.download_issue_attachments("TEST-123", str(tmp_path))
+        assert [d["filename"] for d in rerun["skipped"]] == ["image.png", "image.png"]
+
     # Tests for upload_attachment method
 
     def test_upload_attachment_success(self, attachments_mixin: AttachmentsMixin):
@@ -637,8 +815,13 @@ class TestAttachmentsMixin:
             for i, ext in enumerate(["txt", "pdf", "jpg"])
         ]
 
+        # Uploads run concurrently, so key results by path rather than call order
+        results_by_path = dict(zip(file_paths, mock_results, strict=True))
+
         with patch.object(
-            attachments_mixin, "upload_attachment", side_effect=mock_results
+            attachments_mixin,
+            "upload_attachment",
+            side_effect=lambda _key, path: results_by_path[path],
         ) as mock_upload:
             # Call the method
             result = attachments_mixin.upload_attachments("TEST-123", file_paths)
@@ -697,8 +880,13 @@ class TestAttachmentsMixin:
             },
         ]
 
+        # Uploads run concurrently, so key results by path rather than call order
+        results_by_path = dict(zip(file_paths, mock_results, strict=True))
+
         with patch.object(
-            attachments_mixin, "upload_attachment", side_effect=mock_results
+            attachments_mixin,
+            "upload_attachment",
+            side_effect=lambda _key, path: results_by_path[path],
         ) as mock_upload:
             # Call the method
             result = attachments_mixin.upload_attachments("TEST-123", file_paths)
@@ -727,6 +915,31 @@ class TestAttachmentsMixin:
             assert result["failed"][0]["filename"] == "file2.pdf"
             assert "File not found" in result["failed"][0]["error"]
 
+    def test_upload_attachments_runs_concurrently(
+        self, attachments_mixin: AttachmentsMixin
+    ):
+        """Test that multiple files are uploaded in parallel."""
+        file_paths = ["/path/to/a.txt", "/path/to/b.txt", "/path/to/c.txt"]
+        barrier = threading.Barrier(len(file_paths), timeout=5)
+
+        def fake_upload(issue_key, file_path):
+            barrier.wait()  # Only passes if all uploads are in flight at once
+            name = os.path.basename(file_path)
+            return {"success": True, "filename": name, "size": 1, "id": name}
+
+        attachments_mixin.config.max_concurrency = 4
+        with patch.object(
+            attachments_mixin, "upload_attachment", side_effect=fake_upload
+        ):
+            result = attachments_mixin.upload_attachments("TEST-123", file_paths)
+
+        assert [u["filename"] for u in result["uploaded"]] == [
+            "a.txt",
+            "b.txt",
+            "c.txt",
+        ]
+        assert result["failed"] == []
+
     def test_upload_attachments_empty_list(self, attachments_mixin: AttachmentsMixin):
         """Test upload with an empty list of file paths."""
         # Call the method with an empty list
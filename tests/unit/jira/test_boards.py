@@ -1,12 +1,15 @@
 """Tests for the Jira BoardMixin"""
 
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 import requests
 
 from mcp_atlassian.jira import JiraConfig
-from mcp_atlassian.jira.boards import BoardsMixin
+from mcp_atlassian.jira import boards as boards_module
+from mcp_atlassian.jira.boards import BoardDirectory, BoardsMixin
 from mcp_atlassian.models.jira import JiraBoard
 
 
@@ -18,6 +21,7 @@ def mock_config():
     config.username = "test@example.com"
     config.api_token = "test-token"
     config.auth_type = "pat"
+    config.max_concurrency = 4
     return config
 
 
@@ -99,3 +103,127 @@ def test_get_all_agile_boards_model(boards_mixin, mock_boards):
     assert result == [
         JiraBoard.from_api_response(value) for value in mock_boards["values"]
     ]
+
+
+def _board_pages(count: int, page_size: int = 50) -> dict[int, dict]:
+    """Board list pages keyed by startAt, like the Agile API returns them."""
+    boards = [
+        {
+            "id": i,
+            "name": f"Board {i}",
+            "type": "scrum" if i % 2 else "kanban",
+            "location": {"projectKey": f"P{i % 3}"},
+        }
+        for i in range(count)
+    ]
+    return {
+        start: {
+            "startAt": start,
+            "total": count,
+            "isLast": start + page_size >= count,
+            "values": boards[start : start + page_size],
+        }
+        for start in range(0, count, page_size)
+    }
+
+
+def test_get_all_agile_boards_beyond_first_page(boards_mixin):
+    """Test that the directory pages through every board and filters locally."""
+    pages = _board_pages(230)
+    boards_mixin.jira.get_all_agile_boards.side_effect = lambda start_at=0, **kwargs: (
+        pages[start_at]
+    )
+
+    result = boards_mixin.get_all_agile_boards(
+        board_name="board 1", board_type="scrum", limit=100
+    )
+
+    assert [b["id"] for b in result] == [
+        i for i in range(230) if i % 2 and str(i).startswith("1")
+    ]
+    assert boards_mixin.jira.get_all_agile_boards.call_count == 5
+    # Later lookups are answered from the cached directory
+    assert boards_mixin.get_board_by_id(229)["name"] == "Board 229"
+    assert boards_mixin.get_board_by_name("board 7")["id"] == 7
+    assert boards_mixin.get_board_by_name("Missing") is None
+    assert boards_mixin.jira.get_all_agile_boards.call_count == 5
+
+
+def test_get_all_agile_boards_by_project(boards_mixin):
+    """Test that project lookups use Jira's project query and are cached."""
+    pages = _board_pages(120)
+    # Board 0 is located elsewhere but its filter covers the project
+    pages[0]["values"][0]["location"] = {"projectKey": "OTHER"}
+    boards_mixin.jira.get_all_agile_boards.side_effect = lambda start_at=0, **kwargs: (
+        pages[start_at]
+    )
+
+    result = boards_mixin.get_all_agile_boards(project_key="proj", board_type="kanban")
+    again = boards_mixin.get_all_agile_boards(project_key="PROJ", board_name="board 1")
+
+    assert [b["id"] for b in result][:3] == [0, 2, 4]
+    assert [b["id"] for b in again][:3] == [1, 10, 11]
+    calls = boards_mixin.jira.get_all_agile_boards.call_args_list
+    assert len(calls) == 3
+    assert {call.kwargs["project_key"] for call in calls} == {"proj"}
+    assert sorted(call.kwargs["start_at"] for call in calls) == [0, 50, 100]
+
+
+def test_get_board_by_filter_id_is_remembered(boards_mixin):
+    """Test that filter lookups ask Jira once and then use the directory."""
+    pages = _board_pages(3)
+
+    def fake_get_all_agile_boards(start_at=0, filter_id=None, **kwargs):
+        if filter_id is not None:
+            return {"values": [{"id": 2, "name": "Board 2"}]}
+        return pages[start_at]
+
+    boards_mixin.jira.get_all_agile_boards.side_effect = fake_get_all_agile_boards
+
+    first = boards_mixin.get_board_by_filter_id(10100)
+    second = boards_mixin.get_board_by_filter_id("10100")
+
+    assert first is second
+    assert first["location"] == {"projectKey": "P2"}
+    filter_calls = [
+        call
+        for call in boards_mixin.jira.get_all_agile_boards.call_args_list
+        if call.kwargs.get("filter_id") is not None
+    ]
+    assert len(filter_calls) == 1
+
+
+def test_stale_board_directory_refreshes_in_background(boards_mixin, monkeypatch):
+    """Test that a stale directory is served while a reload runs."""
+    boards_mixin.jira.get_all_agile_boards.return_value = _board_pages(1)[0]
+    stale = boards_mixin.get_board_directory()
+    stale.loaded_at = time.time() - boards_module.BOARD_DIRECTORY_REFRESH_SECONDS - 1
+    boards_mixin.jira.get_all_agile_boards.return_value = _board_pages(2)[0]
+
+    assert boards_mixin.get_board_directory() is stale
+    for thread in threading.enumerate():
+        if thread.name == "board-directory-refresh":
+            thread.join(timeout=5)
+
+    assert len(boards_mixin.get_board_directory().boards) == 2
+
+
+def test_board_directory_find():
+    """Test combined name and type filtering."""
+    directory = BoardDirectory(
+        [
+            {"id": 1, "name": "Team Alpha", "type": "scrum"},
+            {"id": 2, "name": "Alpha Ops", "type": "kanban"},
+            {
+                "id": 3,
+                "name": "Beta",
+                "type": "scrum",
+                "location": {"projectKey": "BETA"},
+            },
+        ]
+    )
+
+    assert [b["id"] for b in directory.find(board_name="ALPHA")] == [1, 2]
+    assert [b["id"] for b in directory.find(board_type="Scrum")] == [1, 3]
+    assert [b["id"] for b in directory.find("alpha", board_type="kanban")] == [2]
+    assert directory.by_name["alpha ops"][0]["id"] == 2
@@ -46,7 +46,9 @@ class TestCommentsMixin:
         result = comments_mixin.get_issue_comments("TEST-123")
 
         # Verify
-        comments_mixin.jira.issue_get_comments.assert_called_once_with("TEST-123")
+        comments_mixin.jira.issue_get_comments.assert_called_once_with(
+            "TEST-123", start_at=0, max_results=50, order_by="-created"
+        )
         assert len(result) == 1
         assert result[0]["id"] == "10001"
         assert result[0]["body"] == "This is a comment"
@@ -83,12 +85,55 @@ class TestCommentsMixin:
         result = comments_mixin.get_issue_comments("TEST-123", limit=2)
 
         # Verify
-        comments_mixin.jira.issue_get_comments.assert_called_once_with("TEST-123")
+        comments_mixin.jira.issue_get_comments.assert_called_once_with(
+            "TEST-123", start_at=0, max_results=2, order_by="-created"
+        )
         assert len(result) == 2  # Only 2 comments should be returned
         assert result[0]["id"] == "10001"
         assert result[1]["id"] == "10002"
         # Third comment shouldn't be included due to limit
 
+    def test_get_issue_comments_fetches_only_needed_pages(self, comments_mixin):
+        """Test that only the pages covering the limit are requested."""
+        thread = [{"id": str(i), "body": f"Comment {i}"} for i in range(250, 0, -1)]
+
+        def fake_issue_get_comments(issue_key, start_at, max_results, order_by):
+            return {
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(thread),
+                "comments": thread[start_at : start_at + max_results],
+            }
+
+        comments_mixin.jira.issue_get_comments.side_effect = fake_issue_get_comments
+
+        result = comments_mixin.get_issue_comments("TEST-123", limit=120)
+
+        assert [c["id"] for c in result] == [str(i) for i in range(250, 130, -1)]
+        assert [
+            call.kwargs["start_at"]
+            for call in comments_mixin.jira.issue_get_comments.call_args_list
+        ] == [0, 100]
+        assert comments_mixin._clean_text.call_count == 120
+
+    def test_iter_issue_comments_walks_older_pages(self, comments_mixin):
+        """Test lazily walking a thread until the server's total is reached."""
+        pages = {
+            0: {"total": 5, "comments": [{"id": "5"}, {"id": "4"}]},
+            2: {"total": 5, "comments": [{"id": "3"}, {"id": "2"}]},
+            4: {"total": 5, "comments": [{"id": "1"}]},
+        }
+        comments_mixin.jira.issue_get_comments.side_effect = (
+            lambda issue_key, start_at, **kwargs: pages[start_at]
+        )
+
+        comments = comments_mixin.iter_issue_comments("TEST-123", page_size=2)
+
+        assert next(comments)["id"] == "5"
+        assert comments_mixin.jira.issue_get_comments.call_count == 1
+        assert [c["id"] for c in comments] == ["4", "3", "2", "1"]
+        assert comments_mixin.jira.issue_get_comments.call_count == 3
+
     def test_get_issue_comments_with_missing_fields(self, comments_mixin):
         """Test get_issue_comments with missing fields in the response."""
         # Setup mock response with missing fields
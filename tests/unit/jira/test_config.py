@@ -204,3 +204,22 @@ def test_is_cloud_oauth_with_cloud_id():
         oauth_config=oauth_config,
     )
     assert config.is_cloud is True
+
+
+def test_from_env_epic_field_overrides():
+    """Test that JIRA_EPIC_FIELDS is parsed into epic field overrides."""
+    with patch.dict(
+        os.environ,
+        {
+            "JIRA_URL": "https://test.atlassian.net",
+            "JIRA_USERNAME": "test_username",
+            "JIRA_API_TOKEN": "test_token",
+            "JIRA_EPIC_FIELDS": "epic_name=customfield_10011, epic_link=parent",
+        },
+        clear=True,
+    ):
+        config = JiraConfig.from_env()
+        assert config.epic_field_overrides == {
+            "epic_name": "customfield_10011",
+            "epic_link": "parent",
+        }
@@ -563,6 +563,44 @@ class TestEpicsMixin:
         assert isinstance(result, JiraIssue)
         assert result.key == "TEST-123"
 
+    def test_link_issue_to_epic_reuses_cached_link_field(self, epics_mixin: EpicsMixin):
+        """Test a linking field that worked once is tried first next time."""
+        epics_mixin.get_fields = MagicMock(
+            return_value=[{"id": "customfield_10014", "name": "Epic Link"}]
+        )
+        epic = {"key": "EPIC-456", "fields": {"issuetype": {"name": "Epic"}}}
+        epics_mixin.jira.get_issue.side_effect = [{"key": "TEST-1"}, epic] * 2
+        epics_mixin.jira.update_issue.side_effect = [
+            Exception("Parent field error"),
+            None,
+            None,
+        ]
+
+        epics_mixin.link_issue_to_epic("TEST-1", "EPIC-456")
+        epics_mixin.link_issue_to_epic("TEST-1", "EPIC-456")
+
+        assert epics_mixin.jira.update_issue.call_count == 3
+        assert epics_mixin.jira.update_issue.call_args_list[2] == call(
+            issue_key="TEST-1", update={"fields": {"customfield_10014": "EPIC-456"}}
+        )
+
+    def test_find_epic_link_field_probes_once_per_site(self, epics_mixin: EpicsMixin):
+        """Test the sample-epic probe does not repeat once it has run."""
+        epics_mixin.get_fields = MagicMock(
+            return_value=[{"id": "customfield_10011", "name": "Epic Name"}]
+        )
+        epics_mixin.jira.jql.return_value = {"issues": []}
+        epics_mixin.jira.get_all_fields.return_value = []
+        field_ids = epics_mixin.get_field_ids_to_epic()
+        probe_calls = epics_mixin.jira.jql.call_count
+
+        assert epics_mixin._find_epic_link_field(field_ids) is None
+        assert epics_mixin.jira.jql.call_count > probe_calls
+        probe_calls = epics_mixin.jira.jql.call_count
+
+        assert epics_mixin._find_epic_link_field(field_ids) is None
+        assert epics_mixin.jira.jql.call_count == probe_calls
+
     def test_link_issue_to_epic_not_epic(self, epics_mixin: EpicsMixin):
         """Test link_issue_to_epic when the target is not an epic."""
         # Setup mocks
@@ -353,6 +353,53 @@ class TestFieldsMixin:
         # Verify the result
         assert result == {}
 
+    def test_get_field_ids_to_epic_shared_across_fetchers(
+        self, fields_mixin: FieldsMixin, mock_fields: list[dict], mock_config
+    ):
+        """Test epic field discovery runs once per site, not once per fetcher."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        first = fields_mixin.get_field_ids_to_epic()
+
+        other = JiraFetcher(config=mock_config)
+        other.jira = MagicMock()
+        second = other.get_field_ids_to_epic()
+
+        assert second == first
+        assert second["epic_link"] == "customfield_10010"
+        other.jira.get_all_fields.assert_not_called()
+        other.jira.jql.assert_not_called()
+
+    def test_get_field_ids_to_epic_invalidate(
+        self, fields_mixin: FieldsMixin, mock_fields: list[dict]
+    ):
+        """Test invalidating the epic field cache forces rediscovery."""
+        fields_mixin.get_fields = MagicMock(return_value=mock_fields)
+        fields_mixin.get_field_ids_to_epic()
+        discovery_calls = fields_mixin.get_fields.call_count
+        fields_mixin.get_field_ids_to_epic()
+        assert fields_mixin.get_fields.call_count == discovery_calls
+
+        fields_mixin.invalidate_epic_field_cache()
+        fields_mixin.get_field_ids_to_epic()
+        assert fields_mixin.get_fields.call_count > discovery_calls
+
+    def test_get_field_ids_to_epic_overrides(self, fields_mixin: FieldsMixin):
+        """Test configured overrides win and skip the sample-epic search."""
+        fields_mixin.config.epic_field_overrides = {
+            "epic_name": "customfield_20001",
+            "epic_link": "parent",
+        }
+        fields_mixin.get_fields = MagicMock(
+            return_value=[{"id": "summary", "name": "Summary"}]
+        )
+
+        result = fields_mixin.get_field_ids_to_epic()
+
+        assert result["epic_name"] == "customfield_20001"
+        assert "epic_link" not in result
+        fields_mixin.jira.jql.assert_not_called()
+        assert fields_mixin._get_cached_epic_field_map().link_field == "parent"
+
     def test_is_custom_field(self, fields_mixin: FieldsMixin):
         """Test is_custom_field correctly identifies custom fields."""
         # Test with custom field
@@ -0,0 +1,174 @@
+"""Tests for the Jira issue dependency graph module."""
+
+import re
+
+import pytest
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError, MCPAtlassianError
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira.graph import _cycle_members
+
+BLOCKS = {"name": "Blocks", "inward": "is blocked by", "outward": "blocks"}
+RELATES = {"name": "Relates", "inward": "relates to", "outward": "relates to"}
+
+
+def _linked(key: str) -> dict:
+    return {
+        "key": key,
+        "fields": {"summary": f"Summary {key}", "status": {"name": "To Do"}},
+    }
+
+
+def _issue(key: str, *, outward=(), inward=(), subtasks=(), parent=None) -> dict:
+    links = [
+        {"id": f"{key}-{other}", "type": link_type, "outwardIssue": _linked(other)}
+        for link_type, other in outward
+    ] + [
+        {"id": f"{other}-{key}", "type": link_type, "inwardIssue": _linked(other)}
+        for link_type, other in inward
+    ]
+    fields = {
+        "summary": f"Summary {key}",
+        "status": {"name": "In Progress"},
+        "issuetype": {"name": "Story"},
+        "issuelinks": links,
+        "subtasks": [_linked(sub) for sub in subtasks],
+    }
+    if parent:
+        fields["parent"] = _linked(parent)
+    return {"key": key, "fields": fields}
+
+
+# PROJ-1 blocks PROJ-2 blocks PROJ-3 blocks PROJ-1 (a cycle); PROJ-2 relates to
+# PROJ-4, which has subtask PROJ-5; PROJ-6 blocks PROJ-1
+ISSUES = {
+    "PROJ-1": _issue(
+        "PROJ-1",
+        outward=[(BLOCKS, "PROJ-2")],
+        inward=[(BLOCKS, "PROJ-3"), (BLOCKS, "PROJ-6")],
+    ),
+    "PROJ-2": _issue(
+        "PROJ-2",
+        outward=[(BLOCKS, "PROJ-3"), (RELATES, "PROJ-4")],
+        inward=[(BLOCKS, "PROJ-1")],
+    ),
+    "PROJ-3": _issue(
+        "PROJ-3", outward=[(BLOCKS, "PROJ-1")], inward=[(BLOCKS, "PROJ-2")]
+    ),
+    "PROJ-4": _issue("PROJ-4", inward=[(RELATES, "PROJ-2")], subtasks=["PROJ-5"]),
+    "PROJ-5": _issue("PROJ-5", parent="PROJ-4"),
+    "PROJ-6": _issue("PROJ-6", outward=[(BLOCKS, "PROJ-1")]),
+}
+
+
+@pytest.fixture
+def fetcher(jira_fetcher: JiraFetcher) -> JiraFetcher:
+    def fake_jql(jql, fields=None, limit=None, **kwargs):
+        keys = re.findall(r'"([^"]+)"', jql)
+        return {"issues": [ISSUES[key] for key in keys if key in ISSUES]}
+
+    jira_fetcher.jira.jql.side_effect = fake_jql
+    return jira_fetcher
+
+
+def _queried_keys(fetcher: JiraFetcher) -> list[set[str]]:
+    return [
+        set(re.findall(r'"([^"]+)"', call.args[0]))
+        for call in fetcher.jira.jql.call_args_list
+    ]
+
+
+def test_walks_whole_graph_one_query_per_level(fetcher: JiraFetcher):
+    graph = fetcher.get_issue_graph(["proj-1"])
+
+    assert graph["roots"] == ["PROJ-1"]
+    assert set(graph["issues"]) == {f"PROJ-{i}" for i in range(1, 7)}
+    assert graph["issues"]["PROJ-1"] == {
+        "summary": "Summary PROJ-1",
+        "status": "In Progress",
+        "type": "Story",
+        "depth": 0,
+    }
+    assert graph["issues"]["PROJ-5"]["depth"] == 3
+    assert graph["adjacency"] == {
+        "PROJ-1": {"blocks": ["PROJ-2"]},
+        "PROJ-2": {"blocks": ["PROJ-3"], "relates to": ["PROJ-4"]},
+        "PROJ-3": {"blocks": ["PROJ-1"]},
+        "PROJ-4": {"has subtask": ["PROJ-5"]},
+        "PROJ-6": {"blocks": ["PROJ-1"]},
+    }
+    assert graph["cycles"] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+    assert graph["truncated"] is False
+    # Each issue is fetched once, one level at a time, and the deepest level
+    # is described from its links without a query of its own
+    assert _queried_keys(fetcher) == [
+        {"PROJ-1"},
+        {"PROJ-2", "PROJ-3", "PROJ-6"},
+        {"PROJ-4"},
+    ]
+
+
+def test_direction_and_link_type_filters(fetcher: JiraFetcher):
+    outward = fetcher.get_issue_graph(["PROJ-2"], direction="outward")
+    assert set(outward["issues"]) == {f"PROJ-{i}" for i in range(1, 6)}
+    assert "PROJ-6" not in outward["adjacency"]
+
+    blockers = fetcher.get_issue_graph(
+        ["PROJ-1"], link_types=["is blocked by"], direction="inward", max_depth=1
+    )
+    assert blockers["adjacency"] == {
+        "PROJ-3": {"blocks": ["PROJ-1"]},
+        "PROJ-6": {"blocks": ["PROJ-1"]},
+    }
+
+    no_hierarchy = fetcher.get_issue_graph(["PROJ-4"], include_hierarchy=False)
+    assert "PROJ-5" not in no_hierarchy["issues"]
+
+
+def test_limits_and_missing_roots(fetcher: JiraFetcher):
+    graph = fetcher.get_issue_graph(["PROJ-1", "PROJ-404"], max_issues=3)
+
+    assert graph["missing"] == ["PROJ-404"]
+    assert graph["issue_count"] == 2
+    assert graph["truncated"] is True
+
+    with pytest.raises(ValueError, match="Direction"):
+        fetcher.get_issue_graph(["PROJ-1"], direction="sideways")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        MCPAtlassianAuthenticationError("Authentication failed for Jira API (401)"),
+        MCPAtlassianError("API request failed with status 429: Too Many Requests"),
+    ],
+)
+def test_lookup_errors_propagate(fetcher: JiraFetcher, error: Exception):
+    fetcher.jira.jql.side_effect = error
+
+    with pytest.raises(type(error)):
+        fetcher.get_issue_graph(["PROJ-1"])
+
+
+def test_cycle_members_ignores_issues_outside_cycles():
+    edges = {
+        ("A", "blocks", "B"),
+        ("B", "blocks", "C"),
+        ("C", "blocks", "B"),
+        ("C", "blocks", "D"),
+        ("E", "blocks", "E"),
+    }
+    assert _cycle_members(edges) == ["B", "C", "E"]
+
+
+def test_cycle_members_ignores_issues_between_cycles():
+    # X is downstream of one cycle and upstream of another, but on neither
+    edges = {
+        ("A", "blocks", "B"),
+        ("B", "blocks", "A"),
+        ("B", "blocks", "X"),
+        ("X", "blocks", "C"),
+        ("C", "blocks", "D"),
+        ("D", "blocks", "C"),
+    }
+    assert _cycle_members(edges) == ["A", "B", "C", "D"]
@@ -268,6 +268,7 @@ class TestIssuesBatchMixin:
         """Test batch_get_changelogs method on cloud instance."""
         issues_mixin.config = MagicMock()
         issues_mixin.config.is_cloud = True
+        issues_mixin.config.max_concurrency = 1
 
         # Mock get_paged result
         mock_get_paged_result = [
@@ -473,8 +474,8 @@ class TestIssuesBatchMixin:
             },
         ]
 
-        # Mock the get_paged method
-        issues_mixin.get_paged = MagicMock(return_value=mock_get_paged_result)
+        # Mock the iter_paged method
+        issues_mixin.iter_paged = MagicMock(return_value=iter(mock_get_paged_result))
 
         # Call the method
         result = issues_mixin.batch_get_changelogs(
@@ -487,7 +488,7 @@ class TestIssuesBatchMixin:
         assert simplified_result == expected_result
 
         # Verify the method was called with the correct arguments
-        issues_mixin.get_paged.assert_called_once_with(
+        issues_mixin.iter_paged.assert_called_once_with(
             method="post",
             url=issues_mixin.jira.resource_url("changelog/bulkfetch"),
             params_or_json={
@@ -495,3 +496,56 @@ class TestIssuesBatchMixin:
                 "issueIdsOrKeys": ["TEST-1", "TEST-2"],
             },
         )
+
+    def test_iter_changelogs_chunks_requests(self, issues_mixin: IssuesMixin):
+        """Test iter_changelogs splits issues into chunks and merges pages."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = True
+        issues_mixin.config.max_concurrency = 2
+
+        def fake_iter_paged(method, url, params_or_json):
+            chunk = params_or_json["issueIdsOrKeys"]
+            # Every issue gets one history entry on each of two pages
+            for page in range(2):
+                yield {
+                    "issueChangeLogs": [
+                        {
+                            "issueId": issue_id,
+                            "changeHistories": [
+                                {"id": f"{issue_id}-{page}", "items": []}
+                            ],
+                        }
+                        for issue_id in chunk
+                    ]
+                }
+
+        issues_mixin.iter_paged = MagicMock(side_effect=fake_iter_paged)
+
+        keys = [f"TEST-{i}" for i in range(5)] + ["TEST-0"]
+        results = list(
+            issues_mixin.iter_changelogs(keys, fields=["status"], chunk_size=2)
+        )
+
+        assert [issue_id for issue_id, _ in results] == [f"TEST-{i}" for i in range(5)]
+        assert all(len(changelogs) == 2 for _, changelogs in results)
+        chunks = [
+            c.kwargs["params_or_json"]["issueIdsOrKeys"]
+            for c in issues_mixin.iter_paged.call_args_list
+        ]
+        assert sorted(chunks) == [
+            ["TEST-0", "TEST-1"],
+            ["TEST-2", "TEST-3"],
+            ["TEST-4"],
+        ]
+        assert all(
+            c.kwargs["params_or_json"]["fieldIds"] == ["status"]
+            for c in issues_mixin.iter_paged.call_args_list
+        )
+
+    def test_iter_changelogs_invalid_chunk_size(self, issues_mixin: IssuesMixin):
+        """Test iter_changelogs rejects chunk sizes the API cannot accept."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = True
+
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(issues_mixin.iter_changelogs(["TEST-1"], chunk_size=1001))
@@ -176,6 +176,28 @@ class TestIssuesFieldsMixin:
             update_history=False,
         )
 
+    def test_get_issue_raw(self, issues_mixin: IssuesMixin):
+        """Test that get_issue can return the issue data without the model."""
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "10001",
+            "key": "TEST-123",
+            "fields": {"summary": "Raw issue", "comment": {"comments": []}},
+        }
+        issues_mixin._get_issue_comments_if_needed = MagicMock(
+            return_value=[{"id": "1", "body": "Fetched comment"}]
+        )
+
+        issue = issues_mixin.get_issue("TEST-123", comment_limit=5, raw=True)
+
+        assert isinstance(issue, dict)
+        assert issue["fields"]["summary"] == "Raw issue"
+        assert issue["fields"]["comment"]["comments"] == [
+            {"id": "1", "body": "Fetched comment"}
+        ]
+        issues_mixin._get_issue_comments_if_needed.assert_called_once_with(
+            "TEST-123", 5
+        )
+
     def test_get_issue_with_config_projects_filter_restricted(
         self, issues_mixin: IssuesMixin
     ):
@@ -115,7 +115,9 @@ class TestIssuesRetrievalMixin:
             properties=None,
             update_history=True,
         )
-        issues_mixin.jira.issue_get_comments.assert_called_once_with("TEST-123")
+        issues_mixin.jira.issue_get_comments.assert_called_once_with(
+            "TEST-123", start_at=0, max_results=10, order_by="-created"
+        )
 
         # Verify the comments were added to the issue
         assert hasattr(issue, "comments")
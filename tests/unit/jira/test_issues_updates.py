@@ -107,3 +107,53 @@ class TestIssuesUpdatesMixin:
         )
         assert not issues_mixin._get_account_id.called
         assert document.key == "TEST-123"
+
+    def test_batch_update_issues_resolves_fields_once(self, issues_mixin: IssuesMixin):
+        """Test batch update formats fields once and updates every issue."""
+        issues_mixin._generate_field_map = MagicMock(return_value={"labels": "labels"})
+        issues_mixin.get_field_by_id = MagicMock(return_value={"name": "Labels"})
+
+        results = issues_mixin.batch_update_issues(
+            ["TEST-1", "test-2", "TEST-1"],
+            {"labels": "backend, api", "assignee": "user@example.com"},
+            notify_users=False,
+        )
+
+        assert results == [
+            {"issue_key": "TEST-1", "success": True},
+            {"issue_key": "TEST-2", "success": True},
+        ]
+        issues_mixin._get_account_id.assert_called_once_with("user@example.com")
+        issues_mixin._generate_field_map.assert_called_once()
+        assert issues_mixin.jira.update_issue.call_count == 2
+        call = issues_mixin.jira.update_issue.call_args
+        assert call.kwargs["fields"] == {
+            "labels": ["backend", "api"],
+            "assignee": {"accountId": "test-account-id"},
+        }
+        assert call.kwargs["notify_users"] is False
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_batch_update_issues_reports_failures(self, issues_mixin: IssuesMixin):
+        """Test a failing issue does not abort the rest of the batch."""
+        issues_mixin._generate_field_map = MagicMock(return_value={"labels": "labels"})
+        issues_mixin.get_field_by_id = MagicMock(return_value={"name": "Labels"})
+        issues_mixin.config.max_concurrency = 1
+        issues_mixin.jira.update_issue.side_effect = [Exception("No permission"), None]
+
+        results = issues_mixin.batch_update_issues(
+            ["TEST-1", "TEST-2"], {"labels": ["backend"]}
+        )
+
+        assert results[0] == {
+            "issue_key": "TEST-1",
+            "success": False,
+            "error": "No permission",
+        }
+        assert results[1] == {"issue_key": "TEST-2", "success": True}
+
+    def test_batch_update_issues_rejects_status(self, issues_mixin: IssuesMixin):
+        """Test status changes are rejected in favour of batch transitions."""
+        with pytest.raises(ValueError, match="batch_transition_issues"):
+            issues_mixin.batch_update_issues(["TEST-1"], {"status": "Done"})
+        issues_mixin.jira.update_issue.assert_not_called()
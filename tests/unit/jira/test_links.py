@@ -179,3 +179,136 @@ class TestLinksMixin:
 
         with pytest.raises(MCPAtlassianAuthenticationError):
             links_mixin.remove_issue_link(link_id)
+
+
+class TestBatchLinks:
+    """Tests for batch issue link and remote link creation."""
+
+    @pytest.fixture
+    def fetcher(self, jira_fetcher):
+        jira_fetcher.jira.get.return_value = {
+            "issueLinkTypes": [
+                {
+                    "id": "1",
+                    "name": "Blocks",
+                    "inward": "is blocked by",
+                    "outward": "blocks",
+                },
+                {
+                    "id": "2",
+                    "name": "Relates",
+                    "inward": "relates to",
+                    "outward": "relates to",
+                },
+            ]
+        }
+        jira_fetcher.jira.jql.return_value = {
+            "issues": [
+                {
+                    "key": "PROJ-1",
+                    "fields": {
+                        "issuelinks": [
+                            {
+                                "id": "500",
+                                "type": {"name": "Blocks"},
+                                "outwardIssue": {"key": "PROJ-2"},
+                            }
+                        ]
+                    },
+                },
+                {
+                    "key": "PROJ-2",
+                    "fields": {
+                        "issuelinks": [
+                            {
+                                "id": "500",
+                                "type": {"name": "Blocks"},
+                                "inwardIssue": {"key": "PROJ-1"},
+                            }
+                        ]
+                    },
+                },
+                {"key": "PROJ-3", "fields": {"issuelinks": []}},
+            ]
+        }
+        return jira_fetcher
+
+    @staticmethod
+    def _link(link_type: str, inward: str, outward: str) -> dict:
+        return {
+            "type": {"name": link_type},
+            "inwardIssue": {"key": inward},
+            "outwardIssue": {"key": outward},
+        }
+
+    def test_batch_create_issue_links(self, fetcher):
+        """Test validation, dedupe of existing links and per-link results."""
+
+        def fake_create_issue_link(data):
+            if data["outwardIssue"]["key"] == "PROJ-1":
+                raise Exception("boom")
+
+        fetcher.jira.create_issue_link.side_effect = fake_create_issue_link
+
+        results = fetcher.batch_create_issue_links(
+            [
+                self._link("Blocks", "PROJ-1", "PROJ-2"),
+                self._link("relates to", "proj-1", "PROJ-3"),
+                self._link("Relates", "PROJ-1", "PROJ-3"),
+                self._link("Clones", "PROJ-1", "PROJ-3"),
+                self._link("Blocks", "PROJ-1", "PROJ-404"),
+                self._link("Blocks", "PROJ-3", "PROJ-1"),
+            ]
+        )
+
+        assert results[0]["skipped"] is True
+        assert results[0]["link_id"] == "500"
+        assert results[1] == {
+            "link_type": "Relates",
+            "inward_issue": "PROJ-1",
+            "outward_issue": "PROJ-3",
+            "success": True,
+        }
+        assert results[2]["success"] is True
+        assert "Unknown link type 'Clones'" in results[3]["error"]
+        assert "PROJ-404" in results[4]["error"]
+        assert results[5] == {
+            "link_type": "Blocks",
+            "inward_issue": "PROJ-3",
+            "outward_issue": "PROJ-1",
+            "success": False,
+            "error": "boom",
+        }
+        # Duplicate links in the batch are created once; link types load once
+        assert fetcher.jira.create_issue_link.call_count == 2
+        fetcher.jira.get.assert_called_once_with("rest/api/2/issueLinkType")
+        fetcher.jira.jql.assert_called_once()
+
+    def test_batch_create_issue_links_authentication_error(self, fetcher):
+        """Test that a failed issue lookup is raised, not reported per link."""
+        fetcher.jira.jql.side_effect = MCPAtlassianAuthenticationError(
+            "Authentication failed for Jira API (401)"
+        )
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            fetcher.batch_create_issue_links([self._link("Blocks", "PROJ-1", "PROJ-2")])
+        fetcher.jira.create_issue_link.assert_not_called()
+
+    def test_batch_create_remote_issue_links(self, fetcher):
+        """Test that URLs become global IDs and repeats are sent once."""
+        link_data = {"object": {"url": "https://example.com", "title": "Spec"}}
+
+        results = fetcher.batch_create_remote_issue_links(
+            [
+                {"issue_key": "PROJ-1", "link_data": link_data},
+                {"issue_key": "proj-1", "link_data": link_data},
+                {"issue_key": "PROJ-2", "link_data": {"object": {"title": "No URL"}}},
+            ]
+        )
+
+        assert [r["success"] for r in results] == [True, True, False]
+        assert results[1]["skipped"] is True
+        fetcher.jira.post.assert_called_once_with(
+            "rest/api/3/issue/PROJ-1/remotelink",
+            json={**link_data, "globalId": "https://example.com"},
+        )
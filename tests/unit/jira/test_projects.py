@@ -98,22 +98,35 @@ def mock_issue_types():
 
 def test_get_all_projects(projects_mixin: ProjectsMixin, mock_projects: list[dict]):
     """Test get_all_projects method."""
-    projects_mixin.jira.projects.return_value = mock_projects
+    archived = {"id": "10002", "key": "OLD", "name": "Old", "archived": True}
+    projects_mixin.jira.projects.return_value = [*mock_projects, archived]
 
     # Test with default value (include_archived=False)
     result = projects_mixin.get_all_projects()
     assert result == mock_projects
-    projects_mixin.jira.projects.assert_called_once_with(included_archived=False)
-
-    # Reset mock and test with include_archived=True
-    projects_mixin.jira.projects.reset_mock()
-    projects_mixin.jira.projects.return_value = mock_projects
 
+    # Archived projects come from the same cached catalog
     result = projects_mixin.get_all_projects(include_archived=True)
-    assert result == mock_projects
+    assert result == [*mock_projects, archived]
     projects_mixin.jira.projects.assert_called_once_with(included_archived=True)
 
 
+def test_get_all_projects_applies_projects_filter(projects_mixin: ProjectsMixin):
+    """Test that keys are upper-cased and the projects filter applied at load."""
+    projects_mixin.config.projects_filter = " proj1 , OPS "
+    projects_mixin.jira.projects.return_value = [
+        {"id": "1", "key": "proj1"},
+        {"id": "2", "key": "OTHER"},
+        {"id": "3", "key": "OPS"},
+    ]
+
+    result = projects_mixin.get_all_projects()
+
+    assert [project["key"] for project in result] == ["PROJ1", "OPS"]
+    assert projects_mixin.project_exists("Proj1") is True
+    assert projects_mixin.project_exists("OTHER") is False
+
+
 def test_get_all_projects_exception(projects_mixin: ProjectsMixin):
     """Test get_all_projects method with exception."""
     projects_mixin.jira.projects.side_effect = Exception("API error")
@@ -169,6 +182,7 @@ def test_get_project_issues(projects_mixin: ProjectsMixin):
         'project = "TEST"',
         start=0,
         limit=50,
+        lazy=False,
     )
     assert isinstance(result, JiraSearchResult)
     assert len(result.issues) == 0
@@ -204,35 +218,30 @@ def test_get_project_issues_with_start(projects_mixin: ProjectsMixin) -> None:
         f'project = "{project_key}"',
         start=start_index,
         limit=5,
+        lazy=False,
     )
 
 
 def test_project_exists(projects_mixin: ProjectsMixin, mock_projects: list[dict]):
     """Test project_exists method."""
-    # Test with existing project
-    project = mock_projects[0]
-    projects_mixin.jira.project.return_value = project
-
-    result = projects_mixin.project_exists("PROJ1")
-    assert result is True
-    projects_mixin.jira.project.assert_called_once_with("PROJ1")
+    projects_mixin.jira.projects.return_value = mock_projects
 
-    # Test with non-existing project
-    projects_mixin.jira.project.reset_mock()
-    projects_mixin.jira.project.return_value = None
+    assert projects_mixin.project_exists("PROJ1") is True
+    assert projects_mixin.project_exists("proj2") is True
+    assert projects_mixin.project_exists("NONEXISTENT") is False
 
-    result = projects_mixin.project_exists("NONEXISTENT")
-    assert result is False
-    projects_mixin.jira.project.assert_called_once()
+    # Answered from the project catalog without per-project requests
+    projects_mixin.jira.projects.assert_called_once()
+    projects_mixin.jira.project.assert_not_called()
 
 
 def test_project_exists_exception(projects_mixin: ProjectsMixin):
     """Test project_exists method with exception."""
-    projects_mixin.jira.project.side_effect = Exception("API error")
+    projects_mixin.jira.projects.side_effect = Exception("API error")
 
     result = projects_mixin.project_exists("PROJ1")
     assert result is False
-    projects_mixin.jira.project.assert_called_once()
+    projects_mixin.jira.projects.assert_called_once()
 
 
 def test_get_project_components(
@@ -522,7 +531,7 @@ def test_get_project_issues_with_search_mixin(projects_mixin: ProjectsMixin):
     result = projects_mixin.get_project_issues("PROJ1", start=10, limit=20)
     assert result == mock_search_result
     projects_mixin.search_issues.assert_called_once_with(
-        'project = "PROJ1"', start=10, limit=20
+        'project = "PROJ1"', start=10, limit=20, lazy=False
     )
     projects_mixin.jira.jql.assert_not_called()
 
@@ -7,7 +7,7 @@ import requests
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.search import SearchMixin
-from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchPage, JiraSearchResult
 
 
 class TestSearchMixin:
@@ -104,9 +104,8 @@ class TestSearchMixin:
             "expand": None,
         }
 
-        # Add start param only for Server/DC
-        if not is_cloud:
-            expected_kwargs["start"] = 0
+        # Both Cloud and Server/DC are called with the start offset
+        expected_kwargs["start_at"] = 0
 
         expected_method_mock.assert_called_once_with(
             jql_query, fields=ANY, **expected_kwargs
@@ -148,7 +147,7 @@ class TestSearchMixin:
         search_mixin.jira.jql.assert_called_once_with(
             "project = TEST",
             fields=ANY,
-            start=0,
+            start_at=0,
             limit=50,
             expand=None,
         )
@@ -244,6 +243,82 @@ class TestSearchMixin:
         assert result.issues[0].status is None
         assert result.issues[0].issue_type is None
 
+    def test_search_all_issues_pages_on_server(self, search_mixin: SearchMixin):
+        """Test search_all_issues follows start offsets until the limit on Server."""
+        search_mixin.config.url = "https://jira.example.com"
+
+        def page(jql, fields=None, start_at=0, limit=50, expand=None):
+            issues = [
+                {"id": str(i), "key": f"TEST-{i}", "fields": {}}
+                for i in range(start_at, min(start_at + limit, 120))
+            ]
+            return {"issues": issues, "total": 120, "startAt": start_at}
+
+        search_mixin.jira.jql.side_effect = page
+
+        issues = search_mixin.search_all_issues("project = TEST", limit=110)
+
+        assert [issue.key for issue in issues] == [f"TEST-{i}" for i in range(110)]
+        assert [c.kwargs["start_at"] for c in search_mixin.jira.jql.call_args_list] == [
+            0,
+            50,
+            100,
+        ]
+
+    def test_search_all_issues_pages_on_cloud(self, search_mixin: SearchMixin):
+        """Test Cloud searches request capped pages until the limit is reached."""
+        search_mixin.config.is_cloud = True
+        search_mixin.config.url = "https://test.atlassian.net"
+        search_mixin.jira.get.return_value = {"total": 250}
+
+        def page(jql, fields=None, limit=100, expand=None, start_at=0):
+            return [
+                {"id": str(i), "key": f"TEST-{i}", "fields": {}}
+                for i in range(start_at, min(start_at + min(limit, 100), 250))
+            ]
+
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = page
+
+        issues = search_mixin.search_all_issues("project = TEST", limit=230)
+        calls = search_mixin.jira.enhanced_jql_get_list_of_tickets.call_args_list
+
+        assert [issue.key for issue in issues] == [f"TEST-{i}" for i in range(230)]
+        assert [(c.kwargs["start_at"], c.kwargs["limit"]) for c in calls] == [
+            (0, 100),
+            (100, 100),
+            (200, 30),
+        ]
+
+        # Paging stops at the total, and a later page honors the start offset
+        calls.clear()
+        result = search_mixin.search_issues("project = TEST", start=180, limit=100)
+        assert [issue.key for issue in result.issues] == [
+            f"TEST-{i}" for i in range(180, 250)
+        ]
+        assert [c.kwargs["start_at"] for c in calls] == [180]
+
+    def test_search_issues_cloud_continues_from_start(self, search_mixin: SearchMixin):
+        """Test that a continuation on Cloud returns the next issues, not the first."""
+        search_mixin.config.is_cloud = True
+        search_mixin.config.url = "https://test.atlassian.net"
+        search_mixin.jira.get.return_value = {"total": 30}
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = (
+            lambda jql, fields=None, limit=100, expand=None, start_at=0: [
+                {"id": str(i), "key": f"TEST-{i}", "fields": {}}
+                for i in range(start_at, min(start_at + limit, 30))
+            ]
+        )
+
+        first = search_mixin.search_issues("project = TEST", limit=20, lazy=True)
+        rest = search_mixin.search_issues(
+            "project = TEST", start=first.start_at + 20, limit=20, lazy=True
+        )
+
+        assert rest.start_at == 20
+        assert [
+            issue["key"] for issue in rest.to_simplified_dict(lazy=True)["issues"]
+        ] == [f"TEST-{i}" for i in range(20, 30)]
+
     def test_search_issues_with_empty_results(self, search_mixin: SearchMixin):
         """Test search with no results."""
         # Setup mock response
@@ -257,6 +332,28 @@ class TestSearchMixin:
         assert len(result.issues) == 0
         assert result.total == -1
 
+    def test_search_issues_lazy(self, search_mixin: SearchMixin):
+        """Test that a lazy search keeps the raw issues of the page."""
+        raw_issue = {"id": "10001", "key": "TEST-1", "fields": {"summary": "Lazy"}}
+        search_mixin.jira.jql.return_value = {
+            "issues": [raw_issue],
+            "total": 1,
+            "startAt": 0,
+            "maxResults": 50,
+        }
+
+        result = search_mixin.search_issues(
+            "project = TEST", fields="summary", lazy=True
+        )
+
+        assert isinstance(result, JiraSearchPage)
+        assert result.raw_issues == [raw_issue]
+        assert result.total == 1
+        assert result.to_simplified_dict()["issues"] == [
+            {"id": "10001", "key": "TEST-1", "summary": "Lazy"}
+        ]
+        assert result.issues[0].key == "TEST-1"
+
     def test_search_issues_with_error(self, search_mixin: SearchMixin):
         """Test search with API error."""
         # Setup mock to raise exception
@@ -293,7 +390,7 @@ class TestSearchMixin:
         search_mixin.jira.jql.assert_called_with(
             "(text ~ 'test') AND project = \"TEST\"",
             fields=ANY,
-            start=0,
+            start_at=0,
             limit=50,
             expand=None,
         )
@@ -305,7 +402,7 @@ class TestSearchMixin:
         search_mixin.jira.jql.assert_called_with(
             '(text ~ \'test\') AND project IN ("TEST", "DEV")',
             fields=ANY,
-            start=0,
+            start_at=0,
             limit=50,
             expand=None,
         )
@@ -340,7 +437,7 @@ class TestSearchMixin:
         search_mixin.jira.jql.assert_called_with(
             '(text ~ \'test\') AND project IN ("TEST", "DEV")',
             fields=ANY,
-            start=0,
+            start_at=0,
             limit=50,
             expand=None,
         )
@@ -352,7 +449,7 @@ class TestSearchMixin:
         search_mixin.jira.jql.assert_called_with(
             "(text ~ 'test') AND project = \"OVERRIDE\"",
             fields=ANY,
-            start=0,
+            start_at=0,
             limit=50,
             expand=None,
         )
@@ -366,7 +463,7 @@ class TestSearchMixin:
         search_mixin.jira.jql.assert_called_with(
             '(text ~ \'test\') AND project IN ("OVER1", "OVER2")',
             fields=ANY,
-            start=0,
+            start_at=0,
             limit=50,
             expand=None,
         )
@@ -414,7 +511,7 @@ class TestSearchMixin:
         search_mixin.jira.jql.assert_called_once_with(
             "project = TEST",
             fields="summary,assignee,customfield_10049",
-            start=0,
+            start_at=0,
             limit=50,
             expand=None,
         )
@@ -598,9 +695,8 @@ class TestSearchMixin:
             "limit": ANY,
             "expand": ANY,
         }
-        # Add start parameter only for Server/DC
-        if not is_cloud:
-            expected_kwargs["start"] = ANY
+        # Both Cloud and Server/DC are called with the start offset
+        expected_kwargs["start_at"] = ANY
 
         # Assert: JQL verification
         api_method_mock.assert_called_with(
@@ -652,9 +748,8 @@ class TestSearchMixin:
             "limit": ANY,
             "expand": ANY,
         }
-        # Add start parameter only for Server/DC
-        if not is_cloud:
-            expected_kwargs["start"] = ANY
+        # Both Cloud and Server/DC are called with the start offset
+        expected_kwargs["start_at"] = ANY
 
         # Act: Use config filter
         search_mixin.search_issues("text ~ 'test'")
@@ -698,9 +793,8 @@ class TestSearchMixin:
             "limit": ANY,
             "expand": ANY,
         }
-        # Add start parameter only for Server/DC
-        if not is_cloud:
-            expected_kwargs["start"] = ANY
+        # Both Cloud and Server/DC are called with the start offset
+        expected_kwargs["start_at"] = ANY
 
         # Test 1: Empty string JQL with single project
         search_mixin.search_issues("", projects_filter="PROJ1")
@@ -748,9 +842,8 @@ class TestSearchMixin:
             "limit": ANY,
             "expand": ANY,
         }
-        # Add start parameter only for Server/DC
-        if not is_cloud:
-            expected_kwargs["start"] = ANY
+        # Both Cloud and Server/DC are called with the start offset
+        expected_kwargs["start_at"] = ANY
 
         # Test 1: ORDER BY with single project
         search_mixin.search_issues("ORDER BY created DESC", projects_filter="PROJ1")
@@ -332,3 +332,102 @@ def test_update_sprint_exception(sprints_mixin):
 
     assert result is None
     sprints_mixin.jira.update_partially_sprint.assert_called_once()
+
+
+def _sprint_issue(key, status, category, points, assignee, created, changelog=None):
+    return {
+        "key": key,
+        "fields": {
+            "status": {"name": status, "statusCategory": {"key": category}},
+            "assignee": {"displayName": assignee} if assignee else None,
+            "created": created,
+            "customfield_10016": points,
+        },
+        "changelog": {"histories": changelog or []},
+    }
+
+
+def test_get_sprint_report(sprints_mixin):
+    """Test the sprint report totals, scope change and assignee load."""
+    sprints_mixin.config.max_concurrency = 4
+    sprints_mixin.jira.get_sprint.return_value = {
+        "id": 10001,
+        "name": "Sprint 1",
+        "state": "active",
+        "startDate": "2024-01-08T09:00:00.000Z",
+    }
+    issues = [
+        _sprint_issue("T-1", "Done", "done", 3, "Alice", "2024-01-01T00:00:00Z"),
+        _sprint_issue("T-2", "In Progress", "indeterminate", 5, "Bob", "2024-01-02"),
+        # Moved into the sprint after it started
+        _sprint_issue(
+            "T-3",
+            "Done",
+            "done",
+            2,
+            "Alice",
+            "2024-01-01T00:00:00Z",
+            changelog=[
+                {
+                    "created": "2024-01-10T12:00:00.000+0000",
+                    "items": [{"field": "Sprint", "from": "", "to": "10000, 10001"}],
+                }
+            ],
+        ),
+        # Created directly in the sprint after it started, never estimated
+        _sprint_issue("T-4", "To Do", "new", None, None, "2024-01-09T00:00:00Z"),
+    ]
+    sprints_mixin.jira.get_sprint_issues.side_effect = [
+        {"issues": issues[:2], "total": 4},
+        {"issues": issues[2:], "total": 4},
+    ]
+
+    report = sprints_mixin.get_sprint_report(
+        "10001", story_points_field="customfield_10016"
+    )
+
+    assert report["sprint"]["name"] == "Sprint 1"
+    assert report["issues"] == {
+        "total": 4,
+        "completed": 2,
+        "not_completed": 2,
+        "unestimated": 1,
+    }
+    assert report["story_points"] == {
+        "committed": 8.0,
+        "added": 2.0,
+        "total": 10.0,
+        "completed": 5.0,
+        "completion_pct": 50.0,
+    }
+    assert report["scope_change"]["added_issue_keys"] == ["T-3", "T-4"]
+    assert report["status_breakdown"] == {"Done": 2, "In Progress": 1, "To Do": 1}
+    assert list(report["assignee_load"]) == ["Alice", "Bob", "Unassigned"]
+    assert report["assignee_load"]["Alice"] == {
+        "issues": 2,
+        "completed": 2,
+        "story_points": 5.0,
+    }
+
+    # Remaining pages are requested from where the first page ended
+    second_call = sprints_mixin.jira.get_sprint_issues.call_args_list[1]
+    assert second_call.kwargs["start_at"] == 2
+    assert second_call.kwargs["expand"] == "changelog"
+    assert "customfield_10016" in second_call.kwargs["fields"]
+
+
+def test_get_sprint_report_discovers_story_points_field(sprints_mixin):
+    """Test the story points field is looked up by name when not given."""
+    sprints_mixin.config.max_concurrency = 4
+    sprints_mixin.get_field_id = MagicMock(
+        side_effect=lambda name: (
+            "customfield_10020" if name == "Story point estimate" else None
+        )
+    )
+    sprints_mixin.jira.get_sprint.return_value = {"id": 1, "state": "future"}
+    sprints_mixin.jira.get_sprint_issues.return_value = {"issues": [], "total": 0}
+
+    report = sprints_mixin.get_sprint_report("1")
+
+    assert report["story_points_field"] == "customfield_10020"
+    assert report["story_points"]["completion_pct"] is None
@@ -4,6 +4,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from mcp_atlassian.exceptions import (
+    MCPAtlassianAuthenticationError,
+    MCPAtlassianValidationError,
+)
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.transitions import TransitionsMixin
 from mcp_atlassian.models.jira import (
@@ -391,3 +395,132 @@ class TestTransitionsMixin:
             transition_data["update"]["comment"][0]["add"]["body"]
             == "Converted comment"
         )
+
+
+class TestBatchTransitionIssues:
+    """Tests for TransitionsMixin.batch_transition_issues."""
+
+    @staticmethod
+    def _issue(key: str, status_id: str, status_name: str) -> dict:
+        return {
+            "key": key,
+            "fields": {
+                "project": {"key": "TEST"},
+                "issuetype": {"id": "10001"},
+                "status": {"id": status_id, "name": status_name},
+            },
+        }
+
+    @pytest.fixture
+    def fetcher(self, jira_fetcher: JiraFetcher) -> JiraFetcher:
+        jira_fetcher.jira.jql.return_value = {
+            "issues": [
+                self._issue("TEST-1", "1", "Open"),
+                self._issue("TEST-2", "1", "Open"),
+                self._issue("TEST-3", "3", "Done"),
+            ]
+        }
+        jira_fetcher.jira.get_issue_transitions.return_value = [
+            {"id": "31", "name": "Resolve", "to": {"id": "3", "name": "Done"}},
+            {"id": "21", "name": "Start", "to": {"id": "2", "name": "In Progress"}},
+        ]
+        return jira_fetcher
+
+    def test_transitions_by_status_name_with_one_lookup_per_state(
+        self, fetcher: JiraFetcher
+    ):
+        """Transitions are looked up once per workflow state and applied per issue."""
+        results = fetcher.batch_transition_issues(
+            ["TEST-1", "test-2", "TEST-1"], "In Progress"
+        )
+
+        assert [r["issue_key"] for r in results] == ["TEST-1", "TEST-2"]
+        assert all(r["success"] and r["transition_id"] == "21" for r in results)
+        assert fetcher.jira.jql.call_count == 1
+        assert fetcher.jira.get_issue_transitions.call_count == 1
+        assert fetcher.jira.set_issue_status_by_transition_id.call_count == 2
+
+    def test_skips_issues_already_in_target_status(self, fetcher: JiraFetcher):
+        """Issues already in the requested status are not transitioned."""
+        results = fetcher.batch_transition_issues(["TEST-1", "TEST-3"], "done")
+
+        assert results[0]["transition_id"] == "31"
+        assert results[1] == {
+            "issue_key": "TEST-3",
+            "success": True,
+            "skipped": True,
+            "from_status": "Done",
+            "to_status": "Done",
+        }
+        fetcher.jira.set_issue_status_by_transition_id.assert_called_once()
+
+    def test_reports_unavailable_and_missing_issues(self, fetcher: JiraFetcher):
+        """Unknown transitions and missing issues fail without aborting the batch."""
+        results = fetcher.batch_transition_issues(["TEST-1", "TEST-404"], "99")
+
+        assert results[0]["success"] is False
+        assert "not available" in results[0]["error"]
+        assert results[1]["success"] is False
+        assert "not found" in results[1]["error"]
+        fetcher.jira.set_issue_status_by_transition_id.assert_not_called()
+
+    def test_failure_is_reported_and_invalidates_cached_transitions(
+        self, fetcher: JiraFetcher
+    ):
+        """A failed transition is reported and the cached transitions refreshed."""
+        fetcher.jira.set_issue_status_by_transition_id.side_effect = [
+            Exception("Field resolution is required"),
+            None,
+        ]
+        fetcher.config.max_concurrency = 1
+
+        results = fetcher.batch_transition_issues(["TEST-1", "TEST-2"], "Resolve")
+        assert results[0]["success"] is False
+        assert "resolution" in results[0]["error"]
+        assert results[1]["success"] is True
+
+        fetcher.batch_transition_issues(["TEST-1"], "Resolve")
+        assert fetcher.jira.get_issue_transitions.call_count == 2
+
+    def test_fields_and_comment_prepared_once(self, fetcher: JiraFetcher):
+        """Fields and comment are passed with each transition request."""
+        fetcher.batch_transition_issues(
+            ["TEST-1", "TEST-2"],
+            "31",
+            fields={"resolution": {"name": "Fixed"}},
+            comment="Closing",
+        )
+
+        for call in fetcher.jira.set_issue_status_by_transition_id.call_args_list:
+            assert call.kwargs["transition_id"] == "31"
+            assert call.kwargs["fields"] == {"resolution": {"name": "Fixed"}}
+            assert "comment" in call.kwargs["update"]
+
+    def test_authentication_error_is_raised(self, fetcher: JiraFetcher):
+        """An expired token fails the batch instead of reporting missing issues."""
+        fetcher.jira.jql.side_effect = MCPAtlassianAuthenticationError(
+            "Authentication failed: 401"
+        )
+        keys = [f"TEST-{i}" for i in range(150)]
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            fetcher.batch_transition_issues(keys, "Resolve")
+
+        # One query per chunk of keys, with no per-key fallback
+        assert fetcher.jira.jql.call_count == 2
+        fetcher.jira.set_issue_status_by_transition_id.assert_not_called()
+
+    def test_unknown_key_falls_back_to_single_lookups(self, fetcher: JiraFetcher):
+        """A chunk rejected for an unknown key is looked up key by key."""
+        fetcher.jira.jql.side_effect = [
+            MCPAtlassianValidationError("The issue key 'TEST-404' does not exist"),
+            {"issues": [self._issue("TEST-1", "1", "Open")]},
+            MCPAtlassianValidationError("The issue key 'TEST-404' does not exist"),
+        ]
+        fetcher.config.max_concurrency = 1
+
+        results = fetcher.batch_transition_issues(["TEST-1", "TEST-404"], "Resolve")
+
+        assert results[0]["success"] is True
+        assert "not found" in results[1]["error"]
+        assert fetcher.jira.jql.call_count == 3
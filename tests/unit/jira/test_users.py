@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.config import JiraConfig
 from mcp_atlassian.jira.users import UsersMixin
 
@@ -212,6 +213,84 @@ class TestUsersMixin:
             ):
                 users_mixin._get_account_id("testuser")
 
+    def test_get_account_id_cached_per_site(self, users_mixin, jira_client):
+        """Test that resolved identifiers are shared across instances of a site."""
+        with patch.object(
+            UsersMixin, "_lookup_user_directly", return_value="direct-account-id"
+        ) as mock_direct:
+            assert users_mixin._get_account_id("User@Example.com") == (
+                "direct-account-id"
+            )
+            other = UsersMixin(config=jira_client.config)
+            other.jira = jira_client.jira
+            assert other._get_account_id("user@example.com ") == "direct-account-id"
+
+        mock_direct.assert_called_once_with("User@Example.com")
+
+    def test_get_account_id_negative_cache(self, users_mixin):
+        """Test that unknown users are not looked up again while cached as missing."""
+        with (
+            patch.object(
+                users_mixin, "_lookup_user_directly", return_value=None
+            ) as mock_direct,
+            patch.object(users_mixin, "_lookup_user_by_permissions", return_value=None),
+        ):
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Could not find account ID"):
+                    users_mixin._get_account_id("ghost")
+
+        mock_direct.assert_called_once_with("ghost")
+
+    def test_get_account_id_failed_search_not_cached(self, users_mixin):
+        """Test that a failed user search is not cached as a missing user."""
+        users_mixin.jira.user_find_by_user_string.side_effect = requests.Timeout(
+            "Read timed out"
+        )
+        throttled = MagicMock(status_code=429)
+        with patch("requests.get", return_value=throttled):
+            for _ in range(2):
+                with pytest.raises(ValueError, match="the user search failed"):
+                    users_mixin._get_account_id("someone")
+
+        assert users_mixin.jira.user_find_by_user_string.call_count == 2
+
+    def test_get_account_id_auth_error_propagates(self, users_mixin):
+        """Test that authentication errors are raised instead of cached."""
+        users_mixin.jira.user_find_by_user_string.side_effect = (
+            MCPAtlassianAuthenticationError("Authentication failed: 401")
+        )
+
+        for _ in range(2):
+            with pytest.raises(MCPAtlassianAuthenticationError):
+                users_mixin.resolve_account_ids(["someone"])
+
+        assert users_mixin.jira.user_find_by_user_string.call_count == 2
+
+    def test_resolve_account_ids_dedupes(self, users_mixin):
+        """Test batch resolution looks up each distinct identifier once."""
+        users_mixin.config.max_concurrency = 4
+        lookups = {"alice": "id-alice", "bob": "id-bob"}
+        with (
+            patch.object(
+                users_mixin,
+                "_lookup_user_directly",
+                side_effect=lambda name: lookups.get(name.lower()),
+            ) as mock_direct,
+            patch.object(users_mixin, "_lookup_user_by_permissions", return_value=None),
+        ):
+            result = users_mixin.resolve_account_ids(
+                ["alice", "Bob", "ALICE", "carol", "bob"]
+            )
+
+        assert result == {
+            "alice": "id-alice",
+            "Bob": "id-bob",
+            "ALICE": "id-alice",
+            "carol": None,
+            "bob": "id-bob",
+        }
+        assert mock_direct.call_count == 3
+
     def test_lookup_user_directly(self, users_mixin):
         """Test _lookup_user_directly when user is found."""
         # Mock the API response
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.worklog import WorklogMixin
 
 
@@ -353,3 +354,119 @@ class TestWorklogMixin:
         # Verify post was still called (worklog added despite estimate error)
         worklog_mixin.jira.post.assert_called_once()
         assert result["original_estimate_updated"] is False
+
+
+class TestWorklogBulk:
+    """Tests for bulk worklog retrieval and aggregation."""
+
+    @staticmethod
+    def _worklog(worklog_id, issue_id, author, started, seconds):
+        return {
+            "id": worklog_id,
+            "issueId": issue_id,
+            "author": {"displayName": author},
+            "started": started,
+            "timeSpentSeconds": seconds,
+        }
+
+    @pytest.fixture
+    def fetcher(self, jira_fetcher):
+        jira_fetcher.jira.jql.return_value = {
+            "issues": [
+                {"id": "101", "key": "TEST-1"},
+                {"id": "102", "key": "TEST-2"},
+            ]
+        }
+        jira_fetcher.jira.resource_url.side_effect = lambda resource: (
+            f"https://test.atlassian.net/rest/api/3/{resource}"
+        )
+        return jira_fetcher
+
+    def test_cloud_uses_updated_and_list_endpoints(self, fetcher):
+        """On Cloud, worklogs are fetched in bulk and totalled server-side."""
+        fetcher.jira.get.side_effect = [
+            {
+                "values": [{"worklogId": 1}, {"worklogId": 2}],
+                "lastPage": False,
+                "nextPage": "https://test.atlassian.net/next",
+            },
+            {"values": [{"worklogId": 3}, {"worklogId": 4}], "lastPage": True},
+        ]
+        fetcher.jira.post.side_effect = [
+            [
+                self._worklog(1, "101", "Alice", "2024-01-02T09:00:00.000+0000", 3600),
+                self._worklog(2, "999", "Alice", "2024-01-02T09:00:00.000+0000", 60),
+            ],
+            [
+                self._worklog(3, "102", "Bob", "2024-01-03T09:00:00.000+0000", 1800),
+                self._worklog(4, "101", "Bob", "2023-12-31T09:00:00.000+0000", 900),
+            ],
+        ]
+        fetcher.config.max_concurrency = 1
+
+        summary = fetcher.summarize_worklogs(
+            ["TEST-1", "TEST-2", "TEST-404"],
+            group_by=["author", "issue", "day"],
+            started_after="2024-01-01",
+        )
+
+        assert summary["issue_count"] == 2
+        assert summary["missing_issue_keys"] == ["TEST-404"]
+        assert summary["worklog_count"] == 2
+        assert summary["total_seconds"] == 5400
+        assert summary["totals"]["by_author"] == {"Alice": 3600, "Bob": 1800}
+        assert summary["totals"]["by_issue"] == {"TEST-1": 3600, "TEST-2": 1800}
+        assert summary["totals"]["by_day"] == {"2024-01-02": 3600, "2024-01-03": 1800}
+
+        first_get, next_get = fetcher.jira.get.call_args_list
+        assert first_get.kwargs["params"] == {"since": 1704067200000}
+        assert next_get.args[0] == "https://test.atlassian.net/next"
+        assert fetcher.jira.post.call_args_list[0].kwargs["json"] == {"ids": [1, 2]}
+
+    def test_server_pages_each_issue(self, fetcher):
+        """Without the bulk endpoints, each issue's worklogs are paged."""
+        fetcher.config.url = "https://jira.example.com"
+        pages = {
+            "TEST-1": [
+                {
+                    "worklogs": [self._worklog(1, "", "Alice", "2024-01-02", 60)],
+                    "total": 2,
+                },
+                {
+                    "worklogs": [self._worklog(2, "", "Alice", "2024-01-03", 120)],
+                    "total": 2,
+                },
+            ],
+            "TEST-2": [{"worklogs": [], "total": 0}],
+        }
+
+        def fake_get(url, params=None):
+            return pages[url.split("/")[-2]].pop(0)
+
+        fetcher.jira.get.side_effect = fake_get
+
+        records = list(fetcher.iter_worklog_records(["TEST-1", "TEST-2"]))
+
+        assert [(key, record.id) for key, record in records] == [
+            ("TEST-1", "1"),
+            ("TEST-1", "2"),
+        ]
+        assert all(record.issue_id == "101" for _, record in records)
+        fetcher.jira.post.assert_not_called()
+
+    def test_invalid_group_by(self, fetcher):
+        """Unsupported grouping dimensions are rejected."""
+        with pytest.raises(ValueError, match="Unsupported group_by"):
+            fetcher.summarize_worklogs(["TEST-1"], group_by=["project"])
+
+    def test_authentication_error_propagates(self, fetcher):
+        """A failed issue lookup is raised rather than reported as missing keys."""
+        fetcher.jira.jql.side_effect = MCPAtlassianAuthenticationError(
+            "Authentication failed for Jira API (401)"
+        )
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            fetcher.summarize_worklogs(["TEST-1", "TEST-2"])
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            list(fetcher.iter_worklog_records(["TEST-1"]))
+        fetcher.jira.get.assert_not_called()
@@ -5,6 +5,7 @@ Tests for the base models and utility classes.
 from typing import Any
 
 import pytest
+from pydantic import Field
 
 from src.mcp_atlassian.models.base import ApiModel, TimestampMixin
 from src.mcp_atlassian.models.constants import EMPTY_STRING
@@ -41,6 +42,22 @@ class TestApiModel:
         assert result["field1"] == "test"
         assert result["field2"] == 123
 
+    def test_construct_trusted_fills_defaults_without_validation(self):
+        """Test that construct_trusted matches the validating constructor."""
+
+        class TestModel(ApiModel):
+            name: str = "default"
+            tags: list[str] = Field(default_factory=list)
+            count: int = 0
+
+        model = TestModel.construct_trusted(name="x")
+
+        assert model == TestModel(name="x")
+        assert model.tags is not TestModel.construct_trusted().tags
+        assert model.model_fields_set == {"name"}
+        # Values are stored as given, not coerced
+        assert TestModel.construct_trusted(count="5").count == "5"
+
 
 class TestTimestampMixin:
     """Tests for the TimestampMixin utility class."""
@@ -460,6 +460,20 @@ class TestConfluencePage:
         # URL should be included
         assert "url" in simplified
 
+    def test_to_markdown_header(self, confluence_page_data):
+        """Test rendering the title and metadata of a page as markdown."""
+        page = ConfluencePage.from_api_response(
+            confluence_page_data, base_url="https://example.atlassian.net/wiki"
+        )
+
+        assert page.to_markdown_header() == (
+            "# Example Meeting Notes\n"
+            "- Space: PROJ (Project Space) | Version: 1\n"
+            "- URL: https://example.atlassian.net/wiki/pages/viewpage.action"
+            "?pageId=987654321\n"
+            "- Attachments: random_geometric_image.svg, stockmaster-architecture.svg"
+        )
+
     def test_from_api_response_with_expandable_space(self):
         """Test creating a ConfluencePage from data with space info in _expandable."""
         page_data = {
@@ -0,0 +1,78 @@
+"""Tests for the compact Jira changelog records."""
+
+from src.mcp_atlassian.models.jira import (
+    JiraChangelog,
+    JiraChangelogRecord,
+    RecordInterner,
+)
+
+
+def _history(index: int) -> dict:
+    user = index % 20
+    return {
+        "id": str(10000 + index),
+        "author": {
+            "accountId": f"user-{user}",
+            "displayName": f"User {user}",
+            "emailAddress": f"user{user}@example.com",
+            "active": True,
+            "timeZone": "UTC",
+            "avatarUrls": {"48x48": f"https://avatar.example.com/{user}"},
+        },
+        "created": f"2024-01-{1 + index % 28:02d}T10:06:03.548+0800",
+        "items": [
+            {
+                "field": "status",
+                "fieldtype": "jira",
+                "from": "1",
+                "fromString": "To Do",
+                "to": "3",
+                "toString": "In Progress",
+            },
+            {
+                "field": "assignee",
+                "fieldtype": "jira",
+                "from": None,
+                "fromString": None,
+                "to": f"user-{user}",
+                "toString": f"User {user}",
+            },
+        ],
+    }
+
+
+class TestJiraChangelogRecord:
+    """Tests for JiraChangelogRecord."""
+
+    def test_to_model_matches_changelog(self):
+        """Test that a record converts to the model built from the same data."""
+        for data in (_history(1), {"id": "1", "items": [None]}, {}):
+            record = JiraChangelogRecord.from_api_response(data, RecordInterner())
+
+            assert record.to_model() == JiraChangelog.from_api_response(data)
+
+    def test_interns_authors_and_items(self):
+        """Test that equal authors and change items share one instance."""
+        intern = RecordInterner()
+        first, second = (
+            JiraChangelogRecord.from_api_response(_history(index), intern)
+            for index in (1, 21)
+        )
+
+        assert first.id != second.id
+        assert first.author is second.author
+        assert first.items[0] is second.items[0]
+        assert first.items[0].field == "status"
+        assert first.items[0].to_string == "In Progress"
+
+    def test_many_entries_share_repeated_values(self):
+        """Test that 2000 entries by 20 users keep one copy of each value."""
+        intern = RecordInterner()
+        records = [
+            JiraChangelogRecord.from_api_response(_history(index), intern)
+            for index in range(2000)
+        ]
+
+        assert len({id(record.author) for record in records}) == 20
+        assert len({id(record.items[0]) for record in records}) == 1
+        assert len({id(record.items[1]) for record in records}) == 20
@@ -1,5 +1,7 @@
 """Tests for the core JiraIssue model functionality."""
 
+import pytest
+
 from src.mcp_atlassian.models.constants import EMPTY_STRING, JIRA_DEFAULT_ID, UNKNOWN
 from src.mcp_atlassian.models.jira import (
     JiraIssue,
@@ -186,3 +188,117 @@ class TestJiraIssue:
         assert issue.status.name == UNKNOWN
         assert issue.assignee.account_id == JIRA_DEFAULT_ID
         assert issue.reporter.account_id == JIRA_DEFAULT_ID
+
+
+class TestJiraIssueCustomFields:
+    """Tests for looking up custom fields by ID, name or short ID."""
+
+    @pytest.fixture
+    def issue(self) -> JiraIssue:
+        return JiraIssue.from_api_response(
+            {
+                "id": "10001",
+                "key": "TEST-1",
+                "fields": {
+                    "summary": "Issue",
+                    "customfield_10010": {"value": "High"},
+                    "customfield_10020": 5,
+                    "customfield_10030": "first",
+                    "customfield_10031": "second",
+                },
+                "names": {
+                    "customfield_10010": "Risk Level",
+                    "customfield_10020": "Story Points",
+                    "customfield_10030": "Team",
+                    "customfield_10031": "Team",
+                },
+            },
+            requested_fields=["summary", "risk level", "cf_10020", "Team", "Nope"],
+        )
+
+    def test_resolve_custom_field_id(self, issue: JiraIssue):
+        assert issue.resolve_custom_field_id("customfield_10010") == "customfield_10010"
+        assert issue.resolve_custom_field_id("RISK LEVEL") == "customfield_10010"
+        assert issue.resolve_custom_field_id("cf_10020") == "customfield_10020"
+        # Duplicate names resolve to the first field, as before
+        assert issue.resolve_custom_field_id("team") == "customfield_10030"
+        assert issue.resolve_custom_field_id("cf_99999") is None
+
+    def test_requested_custom_fields_in_simplified_dict(self, issue: JiraIssue):
+        result = issue.to_simplified_dict()
+
+        assert result["customfield_10010"] == {"value": "High", "name": "Risk Level"}
+        assert result["customfield_10020"] == {"value": 5, "name": "Story Points"}
+        assert result["customfield_10030"] == {"value": "first", "name": "Team"}
+        assert "customfield_10031" not in result
+
+    def test_name_index_follows_replaced_custom_fields(self, issue: JiraIssue):
+        assert issue.resolve_custom_field_id("team") == "customfield_10030"
+        assert "customfield_10030" in issue.to_simplified_dict()
+        team = {"value": "third", "name": "Team"}
+
+        copy = issue.model_copy(update={"custom_fields": {"customfield_10032": team}})
+        assert copy.resolve_custom_field_id("team") == "customfield_10032"
+        assert copy.resolve_custom_field_id("risk level") is None
+        result = copy.to_simplified_dict()
+        assert result["customfield_10032"] == team
+        assert "customfield_10030" not in result
+
+        issue.custom_fields = {"customfield_10033": team}
+        assert issue.resolve_custom_field_id("team") == "customfield_10033"
+        assert issue.to_simplified_dict()["customfield_10033"] == team
+
+        # Fields removed in place are not resolved from the old index
+        del issue.custom_fields["customfield_10033"]
+        assert issue.resolve_custom_field_id("team") is None
+        assert "customfield_10033" not in issue.to_simplified_dict()
+
+    def test_attribute_access_falls_back_to_custom_fields(self, issue: JiraIssue):
+        assert issue.summary == "Issue"
+        assert issue.customfield_10020 == {"value": 5, "name": "Story Points"}
+        with pytest.raises(AttributeError):
+            _ = issue.customfield_99999
+
+
+class TestJiraIssueConstruction:
+    """Tests for building JiraIssue instances from API data without validation."""
+
+    @staticmethod
+    def _issue_data(custom_field_count: int) -> dict:
+        fields = {
+            "summary": "Wide issue",
+            "status": {"id": "1", "name": "Open"},
+            "labels": ["a", "b"],
+            "subtasks": [{"key": "TEST-2"}],
+        }
+        for i in range(custom_field_count):
+            fields[f"customfield_{10100 + i}"] = (
+                {"value": f"option {i}", "id": str(i)} if i % 3 == 0 else None
+            )
+        return {"id": "10001", "key": "TEST-1", "fields": fields}
+
+    def test_matches_validated_construction(self):
+        """Test that the unvalidated issue equals a validated one."""
+        issue = JiraIssue.from_api_response(
+            self._issue_data(10), requested_fields=("summary", "labels")
+        )
+
+        assert issue == JiraIssue(**dict(issue))
+        assert issue.requested_fields == ["summary", "labels"]
+        assert issue.to_simplified_dict() == {
+            "id": "10001",
+            "key": "TEST-1",
+            "summary": "Wide issue",
+            "labels": ["a", "b"],
+        }
+
+    def test_wide_issue_matches_validated_construction(self):
+        """Test that construct_trusted builds a 150-custom-field issue unchanged."""
+        issue = JiraIssue.from_api_response(self._issue_data(150))
+        values = dict(issue)
+
+        trusted = JiraIssue.construct_trusted(**values)
+
+        assert trusted == JiraIssue(**values)
+        assert len(trusted.custom_fields) == 150
+        assert trusted.to_simplified_dict() == JiraIssue(**values).to_simplified_dict()
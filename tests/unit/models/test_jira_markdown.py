@@ -0,0 +1,110 @@
+"""Tests for the compact markdown rendering of Jira issues."""
+
+import copy
+import json
+
+from src.mcp_atlassian.models.jira import JiraSearchPage, JiraSearchResult
+from src.mcp_atlassian.models.jira.issue import IssueProjection
+from src.mcp_atlassian.models.jira.markdown import (
+    render_comment_markdown,
+    render_issue_markdown,
+)
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE, MOCK_JIRA_JQL_RESPONSE
+
+
+class TestRenderIssueMarkdown:
+    """Tests for render_issue_markdown."""
+
+    def test_renders_all_fields(self):
+        """Test the layout of an issue with every field requested."""
+        issue = IssueProjection.for_fields("*all").apply_raw(MOCK_JIRA_ISSUE_RESPONSE)
+
+        text = render_issue_markdown(issue)
+
+        assert text.startswith("# PROJ-123: Test Issue Summary\n")
+        assert "- Type: Task | Status: In Progress | Priority: Medium" in text
+        assert "- Assignee: Test User | Reporter: Reporter User" in text
+        assert "Parent: PROJ-122: Parent Issue Summary" in text
+        assert "Epic: EPIC-KEY-1 (Epic Name Example)" in text
+        assert (
+            "- Time: original estimate 1d, remaining estimate 4h, time spent 4h" in text
+        )
+        assert (
+            "- My Custom MultiSelect: Custom MultiSelect 1, Custom MultiSelect 2"
+            in text
+        )
+        # The ADF description is flattened to its text
+        assert "## Description\nThis is a test issue description\n" in text
+        assert "## Subtasks\n- PROJ-124: Subtask 1 Summary" in text
+        assert "## Attachments\n- test_attachment.txt (text/plain, 1024 bytes)" in text
+        assert text.endswith(
+            "## Comments\n**Commenter User** (2024-01-01T12:00:00.000+0000):\n"
+            "This is a test comment"
+        )
+
+    def test_sections_and_comments(self):
+        """Test heading levels, changelogs, links and leaving out comments."""
+        issue = {
+            "key": "PROJ-1",
+            "summary": "Linked",
+            "issuelinks": [
+                {
+                    "type": {"name": "Blocks", "inward": "is blocked by"},
+                    "inward_issue": {
+                        "key": "PROJ-2",
+                        "fields": {"summary": "Blocker", "status": {"name": "Open"}},
+                    },
+                }
+            ],
+            "changelogs": [
+                {
+                    "author": {"display_name": "Jane"},
+                    "created": "2024-01-01",
+                    "items": [{"field": "status", "to_string": "Done"}],
+                }
+            ],
+            "comments": [{"body": "Hidden"}],
+        }
+
+        text = render_issue_markdown(issue, level=2, include_comments=False)
+
+        assert text == (
+            "## PROJ-1: Linked\n\n"
+            "### Links\n- is blocked by PROJ-2 [Open]: Blocker\n\n"
+            "### Changelog\n- 2024-01-01 Jane: status: - → Done"
+        )
+        assert render_comment_markdown(issue["comments"][0]) == (
+            "**Unknown** ():\nHidden"
+        )
+
+
+class TestJiraSearchPageMarkdown:
+    """Tests for rendering search pages as markdown."""
+
+    def test_iter_markdown_issues(self):
+        """Test that each raw issue is rendered as its own block."""
+        page = JiraSearchPage.from_api_response(MOCK_JIRA_JQL_RESPONSE)
+
+        blocks = list(page.iter_markdown_issues())
+
+        assert len(blocks) == len(MOCK_JIRA_JQL_RESPONSE["issues"])
+        assert blocks[0].startswith("## PROJ-123: Test Issue Summary\n")
+
+    def test_markdown_size(self):
+        """Test that a 50-issue page as markdown is several times smaller than JSON."""
+        data = {
+            **MOCK_JIRA_JQL_RESPONSE,
+            "issues": [
+                copy.deepcopy(MOCK_JIRA_JQL_RESPONSE["issues"][0]) for _ in range(50)
+            ],
+        }
+
+        def as_json() -> str:
+            result = JiraSearchResult.from_api_response(data)
+            return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+
+        def as_markdown() -> str:
+            page = JiraSearchPage.from_api_response(data)
+            return "\n\n".join(page.iter_markdown_issues())
+
+        assert len(as_markdown()) * 4 < len(as_json())
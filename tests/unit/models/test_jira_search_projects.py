@@ -1,7 +1,18 @@
-"""Tests for JiraSearchResult and JiraProject models."""
+"""Tests for JiraSearchResult, JiraSearchPage and JiraProject models."""
+
+from unittest.mock import patch
+
+import pytest
 
 from src.mcp_atlassian.models.constants import EMPTY_STRING, JIRA_DEFAULT_ID, UNKNOWN
-from src.mcp_atlassian.models.jira import JiraProject, JiraSearchResult
+from src.mcp_atlassian.models.jira import (
+    JiraIssue,
+    JiraProject,
+    JiraSearchPage,
+    JiraSearchResult,
+)
+from src.mcp_atlassian.models.jira.issue import _compile_projection
+from tests.fixtures.jira_mocks import MOCK_JIRA_JQL_RESPONSE
 
 
 class TestJiraSearchResult:
@@ -73,6 +84,102 @@ class TestJiraSearchResult:
         assert result.names == {}
         assert result.schema == {}
 
+    def test_to_simplified_dict_shares_one_projection(self):
+        """Test that all issues in a result render with one compiled projection."""
+        issues = [
+            {
+                "id": str(10000 + i),
+                "key": f"TEST-{i}",
+                "fields": {
+                    "summary": f"Issue {i}",
+                    "labels": ["backend"],
+                    "customfield_10010": {"value": "High"},
+                    "customfield_10020": i,
+                },
+                "names": {
+                    "customfield_10010": "Risk Level",
+                    "customfield_10020": "Story Points",
+                },
+            }
+            for i in range(500)
+        ]
+        result = JiraSearchResult.from_api_response(
+            {"issues": issues, "total": 500, "startAt": 0, "maxResults": 500},
+            requested_fields="summary,story points,cf_10010",
+        )
+        _compile_projection.cache_clear()
+
+        simplified = result.to_simplified_dict()
+
+        assert _compile_projection.cache_info().misses == 1
+        assert len(simplified["issues"]) == 500
+        assert simplified["issues"][7] == {
+            "id": "10007",
+            "key": "TEST-7",
+            "summary": "Issue 7",
+            "customfield_10020": {"value": 7, "name": "Story Points"},
+            "customfield_10010": {"value": "High", "name": "Risk Level"},
+        }
+
+
+class TestJiraSearchPage:
+    """Tests for the lazy JiraSearchPage."""
+
+    @pytest.mark.parametrize(
+        "requested_fields",
+        [
+            None,
+            "*all",
+            "summary,status,assignee,comment,issuelinks,customfield_10014",
+            ["labels", "priority", "Epic Link", "cf_10011"],
+        ],
+    )
+    def test_to_simplified_dict_matches_search_result(self, requested_fields):
+        """Test that rendering raw issues gives the same output as the models."""
+        page = JiraSearchPage.from_api_response(
+            MOCK_JIRA_JQL_RESPONSE, requested_fields=requested_fields
+        )
+        result = JiraSearchResult.from_api_response(
+            MOCK_JIRA_JQL_RESPONSE, requested_fields=requested_fields
+        )
+
+        assert page.to_simplified_dict() == result.to_simplified_dict()
+
+    def test_to_simplified_dict_builds_no_issues(self):
+        """Test that serializing a page skips the issue models."""
+        page = JiraSearchPage.from_api_response(
+            MOCK_JIRA_JQL_RESPONSE, requested_fields="*all"
+        )
+
+        with patch.object(JiraIssue, "from_api_response", side_effect=AssertionError):
+            simplified = page.to_simplified_dict()
+
+        assert simplified["total"] == MOCK_JIRA_JQL_RESPONSE["total"]
+        assert [issue["key"] for issue in simplified["issues"]] == [
+            issue["key"] for issue in MOCK_JIRA_JQL_RESPONSE["issues"]
+        ]
+
+    def test_issues_are_built_on_access(self):
+        """Test that issues are built once, when they are first accessed."""
+        page = JiraSearchPage.from_api_response(
+            {"issues": [{"key": "TEST-1"}, None, {"key": "TEST-2"}], "total": 2}
+        )
+        assert len(page) == 2
+
+        with patch.object(
+            JiraIssue, "from_api_response", wraps=JiraIssue.from_api_response
+        ) as build:
+            assert page[1].key == "TEST-2"
+            assert build.call_count == 1
+            assert [issue.key for issue in page.issues] == ["TEST-1", "TEST-2"]
+            assert page[1] is page.issues[1]
+            assert build.call_count == 2
+
+        eager = page.to_search_result()
+        assert isinstance(eager, JiraSearchResult)
+        assert (eager.total, eager.start_at, eager.max_results) == (2, -1, -1)
+        assert eager.issues == page.issues
+
 
 class TestJiraProject:
     """Tests for the JiraProject model."""
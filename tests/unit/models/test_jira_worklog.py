@@ -6,7 +6,7 @@ import re
 import pytest
 
 from src.mcp_atlassian.models.constants import EMPTY_STRING, JIRA_DEFAULT_ID, UNKNOWN
-from src.mcp_atlassian.models.jira import JiraWorklog
+from src.mcp_atlassian.models.jira import JiraWorklog, JiraWorklogRecord, RecordInterner
 
 # Optional: Import real API client for optional real-data testing
 try:
@@ -162,6 +162,33 @@ class TestJiraWorklog:
         assert worklog.time_spent_seconds == 1800
 
 
+class TestJiraWorklogRecord:
+    """Tests for the compact JiraWorklogRecord."""
+
+    def test_interns_repeated_values(self):
+        """Test that records from one fetch share issue IDs and authors."""
+        intern = RecordInterner()
+        # Joined strings are equal but distinct objects for every entry
+        records = [
+            JiraWorklogRecord.from_api_response(
+                {
+                    "id": str(index),
+                    "issueId": "".join(["100", "01"]),
+                    "author": {"displayName": " ".join(["Test", "User"])},
+                    "started": "2024-01-01T09:00:00.000+0000",
+                    "timeSpentSeconds": "3600",
+                },
+                intern,
+            )
+            for index in range(2)
+        ]
+
+        assert records[0].issue_id == "10001"
+        assert records[0].issue_id is records[1].issue_id
+        assert records[0].author is records[1].author
+        assert records[1].time_spent_seconds == 3600
+
+
 @pytest.mark.skipif(
     not real_api_available or os.getenv("SKIP_REAL_API_TESTS", "true") == "true",
     reason="Real API tests disabled or dependencies not available",
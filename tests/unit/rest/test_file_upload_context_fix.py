@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from mcp_atlassian.rest.jira_v3 import JiraV3Client
+from mcp_atlassian.rest.multipart import MultipartFileStream
 
 
 class TestFileUploadContextFix:
@@ -58,21 +59,63 @@ class TestFileUploadContextFix:
             )
             assert call_args[0][0] == expected_url
 
-            # Check that files parameter has correct structure
-            files = call_args[1]["files"]
-            assert "file" in files
-            filename, file_handle, mime_type = files["file"]
-            assert filename == os.path.basename(temp_file)
-            assert mime_type == "text/plain"
+            # Check that the body is a streamed multipart encoder
+            body = call_args[1]["data"]
+            assert isinstance(body, MultipartFileStream)
+            assert body.parts == [("file", os.path.basename(temp_file), "text/plain")]
 
-            # Verify headers
+            # Verify per-request headers
             headers = call_args[1]["headers"]
             assert headers["X-Atlassian-Token"] == "no-check"
-            assert headers["Content-Type"] is None
+            assert headers["Content-Type"] == body.content_type
+            assert headers["Content-Type"].startswith("multipart/form-data")
 
             # Verify response
             assert result == [{"id": "12345", "filename": "test.txt"}]
 
+    def test_session_headers_not_mutated(self, jira_client, temp_file):
+        """Test that the shared session keeps its Content-Type during upload."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = [{"id": "12345"}]
+        seen_content_types = []
+
+        def fake_post(*args, **kwargs):
+            seen_content_types.append(jira_client.session.headers.get("Content-Type"))
+            return mock_response
+
+        with patch.object(jira_client.session, "post", side_effect=fake_post):
+            jira_client.add_attachment("TEST-123", temp_file)
+
+        assert seen_content_types == ["application/json"]
+        assert jira_client.session.headers["Content-Type"] == "application/json"
+
+    def test_add_attachments_single_request(self, jira_client, temp_file):
+        """Test that several files are sent as parts of one multipart body."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = [{"id": "1"}, {"id": "2"}]
+
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            f.write(b'{"a": 1}')
+            second_path = f.name
+
+        try:
+            with patch.object(
+                jira_client.session, "post", return_value=mock_response
+            ) as mock_post:
+                result = jira_client.add_attachments(
+                    "TEST-123", [temp_file, second_path]
+                )
+
+                mock_post.assert_called_once()
+                body = mock_post.call_args[1]["data"]
+                assert [part[1] for part in body.parts] == [
+                    os.path.basename(temp_file),
+                    os.path.basename(second_path),
+                ]
+                assert result == [{"id": "1"}, {"id": "2"}]
+        finally:
+            os.unlink(second_path)
+
     def test_file_not_found_error(self, jira_client):
         """Test that FileNotFoundError is raised for non-existent files."""
         non_existent_file = "/path/to/non/existent/file.txt"
@@ -156,9 +199,9 @@ class TestFileUploadContextFix:
                 ) as mock_post:
                     jira_client.add_attachment("TEST-123", temp_path)
 
-                    # Check MIME type in files parameter
-                    files = mock_post.call_args[1]["files"]
-                    _, _, mime_type = files["file"]
+                    # Check MIME type in the multipart part
+                    body = mock_post.call_args[1]["data"]
+                    _, _, mime_type = body.parts[0]
                     assert mime_type == expected_mime
 
             finally:
@@ -0,0 +1,81 @@
+"""Tests for the streaming multipart encoder."""
+
+from email.parser import BytesParser
+
+import requests
+
+from mcp_atlassian.rest.multipart import MultipartFileStream, guess_content_type
+
+
+def _read_all(stream: MultipartFileStream, size: int) -> bytes:
+    chunks = []
+    while chunk := stream.read(size):
+        assert len(chunk) <= size
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def test_guess_content_type():
+    """Test MIME detection with the octet-stream fallback."""
+    assert guess_content_type("report.pdf") == "application/pdf"
+    assert guess_content_type("no_extension") == "application/octet-stream"
+
+
+def test_stream_encodes_all_parts(tmp_path):
+    """Test that the streamed body is a valid multipart document."""
+    first = tmp_path / "a.txt"
+    first.write_bytes(b"hello world")
+    second = tmp_path / "b.bin"
+    second.write_bytes(bytes(range(256)) * 10)
+
+    with first.open("rb") as fh1, second.open("rb") as fh2:
+        stream = MultipartFileStream(
+            [
+                ("file", "a.txt", fh1, "text/plain"),
+                ("file", "b.bin", fh2, "application/octet-stream"),
+            ]
+        )
+        body = _read_all(stream, 7)
+
+    assert len(body) == len(stream)
+    message = BytesParser().parsebytes(
+        f"Content-Type: {stream.content_type}\r\n\r\n".encode() + body
+    )
+    parts = message.get_payload()
+    assert [part.get_filename() for part in parts] == ["a.txt", "b.bin"]
+    assert parts[0].get_payload(decode=True) == b"hello world"
+    assert parts[1].get_payload(decode=True) == bytes(range(256)) * 10
+
+
+def test_stream_reads_file_lazily(tmp_path):
+    """Test that file contents are only read as the body is consumed."""
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"x" * 10_000)
+
+    with path.open("rb") as fh:
+        stream = MultipartFileStream(
+            [("file", "big.bin", fh, "application/octet-stream")], chunk_size=64
+        )
+        assert fh.tell() == 0
+        first = stream.read()
+        assert len(first) == 64
+        assert fh.tell() < 10_000
+
+
+def test_requests_sets_content_length(tmp_path):
+    """Test that requests sends a Content-Length instead of chunked encoding."""
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"data")
+
+    with path.open("rb") as fh:
+        stream = MultipartFileStream([("file", "a.txt", fh, "text/plain")])
+        prepared = requests.Request(
+            "POST",
+            "https://example.com/upload",
+            data=stream,
+            headers={"Content-Type": stream.content_type},
+        ).prepare()
+
+    assert prepared.body is stream
+    assert prepared.headers["Content-Length"] == str(len(stream))
+    assert "Transfer-Encoding" not in prepared.headers
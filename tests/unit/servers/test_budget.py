@@ -0,0 +1,203 @@
+"""Tests for the tool response budgets."""
+
+import json
+
+import pytest
+
+from mcp_atlassian.servers.budget import (
+    DEFAULT_RESPONSE_MAX_BYTES,
+    ResponseBudget,
+    get_response_budget,
+)
+
+
+def _issue(index: int, description_size: int = 100, changelogs: int = 1) -> dict:
+    return {
+        "key": f"PROJ-{index}",
+        "summary": f"Issue {index}",
+        "description": "word " * (description_size // 5),
+        "changelogs": [
+            {
+                "author": {"display_name": "Jane"},
+                "created": "2024-01-01T10:00:00+00:00",
+                "items": [
+                    {"field": "status", "from_string": "To Do", "to_string": "Done"}
+                ],
+            }
+        ]
+        * changelogs,
+    }
+
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+class TestGetResponseBudget:
+    """Tests for reading budgets from the environment."""
+
+    def test_default(self, monkeypatch):
+        for name in ("MCP_RESPONSE_BUDGETS", "MCP_RESPONSE_MAX_BYTES"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv("MCP_RESPONSE_MAX_TOKENS", raising=False)
+
+        assert get_response_budget("jira_search") == DEFAULT_RESPONSE_MAX_BYTES
+
+    def test_overrides(self, monkeypatch):
+        monkeypatch.setenv("MCP_RESPONSE_BUDGETS", "jira_search=1000,jira_get_issue=0")
+        monkeypatch.delenv("MCP_RESPONSE_MAX_BYTES", raising=False)
+        monkeypatch.setenv("MCP_RESPONSE_MAX_TOKENS", "500")
+
+        assert get_response_budget("jira_search") == 1000
+        assert get_response_budget("jira_get_issue") is None
+        assert get_response_budget("confluence_pages_get_page") == 2000
+
+
+class TestResponseBudget:
+    """Tests for ResponseBudget."""
+
+    def test_matches_json_dumps_within_budget(self):
+        """Test that results within the budget are written as json.dumps would."""
+        budget = ResponseBudget("jira_search", 100_000)
+        issues = [_issue(index) for index in range(5)]
+        envelope = {"total": 5, "start_at": 0}
+
+        assert budget.dump_items(
+            iter(issues), envelope=envelope, key="issues"
+        ) == json.dumps({**envelope, "issues": issues}, indent=2, ensure_ascii=False)
+        assert budget.dump_items(issues) == json.dumps(
+            issues, indent=2, ensure_ascii=False
+        )
+        assert budget.dump_items([]) == "[]"
+
+    def test_items_cut_at_budget(self):
+        """Test that a long list stops at the budget with a working cursor."""
+        budget = ResponseBudget("jira_search", 3000)
+        produced = []
+
+        def issues():
+            for index in range(100):
+                produced.append(index)
+                yield _issue(index)
+
+        text = budget.dump_items(
+            issues(), envelope={"total": 100}, key="issues", offset=20
+        )
+        result = json.loads(text)
+        returned = len(result["issues"])
+
+        assert _size(text) <= 3000
+        assert 0 < returned < 100
+        assert len(produced) == returned + 1
+        assert budget.decode_cursor(result["continuation"]["cursor"]) == 20 + returned
+
+    def test_lowest_priority_fields_shortened_first(self):
+        """Test that changelog details go before descriptions."""
+        issue = _issue(1, description_size=5000, changelogs=40)
+        summarized = json.loads(
+            ResponseBudget("jira_search", 12000).dump_items([issue], key="issues")
+        )[0]
+        shortened = json.loads(
+            ResponseBudget("jira_search", 8000).dump_items([issue], key="issues")
+        )[0]
+
+        assert summarized["truncated_fields"] == ["changelogs"]
+        assert summarized["changelogs"][0]["fields"] == ["status"]
+        assert summarized["description"] == issue["description"]
+        assert shortened["truncated_fields"] == ["changelogs", "description"]
+        assert len(shortened["description"]) < 1000
+
+    def test_document_list_split(self):
+        """Test that an issue's comments continue in follow-up responses."""
+        issue = {
+            "id": "1",
+            "key": "PROJ-1",
+            "summary": "Many comments",
+            "comments": [{"body": f"Comment {i} " * 20} for i in range(50)],
+        }
+        budget = ResponseBudget("jira_get_issue", 2000)
+
+        comments = []
+        offset = 0
+        while True:
+            text = budget.dump_document(issue, key="comments", offset=offset)
+            result = json.loads(text)
+            assert _size(text) <= 2000
+            assert result["key"] == "PROJ-1"
+            comments.extend(result["comments"])
+            if "continuation" not in result:
+                break
+            offset = budget.decode_cursor(result["continuation"]["cursor"])
+
+        assert comments == issue["comments"]
+
+    def test_text_split(self):
+        """Test that long page content is sent in parts that add up to it."""
+        content = "".join(f'Line {i} with ünïcode and "quotes"\n' for i in range(500))
+        page = {"metadata": {"id": "1", "content": {"value": content}}}
+        budget = ResponseBudget("confluence_pages_get_page", 4000)
+        path = ("metadata", "content", "value")
+
+        parts = []
+        offset = 0
+        while True:
+            text = budget.dump_text(page, path, offset=offset)
+            result = json.loads(text)
+            assert _size(text) <= 4000
+            parts.append(result["metadata"]["content"]["value"])
+            if "continuation" not in result:
+                break
+            offset = budget.decode_cursor(result["continuation"]["cursor"])
+
+        assert len(parts) > 1
+        assert all(part.endswith("\n") for part in parts)
+        assert "".join(parts) == content
+        assert page["metadata"]["content"]["value"] == content
+
+    def test_cursor_from_another_tool(self):
+        """Test that cursors are only accepted by the tool that issued them."""
+        cursor = ResponseBudget("jira_search", 1000).encode_cursor(10)
+
+        assert ResponseBudget("jira_search", 1000).decode_cursor(cursor) == 10
+        with pytest.raises(ValueError, match="not issued by jira_get_issue"):
+            ResponseBudget("jira_get_issue", 1000).decode_cursor(cursor)
+        with pytest.raises(ValueError, match="Invalid continuation cursor"):
+            ResponseBudget("jira_search", 1000).decode_cursor("not a cursor")
+
+    def test_markdown_blocks_cut(self):
+        """Test that markdown blocks stop at the budget with a cursor line."""
+        budget = ResponseBudget("jira_search", 1000)
+        blocks = [f"## PROJ-{i}\n" + "text " * 20 for i in range(30)]
+
+        text = budget.dump_markdown("# 30 issues found", iter(blocks), offset=5)
+        shown = text.count("## PROJ-")
+        cursor = text.rsplit("`", 2)[1]
+
+        assert _size(text) <= 1000
+        assert text.startswith("# 30 issues found\n\n## PROJ-0\n")
+        assert 0 < shown < 30
+        assert budget.decode_cursor(cursor) == 5 + shown
+        assert ResponseBudget("jira_search", None).dump_markdown("", blocks) == (
+            "\n\n".join(blocks)
+        )
+
+    def test_markdown_text_cut(self):
+        """Test that long markdown text is sent in parts that add up to it."""
+        content = "".join(f"Paragraph {i} about ünïcode\n" for i in range(300))
+        budget = ResponseBudget("confluence_pages_get_page", 2000)
+
+        parts = []
+        offset = 0
+        while True:
+            text = budget.dump_markdown_text("# Page", content, offset=offset)
+            assert _size(text) <= 2000
+            body, _, cursor_line = text.removeprefix("# Page\n\n").partition(
+                "\n\n---\n"
+            )
+            parts.append(body)
+            if not cursor_line:
+                break
+            offset = budget.decode_cursor(cursor_line.split("`")[1])
+
+        assert len(parts) > 1
+        assert "".join(parts) == content
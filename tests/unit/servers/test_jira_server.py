@@ -1,5 +1,6 @@
 """Unit tests for the Jira FastMCP server implementation."""
 
+import copy
 import json
 import logging
 from collections.abc import AsyncGenerator
@@ -14,11 +15,15 @@ from starlette.requests import Request
 
 from src.mcp_atlassian.jira import JiraFetcher
 from src.mcp_atlassian.jira.config import JiraConfig
+from src.mcp_atlassian.jira.projects import ProjectCatalog
+from src.mcp_atlassian.models.jira import JiraChangelogRecord
+from src.mcp_atlassian.servers.budget import ResponseBudget
 from src.mcp_atlassian.servers.context import MainAppContext
 from src.mcp_atlassian.servers.main import AtlassianMCP
 from src.mcp_atlassian.utils.oauth import OAuthConfig
 from tests.fixtures.jira_mocks import (
     MOCK_JIRA_COMMENTS_SIMPLIFIED,
+    MOCK_JIRA_ISSUE_RESPONSE,
     MOCK_JIRA_ISSUE_RESPONSE_SIMPLIFIED,
     MOCK_JIRA_JQL_RESPONSE_SIMPLIFIED,
 )
@@ -275,9 +280,13 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
     )
     from src.mcp_atlassian.servers.jira import (
         add_comment,
+        batch_create_issue_links,
         batch_create_issues,
+        batch_create_remote_issue_links,
         batch_create_versions,
         batch_get_changelogs,
+        batch_transition_issues,
+        batch_update_issues,
         create_issue,
         create_issue_link,
         delete_issue,
@@ -286,13 +295,17 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         get_all_projects,
         get_board_issues,
         get_issue,
+        get_issue_graph,
         get_link_types,
         get_project_issues,
         get_project_versions,
         get_sprint_issues,
+        get_sprint_report,
         get_sprints_from_board,
+        get_status_analytics,
         get_transitions,
         get_user_profile,
+        get_worklog_summary,
         link_to_epic,
         remove_issue_link,
         search,
@@ -315,18 +328,26 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
     jira_sub_mcp.tool()(get_board_issues)
     jira_sub_mcp.tool()(get_sprints_from_board)
     jira_sub_mcp.tool()(get_sprint_issues)
+    jira_sub_mcp.tool()(get_sprint_report)
     jira_sub_mcp.tool()(get_link_types)
+    jira_sub_mcp.tool()(get_issue_graph)
     jira_sub_mcp.tool()(get_user_profile)
     jira_sub_mcp.tool()(create_issue)
     jira_sub_mcp.tool()(batch_create_issues)
     jira_sub_mcp.tool()(batch_get_changelogs)
+    jira_sub_mcp.tool()(get_worklog_summary)
+    jira_sub_mcp.tool()(get_status_analytics)
     jira_sub_mcp.tool()(update_issue)
+    jira_sub_mcp.tool()(batch_update_issues)
     jira_sub_mcp.tool()(delete_issue)
     jira_sub_mcp.tool()(add_comment)
     jira_sub_mcp.tool()(link_to_epic)
     jira_sub_mcp.tool()(create_issue_link)
+    jira_sub_mcp.tool()(batch_create_issue_links)
+    jira_sub_mcp.tool()(batch_create_remote_issue_links)
     jira_sub_mcp.tool()(remove_issue_link)
     jira_sub_mcp.tool()(transition_issue)
+    jira_sub_mcp.tool()(batch_transition_issues)
     jira_sub_mcp.tool()(update_sprint)
     jira_sub_mcp.tool()(batch_create_versions)
     test_mcp.mount("jira", jira_sub_mcp)
@@ -424,6 +445,31 @@ async def test_get_issue(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_get_issue_markdown(jira_client, mock_jira_fetcher):
+    """Test that get_issue renders markdown from the raw issue data."""
+    mock_jira_fetcher.get_issue.side_effect = None
+    mock_jira_fetcher.get_issue.return_value = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+
+    response = await jira_client.call_tool(
+        "jira_get_issue",
+        {"issue_key": "PROJ-123", "fields": "*all", "output_format": "markdown"},
+    )
+
+    text = response[0].text
+    assert text.startswith("# PROJ-123: Test Issue Summary\n")
+    assert "## Comments\n\n**Commenter User**" in text
+    mock_jira_fetcher.get_issue.assert_called_once_with(
+        issue_key="PROJ-123",
+        fields="*all",
+        expand=None,
+        comment_limit=10,
+        properties=None,
+        update_history=True,
+        raw=True,
+    )
+
+
 @pytest.mark.anyio
 async def test_search(jira_client, mock_jira_fetcher):
     """Test the search tool with fixture data."""
@@ -456,9 +502,30 @@ async def test_search(jira_client, mock_jira_fetcher):
         start=0,
         projects_filter=None,
         expand=None,
+        lazy=True,
     )
 
 
+@pytest.mark.anyio
+async def test_search_with_cursor(jira_client, mock_jira_fetcher):
+    """Test that a continuation cursor resumes the search where it stopped."""
+    cursor = ResponseBudget("jira_search", 1000).encode_cursor(7)
+    response = await jira_client.call_tool(
+        "jira_search",
+        {"jql": "project = TEST", "fields": "summary", "cursor": cursor},
+    )
+    content = json.loads(response[0].text)
+    assert content["start_at"] == 7
+    assert "continuation" not in content
+    assert mock_jira_fetcher.search_issues.call_args.kwargs["start"] == 7
+
+    other_cursor = ResponseBudget("jira_get_issue", 1000).encode_cursor(1)
+    with pytest.raises(ToolError):
+        await jira_client.call_tool(
+            "jira_search", {"jql": "project = TEST", "cursor": other_cursor}
+        )
+
+
 @pytest.mark.anyio
 async def test_create_issue(jira_client, mock_jira_fetcher):
     """Test the create_issue tool with fixture data."""
@@ -732,8 +799,8 @@ async def test_get_all_projects_tool(jira_client, mock_jira_fetcher):
     ]
     # Reset the mock and set specific return value for this test
     mock_jira_fetcher.get_all_projects.reset_mock()
-    mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: mock_projects
+    mock_jira_fetcher.get_all_projects.side_effect = lambda include_archived=False: (
+        mock_projects
     )
 
     # Test with default parameters (include_archived=False)
@@ -781,8 +848,8 @@ async def test_get_all_projects_tool_with_archived(jira_client, mock_jira_fetche
     ]
     # Reset the mock and set specific return value for this test
     mock_jira_fetcher.get_all_projects.reset_mock()
-    mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: mock_projects
+    mock_jira_fetcher.get_all_projects.side_effect = lambda include_archived=False: (
+        mock_projects
     )
 
     # Test with include_archived=True
@@ -833,10 +900,12 @@ async def test_get_all_projects_tool_with_projects_filter(
         },
     ]
 
-    # Set up the mock to return all projects
+    # Set up the mock to filter through the project catalog like the fetcher
     mock_jira_fetcher.get_all_projects.reset_mock()
-    mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: all_mock_projects
+    mock_jira_fetcher.get_all_projects.side_effect = lambda include_archived=False: (
+        ProjectCatalog.build(
+            all_mock_projects, mock_jira_fetcher.config.projects_filter
+        ).list_projects(include_archived=include_archived)
     )
 
     # Set up the projects filter in the config
@@ -889,8 +958,8 @@ async def test_get_all_projects_tool_no_projects_filter(jira_client, mock_jira_f
 
     # Set up the mock to return all projects
     mock_jira_fetcher.get_all_projects.reset_mock()
-    mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: all_mock_projects
+    mock_jira_fetcher.get_all_projects.side_effect = lambda include_archived=False: (
+        all_mock_projects
     )
 
     # Ensure no projects filter is set
@@ -948,10 +1017,12 @@ async def test_get_all_projects_tool_case_insensitive_filter(
         },
     ]
 
-    # Set up the mock to return all projects
+    # Set up the mock to filter through the project catalog like the fetcher
     mock_jira_fetcher.get_all_projects.reset_mock()
-    mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: all_mock_projects
+    mock_jira_fetcher.get_all_projects.side_effect = lambda include_archived=False: (
+        ProjectCatalog.build(
+            all_mock_projects, mock_jira_fetcher.config.projects_filter
+        ).list_projects(include_archived=include_archived)
     )
 
     # Set up projects filter with mixed case and whitespace
@@ -1144,3 +1215,260 @@ async def test_batch_create_versions_empty(jira_client, mock_jira_fetcher):
     )
     content = json.loads(response[0].text)
     assert content == []
+
+
+@pytest.mark.anyio
+async def test_batch_transition_issues(jira_client, mock_jira_fetcher):
+    """Test the batch_transition_issues tool summarizes per-issue results."""
+    mock_jira_fetcher.batch_transition_issues.return_value = [
+        {"issue_key": "TEST-1", "success": True, "transition_id": "31"},
+        {"issue_key": "TEST-2", "success": True, "skipped": True},
+        {"issue_key": "TEST-3", "success": False, "error": "Not available"},
+    ]
+    response = await jira_client.call_tool(
+        "jira_batch_transition_issues",
+        {"issue_keys": ["TEST-1", "TEST-2", "TEST-3"], "transition": "Done"},
+    )
+    content = json.loads(response[0].text)
+    assert content["total"] == 3
+    assert content["succeeded"] == 1
+    assert content["skipped"] == 1
+    assert content["failed"] == 1
+    mock_jira_fetcher.batch_transition_issues.assert_called_once_with(
+        issue_keys=["TEST-1", "TEST-2", "TEST-3"],
+        transition="Done",
+        fields=None,
+        comment=None,
+    )
+
+
+@pytest.mark.anyio
+async def test_batch_get_changelogs_with_cursor(
+    jira_client, mock_jira_fetcher, monkeypatch
+):
+    """Test that a cut changelog response moves the list under 'results'."""
+    mock_jira_fetcher.config.is_cloud = True
+    changelog = JiraChangelogRecord.from_api_response(
+        {
+            "id": "1",
+            "author": {"displayName": "Alice"},
+            "created": "2024-01-01T10:00:00.000+0000",
+            "items": [{"field": "status", "fromString": "To Do", "toString": "Done"}],
+        }
+    )
+    mock_jira_fetcher.iter_changelogs.side_effect = lambda **kwargs: iter(
+        [(f"{10000 + i}", [changelog]) for i in range(20)]
+    )
+    keys = [f"TEST-{i}" for i in range(20)]
+
+    response = await jira_client.call_tool(
+        "jira_batch_get_changelogs", {"issue_ids_or_keys": keys}
+    )
+    content = json.loads(response[0].text)
+    assert isinstance(content, list)
+    assert len(content) == 20
+
+    monkeypatch.setenv("MCP_RESPONSE_BUDGETS", "jira_batch_get_changelogs=2000")
+    response = await jira_client.call_tool(
+        "jira_batch_get_changelogs", {"issue_ids_or_keys": keys}
+    )
+    content = json.loads(response[0].text)
+    assert set(content) == {"results", "continuation"}
+    first_ids = [result["issue_id"] for result in content["results"]]
+    assert 0 < len(first_ids) < 20
+    assert first_ids[0] == "10000"
+
+    response = await jira_client.call_tool(
+        "jira_batch_get_changelogs",
+        {"issue_ids_or_keys": keys, "cursor": content["continuation"]["cursor"]},
+    )
+    content = json.loads(response[0].text)
+    results = content["results"] if isinstance(content, dict) else content
+    assert results[0]["issue_id"] == f"{10000 + len(first_ids)}"
+
+
+@pytest.mark.anyio
+async def test_get_worklog_summary(jira_client, mock_jira_fetcher):
+    """Test the get_worklog_summary tool combines keys and JQL results."""
+    issue = MagicMock()
+    issue.key = "TEST-3"
+    mock_jira_fetcher.search_all_issues.return_value = [issue]
+    mock_jira_fetcher.summarize_worklogs.return_value = {
+        "worklog_count": 2,
+        "total_seconds": 5400,
+        "totals": {"by_author": {"Alice": 5400}},
+    }
+    response = await jira_client.call_tool(
+        "jira_get_worklog_summary",
+        {
+            "issue_keys": "TEST-1, TEST-2",
+            "jql": "sprint = 42",
+            "group_by": "author,day",
+            "started_after": "2024-01-01",
+        },
+    )
+    content = json.loads(response[0].text)
+    assert content["total_seconds"] == 5400
+    mock_jira_fetcher.summarize_worklogs.assert_called_once_with(
+        ["TEST-1", "TEST-2", "TEST-3"],
+        group_by=["author", "day"],
+        started_after="2024-01-01",
+        started_before=None,
+    )
+
+
+@pytest.mark.anyio
+async def test_get_status_analytics(jira_client, mock_jira_fetcher):
+    """Test the get_status_analytics tool passes parsed percentiles."""
+    mock_jira_fetcher.get_status_analytics.return_value = {
+        "issue_count": 1,
+        "lead_time_hours": {"issues": 1, "mean": 2.0, "p50": 2.0},
+    }
+    response = await jira_client.call_tool(
+        "jira_get_status_analytics",
+        {"jql": "project = TEST", "percentiles": "50, 90"},
+    )
+    content = json.loads(response[0].text)
+    assert content["issue_count"] == 1
+    mock_jira_fetcher.get_status_analytics.assert_called_once_with(
+        "project = TEST",
+        limit=1000,
+        percentiles=[50.0, 90.0],
+        include_current=True,
+    )
+
+
+@pytest.mark.anyio
+async def test_get_sprint_report(jira_client, mock_jira_fetcher):
+    """Test the get_sprint_report tool returns the computed report."""
+    mock_jira_fetcher.get_sprint_report.return_value = {
+        "sprint": {"id": "10001", "name": "Sprint 1", "state": "active"},
+        "story_points": {"committed": 8.0, "completed": 5.0},
+    }
+    response = await jira_client.call_tool(
+        "jira_get_sprint_report", {"sprint_id": "10001"}
+    )
+    content = json.loads(response[0].text)
+    assert content["story_points"]["completed"] == 5.0
+    mock_jira_fetcher.get_sprint_report.assert_called_once_with(
+        sprint_id="10001", story_points_field=None
+    )
+
+
+@pytest.mark.anyio
+async def test_batch_create_issue_links(jira_client, mock_jira_fetcher):
+    """Test the batch_create_issue_links tool builds link data and counts results."""
+    mock_jira_fetcher.batch_create_issue_links.return_value = [
+        {"success": True, "skipped": True, "link_id": "500"},
+        {"success": True},
+        {"success": False, "error": "Unknown link type"},
+    ]
+    response = await jira_client.call_tool(
+        "jira_batch_create_issue_links",
+        {
+            "links": [
+                {
+                    "link_type": "Blocks",
+                    "inward_issue_key": "TEST-1",
+                    "outward_issue_key": "TEST-2",
+                    "comment": "Sequenced",
+                }
+            ]
+        },
+    )
+    content = json.loads(response[0].text)
+    assert (content["succeeded"], content["skipped"], content["failed"]) == (1, 1, 1)
+    mock_jira_fetcher.batch_create_issue_links.assert_called_once_with(
+        [
+            {
+                "type": {"name": "Blocks"},
+                "inwardIssue": {"key": "TEST-1"},
+                "outwardIssue": {"key": "TEST-2"},
+                "comment": {"body": "Sequenced"},
+            }
+        ]
+    )
+
+
+@pytest.mark.anyio
+async def test_batch_create_remote_issue_links(jira_client, mock_jira_fetcher):
+    """Test the batch_create_remote_issue_links tool builds remote link data."""
+    mock_jira_fetcher.batch_create_remote_issue_links.return_value = [{"success": True}]
+    response = await jira_client.call_tool(
+        "jira_batch_create_remote_issue_links",
+        {
+            "links": [
+                {
+                    "issue_key": "TEST-1",
+                    "url": "https://example.com",
+                    "title": "Spec",
+                    "relationship": "documentation",
+                }
+            ]
+        },
+    )
+    content = json.loads(response[0].text)
+    assert content["succeeded"] == 1
+    mock_jira_fetcher.batch_create_remote_issue_links.assert_called_once_with(
+        [
+            {
+                "issue_key": "TEST-1",
+                "link_data": {
+                    "object": {"url": "https://example.com", "title": "Spec"},
+                    "relationship": "documentation",
+                },
+            }
+        ]
+    )
+
+
+@pytest.mark.anyio
+async def test_get_issue_graph(jira_client, mock_jira_fetcher):
+    """Test the get_issue_graph tool splits keys and link types."""
+    mock_jira_fetcher.get_issue_graph.return_value = {
+        "roots": ["TEST-1"],
+        "issue_count": 2,
+        "adjacency": {"TEST-1": {"blocks": ["TEST-2"]}},
+        "cycles": [],
+    }
+    response = await jira_client.call_tool(
+        "jira_get_issue_graph",
+        {
+            "issue_keys": "TEST-1, TEST-2",
+            "link_types": "Blocks, Relates",
+            "direction": "outward",
+            "max_depth": 2,
+        },
+    )
+    content = json.loads(response[0].text)
+    assert content["adjacency"] == {"TEST-1": {"blocks": ["TEST-2"]}}
+    mock_jira_fetcher.get_issue_graph.assert_called_once_with(
+        ["TEST-1", "TEST-2"],
+        link_types=["Blocks", "Relates"],
+        direction="outward",
+        max_depth=2,
+        max_issues=200,
+        include_hierarchy=True,
+    )
+
+
+@pytest.mark.anyio
+async def test_batch_update_issues(jira_client, mock_jira_fetcher):
+    """Test the batch_update_issues tool summarizes per-issue results."""
+    mock_jira_fetcher.batch_update_issues.return_value = [
+        {"issue_key": "TEST-1", "success": True},
+        {"issue_key": "TEST-2", "success": False, "error": "No permission"},
+    ]
+    response = await jira_client.call_tool(
+        "jira_batch_update_issues",
+        {"issue_keys": ["TEST-1", "TEST-2"], "fields": {"labels": ["backend"]}},
+    )
+    content = json.loads(response[0].text)
+    assert content["total"] == 2
+    assert content["succeeded"] == 1
+    assert content["failed"] == 1
+    mock_jira_fetcher.batch_update_issues.assert_called_once_with(
+        issue_keys=["TEST-1", "TEST-2"],
+        fields={"labels": ["backend"]},
+        notify_users=True,
+    )
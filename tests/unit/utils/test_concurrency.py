@@ -0,0 +1,64 @@
+"""Tests for the concurrency utilities module."""
+
+import pytest
+
+from mcp_atlassian.utils.concurrency import chunked, iter_concurrently, map_concurrently
+
+
+def test_map_concurrently_preserves_order_and_captures_errors():
+    """Results keep input order and failures are reported per item."""
+
+    def square(value: int) -> int:
+        if value == 3:
+            raise ValueError("boom")
+        return value * value
+
+    results = map_concurrently(square, [1, 2, 3, 4], max_workers=4)
+
+    assert [r.item for r in results] == [1, 2, 3, 4]
+    assert [r.value for r in results] == [1, 4, None, 16]
+    assert [r.ok for r in results] == [True, True, False, True]
+    assert isinstance(results[2].error, ValueError)
+
+
+def test_map_concurrently_empty():
+    """No items yields no results."""
+    assert map_concurrently(lambda x: x, []) == []
+
+
+def test_chunked():
+    """Items are split into consecutive chunks."""
+    assert chunked(range(5), 2) == [[0, 1], [2, 3], [4]]
+    assert chunked([], 3) == []
+    with pytest.raises(ValueError):
+        chunked([1], 0)
+
+
+def test_iter_concurrently_is_lazy_and_ordered():
+    """Items are pulled on demand and results keep input order."""
+    pulled = []
+
+    def source():
+        for value in range(10):
+            pulled.append(value)
+            yield value
+
+    results = iter_concurrently(lambda x: x * 2, source(), max_workers=3)
+    first = next(results)
+
+    assert first.value == 0
+    assert len(pulled) <= 4
+    assert [r.value for r in results] == [2 * v for v in range(1, 10)]
+
+
+def test_iter_concurrently_captures_errors():
+    """Failures are reported per item without stopping iteration."""
+
+    def fail_on_two(value: int) -> int:
+        if value == 2:
+            raise RuntimeError("boom")
+        return value
+
+    results = list(iter_concurrently(fail_on_two, [1, 2, 3], max_workers=1))
+
+    assert [r.ok for r in results] == [True, False, True]
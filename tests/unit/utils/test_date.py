@@ -1,8 +1,11 @@
 "Tests for the date utility functions."
 
+from datetime import datetime, timezone
+
+import dateutil.parser
 import pytest
 
-from mcp_atlassian.utils import parse_date
+from mcp_atlassian.utils import parse_date, parse_timestamp, parse_timestamps
 
 
 def test_parse_date_invalid_input():
@@ -37,3 +40,49 @@ def test_parse_date_rfc3339():
         str(parse_date("1937-01-01T12:00:27.87+00:20"))
         == "1937-01-01 12:00:27.870000+00:20"
     )
+
+
+@pytest.mark.parametrize(
+    ("timestamp", "expected"),
+    [
+        ("2024-01-01T10:00:00.000+0000", "2024-01-01 10:00:00+00:00"),
+        ("2024-01-01T10:00:00.000-0530", "2024-01-01 10:00:00-05:30"),
+        ("2024-01-01T10:00:00Z", "2024-01-01 10:00:00+00:00"),
+        ("2024-01-01T10:00:00+05:30", "2024-01-01 10:00:00+05:30"),
+        ("2024-01-01", "2024-01-01 00:00:00"),
+    ],
+)
+def test_parse_timestamp_atlassian_formats(timestamp, expected):
+    """Test that parse_timestamp reads the timestamp forms Atlassian APIs use."""
+    assert str(parse_timestamp(timestamp)) == expected
+    assert parse_date(timestamp) == dateutil.parser.parse(timestamp)
+
+
+def test_parse_timestamp_invalid_and_memoized():
+    """Test that invalid timestamps give None and repeated ones share a result."""
+    assert parse_timestamp("invalid") is None
+    assert parse_timestamp("2024-02-03T04:05:06.789+0000") is parse_timestamp(
+        "2024-02-03T04:05:06.789+0000"
+    )
+
+
+def test_parse_timestamps_column():
+    """Test that a column is parsed in order, with empty and invalid values."""
+    column = ["2024-01-01T10:00:00.000+0000", None, "", "nope"] * 3
+
+    parsed = parse_timestamps(column)
+
+    assert len(parsed) == len(column)
+    assert parsed[0] == datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+    assert parsed[0] is parsed[4]
+    assert parsed[1:4] == [None, None, None]
+
+
+def test_parse_timestamps_matches_dateutil():
+    """Test that a 10k timestamp column parses like dateutil, value by value."""
+    column = [
+        f"2024-01-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:00.000+0000"
+        for i in range(10000)
+    ]
+
+    assert parse_timestamps(column) == [dateutil.parser.parse(v) for v in column]